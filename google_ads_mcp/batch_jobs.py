@@ -0,0 +1,287 @@
+"""Asynchronous server-side mutations through BatchJobService."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, Iterator
+
+from google_ads_mcp.builders.operations import (
+    build_ad_group_status_operation,
+    build_ad_status_operation,
+    build_add_keywords_operations,
+    build_budget_update_operation,
+    build_campaign_status_operation,
+    build_negative_keyword_operations,
+    build_update_keyword_operation,
+)
+from google_ads_mcp.enums import enum_name
+from google_ads_mcp.models.common import BatchAction
+from google_ads_mcp.models.mutation_inputs import BatchOperation
+
+if TYPE_CHECKING:
+    from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
+
+logger = logging.getLogger(__name__)
+
+# Operations per AddBatchJobOperations request.
+ADD_OPERATIONS_CHUNK_SIZE = 5_000
+
+# Polling backoff: first wait, growth factor and cap, in seconds.
+POLL_INITIAL_DELAY = 1.0
+POLL_BACKOFF = 2.0
+POLL_MAX_DELAY = 30.0
+
+_STATUS_QUERY = (
+    "SELECT batch_job.id, batch_job.status, "
+    "batch_job.metadata.operation_count, "
+    "batch_job.metadata.executed_operation_count, "
+    "batch_job.metadata.estimated_completion_ratio, "
+    "batch_job.metadata.creation_date_time, "
+    "batch_job.metadata.completion_date_time "
+    "FROM batch_job "
+    "WHERE batch_job.resource_name = '{resource_name}'"
+)
+
+
+@dataclass(frozen=True)
+class BatchJobSubmission:
+    """A batch job that received its operations and was started."""
+
+    resource_name: str
+    operations: int
+    requests: int
+
+    @property
+    def job_id(self) -> str:
+        return self.resource_name.rsplit("/", 1)[-1]
+
+
+@dataclass(frozen=True)
+class BatchJobStatus:
+    """Progress of a batch job as reported by the ``batch_job`` resource."""
+
+    job_id: str
+    status: str
+    operation_count: int = 0
+    executed_operation_count: int = 0
+    completion_ratio: float = 0.0
+    created: str = ""
+    completed: str = ""
+
+    @property
+    def done(self) -> bool:
+        return self.status == "DONE"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "operation_count": self.operation_count,
+            "executed_operation_count": self.executed_operation_count,
+            "completion_ratio": self.completion_ratio,
+            "created": self.created,
+            "completed": self.completed,
+        }
+
+
+@dataclass
+class BatchJobResultsPage:
+    """One page of per-operation batch job results."""
+
+    results: list[dict[str, Any]] = field(default_factory=list)
+    next_page_token: str = ""
+
+
+def batch_job_resource_name(customer_id: str, job_id: str) -> str:
+    return f"customers/{customer_id}/batchJobs/{job_id}"
+
+
+def build_batch_operations(
+    client: Any, customer_id: str, operations: Iterable[BatchOperation]
+) -> Iterator[Any]:
+    """Yield the MutateOperation(s) of each :class:`BatchOperation`, lazily."""
+    for op in operations:
+        action = op.action
+        if action == BatchAction.ADD_KEYWORD:
+            match_type = op.match_type.value if op.match_type else "broad"
+            yield from build_add_keywords_operations(
+                client, customer_id, op.ad_group_id, [op.text], match_type,
+                cpc_bid_micros=op.cpc_bid_micros,
+            )
+        elif action == BatchAction.ADD_NEGATIVE_KEYWORD:
+            level, parent_id = (
+                ("ad_group", op.ad_group_id) if op.ad_group_id
+                else ("campaign", op.campaign_id)
+            )
+            match_type = op.match_type.value if op.match_type else "exact"
+            yield from build_negative_keyword_operations(
+                client, customer_id, level, parent_id, [op.text], match_type,
+            )
+        elif action == BatchAction.UPDATE_KEYWORD:
+            yield build_update_keyword_operation(
+                client, customer_id, op.ad_group_id, op.criterion_id,
+                cpc_bid_micros=op.cpc_bid_micros,
+                status=op.status.value if op.status else None,
+            )
+        elif action == BatchAction.CAMPAIGN_STATUS:
+            yield build_campaign_status_operation(
+                client, customer_id, op.campaign_id, op.status.value
+            )
+        elif action == BatchAction.AD_GROUP_STATUS:
+            yield build_ad_group_status_operation(
+                client, customer_id, op.ad_group_id, op.status.value
+            )
+        elif action == BatchAction.AD_STATUS:
+            yield build_ad_status_operation(
+                client, customer_id, op.ad_group_id, op.ad_id, op.status.value
+            )
+        elif action == BatchAction.UPDATE_BUDGET:
+            yield build_budget_update_operation(
+                client, customer_id, op.budget_id, op.amount_micros
+            )
+
+
+async def submit_batch_job(
+    client: AsyncGoogleAdsClientWrapper,
+    customer_id: str,
+    operations: Iterable[Any],
+    chunk_size: int = ADD_OPERATIONS_CHUNK_SIZE,
+) -> BatchJobSubmission:
+    """Create a batch job, upload ``operations`` and start it.
+
+    Operations are streamed in chunks of ``chunk_size``; each upload
+    passes the sequence token returned by the previous one, so the
+    requests are sent one after the other. The job is started without
+    waiting for it: use :func:`poll_batch_job` to follow it.
+    """
+    service = client.get_service("BatchJobService")
+    raw = client.client
+    job_operation = raw.get_type("BatchJobOperation")
+    raw.copy_from(job_operation.create, raw.get_type("BatchJob"))
+    response = await client.acall(
+        service.mutate_batch_job, customer_id=customer_id, operation=job_operation
+    )
+    resource_name = response.result.resource_name
+
+    iterator = iter(operations)
+    sequence_token = ""
+    total = requests = 0
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        response = await client.acall(
+            service.add_batch_job_operations,
+            resource_name=resource_name,
+            sequence_token=sequence_token,
+            mutate_operations=chunk,
+        )
+        sequence_token = response.next_sequence_token
+        total += len(chunk)
+        requests += 1
+
+    await client.acall(service.run_batch_job, resource_name=resource_name)
+    logger.info(
+        "Batch job %s started with %d operations (%d uploads)",
+        resource_name, total, requests,
+    )
+    return BatchJobSubmission(resource_name, total, requests)
+
+
+async def get_batch_job_status(
+    client: AsyncGoogleAdsClientWrapper, customer_id: str, job_id: str
+) -> BatchJobStatus:
+    """Read the current status of a batch job (never from the query cache)."""
+    query = _STATUS_QUERY.format(
+        resource_name=batch_job_resource_name(customer_id, job_id)
+    )
+    rows = await client.aquery(customer_id, query, bypass_cache=True)
+    if not rows:
+        return BatchJobStatus(job_id=job_id, status="NOT_FOUND")
+    job = rows[0].batch_job
+    metadata = job.metadata
+    return BatchJobStatus(
+        job_id=str(job.id),
+        status=enum_name(job.status),
+        operation_count=int(metadata.operation_count or 0),
+        executed_operation_count=int(metadata.executed_operation_count or 0),
+        completion_ratio=round(float(metadata.estimated_completion_ratio or 0), 4),
+        created=str(metadata.creation_date_time or ""),
+        completed=str(metadata.completion_date_time or ""),
+    )
+
+
+async def poll_batch_job(
+    client: AsyncGoogleAdsClientWrapper,
+    customer_id: str,
+    job_id: str,
+    wait_seconds: float = 0,
+    sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+) -> BatchJobStatus:
+    """Poll a batch job until it is done or ``wait_seconds`` have passed.
+
+    Waits between polls grow from :data:`POLL_INITIAL_DELAY` by
+    :data:`POLL_BACKOFF` up to :data:`POLL_MAX_DELAY`, never beyond the
+    remaining wait. With ``wait_seconds=0`` the status is read once.
+    """
+    status = await get_batch_job_status(client, customer_id, job_id)
+    remaining = float(wait_seconds)
+    delay = POLL_INITIAL_DELAY
+    while not status.done and status.status != "NOT_FOUND" and remaining > 0:
+        pause = min(delay, remaining)
+        await sleep(pause)
+        remaining -= pause
+        delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
+        status = await get_batch_job_status(client, customer_id, job_id)
+    return status
+
+
+async def list_batch_job_results(
+    client: AsyncGoogleAdsClientWrapper,
+    customer_id: str,
+    job_id: str,
+    page_size: int = 100,
+    page_token: str = "",
+) -> BatchJobResultsPage:
+    """Read one page of per-operation results of a finished batch job."""
+    service = client.get_service("BatchJobService")
+    request = {
+        "resource_name": batch_job_resource_name(customer_id, job_id),
+        "page_size": page_size,
+    }
+    if page_token:
+        request["page_token"] = page_token
+
+    def read_page() -> BatchJobResultsPage:
+        pager = service.list_batch_job_results(request=request)
+        page = next(iter(pager.pages), None)
+        if page is None:
+            return BatchJobResultsPage()
+        return BatchJobResultsPage(
+            [_result_to_dict(result) for result in page.results],
+            page.next_page_token,
+        )
+
+    return await client.acall(read_page)
+
+
+def _result_to_dict(result: Any) -> dict[str, Any]:
+    status = result.status
+    failed = bool(getattr(status, "code", 0))
+    return {
+        "operation_index": int(result.operation_index),
+        "status": "FAILED" if failed else "OK",
+        "error": status.message if failed else "",
+        "resource_name": "" if failed else _response_resource_name(
+            result.mutate_operation_response
+        ),
+    }
+
+
+def _response_resource_name(response: Any) -> str:
+    """Resource name of whichever result a MutateOperationResponse holds."""
+    try:
+        which = type(response).pb(response).WhichOneof("response")
+    except (AttributeError, TypeError):
+        return ""
+    return getattr(getattr(response, which, None), "resource_name", "") if which else ""
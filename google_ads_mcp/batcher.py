@@ -0,0 +1,160 @@
+"""Time-window micro-batching of small mutations across concurrent calls."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from google_ads_mcp.utils.errors import GoogleAdsMCPError, format_google_ads_error
+
+logger = logging.getLogger(__name__)
+
+# send(customer_id, operations) -> (per-operation responses, errors by index)
+SendBatch = Callable[
+    [str, list[Any]], Awaitable[tuple[list[Any], dict[int | None, str]]]
+]
+
+
+@dataclass(frozen=True)
+class BatchedMutateResponse:
+    """A caller's slice of a merged mutate response."""
+
+    mutate_operation_responses: list[Any] = field(default_factory=list)
+
+
+@dataclass
+class _Waiter:
+    start: int
+    count: int
+    future: asyncio.Future[BatchedMutateResponse]
+
+
+@dataclass
+class _Batch:
+    operations: list[Any] = field(default_factory=list)
+    waiters: list[_Waiter] = field(default_factory=list)
+    flushed: bool = False
+
+
+class MutationBatcher:
+    """Merge mutations of one customer arriving within a short window.
+
+    The first :meth:`submit` for a customer opens a batch that stays open
+    for ``window_seconds`` (or until it holds ``max_operations``); the
+    operations of every call arriving meanwhile are appended, and the
+    batch is sent as one partial-failure mutate. Each caller receives the
+    responses of its own operations, or a :class:`GoogleAdsMCPError` if any
+    of them was rejected; operations of other callers are not affected. An
+    error of the whole request, or a partial-failure error not tied to an
+    operation, is raised to every caller of the batch.
+
+    Only independent operations should be batched: a multi-operation call
+    is no longer atomic once merged.
+    """
+
+    def __init__(
+        self,
+        send: SendBatch,
+        window_seconds: float = 0.02,
+        max_operations: int = 1000,
+    ) -> None:
+        self._send = send
+        self.window_seconds = window_seconds
+        self.max_operations = max(1, max_operations)
+        self._pending: dict[str, _Batch] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._calls = 0
+        self._requests = 0
+
+    async def submit(
+        self, customer_id: str, operations: list[Any]
+    ) -> BatchedMutateResponse:
+        """Queue ``operations`` for the customer's next batch and await its outcome."""
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(customer_id)
+        if batch is not None and (
+            len(batch.operations) + len(operations) > self.max_operations
+        ):
+            self._start(self._flush(customer_id, batch))
+            batch = None
+        if batch is None:
+            batch = _Batch()
+            self._pending[customer_id] = batch
+            self._start(self._flush_later(customer_id, batch))
+
+        waiter = _Waiter(len(batch.operations), len(operations), loop.create_future())
+        batch.operations.extend(operations)
+        batch.waiters.append(waiter)
+        self._calls += 1
+        if len(batch.operations) >= self.max_operations:
+            self._start(self._flush(customer_id, batch))
+        return await waiter.future
+
+    def stats(self) -> dict[str, int]:
+        """Calls received and mutate requests actually sent."""
+        return {"calls": self._calls, "requests": self._requests}
+
+    def _start(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush_later(self, customer_id: str, batch: _Batch) -> None:
+        await asyncio.sleep(self.window_seconds)
+        await self._flush(customer_id, batch)
+
+    async def _flush(self, customer_id: str, batch: _Batch) -> None:
+        if batch.flushed:
+            return
+        batch.flushed = True
+        if self._pending.get(customer_id) is batch:
+            del self._pending[customer_id]
+        self._requests += 1
+        logger.debug(
+            "Sending %d operations from %d calls for %s in one mutate",
+            len(batch.operations), len(batch.waiters), customer_id,
+        )
+        try:
+            responses, errors = await self._send(customer_id, batch.operations)
+        except BaseException as exc:
+            for waiter in batch.waiters:
+                if not waiter.future.done():
+                    waiter.future.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+            return
+
+        # Errors without an operation index cannot be attributed to a caller.
+        unattributed = [
+            message for index, message in errors.items()
+            if index is None or not 0 <= index < len(batch.operations)
+        ]
+        for waiter in batch.waiters:
+            if waiter.future.done():
+                continue
+            indexes = range(waiter.start, waiter.start + waiter.count)
+            messages = [errors[i] for i in indexes if i in errors] + unattributed
+            if messages:
+                waiter.future.set_exception(GoogleAdsMCPError(
+                    format_google_ads_error("MUTATE_ERROR", "; ".join(messages))
+                ))
+            else:
+                waiter.future.set_result(BatchedMutateResponse(
+                    list(responses[waiter.start:waiter.start + waiter.count])
+                ))
+
+
+def batcher_settings_from_env() -> tuple[float, int]:
+    """Read the micro-batching window and batch size from the environment.
+
+    ``GOOGLE_ADS_MUTATE_BATCH_WINDOW_MS`` is how long single mutations wait
+    for others to join them (default 0: batching disabled);
+    ``GOOGLE_ADS_MUTATE_BATCH_MAX_OPERATIONS`` sends a batch early once it
+    holds that many operations (default 1000).
+    """
+    window_ms = float(os.environ.get("GOOGLE_ADS_MUTATE_BATCH_WINDOW_MS", "0"))
+    max_operations = int(os.environ.get("GOOGLE_ADS_MUTATE_BATCH_MAX_OPERATIONS", "1000"))
+    return max(0.0, window_ms) / 1000, max(1, max_operations)
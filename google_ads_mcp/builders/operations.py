@@ -10,35 +10,33 @@ from typing import Any
 
 from google.ads.googleads.client import GoogleAdsClient
 
-
-# CampaignStatus / AdGroupStatus / AdGroupAdStatus numeric values
+from google_ads_mcp.enums import (
+    AD_GROUP_TYPE,
+    ADVERTISING_CHANNEL_TYPE,
+    ASSET_FIELD_TYPE,
+    ASSET_TYPE,
+    BUDGET_DELIVERY_METHOD,
+    CAMPAIGN_STATUS,
+    KEYWORD_MATCH_TYPE,
+    LISTING_GROUP_FILTER_TYPE,
+)
+
+
+# Numeric values shared with the decoders in google_ads_mcp.enums.
+# CampaignStatus / AdGroupStatus / AdGroupAdStatus use the same numbers.
 STATUS_TO_ENUM: dict[str, int] = {
-    "enable": 2,   # ENABLED
-    "pause": 3,    # PAUSED
-    "remove": 4,   # REMOVED
+    "enable": CAMPAIGN_STATUS["ENABLED"],
+    "pause": CAMPAIGN_STATUS["PAUSED"],
+    "remove": CAMPAIGN_STATUS["REMOVED"],
 }
 
 MATCH_TYPE_TO_ENUM: dict[str, int] = {
-    "exact": 2,    # EXACT
-    "phrase": 3,   # PHRASE
-    "broad": 4,    # BROAD
+    name.lower(): number for name, number in KEYWORD_MATCH_TYPE.numbers.items()
 }
 
-CAMPAIGN_TYPE_TO_ENUM: dict[str, int] = {
-    "SEARCH": 2,
-    "DISPLAY": 3,
-    "SHOPPING": 4,
-    "VIDEO": 6,
-    "PERFORMANCE_MAX": 14,
-    "DEMAND_GEN": 15,
-}
+CAMPAIGN_TYPE_TO_ENUM: dict[str, int] = dict(ADVERTISING_CHANNEL_TYPE.numbers)
 
-AD_GROUP_TYPE_TO_ENUM: dict[str, int] = {
-    "SEARCH_STANDARD": 2,
-    "DISPLAY_STANDARD": 3,
-    "SHOPPING_PRODUCT": 4,
-    "VIDEO_RESPONSIVE": 9,
-}
+AD_GROUP_TYPE_TO_ENUM: dict[str, int] = dict(AD_GROUP_TYPE.numbers)
 
 DEVICE_TYPE_TO_CRITERION: dict[str, int] = {
     "MOBILE": 30001,
@@ -46,7 +44,7 @@ DEVICE_TYPE_TO_CRITERION: dict[str, int] = {
     "TABLET": 30002,
 }
 
-BUDGET_DELIVERY_STANDARD = 2
+BUDGET_DELIVERY_STANDARD = BUDGET_DELIVERY_METHOD["STANDARD"]
 
 BIDDING_STRATEGY_MAP: dict[str, str] = {
     "MANUAL_CPC": "manual_cpc",
@@ -57,32 +55,13 @@ BIDDING_STRATEGY_MAP: dict[str, str] = {
     "MAXIMIZE_CLICKS": "maximize_clicks",
 }
 
-ASSET_TYPE_TO_ENUM: dict[str, int] = {
-    "TEXT": 4,
-    "IMAGE": 5,
-    "YOUTUBE_VIDEO": 2,
-    "MEDIA_BUNDLE": 3,
-    "CALL_TO_ACTION": 30,
-}
+ASSET_TYPE_TO_ENUM: dict[str, int] = dict(ASSET_TYPE.numbers)
 
-ASSET_FIELD_TYPE_TO_ENUM: dict[str, int] = {
-    "HEADLINE": 2,
-    "DESCRIPTION": 3,
-    "LONG_HEADLINE": 19,
-    "BUSINESS_NAME": 12,
-    "MARKETING_IMAGE": 4,
-    "SQUARE_MARKETING_IMAGE": 11,
-    "LOGO": 5,
-    "LANDSCAPE_LOGO": 14,
-    "YOUTUBE_VIDEO": 7,
-    "CALL_TO_ACTION_SELECTION": 20,
-}
+ASSET_FIELD_TYPE_TO_ENUM: dict[str, int] = dict(ASSET_FIELD_TYPE.numbers)
 
-LISTING_GROUP_FILTER_TYPE_TO_ENUM: dict[str, int] = {
-    "UNIT_INCLUDED": 2,
-    "UNIT_EXCLUDED": 3,
-    "SUBDIVISION": 4,
-}
+LISTING_GROUP_FILTER_TYPE_TO_ENUM: dict[str, int] = dict(
+    LISTING_GROUP_FILTER_TYPE.numbers
+)
 
 
 def _resource_name(customer_id: str, resource: str, resource_id: str) -> str:
@@ -0,0 +1,164 @@
+"""Chunked, concurrent execution of large mutate operation streams."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Sequence
+
+from google_ads_mcp.partial_failure import OperationFailure, operation_errors
+from google_ads_mcp.utils.errors import GoogleAdsMCPError
+
+if TYPE_CHECKING:
+    from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
+
+logger = logging.getLogger(__name__)
+
+# GoogleAdsService.Mutate accepts at most 10,000 operations per request.
+MAX_MUTATE_OPERATIONS = 10_000
+
+DEFAULT_CHUNK_SIZE = 5_000
+DEFAULT_CONCURRENCY = 4
+
+
+@dataclass
+class BulkMutateResult:
+    """Outcome of a :meth:`BulkMutator.run`, merged over all chunks.
+
+    ``failures`` are sorted by ``index``, the position of the operation in
+    the input stream; ``errors`` holds messages the API did not tie to an
+    operation.
+    """
+
+    total: int = 0
+    chunks: int = 0
+    failures: list[OperationFailure] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        return self.total - len(self.failures)
+
+    @property
+    def failed_indexes(self) -> list[int]:
+        return [f.index for f in self.failures]
+
+    @property
+    def failed_items(self) -> list[Any]:
+        return [f.item for f in self.failures]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": len(self.failures),
+            "chunks": self.chunks,
+            "failures": [f.to_dict() for f in self.failures],
+            "errors": self.errors,
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+        }
+
+
+class BulkMutator:
+    """Send an arbitrarily long stream of MutateOperations for one customer.
+
+    Operations (as produced by ``google_ads_mcp.builders.operations``) are
+    cut into chunks of ``chunk_size`` (at most :data:`MAX_MUTATE_OPERATIONS`)
+    and sent with ``partial_failure=True``, up to ``max_concurrency`` chunks
+    at a time. The stream is consumed lazily, so generators are never fully
+    materialized. Every request still goes through the wrapper's retry and
+    quota handling.
+
+    Rejected operations are reported with their index in the whole stream;
+    a chunk that fails as a whole (e.g. quota exhausted) marks all of its
+    operations failed and does not stop the other chunks.
+    """
+
+    def __init__(
+        self,
+        client: AsyncGoogleAdsClientWrapper,
+        chunk_size: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> None:
+        if chunk_size is None:
+            chunk_size = getattr(client, "mutate_chunk_size", DEFAULT_CHUNK_SIZE)
+        if max_concurrency is None:
+            max_concurrency = getattr(client, "mutate_concurrency", DEFAULT_CONCURRENCY)
+        self.client = client
+        self.chunk_size = max(1, min(int(chunk_size), MAX_MUTATE_OPERATIONS))
+        self.max_concurrency = max(1, int(max_concurrency))
+
+    async def run(
+        self,
+        customer_id: str,
+        operations: Iterable[Any],
+        items: Sequence[Any] | None = None,
+    ) -> BulkMutateResult:
+        """Mutate all ``operations`` and collect per-operation failures.
+
+        Args:
+            customer_id: Google Ads customer ID.
+            operations: MutateOperations, in any iterable.
+            items: Optional inputs parallel to ``operations`` (e.g. keyword
+                texts), reported alongside failed operations.
+        """
+        started = time.monotonic()
+        result = BulkMutateResult()
+        chunks = self._chunks(operations)
+
+        async def worker() -> None:
+            for offset, chunk in chunks:
+                result.chunks += 1
+                result.total += len(chunk)
+                for index, error in (await self._send(customer_id, chunk)).items():
+                    if index is None or not 0 <= index < len(chunk):
+                        result.errors.append(error)
+                        continue
+                    position = offset + index
+                    item = items[position] if items is not None else None
+                    result.failures.append(OperationFailure(position, item, error))
+
+        await asyncio.gather(*(worker() for _ in range(self.max_concurrency)))
+        result.failures.sort(key=lambda f: f.index)
+        result.elapsed_seconds = time.monotonic() - started
+        logger.info(
+            "Bulk mutate for %s: %d operations in %d chunks, %d failed (%.1fs)",
+            customer_id, result.total, result.chunks,
+            len(result.failures), result.elapsed_seconds,
+        )
+        return result
+
+    def _chunks(self, operations: Iterable[Any]) -> Iterator[tuple[int, list[Any]]]:
+        iterator = iter(operations)
+        offset = 0
+        while chunk := list(itertools.islice(iterator, self.chunk_size)):
+            yield offset, chunk
+            offset += len(chunk)
+
+    async def _send(
+        self, customer_id: str, chunk: list[Any]
+    ) -> dict[int | None, str]:
+        try:
+            response = await self.client.amutate(
+                customer_id, chunk, partial_failure=True
+            )
+        except GoogleAdsMCPError as exc:
+            return {index: str(exc) for index in range(len(chunk))}
+        return operation_errors(self.client.client, response)
+
+
+def bulk_settings_from_env() -> tuple[int, int]:
+    """Read bulk mutate chunk size and concurrency from the environment.
+
+    ``GOOGLE_ADS_MUTATE_CHUNK_SIZE`` is the number of operations per request
+    (default 5000, capped at 10000); ``GOOGLE_ADS_MUTATE_CONCURRENCY`` the
+    chunks in flight per bulk call (default 4).
+    """
+    chunk_size = int(os.environ.get("GOOGLE_ADS_MUTATE_CHUNK_SIZE", str(DEFAULT_CHUNK_SIZE)))
+    concurrency = int(os.environ.get("GOOGLE_ADS_MUTATE_CONCURRENCY", str(DEFAULT_CONCURRENCY)))
+    return max(1, min(chunk_size, MAX_MUTATE_OPERATIONS)), max(1, concurrency)
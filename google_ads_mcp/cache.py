@@ -0,0 +1,263 @@
+"""In-memory TTL + LRU cache for GAQL query results."""
+
+from __future__ import annotations
+
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterable
+
+# Seconds a result stays fresh, keyed by the GAQL FROM resource. Account
+# structure changes rarely; click and change-history data keeps arriving.
+DEFAULT_RESOURCE_TTLS: dict[str, float] = {
+    "customer": 3600.0,
+    "customer_client": 3600.0,
+    "merchant_center_link": 3600.0,
+    "label": 1800.0,
+    "campaign_label": 1800.0,
+    "ad_group_label": 1800.0,
+    "ad_group_ad_label": 1800.0,
+    "ad_group_criterion_label": 1800.0,
+    "customer_label": 1800.0,
+    "user_interest": 86400.0,
+    "change_event": 60.0,
+    "click_view": 60.0,
+}
+
+_STRING_LITERAL = re.compile(r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")""")
+_WHITESPACE = re.compile(r"\s+")
+_FROM_RESOURCE = re.compile(r"\bFROM\s+([a-z_]+)", re.IGNORECASE)
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace and lowercase a GAQL query outside string literals.
+
+    Literals keep their case because GAQL string comparisons are
+    case-sensitive (``campaign.name = 'Brand'`` differs from ``'brand'``).
+    """
+    parts = _STRING_LITERAL.split(query)
+    for i in range(0, len(parts), 2):
+        parts[i] = _WHITESPACE.sub(" ", parts[i]).lower()
+    return "".join(parts).strip()
+
+
+def query_resource(query: str) -> str:
+    """Return the resource named in a GAQL FROM clause ('' if none)."""
+    match = _FROM_RESOURCE.search(query)
+    return match.group(1).lower() if match else ""
+
+
+def estimate_rows_size(rows: Iterable[Any]) -> int:
+    """Approximate memory footprint of result rows, in bytes.
+
+    Uses the serialized protobuf size when available (proto-plus or raw
+    messages) and ``sys.getsizeof`` otherwise.
+    """
+    total = 0
+    for row in rows:
+        try:
+            pb = type(row).pb(row) if hasattr(type(row), "pb") else row
+            total += int(pb.ByteSize())
+        except Exception:
+            total += sys.getsizeof(row)
+    return total
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of cache counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": self.entries,
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    size: int
+    customer_id: str
+    complete: bool = True
+
+
+class QueryCache:
+    """Thread-safe TTL cache with LRU eviction under a memory budget.
+
+    Keys are built by :meth:`make_key` from the customer ID, the login
+    customer ID and the normalized query, plus an optional variant (e.g.
+    the page coordinates of a paginated read). Entries expire after the
+    TTL configured for the query's FROM resource; when the total size
+    exceeds ``max_bytes`` the least recently used entries are dropped.
+
+    Args:
+        max_bytes: Memory budget for cached values.
+        default_ttl: TTL in seconds for resources not in ``ttls``.
+        ttls: Per-resource TTL overrides, merged over
+            :data:`DEFAULT_RESOURCE_TTLS`. A TTL of 0 disables caching
+            for that resource.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: float = 300.0,
+        ttls: dict[str, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = {**DEFAULT_RESOURCE_TTLS, **(ttls or {})}
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        customer_id: str,
+        login_customer_id: str | None,
+        query: str,
+        *variant: Hashable,
+    ) -> tuple[Hashable, ...]:
+        """Build a cache key; ``variant`` distinguishes reads of the same query."""
+        return (customer_id, login_customer_id or "", normalize_query(query), *variant)
+
+    def ttl_for(self, query: str) -> float:
+        """TTL in seconds for ``query``, based on its FROM resource."""
+        return self.ttls.get(query_resource(query), self.default_ttl)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for ``key``, or None on miss or expiry."""
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return entry.value
+
+    def put(
+        self,
+        key: Hashable,
+        query: str,
+        value: Any,
+        size: int,
+        complete: bool = True,
+    ) -> None:
+        """Store ``value`` under ``key`` with the TTL of ``query``'s resource.
+
+        Values larger than the whole budget, or for resources with a TTL of
+        0, are not stored.
+        """
+        ttl = self.ttl_for(query)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        entry = _Entry(
+            value=value,
+            expires_at=self._clock() + ttl,
+            size=size,
+            customer_id=str(key[0]) if isinstance(key, tuple) else "",
+            complete=complete,
+        )
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = entry
+            self._size += size
+            while self._size > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+                self._evictions += 1
+
+    def get_rows(self, key: Hashable, max_rows: int | None) -> list[Any] | None:
+        """Return up to ``max_rows`` cached rows for a full-result read.
+
+        A result cached from a truncated read only answers requests it fully
+        covers; anything larger counts as a miss.
+        """
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None and not entry.complete and (
+                max_rows is None or max_rows > len(entry.value)
+            ):
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return list(entry.value[:max_rows])
+
+    def put_rows(
+        self,
+        key: Hashable,
+        query: str,
+        rows: list[Any],
+        max_rows: int | None,
+    ) -> None:
+        """Store the rows of a full-result read made with ``max_rows``."""
+        complete = max_rows is None or len(rows) < max_rows
+        self.put(key, query, list(rows), estimate_rows_size(rows), complete)
+
+    def invalidate(self, customer_id: str | None = None) -> int:
+        """Drop all entries, or only those of ``customer_id``. Returns the count."""
+        with self._lock:
+            keys = [
+                key for key, entry in self._entries.items()
+                if customer_id is None or entry.customer_id == customer_id
+            ]
+            for key in keys:
+                self._discard(key)
+            return len(keys)
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the hit/miss counters and memory usage."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_bytes=self._size,
+                max_bytes=self.max_bytes,
+            )
+
+    def _lookup(self, key: Hashable) -> _Entry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            self._discard(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
@@ -2,39 +2,113 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import itertools
+import math
 import time
 import logging
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Hashable, Iterator
 
 from google.ads.googleads.client import GoogleAdsClient
 from google.ads.googleads.errors import GoogleAdsException
 from google.api_core.exceptions import InternalServerError, ServiceUnavailable
 
+from google_ads_mcp.batcher import BatchedMutateResponse, MutationBatcher
+from google_ads_mcp.cache import QueryCache, estimate_rows_size, normalize_query
+from google_ads_mcp.hashing import IdentifierHasher
+from google_ads_mcp.quota import QuotaLimiter
+from google_ads_mcp.history import aggregate_rows, parse_daily_report
+from google_ads_mcp.partial_failure import operation_errors
+from google_ads_mcp.retry import RetryPolicy, RetryState, parse_retry_delay
+from google_ads_mcp.sharding import ShardSize, shard_ranges
+from google_ads_mcp.singleflight import SingleFlight
 from google_ads_mcp.utils.errors import (
     GoogleAdsMCPError,
     AuthenticationError,
     QuotaExhaustedError,
     ResourceNotFoundError,
+    TransientError,
     format_google_ads_error,
 )
 
+if TYPE_CHECKING:
+    from google_ads_mcp.history import HistoryCache
+
 logger = logging.getLogger(__name__)
 
 _TRANSIENT_ERRORS = (InternalServerError, ServiceUnavailable, ConnectionError)
 
 
+@dataclass(frozen=True)
+class QueryPage:
+    """One slice of a GAQL result set plus the position right after it.
+
+    ``next_page_token`` / ``next_position`` locate the first unread row:
+    the API page token of the page holding it (empty for the first page)
+    and its index within that page. ``skipped`` counts rows passed over
+    to reach the requested start position.
+    """
+
+    rows: list[Any] = field(default_factory=list)
+    next_page_token: str = ""
+    next_position: int = 0
+    has_more: bool = False
+    skipped: int = 0
+
+
 class GoogleAdsClientWrapper:
-    """Wrapper around GoogleAdsClient providing query, mutate, and retry logic."""
+    """Wrapper around GoogleAdsClient providing query, mutate, and retry logic.
+
+    When a :class:`QueryCache` is given, ``query`` and ``query_page``
+    results are served from it while fresh, and every mutate drops the
+    cached results of the mutated customer. ``history`` is the closed-day
+    store used by date-ranged report tools (see ``google_ads_mcp.history``).
+    With a :class:`QuotaLimiter`, every API request (retries included)
+    first books its operations and waits for its turn.
+
+    Transient errors and temporary quota errors are retried according to
+    ``retry_policy`` (by default built from ``max_retries`` and
+    ``base_delay``), honoring the delay the API asks for.
+
+    With a :class:`SingleFlight`, identical ``query``/``query_page`` calls
+    (same customer and normalized query) that overlap in time share one
+    API request.
+
+    ``protobuf_client`` is an optional second client created with
+    ``use_proto_plus=False``. Reads made with ``protobuf=True`` go through
+    it and return raw protobuf rows, which are much cheaper to iterate
+    than proto-plus wrappers; only callers that read rows through
+    accessors supporting both (see ``google_ads_mcp.columns``) should ask
+    for them. Without it, ``protobuf=True`` returns proto-plus rows.
+    """
 
     def __init__(
         self,
         client: GoogleAdsClient,
         max_retries: int = 3,
         base_delay: float = 1.0,
+        cache: QueryCache | None = None,
+        history: HistoryCache | None = None,
+        quota: QuotaLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        singleflight: SingleFlight | None = None,
+        protobuf_client: GoogleAdsClient | None = None,
     ) -> None:
         self.client = client
-        self.max_retries = max_retries
-        self.base_delay = base_delay
+        self.protobuf_client = protobuf_client
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=max_retries, base_delay=base_delay
+        )
+        self.max_retries = self.retry_policy.max_retries
+        self.base_delay = self.retry_policy.base_delay
+        self.cache = cache
+        self.history = history
+        self.quota = quota
+        self.singleflight = singleflight
 
     def get_service(self, service_name: str) -> Any:
         """Get a Google Ads API service by name."""
@@ -45,6 +119,9 @@ class GoogleAdsClientWrapper:
         customer_id: str,
         query: str,
         page_size: int = 10000,
+        max_rows: int | None = None,
+        bypass_cache: bool = False,
+        protobuf: bool = False,
     ) -> list[Any]:
         """Execute a GAQL SELECT query with retry.
 
@@ -52,6 +129,11 @@ class GoogleAdsClientWrapper:
             customer_id: Google Ads customer ID (10 digits, no dashes).
             query: GAQL query string (SELECT only).
             page_size: Results per page.
+            max_rows: Stop reading after this many rows (None reads all).
+                Pages past the last needed row are never requested.
+            bypass_cache: Always read from the API (the fresh result still
+                replaces the cached one).
+            protobuf: Return raw protobuf rows (see class docstring).
 
         Returns:
             List of result rows.
@@ -60,15 +142,142 @@ class GoogleAdsClientWrapper:
             ValueError: If query is not a SELECT.
             GoogleAdsMCPError: On API errors.
         """
-        stripped = query.strip()
-        if not stripped.upper().startswith("SELECT"):
-            raise ValueError(
-                f"Solo query SELECT consentite. Ricevuto: '{stripped[:30]}...'"
-            )
+        stripped = self._validate_select(query)
+        rows_format = self._rows_format(protobuf)
+        key = self._cache_key(customer_id, stripped, "rows", *rows_format)
+        if key is not None and not bypass_cache:
+            cached = self.cache.get_rows(key, max_rows)
+            if cached is not None:
+                return cached
+        rows = self._run_shared(
+            self._flight_key(
+                customer_id, stripped, "rows", page_size, max_rows, *rows_format
+            ),
+            functools.partial(
+                self._execute_with_retry,
+                self._do_query, customer_id, stripped, page_size, max_rows,
+                bool(rows_format), customer_id=customer_id,
+            ),
+        )
+        if key is not None:
+            self.cache.put_rows(key, stripped, rows, max_rows)
+        return rows
+
+    def iter_query(
+        self,
+        customer_id: str,
+        query: str,
+        page_size: int = 10000,
+        max_rows: int | None = None,
+    ) -> Iterator[Any]:
+        """Execute a GAQL SELECT query and stream its rows.
+
+        Pages are fetched lazily as the iterator advances, so a consumer
+        that stops early never pulls the rest of the result set. The first
+        page is read eagerly; every page request is retried like
+        :meth:`query`.
+
+        Args:
+            customer_id: Google Ads customer ID (10 digits, no dashes).
+            query: GAQL query string (SELECT only).
+            page_size: Results per page.
+            max_rows: Stop after this many rows (None streams all).
+
+        Returns:
+            Iterator over result rows.
+
+        Raises:
+            ValueError: If query is not a SELECT.
+            GoogleAdsMCPError: On API errors, also while iterating.
+        """
+        stripped = self._validate_select(query)
+        first = self._execute_with_retry(
+            self._do_search_page, customer_id, stripped, page_size, "",
+            customer_id=customer_id,
+        )
+        return itertools.islice(
+            self._iter_pages(customer_id, stripped, page_size, first), max_rows
+        )
+
+    def query_stream(self, customer_id: str, query: str) -> Iterator[Any]:
+        """Execute a GAQL SELECT query through ``search_stream``.
+
+        The whole result set arrives over a single server-streaming call
+        instead of one request per page, and rows are yielded batch by
+        batch, so memory stays flat no matter how many rows are read.
+        Opening the stream is retried like :meth:`query`; an interrupted
+        stream is not resumed (there is no page token to resume from).
+
+        Args:
+            customer_id: Google Ads customer ID (10 digits, no dashes).
+            query: GAQL query string (SELECT only).
+
+        Returns:
+            Iterator over result rows.
+
+        Raises:
+            ValueError: If query is not a SELECT.
+            GoogleAdsMCPError: On API errors, also while iterating.
+        """
+        stripped = self._validate_select(query)
+        stream = self._execute_with_retry(
+            self._do_search_stream, customer_id, stripped, customer_id=customer_id
+        )
+        return self._iter_stream(stream)
+
+    def query_page(
+        self,
+        customer_id: str,
+        query: str,
+        limit: int,
+        page_token: str = "",
+        position: int = 0,
+        page_size: int = 10000,
+        bypass_cache: bool = False,
+        protobuf: bool = False,
+    ) -> QueryPage:
+        """Read ``limit`` rows starting at a page token and in-page position.
+
+        Only the API pages that hold the requested slice are fetched, so
+        resuming from a previous :class:`QueryPage` costs one slice rather
+        than re-reading everything before it.
 
-        return self._execute_with_retry(
-            self._do_query, customer_id, stripped, page_size
+        Args:
+            customer_id: Google Ads customer ID (10 digits, no dashes).
+            query: GAQL query string (SELECT only).
+            limit: Maximum rows to return.
+            page_token: API page token to start from ('' = first page).
+            position: Rows to skip from the start of that page.
+            page_size: Results per page.
+            bypass_cache: Always read from the API.
+            protobuf: Return raw protobuf rows (see class docstring).
+
+        Returns:
+            QueryPage with the rows and the position of the next unread row.
+        """
+        stripped = self._validate_select(query)
+        rows_format = self._rows_format(protobuf)
+        key = self._page_cache_key(
+            customer_id, stripped, limit, page_token, position, *rows_format
+        )
+        if key is not None and not bypass_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        page = self._run_shared(
+            self._flight_key(
+                customer_id, stripped, "page", limit, page_token, position,
+                page_size, *rows_format,
+            ),
+            functools.partial(
+                self._execute_with_retry,
+                self._do_query_page,
+                customer_id, stripped, limit, page_token, position, page_size,
+                bool(rows_format), customer_id=customer_id,
+            ),
         )
+        self._cache_page(key, stripped, page)
+        return page
 
     def mutate(
         self,
@@ -86,20 +295,181 @@ class GoogleAdsClientWrapper:
         Returns:
             Mutate response.
         """
-        return self._execute_with_retry(
-            self._do_mutate, customer_id, operations, partial_failure
+        try:
+            return self._execute_with_retry(
+                self._do_mutate, customer_id, operations, partial_failure,
+                customer_id=customer_id, cost=len(operations) or 1,
+            )
+        finally:
+            self._invalidate_cache(customer_id)
+
+    def _cache_key(
+        self, customer_id: str, query: str, *variant: Any
+    ) -> tuple[Any, ...] | None:
+        if self.cache is None:
+            return None
+        login = getattr(self.client, "login_customer_id", None)
+        return self.cache.make_key(
+            customer_id, str(login) if login else None, query, *variant
         )
 
-    def _do_query(
-        self, customer_id: str, query: str, page_size: int
-    ) -> list[Any]:
-        service = self.get_service("GoogleAdsService")
-        request = self.client.get_type("SearchGoogleAdsRequest")
+    def _page_cache_key(
+        self,
+        customer_id: str,
+        query: str,
+        limit: int,
+        page_token: str,
+        position: int,
+        *variant: Any,
+    ) -> tuple[Any, ...] | None:
+        return self._cache_key(
+            customer_id, query, "page", page_token, position, limit, *variant
+        )
+
+    def _cache_page(
+        self, key: tuple[Any, ...] | None, query: str, page: QueryPage
+    ) -> None:
+        if key is not None:
+            self.cache.put(key, query, page, estimate_rows_size(page.rows))
+
+    def _invalidate_cache(self, customer_id: str) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(customer_id)
+
+    def _rows_format(self, protobuf: bool) -> tuple[str, ...]:
+        """Cache/flight key variant of the row representation actually returned."""
+        return ("protobuf",) if protobuf and self.protobuf_client is not None else ()
+
+    def _flight_key(self, customer_id: str, query: str, *variant: Any) -> Hashable:
+        login = getattr(self.client, "login_customer_id", None)
+        return (
+            customer_id, str(login) if login else None, normalize_query(query), *variant
+        )
+
+    def _run_shared(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Run ``func`` through the single-flight group, if configured."""
+        if self.singleflight is None:
+            return func()
+        result, shared = self.singleflight.do(key, func)
+        # Each caller gets its own list, as with an unshared request.
+        return list(result) if shared and isinstance(result, list) else result
+
+    @staticmethod
+    def _validate_select(query: str) -> str:
+        """Strip a GAQL query and ensure it is a SELECT."""
+        stripped = query.strip()
+        if not stripped.upper().startswith("SELECT"):
+            raise ValueError(
+                f"Solo query SELECT consentite. Ricevuto: '{stripped[:30]}...'"
+            )
+        return stripped
+
+    def _do_search(
+        self,
+        customer_id: str,
+        query: str,
+        page_size: int,
+        page_token: str = "",
+        protobuf: bool = False,
+    ) -> Any:
+        client = self.protobuf_client if protobuf else self.client
+        service = client.get_service("GoogleAdsService")
+        request = client.get_type("SearchGoogleAdsRequest")
         request.customer_id = customer_id
         request.query = query
         request.page_size = page_size
-        response = service.search(request=request)
-        return list(response)
+        if page_token:
+            request.page_token = page_token
+        return service.search(request=request)
+
+    def _do_search_page(
+        self, customer_id: str, query: str, page_size: int, page_token: str
+    ) -> Any:
+        """Single API page of a search, starting at ``page_token``."""
+        response = self._do_search(customer_id, query, page_size, page_token)
+        return next(iter(response.pages))
+
+    def _iter_pages(
+        self, customer_id: str, query: str, page_size: int, page: Any
+    ) -> Iterator[Any]:
+        """Yield the rows of ``page`` and of the pages after it, one request each."""
+        while True:
+            yield from page.results
+            if not page.next_page_token:
+                return
+            page = self._execute_with_retry(
+                self._do_search_page, customer_id, query, page_size,
+                page.next_page_token, customer_id=customer_id,
+            )
+
+    def _do_search_stream(self, customer_id: str, query: str) -> Any:
+        service = self.get_service("GoogleAdsService")
+        request = self.client.get_type("SearchGoogleAdsStreamRequest")
+        request.customer_id = customer_id
+        request.query = query
+        return service.search_stream(request=request)
+
+    def _iter_stream(self, stream: Any) -> Iterator[Any]:
+        try:
+            for batch in stream:
+                yield from batch.results
+        except GoogleAdsException as exc:
+            self._handle_google_ads_exception(exc)
+        except _TRANSIENT_ERRORS as exc:
+            raise GoogleAdsMCPError(f"Stream interrotto: {exc}") from exc
+
+    def _do_query(
+        self,
+        customer_id: str,
+        query: str,
+        page_size: int,
+        max_rows: int | None = None,
+        protobuf: bool = False,
+    ) -> list[Any]:
+        response = self._do_search(customer_id, query, page_size, protobuf=protobuf)
+        return list(itertools.islice(response, max_rows))
+
+    def _do_query_page(
+        self,
+        customer_id: str,
+        query: str,
+        limit: int,
+        page_token: str,
+        position: int,
+        page_size: int,
+        protobuf: bool = False,
+    ) -> QueryPage:
+        response = self._do_search(
+            customer_id, query, page_size, page_token, protobuf=protobuf
+        )
+        token = page_token
+        to_skip = position
+        rows: list[Any] = []
+
+        for page in response.pages:
+            results = page.results
+            size = len(results)
+            if to_skip >= size:
+                to_skip -= size
+            else:
+                end = min(size, to_skip + limit - len(rows))
+                rows.extend(results[to_skip:end])
+                to_skip = 0
+                if len(rows) >= limit:
+                    if end < size:
+                        return QueryPage(
+                            rows, token, end, has_more=True, skipped=position
+                        )
+                    next_token = page.next_page_token
+                    return QueryPage(
+                        rows, next_token, 0,
+                        has_more=bool(next_token), skipped=position,
+                    )
+            token = page.next_page_token
+            if not token:
+                break
+
+        return QueryPage(rows, skipped=position - to_skip)
 
     def _do_mutate(
         self,
@@ -114,52 +484,105 @@ class GoogleAdsClientWrapper:
             partial_failure=partial_failure,
         )
 
-    def _execute_with_retry(self, func: Any, *args: Any) -> Any:
-        """Execute a function with exponential backoff retry on transient errors."""
-        last_exception: Exception | None = None
+    def _execute_with_retry(
+        self,
+        func: Any,
+        *args: Any,
+        customer_id: str | None = None,
+        cost: int = 1,
+    ) -> Any:
+        """Execute a function, retrying transient and temporary quota errors.
 
-        for attempt in range(self.max_retries + 1):
+        Each attempt books ``cost`` operations for ``customer_id`` with the
+        quota limiter (if any) before calling ``func``.
+        """
+        state = self.retry_policy.start()
+        while True:
+            if self.quota is not None:
+                self.quota.acquire(customer_id, cost)
             try:
                 return func(*args)
             except GoogleAdsException as exc:
-                self._handle_google_ads_exception(exc)
+                time.sleep(self._quota_retry_delay(state, exc))
             except _TRANSIENT_ERRORS as exc:
-                last_exception = exc
-                if attempt < self.max_retries:
-                    delay = self.base_delay * (2**attempt)
-                    logger.warning(
-                        "Transient error (attempt %d/%d), retrying in %.1fs: %s",
-                        attempt + 1,
-                        self.max_retries + 1,
-                        delay,
-                        exc,
-                    )
-                    time.sleep(delay)
-                else:
-                    raise GoogleAdsMCPError(
-                        f"Errore dopo {self.max_retries + 1} tentativi: {exc}"
-                    ) from exc
+                time.sleep(self._retry_delay(state, exc))
 
-        raise GoogleAdsMCPError(
-            f"Errore inaspettato dopo retry: {last_exception}"
+    def _retry_delay(self, state: RetryState, exc: Exception) -> float:
+        """Return the backoff delay for a transient error, or raise if exhausted."""
+        delay = state.next_delay()
+        if delay is None:
+            raise TransientError(
+                f"Errore dopo {state.attempts} tentativi: {exc}"
+            ) from exc
+        self._log_retry(state, delay, exc)
+        return delay
+
+    def _quota_retry_delay(self, state: RetryState, exc: GoogleAdsException) -> float:
+        """Return the delay before retrying a quota error, or raise.
+
+        Quota errors are retried when the API says how long to wait
+        (``quota_error_details.retry_delay``) or the exhaustion is only
+        temporary, as long as the wait fits the retry budget. Any other
+        error is converted by :meth:`_handle_google_ads_exception`.
+        """
+        quota_errors = [
+            self._error_code_name(error).lower()
+            for error in exc.failure.errors
+            if self._is_quota_error(error)
+        ]
+        if not quota_errors:
+            self._handle_google_ads_exception(exc)
+
+        retry_after = parse_retry_delay(exc.failure)
+        delay = None
+        if retry_after is not None or any("temporarily" in c for c in quota_errors):
+            delay = state.next_delay(retry_after)
+        if delay is None:
+            raise QuotaExhaustedError(
+                format_google_ads_error("QUOTA_ERROR", self._failure_message(exc)),
+                retry_after_seconds=math.ceil(retry_after) if retry_after else 60,
+            ) from exc
+        self._log_retry(state, delay, exc)
+        return delay
+
+    def _log_retry(self, state: RetryState, delay: float, exc: Exception) -> None:
+        logger.warning(
+            "Transient error (attempt %d/%d), retrying in %.1fs: %s",
+            state.attempts,
+            self.retry_policy.max_retries + 1,
+            delay,
+            exc,
         )
 
+    @staticmethod
+    def _error_code_name(error: Any) -> str:
+        error_code = error.error_code
+        return str(error_code).split(".")[-1] if error_code else "UNKNOWN"
+
+    @classmethod
+    def _is_quota_error(cls, error: Any) -> bool:
+        code_name = cls._error_code_name(error).lower()
+        return "quota" in code_name or "rate" in code_name
+
+    @staticmethod
+    def _failure_message(exc: GoogleAdsException) -> str:
+        return "; ".join(e.message for e in exc.failure.errors if e.message) or str(exc)
+
     def _handle_google_ads_exception(self, exc: GoogleAdsException) -> None:
         """Convert GoogleAdsException to appropriate MCP error."""
         for error in exc.failure.errors:
-            error_code = error.error_code
             message = error.message
-
-            code_name = str(error_code).split(".")[-1] if error_code else "UNKNOWN"
+            code_name = self._error_code_name(error)
 
             if "authentication" in code_name.lower() or "authorization" in code_name.lower():
                 raise AuthenticationError(
                     format_google_ads_error("AUTHENTICATION_ERROR", message)
                 ) from exc
-            if "quota" in code_name.lower() or "rate" in code_name.lower():
+            if self._is_quota_error(error):
+                retry_after = parse_retry_delay(exc.failure)
                 raise QuotaExhaustedError(
                     format_google_ads_error("QUOTA_ERROR", message),
-                    retry_after_seconds=60,
+                    retry_after_seconds=math.ceil(retry_after) if retry_after else 60,
                 ) from exc
             if "not_found" in code_name.lower():
                 raise ResourceNotFoundError(
@@ -169,3 +592,307 @@ class GoogleAdsClientWrapper:
         raise GoogleAdsMCPError(
             format_google_ads_error("REQUEST_ERROR", str(exc))
         ) from exc
+
+
+class AsyncGoogleAdsClientWrapper(GoogleAdsClientWrapper):
+    """Asyncio front-end for GoogleAdsClientWrapper.
+
+    The Google Ads client library is gRPC-blocking, so every API call runs in
+    a dedicated worker pool while retry backoff awaits ``asyncio.sleep``.
+    The event loop stays free to serve other tool calls while requests are
+    in flight.
+
+    ``shard_size`` / ``shard_concurrency`` configure :meth:`aquery_sharded`,
+    which splits long date-ranged reports into concurrent sub-range queries.
+    ``mutate_chunk_size`` / ``mutate_concurrency`` configure the
+    :class:`~google_ads_mcp.bulk.BulkMutator` used by bulk mutation tools.
+    With ``mutate_batch_window`` > 0 (seconds), :meth:`amutate_batched`
+    merges small mutations of the same customer issued within the window
+    into one request (see :class:`~google_ads_mcp.batcher.MutationBatcher`).
+    ``hasher`` normalizes and hashes Customer Match identifiers in a
+    process pool (see :class:`~google_ads_mcp.hashing.IdentifierHasher`).
+    """
+
+    def __init__(
+        self,
+        client: GoogleAdsClient,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_workers: int = 32,
+        cache: QueryCache | None = None,
+        history: HistoryCache | None = None,
+        quota: QuotaLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        singleflight: SingleFlight | None = None,
+        shard_size: ShardSize | None = None,
+        shard_concurrency: int = 4,
+        mutate_chunk_size: int = 5000,
+        mutate_concurrency: int = 4,
+        mutate_batch_window: float = 0.0,
+        mutate_batch_max_operations: int = 1000,
+        hasher: IdentifierHasher | None = None,
+        protobuf_client: GoogleAdsClient | None = None,
+    ) -> None:
+        super().__init__(
+            client,
+            max_retries=max_retries,
+            base_delay=base_delay,
+            cache=cache,
+            history=history,
+            quota=quota,
+            retry_policy=retry_policy,
+            singleflight=singleflight,
+            protobuf_client=protobuf_client,
+        )
+        self.max_workers = max_workers
+        self.shard_size = shard_size
+        self.shard_concurrency = shard_concurrency
+        self.mutate_chunk_size = mutate_chunk_size
+        self.mutate_concurrency = mutate_concurrency
+        self.batcher = (
+            MutationBatcher(
+                self._amutate_batch,
+                window_seconds=mutate_batch_window,
+                max_operations=mutate_batch_max_operations,
+            )
+            if mutate_batch_window > 0
+            else None
+        )
+        self.hasher = hasher if hasher is not None else IdentifierHasher()
+        self._executor: ThreadPoolExecutor | None = None
+
+    async def aquery(
+        self,
+        customer_id: str,
+        query: str,
+        page_size: int = 10000,
+        max_rows: int | None = None,
+        bypass_cache: bool = False,
+        protobuf: bool = False,
+    ) -> list[Any]:
+        """Async variant of :meth:`query`."""
+        stripped = self._validate_select(query)
+        rows_format = self._rows_format(protobuf)
+        key = self._cache_key(customer_id, stripped, "rows", *rows_format)
+        if key is not None and not bypass_cache:
+            cached = self.cache.get_rows(key, max_rows)
+            if cached is not None:
+                return cached
+        rows = await self._arun_shared(
+            self._flight_key(
+                customer_id, stripped, "rows", page_size, max_rows, *rows_format
+            ),
+            functools.partial(
+                self._aexecute_with_retry,
+                self._do_query, customer_id, stripped, page_size, max_rows,
+                bool(rows_format), customer_id=customer_id,
+            ),
+        )
+        if key is not None:
+            self.cache.put_rows(key, stripped, rows, max_rows)
+        return rows
+
+    async def aquery_page(
+        self,
+        customer_id: str,
+        query: str,
+        limit: int,
+        page_token: str = "",
+        position: int = 0,
+        page_size: int = 10000,
+        bypass_cache: bool = False,
+        protobuf: bool = False,
+    ) -> QueryPage:
+        """Async variant of :meth:`query_page`."""
+        stripped = self._validate_select(query)
+        rows_format = self._rows_format(protobuf)
+        key = self._page_cache_key(
+            customer_id, stripped, limit, page_token, position, *rows_format
+        )
+        if key is not None and not bypass_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        page = await self._arun_shared(
+            self._flight_key(
+                customer_id, stripped, "page", limit, page_token, position,
+                page_size, *rows_format,
+            ),
+            functools.partial(
+                self._aexecute_with_retry,
+                self._do_query_page,
+                customer_id, stripped, limit, page_token, position, page_size,
+                bool(rows_format), customer_id=customer_id,
+            ),
+        )
+        self._cache_page(key, stripped, page)
+        return page
+
+    def shards_for(
+        self, query: str, shard_size: ShardSize | None = None
+    ) -> list[tuple[date, date]]:
+        """Date shards :meth:`aquery_sharded` would use ([] = not shardable)."""
+        size = shard_size or self.shard_size
+        report = parse_daily_report(query)
+        if not size or report is None:
+            return []
+        return shard_ranges(report.start, report.end, size)
+
+    async def aquery_sharded(
+        self,
+        customer_id: str,
+        query: str,
+        shard_size: ShardSize | None = None,
+        max_concurrency: int | None = None,
+        bypass_cache: bool = False,
+        protobuf: bool = False,
+    ) -> list[Any]:
+        """Run a ``segments.date BETWEEN`` report as concurrent date shards.
+
+        The range is split into week/month/N-day shards, each read with
+        :meth:`aquery` (so cache, coalescing, rate limiting and retry apply
+        per shard) with at most ``max_concurrency`` in flight. Shard rows
+        are then summed per entity and ratio metrics recomputed, as for the
+        closed-day history. Queries that cannot be aggregated this way, or
+        fit in a single shard, run as one :meth:`aquery`.
+
+        Args:
+            customer_id: Google Ads customer ID (10 digits, no dashes).
+            query: GAQL query string (SELECT only).
+            shard_size: 'week', 'month' or days (default: ``self.shard_size``).
+            max_concurrency: Shards in flight (default: ``self.shard_concurrency``).
+            bypass_cache: Always read from the API.
+            protobuf: Read raw protobuf rows (see :class:`GoogleAdsClientWrapper`).
+
+        Returns:
+            Aggregated rows, ordered by the query's ORDER BY.
+        """
+        stripped = self._validate_select(query)
+        spans = self.shards_for(stripped, shard_size)
+        if len(spans) < 2:
+            return await self.aquery(
+                customer_id, stripped, bypass_cache=bypass_cache, protobuf=protobuf
+            )
+
+        report = parse_daily_report(stripped)
+        semaphore = asyncio.Semaphore(max_concurrency or self.shard_concurrency)
+
+        async def read(start: date, end: date) -> list[Any]:
+            async with semaphore:
+                return await self.aquery(
+                    customer_id, report.range_query_for(start, end),
+                    bypass_cache=bypass_cache, protobuf=protobuf,
+                )
+
+        shards = await asyncio.gather(*(read(start, end) for start, end in spans))
+        logger.debug("Merged %d date shards for %s", len(spans), customer_id)
+        return aggregate_rows([row for rows in shards for row in rows], report)
+
+    async def amutate(
+        self,
+        customer_id: str,
+        operations: list[Any],
+        partial_failure: bool = False,
+    ) -> Any:
+        """Async variant of :meth:`mutate`."""
+        try:
+            return await self._aexecute_with_retry(
+                self._do_mutate, customer_id, operations, partial_failure,
+                customer_id=customer_id, cost=len(operations) or 1,
+            )
+        finally:
+            self._invalidate_cache(customer_id)
+
+    async def amutate_batched(
+        self, customer_id: str, operations: list[Any]
+    ) -> BatchedMutateResponse | Any:
+        """Mutate independent operations, sharing a request when batching is on.
+
+        Without a batcher this is :meth:`amutate`. With one, the operations
+        join the customer's pending batch and the call returns the responses
+        of its own operations, raising if any of them was rejected.
+        """
+        if self.batcher is None:
+            return await self.amutate(customer_id, operations)
+        return await self.batcher.submit(customer_id, operations)
+
+    async def _amutate_batch(
+        self, customer_id: str, operations: list[Any]
+    ) -> tuple[list[Any], dict[int | None, str]]:
+        response = await self.amutate(customer_id, operations, partial_failure=True)
+        return (
+            list(response.mutate_operation_responses),
+            operation_errors(self.client, response),
+        )
+
+    async def acall(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run an arbitrary blocking service call off the event loop, with retry.
+
+        Use this for services without a dedicated wrapper method (e.g.
+        KeywordPlanIdeaService). Pagers must be consumed inside ``func`` so
+        that follow-up page fetches also happen in the worker thread.
+        Such calls count against the developer token's quota only.
+        """
+        return await self._aexecute_with_retry(
+            functools.partial(func, *args, **kwargs)
+        )
+
+    async def arun(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run blocking local work off the event loop, without retry or quota.
+
+        Use this for helpers that only touch local storage or that call this
+        wrapper's synchronous methods themselves, which already retry and
+        book quota per API request.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), functools.partial(func, *args, **kwargs)
+        )
+
+    def close(self) -> None:
+        """Shut down the worker pools and the history store."""
+        if self.history is not None:
+            self.history.close()
+        self.hasher.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _arun_shared(
+        self, key: Hashable, func: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Async counterpart of :meth:`_run_shared`."""
+        if self.singleflight is None:
+            return await func()
+        result, shared = await self.singleflight.ado(key, func)
+        return list(result) if shared and isinstance(result, list) else result
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="google-ads",
+            )
+        return self._executor
+
+    async def _aexecute_with_retry(
+        self,
+        func: Any,
+        *args: Any,
+        customer_id: str | None = None,
+        cost: int = 1,
+    ) -> Any:
+        """Async counterpart of _execute_with_retry using asyncio.sleep."""
+        loop = asyncio.get_running_loop()
+        state = self.retry_policy.start()
+        while True:
+            if self.quota is not None:
+                await self.quota.aacquire(customer_id, cost)
+            try:
+                return await loop.run_in_executor(
+                    self._get_executor(), functools.partial(func, *args)
+                )
+            except GoogleAdsException as exc:
+                await asyncio.sleep(self._quota_retry_delay(state, exc))
+            except _TRANSIENT_ERRORS as exc:
+                await asyncio.sleep(self._retry_delay(state, exc))
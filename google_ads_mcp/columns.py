@@ -0,0 +1,245 @@
+"""Columnar extraction of GAQL result rows.
+
+A report tool describes its output once as a :class:`RowExtractor` of
+:class:`Field` specs. :meth:`RowExtractor.extract` walks the rows column by
+column into typed arrays: ints for counters and micros, floats for ratios,
+interned names for enums. Each parent message (``row.metrics``,
+``row.campaign``...) is resolved once per row and shared by all its fields.
+Display formatting (currency, percentages, rounding) is applied only by
+:meth:`ColumnBatch.records`, to the slice actually returned.
+
+Reports that are sorted or aggregated before formatting use the
+extractor's ``row_type``: a named tuple class generated per report
+(``CampaignPerfRow``, ``SearchTermRow``...) holding the raw typed values,
+with no per-row ``__dict__`` and no repeated keys. :meth:`RowExtractor.format`
+turns such rows back into display dicts.
+
+Rows may be proto-plus messages, raw protobuf messages (clients created
+with ``use_proto_plus=False``) or plain objects such as warehouse rows.
+Enums are named through the shared tables of :mod:`google_ads_mcp.enums`
+(raw protobuf enums, plain ints, through the field descriptor), and
+fields that proto-plus renames with a trailing underscore (``type_``)
+are read under their protobuf name.
+"""
+
+from __future__ import annotations
+
+from collections import namedtuple
+from dataclasses import dataclass
+from itertools import repeat
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Sequence
+
+from google_ads_mcp.enums import enum_name, field_enum_names
+from google_ads_mcp.utils.formatting import micros_to_currency
+
+# Column kinds: how values are stored and how they are displayed.
+FIELD_KINDS = ("str", "enum", "int", "micros", "float", "percent")
+
+
+def _to_str(values: list[Any]) -> list[str]:
+    return [str(v) if v is not None else "" for v in values]
+
+
+def _to_int(values: list[Any]) -> list[int]:
+    try:
+        return [int(v or 0) for v in values]
+    except (TypeError, ValueError):
+        return [_safe_number(int, v) for v in values]
+
+
+def _to_float(values: list[Any]) -> list[float]:
+    try:
+        return [float(v or 0) for v in values]
+    except (TypeError, ValueError):
+        return [_safe_number(float, v) for v in values]
+
+
+def _safe_number(cast: Callable[[Any], Any], value: Any) -> Any:
+    try:
+        return cast(value or 0)
+    except (TypeError, ValueError):
+        return cast(0)
+
+
+def _to_enum(values: list[Any], names: dict[Any, str] | None = None) -> list[str]:
+    names = dict(names or {})
+    out: list[str] = []
+    append = out.append
+    for value in values:
+        try:
+            name = names.get(value)
+            if name is None:
+                name = names[value] = enum_name(value)
+        except TypeError:  # unhashable
+            name = enum_name(value)
+        append(name)
+    return out
+
+
+_CONVERTERS: dict[str, Callable[[list[Any]], list[Any]]] = {
+    "str": _to_str,
+    "enum": _to_enum,
+    "int": _to_int,
+    "micros": _to_int,
+    "float": _to_float,
+    "percent": _to_float,
+}
+
+_FORMATTERS: dict[str, Callable[[Any], Any] | None] = {
+    "str": None,
+    "enum": None,
+    "int": None,
+    "micros": micros_to_currency,
+    "float": lambda v: round(v, 2),
+    "percent": "{:.2%}".format,
+}
+
+
+@dataclass(frozen=True)
+class Field:
+    """One output column read from a dotted row path.
+
+    Attributes:
+        key: Output key in the formatted records.
+        path: Attribute path in the row, e.g. ``metrics.cost_micros``.
+        kind: Storage and display type, one of :data:`FIELD_KINDS`.
+        format: Overrides the kind's display formatting.
+    """
+
+    key: str
+    path: str
+    kind: str = "str"
+    format: Callable[[Any], Any] | None = None
+
+    def __post_init__(self) -> None:
+        if self.kind not in _CONVERTERS:
+            raise ValueError(f"Unknown field kind {self.kind!r}")
+
+    @property
+    def formatter(self) -> Callable[[Any], Any] | None:
+        return self.format or _FORMATTERS[self.kind]
+
+
+def _format_columns(
+    keys: Sequence[str],
+    formatters: Sequence[Callable[[Any], Any] | None],
+    columns: Iterable[Sequence[Any]],
+) -> list[dict[str, Any]]:
+    cols = [
+        values if fmt is None else list(map(fmt, values))
+        for fmt, values in zip(formatters, columns)
+    ]
+    return [dict(zip(keys, values)) for values in zip(*cols)]
+
+
+class ColumnBatch:
+    """Typed column arrays extracted from a list of rows."""
+
+    def __init__(
+        self,
+        fields: Sequence[Field],
+        columns: dict[str, list[Any]],
+        size: int,
+        row_type: type[tuple] | None = None,
+    ) -> None:
+        self.fields = tuple(fields)
+        self.columns = columns
+        self.row_type = row_type
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def column(self, key: str) -> list[Any]:
+        """Raw (unformatted) values of one column."""
+        return self.columns[key]
+
+    def records(self, start: int = 0, stop: int | None = None) -> list[dict[str, Any]]:
+        """Formatted dicts for rows ``start:stop`` only."""
+        return _format_columns(
+            [f.key for f in self.fields],
+            [f.formatter for f in self.fields],
+            (self.columns[f.key][start:stop] for f in self.fields),
+        )
+
+    def rows(
+        self, *context: Any, start: int = 0, stop: int | None = None
+    ) -> list[tuple]:
+        """Raw values of rows ``start:stop`` as ``row_type`` tuples.
+
+        ``context`` gives the values of the extractor's leading context
+        fields, the same for every row (e.g. the account of a fan-out).
+        """
+        count = len(range(self._size)[start:stop])
+        cols = [self.columns[f.key][start:stop] for f in self.fields]
+        return list(map(
+            self.row_type._make,
+            zip(*(repeat(value, count) for value in context), *cols),
+        ))
+
+
+def _read(objects: list[Any], leaf: str) -> list[Any]:
+    try:
+        return list(map(attrgetter(leaf), objects))
+    except AttributeError:
+        if not leaf.endswith("_"):
+            raise
+        return list(map(attrgetter(leaf[:-1]), objects))
+
+
+class RowExtractor:
+    """Reusable columnar parser for one report shape.
+
+    Args:
+        fields: Output columns, in order.
+        name: Class name of the generated :attr:`row_type`.
+        context: Keys of leading :attr:`row_type` fields that are not read
+            from the rows but passed to :meth:`ColumnBatch.rows`.
+    """
+
+    def __init__(
+        self, *fields: Field, name: str = "Row", context: Sequence[str] = ()
+    ) -> None:
+        self.fields = fields
+        self.context = tuple(context)
+        self.row_type = namedtuple(name, [*self.context, *(f.key for f in fields)])
+
+    def extract(self, rows: Iterable[Any]) -> ColumnBatch:
+        """Read every field of ``rows`` into typed column arrays."""
+        rows = rows if isinstance(rows, list) else list(rows)
+        resolved: dict[str, list[Any]] = {"": rows}
+
+        def resolve(path: str) -> list[Any]:
+            values = resolved.get(path)
+            if values is None:
+                parent, _, leaf = path.rpartition(".")
+                values = resolved[path] = _read(resolve(parent), leaf)
+            return values
+
+        columns: dict[str, list[Any]] = {}
+        for f in self.fields:
+            values = resolve(f.path)
+            if f.kind == "enum" and values and type(values[0]) is int:
+                parent, _, leaf = f.path.rpartition(".")
+                names = field_enum_names(resolve(parent)[0], leaf)
+                columns[f.key] = _to_enum(values, names)
+            else:
+                columns[f.key] = _CONVERTERS[f.kind](values)
+        return ColumnBatch(self.fields, columns, len(rows), self.row_type)
+
+    def records(self, rows: Iterable[Any]) -> list[dict[str, Any]]:
+        """Extract ``rows`` and format all of them."""
+        return self.extract(rows).records()
+
+    def rows(self, rows: Iterable[Any], *context: Any) -> list[tuple]:
+        """Extract ``rows`` as unformatted :attr:`row_type` tuples."""
+        return self.extract(rows).rows(*context)
+
+    def format(self, rows: Sequence[tuple]) -> list[dict[str, Any]]:
+        """Formatted dicts of :attr:`row_type` tuples, e.g. once sorted."""
+        return _format_columns(
+            self.row_type._fields,
+            [None] * len(self.context) + [f.formatter for f in self.fields],
+            zip(*rows),
+        )
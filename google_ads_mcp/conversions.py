@@ -0,0 +1,367 @@
+"""Bulk upload of offline click conversions from NDJSON or CSV files."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterator
+
+from google_ads_mcp.partial_failure import OperationFailure, operation_errors
+from google_ads_mcp.utils.errors import GoogleAdsMCPError, is_transient_error
+
+if TYPE_CHECKING:
+    from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
+    from google_ads_mcp.outbox import Outbox
+
+logger = logging.getLogger(__name__)
+
+# ConversionUploadService.UploadClickConversions accepts at most 2,000
+# conversions per request.
+MAX_CONVERSIONS_PER_REQUEST = 2_000
+
+# Failed rows kept in the result; the rest are only counted.
+MAX_REPORTED_FAILURES = 100
+
+CLICK_ID_FIELDS = ("gclid", "gbraid", "wbraid")
+
+# Accepted column / key names for each ClickConversion field.
+_ALIASES = {
+    "conversion_date_time": ("conversion_date_time", "datetime", "date_time"),
+    "conversion_value": ("conversion_value", "value"),
+    "currency_code": ("currency_code", "currency"),
+    "conversion_action_id": ("conversion_action_id", "conversion_action"),
+}
+
+NDJSON_SUFFIXES = (".ndjson", ".jsonl", ".json")
+
+
+@dataclass(frozen=True)
+class ClickConversionInput:
+    """One validated row of a conversion file."""
+
+    line: int
+    conversion_action_id: str
+    click_id_field: str
+    click_id: str
+    conversion_date_time: str
+    conversion_value: float | None = None
+    currency_code: str = ""
+
+    @property
+    def dedupe_key(self) -> tuple[str, str, str]:
+        return (self.click_id, self.conversion_action_id, self.conversion_date_time)
+
+
+@dataclass
+class ClickConversionUpload:
+    """Progress and outcome of :func:`upload_click_conversions_file`.
+
+    ``failures`` are indexed by the file line of the rejected conversion
+    (invalid rows and rows rejected by the API alike). ``queued`` counts
+    conversions of batches that failed transiently and were stored in the
+    outbox for redelivery.
+    """
+
+    rows: int = 0
+    uploaded: int = 0
+    failed: int = 0
+    queued: int = 0
+    invalid_rows: int = 0
+    duplicate_rows: int = 0
+    requests: int = 0
+    failures: list[OperationFailure] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        return self.uploaded - self.failed - self.queued
+
+    def add_failure(self, line: int, error: str) -> None:
+        """Report a failed row (counting it is up to the caller)."""
+        if len(self.failures) < MAX_REPORTED_FAILURES:
+            self.failures.append(OperationFailure(line, f"line {line}", error))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "uploaded": self.uploaded,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "queued": self.queued,
+            "invalid_rows": self.invalid_rows,
+            "duplicate_rows": self.duplicate_rows,
+            "requests": self.requests,
+            "failures": [f.to_dict() for f in self.failures],
+            "errors": self.errors,
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+        }
+
+
+def _is_ndjson(path: str) -> bool:
+    return path.lower().endswith(NDJSON_SUFFIXES)
+
+
+def _field(record: dict[str, Any], name: str) -> str:
+    for alias in _ALIASES.get(name, (name,)):
+        value = record.get(alias)
+        if value is not None and str(value).strip():
+            return str(value).strip()
+    return ""
+
+
+def parse_click_conversion(
+    line: int, record: dict[str, Any], default_action_id: str = ""
+) -> ClickConversionInput:
+    """Validate one file record.
+
+    Exactly one of gclid, gbraid and wbraid must be set. A ``T`` between
+    date and time is accepted and replaced with the space the API expects.
+
+    Raises:
+        ValueError: If the record cannot be uploaded.
+    """
+    record = {str(k).strip().lower(): v for k, v in record.items() if k is not None}
+    click_ids = [(f, _field(record, f)) for f in CLICK_ID_FIELDS if _field(record, f)]
+    if len(click_ids) != 1:
+        raise ValueError("exactly one of gclid, gbraid or wbraid is required")
+    action_id = _field(record, "conversion_action_id") or default_action_id
+    if not action_id:
+        raise ValueError("missing conversion_action_id")
+    action_id = action_id.rsplit("/", 1)[-1]
+    date_time = _field(record, "conversion_date_time")
+    if not date_time:
+        raise ValueError("missing conversion_date_time")
+    if len(date_time) > 10 and date_time[10] == "T":
+        date_time = f"{date_time[:10]} {date_time[11:]}"
+    value_text = _field(record, "conversion_value")
+    try:
+        value = float(value_text) if value_text else None
+    except ValueError:
+        raise ValueError(f"invalid conversion_value {value_text!r}") from None
+    (click_field, click_id), = click_ids
+    return ClickConversionInput(
+        line=line,
+        conversion_action_id=action_id,
+        click_id_field=click_field,
+        click_id=click_id,
+        conversion_date_time=date_time,
+        conversion_value=value,
+        currency_code=_field(record, "currency_code").upper(),
+    )
+
+
+def check_conversions_file(path: str) -> None:
+    """Raise ValueError unless a CSV ``path`` has a click ID and a datetime column."""
+    if _is_ndjson(path):
+        return
+    with open(path, encoding="utf-8-sig", newline="") as fh:
+        columns = {
+            name.strip().lower() for name in csv.DictReader(fh).fieldnames or []
+        }
+    if not columns & set(CLICK_ID_FIELDS):
+        raise ValueError(
+            "The CSV needs a gclid, gbraid or wbraid column "
+            f"(found: {', '.join(sorted(columns)) or 'none'})."
+        )
+    if not columns & set(_ALIASES["conversion_date_time"]):
+        raise ValueError("The CSV needs a conversion_date_time or datetime column.")
+
+
+def read_conversion_records(path: str) -> Iterator[tuple[int, dict[str, Any] | str]]:
+    """Yield (line number, record) for each row of an NDJSON or CSV file.
+
+    Files ending in .ndjson, .jsonl or .json are read as one JSON object
+    per line; anything else as CSV with a header. A line that is not a
+    JSON object is yielded as its error message instead of a record.
+    """
+    with open(path, encoding="utf-8-sig", newline="") as fh:
+        if not _is_ndjson(path):
+            reader = csv.DictReader(fh)
+            for row in reader:
+                yield reader.line_num, row
+            return
+        for line, text in enumerate(fh, start=1):
+            if not text.strip():
+                continue
+            try:
+                record = json.loads(text)
+            except json.JSONDecodeError as exc:
+                yield line, f"invalid JSON: {exc.msg}"
+                continue
+            if not isinstance(record, dict):
+                yield line, "invalid JSON: expected an object"
+                continue
+            yield line, record
+
+
+class _ConversionReader:
+    """Thread-safe source of validated, deduplicated conversion batches."""
+
+    def __init__(
+        self,
+        path: str,
+        default_action_id: str,
+        batch_size: int,
+        result: ClickConversionUpload,
+    ) -> None:
+        self._records = read_conversion_records(path)
+        self._default_action_id = default_action_id
+        self._batch_size = batch_size
+        self._result = result
+        self._seen: set[tuple[str, str, str]] = set()
+        self._lock = threading.Lock()
+
+    def next_batch(self) -> list[ClickConversionInput]:
+        batch: list[ClickConversionInput] = []
+        with self._lock:
+            for line, record in self._records:
+                self._result.rows += 1
+                try:
+                    if isinstance(record, str):
+                        raise ValueError(record)
+                    conversion = parse_click_conversion(
+                        line, record, self._default_action_id
+                    )
+                except ValueError as exc:
+                    self._result.invalid_rows += 1
+                    self._result.add_failure(line, str(exc))
+                    continue
+                if conversion.dedupe_key in self._seen:
+                    self._result.duplicate_rows += 1
+                    continue
+                self._seen.add(conversion.dedupe_key)
+                batch.append(conversion)
+                if len(batch) >= self._batch_size:
+                    break
+        return batch
+
+    def close(self) -> None:
+        with self._lock:
+            self._records.close()
+
+
+def build_upload_request(
+    raw: Any, customer_id: str, conversions: list[ClickConversionInput]
+) -> Any:
+    """UploadClickConversionsRequest (partial failure) for one batch."""
+    request = raw.get_type("UploadClickConversionsRequest")
+    request.customer_id = customer_id
+    request.partial_failure = True
+    for item in conversions:
+        conversion = raw.get_type("ClickConversion")
+        conversion.conversion_action = (
+            f"customers/{customer_id}/conversionActions/{item.conversion_action_id}"
+        )
+        setattr(conversion, item.click_id_field, item.click_id)
+        conversion.conversion_date_time = item.conversion_date_time
+        if item.conversion_value is not None:
+            conversion.conversion_value = item.conversion_value
+        if item.currency_code:
+            conversion.currency_code = item.currency_code
+        request.conversions.append(conversion)
+    return request
+
+
+async def upload_click_conversions_file(
+    client: AsyncGoogleAdsClientWrapper,
+    customer_id: str,
+    path: str,
+    conversion_action_id: str = "",
+    batch_size: int = MAX_CONVERSIONS_PER_REQUEST,
+    max_concurrency: int = 4,
+    on_progress: Callable[[ClickConversionUpload], Awaitable[Any]] | None = None,
+    outbox: Outbox | None = None,
+) -> ClickConversionUpload:
+    """Upload every click conversion of ``path`` in concurrent batches.
+
+    The file is read in a worker thread one batch at a time, so memory
+    stays bounded by ``batch_size * max_concurrency`` rows (plus the
+    dedupe keys). Rows repeating a (click ID, conversion action, datetime)
+    already seen are dropped. Up to ``max_concurrency`` requests of at most
+    :data:`MAX_CONVERSIONS_PER_REQUEST` conversions are in flight, each
+    through the wrapper's retry and rate limiter, with partial failure
+    enabled; rejected and invalid rows are reported by file line. A batch
+    that fails as a whole marks all its rows failed and does not stop the
+    others; with an ``outbox``, batches failing transiently are queued for
+    redelivery instead.
+
+    Args:
+        conversion_action_id: Used for rows without their own
+            ``conversion_action_id``.
+
+    Raises:
+        ValueError: If a CSV file lacks the click ID or datetime column.
+    """
+    started = time.monotonic()
+    await client.arun(check_conversions_file, path)
+    raw = client.client
+    service = client.get_service("ConversionUploadService")
+    result = ClickConversionUpload()
+    reader = _ConversionReader(
+        path,
+        conversion_action_id,
+        max(1, min(batch_size, MAX_CONVERSIONS_PER_REQUEST)),
+        result,
+    )
+
+    def upload(conversions: list[ClickConversionInput]) -> Any:
+        request = build_upload_request(raw, customer_id, conversions)
+        return service.upload_click_conversions(request=request)
+
+    async def worker() -> None:
+        while True:
+            batch = await client.arun(reader.next_batch)
+            if not batch:
+                return
+            result.requests += 1
+            result.uploaded += len(batch)
+            try:
+                response = await client.acall(upload, batch)
+            except GoogleAdsMCPError as exc:
+                result.errors.append(str(exc))
+                if outbox is not None and is_transient_error(exc):
+                    await client.arun(
+                        outbox.enqueue_click_conversions, customer_id, batch, str(exc)
+                    )
+                    result.queued += len(batch)
+                else:
+                    result.failed += len(batch)
+                    for item in batch:
+                        result.add_failure(item.line, str(exc))
+            else:
+                for index, error in operation_errors(raw, response).items():
+                    if index is None or not 0 <= index < len(batch):
+                        result.errors.append(error)
+                    else:
+                        result.failed += 1
+                        result.add_failure(batch[index].line, error)
+            if on_progress is not None:
+                await on_progress(result)
+
+    workers = [
+        asyncio.ensure_future(worker()) for _ in range(max(1, max_concurrency))
+    ]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for task in workers:
+            task.cancel()
+        raise
+    finally:
+        reader.close()
+
+    result.failures.sort(key=lambda f: f.index)
+    result.elapsed_seconds = time.monotonic() - started
+    logger.info(
+        "Click conversions for %s: %d uploaded from %d rows in %d requests, "
+        "%d rejected, %d invalid, %d duplicates",
+        customer_id, result.uploaded, result.rows, result.requests,
+        result.failed, result.invalid_rows, result.duplicate_rows,
+    )
+    return result
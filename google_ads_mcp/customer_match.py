@@ -0,0 +1,353 @@
+"""Stream Customer Match members from a CSV file into an OfflineUserDataJob."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterator
+
+from google_ads_mcp.hashing import IdentifierHasher
+from google_ads_mcp.partial_failure import OperationFailure, operation_errors
+
+if TYPE_CHECKING:
+    from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
+
+logger = logging.getLogger(__name__)
+
+# Members per AddOfflineUserDataJobOperations request (the API accepts up
+# to 100,000 identifiers per request).
+DEFAULT_CHUNK_SIZE = 10_000
+MAX_CHUNK_SIZE = 100_000
+
+# Failed rows kept in the result; the rest are only counted.
+MAX_REPORTED_FAILURES = 100
+
+EMAIL_COLUMNS = ("email", "e-mail", "email_address")
+PHONE_COLUMNS = ("phone", "phone_number", "telefono")
+
+
+@dataclass
+class CustomerMatchUpload:
+    """Progress and outcome of :func:`upload_customer_match_file`.
+
+    ``failures`` are indexed by the CSV line of the rejected member.
+    """
+
+    job_resource_name: str = ""
+    rows: int = 0
+    members: int = 0
+    skipped_rows: int = 0
+    duplicate_rows: int = 0
+    chunks: int = 0
+    failed: int = 0
+    failures: list[OperationFailure] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job_resource_name": self.job_resource_name,
+            "rows": self.rows,
+            "members": self.members,
+            "skipped_rows": self.skipped_rows,
+            "duplicate_rows": self.duplicate_rows,
+            "chunks": self.chunks,
+            "failed": self.failed,
+            "failures": [f.to_dict() for f in self.failures],
+            "errors": self.errors,
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+        }
+
+
+def _column(fieldnames: list[str], candidates: tuple[str, ...]) -> str | None:
+    by_name = {name.strip().lower(): name for name in fieldnames}
+    for candidate in candidates:
+        if candidate in by_name:
+            return by_name[candidate]
+    return None
+
+
+def _member_columns(fieldnames: list[str]) -> tuple[str | None, str | None]:
+    email_col = _column(fieldnames, EMAIL_COLUMNS)
+    phone_col = _column(fieldnames, PHONE_COLUMNS)
+    if email_col is None and phone_col is None:
+        raise ValueError(
+            "The CSV needs an email and/or phone column "
+            f"(found: {', '.join(fieldnames) or 'none'})."
+        )
+    return email_col, phone_col
+
+
+def check_members_file(path: str) -> None:
+    """Raise ValueError unless ``path`` has an email and/or phone column."""
+    with open(path, encoding="utf-8-sig", newline="") as fh:
+        _member_columns(csv.DictReader(fh).fieldnames or [])
+
+
+def read_members(path: str) -> Iterator[tuple[int, str, str]]:
+    """Yield (line number, email, phone) for each CSV row, one at a time.
+
+    The header must contain an email and/or a phone column (matched case
+    insensitively, e.g. ``email``, ``phone``, ``phone_number``).
+
+    Raises:
+        ValueError: If the file has neither column.
+    """
+    with open(path, encoding="utf-8-sig", newline="") as fh:
+        reader = csv.DictReader(fh)
+        email_col, phone_col = _member_columns(reader.fieldnames or [])
+        for row in reader:
+            email = (row.get(email_col) or "").strip() if email_col else ""
+            phone = (row.get(phone_col) or "").strip() if phone_col else ""
+            yield reader.line_num, email, phone
+
+
+def build_member_operation(
+    raw: Any, hashed_email: str | None, hashed_phone: str | None, remove: bool
+) -> Any | None:
+    """OfflineUserDataJobOperation for one member, or None if it has no identifier.
+
+    ``hashed_email`` / ``hashed_phone`` are SHA-256 digests of normalized
+    values (see :mod:`google_ads_mcp.hashing`).
+    """
+    if not hashed_email and not hashed_phone:
+        return None
+    user_data = raw.get_type("UserData")
+    if hashed_email:
+        identifier = raw.get_type("UserIdentifier")
+        identifier.hashed_email = hashed_email
+        user_data.user_identifiers.append(identifier)
+    if hashed_phone:
+        identifier = raw.get_type("UserIdentifier")
+        identifier.hashed_phone_number = hashed_phone
+        user_data.user_identifiers.append(identifier)
+    operation = raw.get_type("OfflineUserDataJobOperation")
+    if remove:
+        operation.remove = user_data
+    else:
+        operation.create = user_data
+    return operation
+
+
+def build_user_data_request(
+    raw: Any,
+    customer_id: str,
+    user_list_id: str,
+    identifiers: list[tuple[str, str]],
+    remove: bool = False,
+) -> Any:
+    """UploadUserDataRequest adding (or removing) one member per identifier.
+
+    ``identifiers`` are (UserIdentifier field, SHA-256 digest) pairs, e.g.
+    ``("hashed_email", "...")``.
+    """
+    request = raw.get_type("UploadUserDataRequest")
+    request.customer_id = customer_id
+    for field_name, digest in identifiers:
+        user_data = raw.get_type("UserData")
+        user_identifier = raw.get_type("UserIdentifier")
+        setattr(user_identifier, field_name, digest)
+        user_data.user_identifiers.append(user_identifier)
+        operation = raw.get_type("UserDataOperation")
+        if remove:
+            operation.remove = user_data
+        else:
+            operation.create = user_data
+        request.operations.append(operation)
+    metadata = raw.get_type("CustomerMatchUserListMetadata")
+    metadata.user_list = f"customers/{customer_id}/userLists/{user_list_id}"
+    request.customer_match_user_list_metadata = metadata
+    return request
+
+
+@dataclass
+class _RawChunk:
+    lines: list[int] = field(default_factory=list)
+    emails: list[str] = field(default_factory=list)
+    phones: list[str] = field(default_factory=list)
+
+
+class _ChunkReader:
+    """Thread-safe source of raw member chunks from a CSV, with deduplication.
+
+    Members already seen in the file are dropped when operations are built;
+    the seen set keeps 32 bytes per member (a prefix of each digest).
+    """
+
+    def __init__(
+        self,
+        raw: Any,
+        path: str,
+        remove: bool,
+        chunk_size: int,
+        result: CustomerMatchUpload,
+    ) -> None:
+        self._members = read_members(path)
+        self._raw = raw
+        self._remove = remove
+        self._chunk_size = chunk_size
+        self._result = result
+        self._lock = threading.Lock()
+        self._seen: set[bytes] = set()
+
+    def next_chunk(self) -> _RawChunk:
+        chunk = _RawChunk()
+        with self._lock:
+            for line, email, phone in self._members:
+                self._result.rows += 1
+                if not email and not phone:
+                    self._result.skipped_rows += 1
+                    continue
+                chunk.lines.append(line)
+                chunk.emails.append(email)
+                chunk.phones.append(phone)
+                if len(chunk.lines) >= self._chunk_size:
+                    break
+        return chunk
+
+    def build_operations(
+        self,
+        chunk: _RawChunk,
+        hashed_emails: list[str | None],
+        hashed_phones: list[str | None],
+    ) -> tuple[list[int], list[Any]]:
+        lines: list[int] = []
+        operations: list[Any] = []
+        for line, hashed_email, hashed_phone in zip(
+            chunk.lines, hashed_emails, hashed_phones
+        ):
+            if not hashed_email and not hashed_phone:
+                with self._lock:
+                    self._result.skipped_rows += 1
+                continue
+            key = bytes.fromhex((hashed_email or "0" * 32)[:32]) + bytes.fromhex(
+                (hashed_phone or "0" * 32)[:32]
+            )
+            with self._lock:
+                if key in self._seen:
+                    self._result.duplicate_rows += 1
+                    continue
+                self._seen.add(key)
+            lines.append(line)
+            operations.append(build_member_operation(
+                self._raw, hashed_email, hashed_phone, self._remove
+            ))
+        return lines, operations
+
+    def close(self) -> None:
+        with self._lock:
+            self._members.close()
+
+
+async def upload_customer_match_file(
+    client: AsyncGoogleAdsClientWrapper,
+    customer_id: str,
+    user_list_id: str,
+    path: str,
+    remove: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_concurrency: int = 4,
+    on_progress: Callable[[CustomerMatchUpload], Awaitable[Any]] | None = None,
+    hasher: IdentifierHasher | None = None,
+) -> CustomerMatchUpload:
+    """Create a Customer Match job for ``path``, upload it in chunks and run it.
+
+    The file is read in a worker thread, one chunk at a time, so memory
+    stays bounded by ``chunk_size * max_concurrency`` members whatever the
+    file size. Up to ``max_concurrency`` chunks are uploaded at once with
+    partial failure enabled; rejected members are reported by CSV line.
+    Identifiers are normalized and hashed by ``hasher`` (default: the
+    client's), in worker processes for large chunks; rows without a valid
+    identifier are skipped and repeated members are uploaded once.
+    The job is started without waiting for Google to process it.
+
+    Raises:
+        ValueError: If the file has no email or phone column.
+    """
+    started = time.monotonic()
+    await client.arun(check_members_file, path)
+    raw = client.client
+    hasher = hasher or client.hasher
+    service = client.get_service("OfflineUserDataJobService")
+    result = CustomerMatchUpload()
+
+    job = raw.get_type("OfflineUserDataJob")
+    job.type_ = raw.enums.OfflineUserDataJobTypeEnum.CUSTOMER_MATCH_USER_LIST
+    job.customer_match_user_list_metadata.user_list = (
+        f"customers/{customer_id}/userLists/{user_list_id}"
+    )
+    response = await client.acall(
+        service.create_offline_user_data_job, customer_id=customer_id, job=job
+    )
+    result.job_resource_name = response.resource_name
+
+    reader = _ChunkReader(
+        raw, path, remove, max(1, min(chunk_size, MAX_CHUNK_SIZE)), result
+    )
+
+    def add_operations(operations: list[Any]) -> Any:
+        request = raw.get_type("AddOfflineUserDataJobOperationsRequest")
+        request.resource_name = result.job_resource_name
+        request.enable_partial_failure = True
+        for operation in operations:
+            request.operations.append(operation)
+        return service.add_offline_user_data_job_operations(request=request)
+
+    async def worker() -> None:
+        while True:
+            chunk = await client.arun(reader.next_chunk)
+            if not chunk.lines:
+                return
+            hashed_emails, hashed_phones = await asyncio.gather(
+                hasher.ahash("email", chunk.emails),
+                hasher.ahash("phone", chunk.phones),
+            )
+            lines, operations = await client.arun(
+                reader.build_operations, chunk, hashed_emails, hashed_phones
+            )
+            if not operations:
+                continue
+            response = await client.acall(add_operations, operations)
+            result.chunks += 1
+            result.members += len(operations)
+            for index, error in operation_errors(raw, response).items():
+                if index is None or not 0 <= index < len(lines):
+                    result.errors.append(error)
+                    continue
+                result.failed += 1
+                if len(result.failures) < MAX_REPORTED_FAILURES:
+                    line = lines[index]
+                    result.failures.append(
+                        OperationFailure(line, f"line {line}", error)
+                    )
+            if on_progress is not None:
+                await on_progress(result)
+
+    workers = [
+        asyncio.ensure_future(worker()) for _ in range(max(1, max_concurrency))
+    ]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for task in workers:
+            task.cancel()
+        raise
+    finally:
+        reader.close()
+
+    if result.members:
+        await client.acall(
+            service.run_offline_user_data_job, resource_name=result.job_resource_name
+        )
+    result.failures.sort(key=lambda f: f.index)
+    result.elapsed_seconds = time.monotonic() - started
+    logger.info(
+        "Customer Match job %s: %d members from %d rows in %d chunks, %d rejected",
+        result.job_resource_name, result.members, result.rows,
+        result.chunks, result.failed,
+    )
+    return result
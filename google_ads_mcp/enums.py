@@ -0,0 +1,193 @@
+"""Registry of Google Ads enum names and numbers.
+
+Every decoding of an enum value into its display name (``ENABLED``,
+``EXACT``...) goes through :func:`enum_name`, backed by number -> name
+dicts built once per enum type and shared by all tools:
+
+* proto-plus rows carry ``IntEnum`` members, decoded by their type;
+* raw protobuf rows carry plain ints, decoded through the field's
+  ``EnumDescriptor`` (see :func:`names_for`) or an :class:`EnumTable`;
+* mocks and warehouse rows carry strings such as ``CampaignStatus.ENABLED``.
+
+``str()`` is never used on an ``IntEnum``: since Python 3.11 it returns
+the number, not ``CampaignStatus.ENABLED``.
+
+The :class:`EnumTable` constants take the numbers the mutate builders
+write from the google-ads enum classes, so their ``*_TO_ENUM`` maps and
+the decoders share one source.
+"""
+
+from __future__ import annotations
+
+import enum
+import sys
+from importlib import import_module
+from typing import Any, Iterable, Mapping
+
+from google.ads.googleads.client import _DEFAULT_VERSION
+
+# Enums of the API version GoogleAdsClient uses when none is configured,
+# which is how auth.create_client builds it.
+_ENUMS_MODULE = f"google.ads.googleads.{_DEFAULT_VERSION}.enums"
+
+# Every Google Ads enum reserves these two numbers.
+_RESERVED = {"UNSPECIFIED": 0, "UNKNOWN": 1}
+
+# Number -> name tables, keyed by enum class, EnumDescriptor or table name.
+_NAMES: dict[Any, dict[int, str]] = {}
+
+
+class EnumTable:
+    """Name <-> number table of one Google Ads enum.
+
+    Attributes:
+        name: Enum type name, e.g. ``CampaignStatus``.
+        numbers: Settable names -> numbers (without UNSPECIFIED/UNKNOWN).
+        names: Numbers -> interned names, reserved values included.
+    """
+
+    def __init__(self, name: str, numbers: Mapping[str, int]) -> None:
+        self.name = name
+        self.numbers: dict[str, int] = dict(numbers)
+        self.names: dict[int, str] = {
+            number: sys.intern(key)
+            for key, number in {**_RESERVED, **self.numbers}.items()
+        }
+        _NAMES[name] = self.names
+
+    @classmethod
+    def from_library(cls, name: str, settable: Iterable[str]) -> EnumTable:
+        """Table of the google-ads enum ``name``, numbered by the library.
+
+        ``numbers`` holds only the ``settable`` names, while ``names``
+        decodes every member of the enum. An unknown name raises
+        ``KeyError`` at import time instead of writing a wrong number.
+        """
+        enum_type = getattr(import_module(_ENUMS_MODULE), f"{name}Enum")
+        members = getattr(enum_type, name)
+        table = cls(name, {key: members[key].value for key in settable})
+        table.names.update(names_for(members))
+        return table
+
+    def __getitem__(self, name: str) -> int:
+        return self.numbers[name]
+
+    def __repr__(self) -> str:
+        return f"EnumTable({self.name!r})"
+
+
+def names_for(enum_type: Any) -> dict[int, str]:
+    """Cached number -> name dict of an enum type.
+
+    ``enum_type`` may be an :class:`EnumTable`, its name, a proto-plus /
+    ``IntEnum`` class or a protobuf ``EnumDescriptor``. Unknown types
+    yield an empty dict.
+    """
+    if isinstance(enum_type, EnumTable):
+        return enum_type.names
+    names = _NAMES.get(enum_type)
+    if names is None:
+        if hasattr(enum_type, "values_by_number"):  # protobuf EnumDescriptor
+            names = {
+                number: sys.intern(value.name)
+                for number, value in enum_type.values_by_number.items()
+            }
+        elif isinstance(enum_type, type) and issubclass(enum_type, enum.Enum):
+            names = {member.value: sys.intern(member.name) for member in enum_type}
+        else:
+            return {}
+        _NAMES[enum_type] = names
+    return names
+
+
+def field_enum_names(message: Any, field: str) -> dict[int, str]:
+    """Number -> name dict of the enum ``field`` of a raw protobuf message.
+
+    proto-plus renamed fields (``type_``) are looked up under their
+    protobuf name. Non-enum fields yield an empty dict.
+    """
+    fields = getattr(getattr(message, "DESCRIPTOR", None), "fields_by_name", {})
+    descriptor = fields.get(field) or fields.get(field.rstrip("_"))
+    enum_type = getattr(descriptor, "enum_type", None)
+    return names_for(enum_type) if enum_type is not None else {}
+
+
+def enum_name(value: Any, enum_type: Any = None) -> str:
+    """Display name of an enum value: ``CampaignStatus.ENABLED`` -> ``ENABLED``.
+
+    Plain ints are decoded with ``enum_type`` (see :func:`names_for`) and
+    fall back to their digits when the number is unknown.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, enum.Enum):
+        name = names_for(type(value)).get(value.value)
+        return name if name is not None else sys.intern(value.name)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return names_for(enum_type).get(value) or str(value)
+    name = getattr(value, "name", None)
+    if not isinstance(name, str):
+        name = str(value).rsplit(".", 1)[-1]
+    return sys.intern(name)
+
+
+_ENTITY_STATUS = ("ENABLED", "PAUSED", "REMOVED")
+
+CAMPAIGN_STATUS = EnumTable.from_library("CampaignStatus", _ENTITY_STATUS)
+AD_GROUP_STATUS = EnumTable.from_library("AdGroupStatus", _ENTITY_STATUS)
+AD_GROUP_AD_STATUS = EnumTable.from_library("AdGroupAdStatus", _ENTITY_STATUS)
+AD_GROUP_CRITERION_STATUS = EnumTable.from_library(
+    "AdGroupCriterionStatus", _ENTITY_STATUS
+)
+ASSET_GROUP_STATUS = EnumTable.from_library("AssetGroupStatus", _ENTITY_STATUS)
+
+KEYWORD_MATCH_TYPE = EnumTable.from_library(
+    "KeywordMatchType", ("EXACT", "PHRASE", "BROAD")
+)
+
+ADVERTISING_CHANNEL_TYPE = EnumTable.from_library("AdvertisingChannelType", (
+    "SEARCH",
+    "DISPLAY",
+    "SHOPPING",
+    "VIDEO",
+    "PERFORMANCE_MAX",
+    "DEMAND_GEN",
+))
+
+AD_GROUP_TYPE = EnumTable.from_library("AdGroupType", (
+    "SEARCH_STANDARD",
+    "DISPLAY_STANDARD",
+    "SHOPPING_PRODUCT_ADS",
+    "VIDEO_RESPONSIVE",
+))
+
+BUDGET_DELIVERY_METHOD = EnumTable.from_library(
+    "BudgetDeliveryMethod", ("STANDARD", "ACCELERATED")
+)
+
+ASSET_TYPE = EnumTable.from_library("AssetType", (
+    "YOUTUBE_VIDEO",
+    "MEDIA_BUNDLE",
+    "TEXT",
+    "IMAGE",
+    "CALL_TO_ACTION",
+))
+
+ASSET_FIELD_TYPE = EnumTable.from_library("AssetFieldType", (
+    "HEADLINE",
+    "DESCRIPTION",
+    "MARKETING_IMAGE",
+    "LOGO",
+    "YOUTUBE_VIDEO",
+    "SQUARE_MARKETING_IMAGE",
+    "BUSINESS_NAME",
+    "LANDSCAPE_LOGO",
+    "LONG_HEADLINE",
+    "CALL_TO_ACTION_SELECTION",
+))
+
+LISTING_GROUP_FILTER_TYPE = EnumTable.from_library("ListingGroupFilterType", (
+    "SUBDIVISION",
+    "UNIT_INCLUDED",
+    "UNIT_EXCLUDED",
+))
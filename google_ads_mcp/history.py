@@ -0,0 +1,580 @@
+"""Persistent cache of closed-day metrics for date-ranged GAQL reports.
+
+Metrics for a day stop changing once it falls outside the conversion lag
+window. :class:`HistoryCache` answers a ``segments.date BETWEEN`` report by
+splitting the range into closed days, read from a local SQLite store and
+fetched from the API only when missing or older than the TTL, and an open
+tail that is always re-queried. Daily rows are stored unfiltered by entity
+attributes (status, name...): those conditions are applied at read time
+against the current entities. Daily rows are then summed per entity and
+ratio metrics recomputed, so the result matches what the aggregated query
+would have returned.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any, Callable, Protocol
+
+from google_ads_mcp.cache import normalize_query
+from google_ads_mcp.sharding import shard_ranges
+
+if TYPE_CHECKING:
+    from google_ads_mcp.client import GoogleAdsClientWrapper
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LAG_DAYS = 30
+DEFAULT_TTL_DAYS = 7.0
+
+# Metrics that can be summed across days.
+ADDITIVE_METRICS = frozenset({
+    "impressions",
+    "clicks",
+    "cost_micros",
+    "interactions",
+    "engagements",
+    "conversions",
+    "conversions_value",
+    "all_conversions",
+    "all_conversions_value",
+    "view_through_conversions",
+    "video_views",
+})
+
+# Ratio metrics rebuilt from summed inputs: name -> (numerator, denominator, scale).
+DERIVED_METRICS: dict[str, tuple[str, str, float]] = {
+    "ctr": ("clicks", "impressions", 1.0),
+    "average_cpc": ("cost_micros", "clicks", 1.0),
+    "average_cpm": ("cost_micros", "impressions", 1000.0),
+    "average_cost": ("cost_micros", "interactions", 1.0),
+    "interaction_rate": ("interactions", "impressions", 1.0),
+    "engagement_rate": ("engagements", "impressions", 1.0),
+    "conversions_from_interactions_rate": ("conversions", "interactions", 1.0),
+    "cost_per_conversion": ("cost_micros", "conversions", 1.0),
+    "value_per_conversion": ("conversions_value", "conversions", 1.0),
+}
+
+_QUERY = re.compile(
+    r"^\s*SELECT\s+(?P<fields>.+?)\s+FROM\s+(?P<resource>[a-z_]+)"
+    r"(?:\s+WHERE\s+(?P<where>.+?))?"
+    r"(?:\s+ORDER\s+BY\s+(?P<order>.+?))?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+_DATE_RANGE = re.compile(
+    r"segments\.date\s+BETWEEN\s+'(\d{4}-\d{2}-\d{2})'\s+AND\s+'(\d{4}-\d{2}-\d{2})'",
+    re.IGNORECASE,
+)
+_RANGE_PLACEHOLDER = "segments.date BETWEEN '{start}' AND '{end}'"
+_LITERAL = re.compile(r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")""")
+_AND = re.compile(r"\s+AND\s+", re.IGNORECASE)
+_OPEN_BETWEEN = re.compile(r"\bBETWEEN\s+\S+$", re.IGNORECASE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history_days (
+    customer_id TEXT NOT NULL,
+    template TEXT NOT NULL,
+    day TEXT NOT NULL,
+    fetched_at REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (customer_id, template, day)
+);
+CREATE TABLE IF NOT EXISTS history_rows (
+    customer_id TEXT NOT NULL,
+    template TEXT NOT NULL,
+    day TEXT NOT NULL,
+    row BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_history_rows
+    ON history_rows (customer_id, template, day);
+"""
+
+
+class RowCodec(Protocol):
+    """Serializes result rows for the store and copies them for aggregation."""
+
+    def dumps(self, row: Any) -> bytes: ...
+
+    def loads(self, data: bytes) -> Any: ...
+
+
+class ProtoRowCodec:
+    """Codec for proto-plus ``GoogleAdsRow`` messages."""
+
+    def __init__(self, row_type: Any) -> None:
+        self.row_type = row_type
+
+    def dumps(self, row: Any) -> bytes:
+        return type(row).serialize(row)
+
+    def loads(self, data: bytes) -> Any:
+        return self.row_type.deserialize(data)
+
+
+@dataclass(frozen=True)
+class DailyReport:
+    """A date-ranged report query rewritten to read one row per entity per day.
+
+    ``template`` keeps only the date and segment conditions; ``filters``
+    holds the attribute conditions, applied at read time through
+    :attr:`entity_query`. ``range_template`` is the original query without
+    the date segment, i.e. one row per entity for a whole sub-range, used
+    to shard long ranges.
+    """
+
+    template: str
+    start: date
+    end: date
+    key_fields: tuple[str, ...]
+    additive: tuple[str, ...]
+    derived: tuple[str, ...]
+    order: tuple[tuple[str, bool], ...]
+    range_template: str = ""
+    filters: str = ""
+
+    def query_for(self, start: date, end: date) -> str:
+        return _with_range(self.template, start, end)
+
+    def range_query_for(self, start: date, end: date) -> str:
+        return _with_range(self.range_template, start, end)
+
+    @property
+    def entity_query(self) -> str:
+        """Query listing the entities that currently match :attr:`filters`."""
+        key = self.key_fields[0]
+        return f"select {key} from {key.rsplit('.', 1)[0]} where {self.filters}"
+
+    @property
+    def fingerprint(self) -> str:
+        return hashlib.sha256(self.template.encode("utf-8")).hexdigest()[:32]
+
+
+def parse_daily_report(query: str) -> DailyReport | None:
+    """Rewrite a ``segments.date BETWEEN`` report into its daily form.
+
+    Returns None when the query cannot be served from daily rows: no date
+    range, already segmented by date, a LIMIT clause, a condition on a
+    metric (it applies to the aggregated values, not to each day), or a
+    selected metric that is neither additive nor derivable from additive
+    ones.
+    """
+    match = _QUERY.match(query)
+    if match is None or re.search(r"\bLIMIT\b", query, re.IGNORECASE):
+        return None
+    where = match.group("where") or ""
+    date_match = _DATE_RANGE.search(where)
+    if date_match is None:
+        return None
+
+    fields = [f.strip() for f in match.group("fields").split(",") if f.strip()]
+    if any(f.lower() == "segments.date" for f in fields):
+        return None
+    metrics = [f.split(".", 1)[1] for f in fields if f.startswith("metrics.")]
+    if any(m not in ADDITIVE_METRICS and m not in DERIVED_METRICS for m in metrics):
+        return None
+
+    daily_where: list[str] = []
+    filters: list[str] = []
+    template_where = _DATE_RANGE.sub(lambda _: _RANGE_PLACEHOLDER, where, count=1)
+    for condition in _conditions(template_where):
+        field = condition.split(None, 1)[0].lower()
+        if field.startswith("metrics."):
+            return None
+        if condition == _RANGE_PLACEHOLDER or field.startswith("segments."):
+            daily_where.append(condition)
+        else:
+            filters.append(condition)
+
+    derived = tuple(m for m in metrics if m in DERIVED_METRICS)
+    additive = list(dict.fromkeys(m for m in metrics if m in ADDITIVE_METRICS))
+    for name in derived:
+        numerator, denominator, _ = DERIVED_METRICS[name]
+        for needed in (numerator, denominator):
+            if needed not in additive:
+                additive.append(needed)
+
+    resource = match.group("resource")
+    # One row per resource and segment; other attributes (names, statuses)
+    # follow the entity rather than split it, as in the aggregated query.
+    key_fields = (f"{resource}.resource_name",) + tuple(
+        f for f in fields if f.startswith("segments.")
+    )
+    select = ", ".join(
+        [f for f in fields if not f.startswith("metrics.")]
+        + [f"metrics.{m}" for m in (*additive, *derived)]
+    )
+    range_template = normalize_query(
+        f"SELECT {select} FROM {resource} WHERE {template_where}"
+    ).replace(_RANGE_PLACEHOLDER.lower(), _RANGE_PLACEHOLDER)
+    template = normalize_query(
+        f"SELECT segments.date, {select} FROM {resource} "
+        f"WHERE {' AND '.join(daily_where)}"
+    ).replace(_RANGE_PLACEHOLDER.lower(), _RANGE_PLACEHOLDER)
+
+    order: list[tuple[str, bool]] = []
+    for term in (match.group("order") or "").split(","):
+        parts = term.split()
+        if parts:
+            order.append((parts[0], len(parts) > 1 and parts[1].upper() == "DESC"))
+
+    return DailyReport(
+        template=template,
+        start=date.fromisoformat(date_match.group(1)),
+        end=date.fromisoformat(date_match.group(2)),
+        key_fields=key_fields,
+        additive=tuple(additive),
+        derived=derived,
+        order=tuple(order),
+        range_template=range_template,
+        filters=normalize_query(" AND ".join(filters)),
+    )
+
+
+def _conditions(where: str) -> list[str]:
+    """Split a WHERE clause on its top-level ANDs (GAQL has no OR)."""
+    # Mask literals so an AND inside a string is not taken as a separator.
+    masked = _LITERAL.sub(lambda m: "x" * len(m.group()), where)
+    conditions: list[str] = []
+    start = 0
+    for match in _AND.finditer(masked):
+        if _OPEN_BETWEEN.search(masked[start:match.start()]):
+            continue  # the AND of ``x BETWEEN a AND b``
+        conditions.append(where[start:match.start()].strip())
+        start = match.end()
+    conditions.append(where[start:].strip())
+    return [c for c in conditions if c]
+
+
+def _with_range(template: str, start: date, end: date) -> str:
+    return template.replace(
+        _RANGE_PLACEHOLDER,
+        f"segments.date BETWEEN '{start.isoformat()}' AND '{end.isoformat()}'",
+    )
+
+
+def _resolve(row: Any, path: str) -> Any:
+    value = row
+    for part in path.split("."):
+        value = getattr(value, part)
+    return value
+
+
+def copy_row(row: Any) -> Any:
+    """Deep copy of a result row (proto-plus, raw protobuf or plain object)."""
+    row_type = type(row)
+    if hasattr(row_type, "serialize") and hasattr(row_type, "deserialize"):
+        return row_type.deserialize(row_type.serialize(row))
+    if hasattr(row, "SerializeToString"):
+        return row_type.FromString(row.SerializeToString())
+    return copy.deepcopy(row)
+
+
+def aggregate_rows(
+    rows: list[Any],
+    report: DailyReport,
+    clone: Callable[[Any], Any] = copy_row,
+) -> list[Any]:
+    """Sum rows per entity, recompute ratios and apply the report's ORDER BY.
+
+    Attributes are taken from the last row of each entity, so pass rows in
+    chronological order to report current names and statuses. Input rows
+    are not modified: each entity's output row is a ``clone`` of its last one.
+    """
+    groups: dict[tuple[str, ...], list[Any]] = {}
+    for row in rows:
+        key = tuple(str(_resolve(row, f)) for f in report.key_fields)
+        groups.setdefault(key, []).append(row)
+
+    merged: list[Any] = []
+    for entity_rows in groups.values():
+        out = clone(entity_rows[-1])
+        totals = {
+            name: sum(getattr(r.metrics, name) or 0 for r in entity_rows)
+            for name in report.additive
+        }
+        for name, value in totals.items():
+            setattr(out.metrics, name, value)
+        for name in report.derived:
+            numerator, denominator, scale = DERIVED_METRICS[name]
+            den = totals[denominator]
+            setattr(out.metrics, name, totals[numerator] * scale / den if den else 0.0)
+        merged.append(out)
+
+    for path, descending in reversed(report.order):
+        merged.sort(key=lambda r: _resolve(r, path), reverse=descending)
+    return merged
+
+
+def _day_spans(days: list[date]) -> list[tuple[date, date]]:
+    """Group sorted days into contiguous (first, last) spans."""
+    spans: list[tuple[date, date]] = []
+    for day in days:
+        if spans and day == spans[-1][1] + timedelta(days=1):
+            spans[-1] = (spans[-1][0], day)
+        else:
+            spans.append((day, day))
+    return spans
+
+
+class HistoryCache:
+    """Serve date-ranged reports from stored closed days plus a live tail.
+
+    Args:
+        path: SQLite file for closed-day rows (created on first use).
+        codec: Row serializer, e.g. :class:`ProtoRowCodec`.
+        lag_days: Days before today still considered open, i.e. always
+            re-queried. Conversions keep being attributed to a day for as
+            long as the account's conversion window, so keep this at least
+            as long as that window.
+        ttl_days: Age after which a stored day is fetched again, picking
+            up late conversions beyond ``lag_days``. 0 keeps days forever.
+        today: Date source (injectable for tests).
+        clock: Wall-clock source for ``ttl_days`` (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        codec: RowCodec,
+        lag_days: int = DEFAULT_LAG_DAYS,
+        ttl_days: float = DEFAULT_TTL_DAYS,
+        today: Callable[[], date] = date.today,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.codec = codec
+        self.lag_days = lag_days
+        self.ttl_days = ttl_days
+        self._today = today
+        self._clock = clock
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def supports(self, query: str) -> bool:
+        """Whether ``query`` can be answered from daily rows."""
+        return parse_daily_report(query) is not None
+
+    def query(
+        self,
+        client: GoogleAdsClientWrapper,
+        customer_id: str,
+        query: str,
+        refresh: bool = False,
+    ) -> list[Any]:
+        """Return the aggregated rows of a date-ranged report query.
+
+        Closed days missing from the store, or stored more than ``ttl_days``
+        ago, are fetched (one request per contiguous gap) and persisted;
+        days inside the lag window are always re-queried. Attribute filters
+        are applied to the daily rows with one live :attr:`DailyReport.entity_query`.
+        ``refresh`` re-fetches every day of the range and bypasses the
+        client's result cache. Blocking: call it from a worker thread.
+
+        Raises:
+            ValueError: If the query is not supported (see :meth:`supports`).
+        """
+        report = parse_daily_report(query)
+        if report is None:
+            raise ValueError("Query not supported by the history cache.")
+
+        cutoff = self._today() - timedelta(days=self.lag_days)
+        closed_end = min(report.end, cutoff)
+        rows: list[Any] = []
+
+        if report.start <= closed_end:
+            self._fill_closed_days(
+                client, customer_id, report, report.start, closed_end, refresh
+            )
+            rows.extend(self._load(customer_id, report, report.start, closed_end))
+
+        tail_start = max(report.start, cutoff + timedelta(days=1))
+        if tail_start <= report.end:
+            rows.extend(client.query(
+                customer_id, report.query_for(tail_start, report.end),
+                bypass_cache=refresh,
+            ))
+
+        if report.filters:
+            key = report.key_fields[0]
+            matching = {
+                str(_resolve(row, key))
+                for row in client.query(
+                    customer_id, report.entity_query, bypass_cache=refresh
+                )
+            }
+            rows = [row for row in rows if str(_resolve(row, key)) in matching]
+        return self._aggregate(rows, report)
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+            columns = {
+                name for (_, name, *_) in self._conn.execute(
+                    "PRAGMA table_info(history_days)"
+                )
+            }
+            if "fetched_at" not in columns:
+                # Stores written before the TTL: their days count as expired.
+                self._conn.execute(
+                    "ALTER TABLE history_days "
+                    "ADD COLUMN fetched_at REAL NOT NULL DEFAULT 0"
+                )
+        return self._conn
+
+    def _fill_closed_days(
+        self,
+        client: GoogleAdsClientWrapper,
+        customer_id: str,
+        report: DailyReport,
+        start: date,
+        end: date,
+        refresh: bool = False,
+    ) -> None:
+        fresh_after = (
+            self._clock() - self.ttl_days * 86400 if self.ttl_days > 0 else -1.0
+        )
+        stored: set[str] = set()
+        if not refresh:
+            with self._lock:
+                stored = {
+                    day for (day,) in self._connection().execute(
+                        "SELECT day FROM history_days WHERE customer_id = ? "
+                        "AND template = ? AND day BETWEEN ? AND ? AND fetched_at >= ?",
+                        (
+                            customer_id, report.fingerprint,
+                            start.isoformat(), end.isoformat(), fresh_after,
+                        ),
+                    )
+                }
+        missing = [
+            start + timedelta(days=i)
+            for i in range((end - start).days + 1)
+            if (start + timedelta(days=i)).isoformat() not in stored
+        ]
+        spans = _day_spans(missing)
+        shard_size = getattr(client, "shard_size", None)
+        if shard_size:
+            spans = [
+                shard
+                for first, last in spans
+                for shard in shard_ranges(first, last, shard_size)
+            ]
+        if not spans:
+            return
+
+        def fetch(span: tuple[date, date]) -> list[Any]:
+            return client.query(
+                customer_id, report.query_for(*span), bypass_cache=True
+            )
+
+        # Long gaps (e.g. a first 365-day read) are fetched as concurrent shards.
+        workers = min(len(spans), getattr(client, "shard_concurrency", 1) or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for (span_start, span_end), fetched in zip(spans, pool.map(fetch, spans)):
+                self._store(customer_id, report, span_start, span_end, fetched)
+
+    def _store(
+        self,
+        customer_id: str,
+        report: DailyReport,
+        start: date,
+        end: date,
+        rows: list[Any],
+    ) -> None:
+        days = [
+            (start + timedelta(days=i)).isoformat()
+            for i in range((end - start).days + 1)
+        ]
+        encoded = [
+            (customer_id, report.fingerprint, str(row.segments.date), self.codec.dumps(row))
+            for row in rows
+        ]
+        fetched_at = self._clock()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "DELETE FROM history_rows WHERE customer_id = ? AND template = ? "
+                    "AND day BETWEEN ? AND ?",
+                    (customer_id, report.fingerprint, days[0], days[-1]),
+                )
+                conn.executemany(
+                    "INSERT INTO history_rows (customer_id, template, day, row) "
+                    "VALUES (?, ?, ?, ?)",
+                    encoded,
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO history_days "
+                    "(customer_id, template, day, fetched_at) VALUES (?, ?, ?, ?)",
+                    [
+                        (customer_id, report.fingerprint, day, fetched_at)
+                        for day in days
+                    ],
+                )
+        logger.debug(
+            "Stored %d rows for %s..%s (%s)", len(rows), days[0], days[-1], customer_id
+        )
+
+    def _load(
+        self,
+        customer_id: str,
+        report: DailyReport,
+        start: date,
+        end: date,
+    ) -> list[Any]:
+        with self._lock:
+            blobs = self._connection().execute(
+                "SELECT row FROM history_rows WHERE customer_id = ? AND template = ? "
+                "AND day BETWEEN ? AND ?",
+                (customer_id, report.fingerprint, start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return [self.codec.loads(blob) for (blob,) in blobs]
+
+    def _aggregate(self, rows: list[Any], report: DailyReport) -> list[Any]:
+        """Sum daily rows per entity, recompute ratios and apply ORDER BY."""
+        rows = sorted(rows, key=lambda r: str(r.segments.date))
+        return aggregate_rows(
+            rows, report, lambda row: self.codec.loads(self.codec.dumps(row))
+        )
+
+
+def history_from_env(codec: RowCodec) -> HistoryCache | None:
+    """Build a HistoryCache from environment variables, if enabled.
+
+    The cache is opt-in: ``GOOGLE_ADS_HISTORY_DB`` sets the store path
+    (unset or empty disables it). ``GOOGLE_ADS_HISTORY_LAG_DAYS`` sets the
+    open window (default 30) and ``GOOGLE_ADS_HISTORY_TTL_DAYS`` the age
+    after which stored days are fetched again (default 7, 0 = never).
+    """
+    path = os.environ.get("GOOGLE_ADS_HISTORY_DB", "")
+    if not path:
+        return None
+    lag_days = int(
+        os.environ.get("GOOGLE_ADS_HISTORY_LAG_DAYS", str(DEFAULT_LAG_DAYS))
+    )
+    ttl_days = float(
+        os.environ.get("GOOGLE_ADS_HISTORY_TTL_DAYS", str(DEFAULT_TTL_DAYS))
+    )
+    return HistoryCache(
+        os.path.expanduser(path), codec, lag_days=lag_days, ttl_days=ttl_days
+    )
@@ -2,12 +2,15 @@
 
 from google_ads_mcp.models.common import (
     ResponseFormat,
+    ReportSource,
+    MccReport,
     CampaignStatusFilter,
     AdGroupStatusFilter,
     CampaignTypeFilter,
     MatchType,
     StatusAction,
     NegativeKeywordLevel,
+    BatchAction,
     CampaignType,
     BiddingStrategyType,
     AdGroupType,
@@ -28,6 +31,7 @@ from google_ads_mcp.models.tool_inputs import (
     GetCampaignPerformanceInput,
     GetKeywordPerformanceInput,
     ListAdGroupsInput,
+    MccReportInput,
     ListCampaignsInput,
     ListKeywordsInput,
     SearchTermsReportInput,
@@ -41,6 +45,9 @@ from google_ads_mcp.models.mutation_inputs import (
     AddNegativeKeywordsInput,
     SetLocationTargetingInput,
     SetLanguageTargetingInput,
+    BatchOperation,
+    SubmitBatchJobInput,
+    PollBatchJobInput,
 )
 from google_ads_mcp.models.creation_inputs import (
     CreateCampaignInput,
@@ -68,12 +75,15 @@ from google_ads_mcp.models.asset_inputs import (
 
 __all__ = [
     "ResponseFormat",
+    "ReportSource",
+    "MccReport",
     "CampaignStatusFilter",
     "AdGroupStatusFilter",
     "CampaignTypeFilter",
     "MatchType",
     "StatusAction",
     "NegativeKeywordLevel",
+    "BatchAction",
     "CampaignType",
     "BiddingStrategyType",
     "AdGroupType",
@@ -88,6 +98,7 @@ __all__ = [
     "GetCampaignPerformanceInput",
     "GetKeywordPerformanceInput",
     "ListAdGroupsInput",
+    "MccReportInput",
     "ListCampaignsInput",
     "ListKeywordsInput",
     "SearchTermsReportInput",
@@ -99,6 +110,9 @@ __all__ = [
     "AddNegativeKeywordsInput",
     "SetLocationTargetingInput",
     "SetLanguageTargetingInput",
+    "BatchOperation",
+    "SubmitBatchJobInput",
+    "PollBatchJobInput",
     "CreateCampaignInput",
     "CreateAdGroupInput",
     "CreateResponsiveSearchAdInput",
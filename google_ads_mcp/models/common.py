@@ -11,6 +11,19 @@ class ResponseFormat(str, Enum):
     """Output format for tool responses."""
     MARKDOWN = "markdown"
     JSON = "json"
+    COMPACT = "compact"  # JSON without indentation
+
+
+class ReportSource(str, Enum):
+    """Where report tools read their data from."""
+    API = "api"
+    WAREHOUSE = "warehouse"
+
+
+class MccReport(str, Enum):
+    """Built-in reports for the MCC fan-out tool."""
+    ACCOUNT = "account"
+    CAMPAIGN = "campaign"
 
 
 class CampaignStatusFilter(str, Enum):
@@ -60,6 +73,17 @@ class StatusAction(str, Enum):
     REMOVE = "remove"
 
 
+class BatchAction(str, Enum):
+    """Kind of change in a batch job operation."""
+    ADD_KEYWORD = "add_keyword"
+    ADD_NEGATIVE_KEYWORD = "add_negative_keyword"
+    UPDATE_KEYWORD = "update_keyword"
+    CAMPAIGN_STATUS = "campaign_status"
+    AD_GROUP_STATUS = "ad_group_status"
+    AD_STATUS = "ad_status"
+    UPDATE_BUDGET = "update_budget"
+
+
 class NegativeKeywordLevel(str, Enum):
     """Level at which to add negative keywords."""
     CAMPAIGN = "campaign"
@@ -90,7 +114,7 @@ class AdGroupType(str, Enum):
     """Ad group type for creation."""
     SEARCH_STANDARD = "SEARCH_STANDARD"
     DISPLAY_STANDARD = "DISPLAY_STANDARD"
-    SHOPPING_PRODUCT = "SHOPPING_PRODUCT"
+    SHOPPING_PRODUCT_ADS = "SHOPPING_PRODUCT_ADS"
     VIDEO_RESPONSIVE = "VIDEO_RESPONSIVE"
 
 
@@ -104,8 +104,8 @@ class AddKeywordsInput(CustomerIdMixin):
 
     ad_group_id: str = Field(..., description="Ad group ID.")
     keywords: list[str] = Field(
-        ..., min_length=1, max_length=20,
-        description="Keywords to add (max 20 per call).",
+        ..., min_length=1, max_length=50_000,
+        description="Keywords to add (max 50,000 per call, sent in chunks).",
     )
     match_type: MatchType = Field(
         default=MatchType.BROAD, description="Match type: exact, phrase, or broad."
@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import re
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from google_ads_mcp.models.common import (
+    BatchAction,
     CustomerIdMixin,
     MatchType,
     NegativeKeywordLevel,
+    ResponseFormat,
     StatusAction,
 )
 
@@ -80,8 +82,8 @@ class AddNegativeKeywordsInput(CustomerIdMixin):
         default=None, description="Ad group ID (required if level=ad_group)."
     )
     keywords: list[str] = Field(
-        ..., min_length=1, max_length=20,
-        description="Keywords to add as negatives (max 20 per call).",
+        ..., min_length=1, max_length=50_000,
+        description="Keywords to add as negatives (max 50,000 per call, sent in chunks).",
     )
     match_type: MatchType = Field(
         default=MatchType.EXACT, description="Match type: exact, phrase, or broad."
@@ -115,3 +117,88 @@ class SetLanguageTargetingInput(CustomerIdMixin):
         ..., min_length=1,
         description="Language criterion IDs (e.g. 1000 for English, 1004 for Italian).",
     )
+
+
+# Fields each batch action needs; add_negative_keyword also needs
+# campaign_id or ad_group_id (checked separately).
+_BATCH_REQUIRED_FIELDS: dict[BatchAction, tuple[str, ...]] = {
+    BatchAction.ADD_KEYWORD: ("ad_group_id", "text"),
+    BatchAction.ADD_NEGATIVE_KEYWORD: ("text",),
+    BatchAction.UPDATE_KEYWORD: ("ad_group_id", "criterion_id"),
+    BatchAction.CAMPAIGN_STATUS: ("campaign_id", "status"),
+    BatchAction.AD_GROUP_STATUS: ("ad_group_id", "status"),
+    BatchAction.AD_STATUS: ("ad_group_id", "ad_id", "status"),
+    BatchAction.UPDATE_BUDGET: ("budget_id", "amount_micros"),
+}
+
+
+class BatchOperation(BaseModel):
+    """A single change in a batch job, built with the regular operation builders."""
+
+    action: BatchAction = Field(..., description="Kind of change.")
+    campaign_id: str | None = Field(default=None, description="Campaign ID.")
+    ad_group_id: str | None = Field(default=None, description="Ad group ID.")
+    ad_id: str | None = Field(default=None, description="Ad ID (ad_status).")
+    criterion_id: str | None = Field(default=None, description="Keyword criterion ID (update_keyword).")
+    budget_id: str | None = Field(default=None, description="Campaign budget ID (update_budget).")
+    text: str | None = Field(default=None, description="Keyword text.")
+    match_type: MatchType | None = Field(
+        default=None,
+        description="Match type (default: broad for keywords, exact for negatives).",
+    )
+    status: StatusAction | None = Field(default=None, description="New status.")
+    cpc_bid_micros: int | None = Field(default=None, gt=0, description="CPC bid in micros.")
+    amount_micros: int | None = Field(default=None, gt=0, description="Daily budget in micros.")
+
+    @model_validator(mode="after")
+    def validate_action_fields(self) -> "BatchOperation":
+        missing = [
+            name for name in _BATCH_REQUIRED_FIELDS[self.action]
+            if getattr(self, name) is None
+        ]
+        if missing:
+            raise ValueError(
+                f"{', '.join(missing)} required for action={self.action.value}"
+            )
+        if self.action == BatchAction.ADD_NEGATIVE_KEYWORD and not (
+            self.campaign_id or self.ad_group_id
+        ):
+            raise ValueError("add_negative_keyword requires campaign_id or ad_group_id")
+        if self.action == BatchAction.UPDATE_KEYWORD and (
+            self.cpc_bid_micros is None and self.status is None
+        ):
+            raise ValueError("update_keyword requires cpc_bid_micros or status")
+        return self
+
+
+class SubmitBatchJobInput(CustomerIdMixin):
+    """Input for gads_submit_batch_job tool."""
+
+    operations: list[BatchOperation] = Field(
+        ..., min_length=1, max_length=1_000_000,
+        description="Changes to run server-side (max 1,000,000 per job).",
+    )
+
+
+class PollBatchJobInput(CustomerIdMixin):
+    """Input for gads_poll_batch_job tool."""
+
+    batch_job_id: str = Field(..., description="Batch job ID returned by gads_submit_batch_job.")
+    wait_seconds: int = Field(
+        default=0, ge=0, le=300,
+        description="Keep polling up to this many seconds until the job is done.",
+    )
+    page_size: int = Field(default=100, ge=1, le=1000, description="Results per page.")
+    page_token: str = Field(default="", description="Token of the results page to read.")
+    failures_only: bool = Field(default=True, description="Only list failed operations.")
+    response_format: ResponseFormat = Field(
+        default=ResponseFormat.MARKDOWN,
+        description="Output format: markdown, json or compact (unindented json).",
+    )
+
+    @field_validator("batch_job_id")
+    @classmethod
+    def validate_batch_job_id(cls, v: str) -> str:
+        if not v.isdigit():
+            raise ValueError(f"batch_job_id must be numeric, got: '{v}'")
+        return v
@@ -4,14 +4,17 @@ from __future__ import annotations
 
 from datetime import date, timedelta
 
-from pydantic import Field
+from pydantic import Field, field_validator
 
 from google_ads_mcp.models.common import (
     AdGroupStatusFilter,
     CampaignStatusFilter,
     CampaignTypeFilter,
     CustomerIdMixin,
+    MccReport,
+    ReportSource,
     ResponseFormat,
+    sanitize_customer_id,
 )
 
 
@@ -30,6 +33,10 @@ class ListCampaignsInput(CustomerIdMixin):
     campaign_type: CampaignTypeFilter = CampaignTypeFilter.ALL
     limit: int = Field(default=50, ge=1, le=1000)
     offset: int = Field(default=0, ge=0)
+    cursor: str = Field(
+        default="",
+        description="next_cursor from a previous call; overrides offset.",
+    )
     response_format: ResponseFormat = ResponseFormat.MARKDOWN
 
 
@@ -45,6 +52,14 @@ class GetCampaignPerformanceInput(CustomerIdMixin):
     end_date: str = Field(default_factory=_default_end_date)
     limit: int = Field(default=50, ge=1, le=1000)
     offset: int = Field(default=0, ge=0)
+    cursor: str = Field(
+        default="",
+        description="next_cursor from a previous call; overrides offset.",
+    )
+    source: ReportSource = Field(
+        default=ReportSource.API,
+        description="api (live) or warehouse (local tables from gads_sync_reports).",
+    )
     response_format: ResponseFormat = ResponseFormat.MARKDOWN
 
 
@@ -58,6 +73,10 @@ class ListAdGroupsInput(CustomerIdMixin):
     status: AdGroupStatusFilter = AdGroupStatusFilter.ALL
     limit: int = Field(default=50, ge=1, le=1000)
     offset: int = Field(default=0, ge=0)
+    cursor: str = Field(
+        default="",
+        description="next_cursor from a previous call; overrides offset.",
+    )
     response_format: ResponseFormat = ResponseFormat.MARKDOWN
 
 
@@ -71,6 +90,14 @@ class GetAdGroupPerformanceInput(CustomerIdMixin):
     end_date: str = Field(default_factory=_default_end_date)
     limit: int = Field(default=50, ge=1, le=1000)
     offset: int = Field(default=0, ge=0)
+    cursor: str = Field(
+        default="",
+        description="next_cursor from a previous call; overrides offset.",
+    )
+    source: ReportSource = Field(
+        default=ReportSource.API,
+        description="api (live) or warehouse (local tables from gads_sync_reports).",
+    )
     response_format: ResponseFormat = ResponseFormat.MARKDOWN
 
 
@@ -81,6 +108,10 @@ class ListKeywordsInput(CustomerIdMixin):
     ad_group_id: str | None = Field(default=None)
     limit: int = Field(default=50, ge=1, le=1000)
     offset: int = Field(default=0, ge=0)
+    cursor: str = Field(
+        default="",
+        description="next_cursor from a previous call; overrides offset.",
+    )
     response_format: ResponseFormat = ResponseFormat.MARKDOWN
 
 
@@ -93,6 +124,14 @@ class GetKeywordPerformanceInput(CustomerIdMixin):
     end_date: str = Field(default_factory=_default_end_date)
     limit: int = Field(default=50, ge=1, le=1000)
     offset: int = Field(default=0, ge=0)
+    cursor: str = Field(
+        default="",
+        description="next_cursor from a previous call; overrides offset.",
+    )
+    source: ReportSource = Field(
+        default=ReportSource.API,
+        description="api (live) or warehouse (local tables from gads_sync_reports).",
+    )
     response_format: ResponseFormat = ResponseFormat.MARKDOWN
 
 
@@ -113,4 +152,40 @@ class SearchTermsReportInput(CustomerIdMixin):
     end_date: str = Field(default_factory=_default_end_date)
     limit: int = Field(default=100, ge=1, le=5000)
     offset: int = Field(default=0, ge=0)
+    cursor: str = Field(
+        default="",
+        description="next_cursor from a previous call; overrides offset.",
+    )
+    source: ReportSource = Field(
+        default=ReportSource.API,
+        description="api (live) or warehouse (local tables from gads_sync_reports).",
+    )
     response_format: ResponseFormat = ResponseFormat.MARKDOWN
+
+
+class MccReportInput(CustomerIdMixin):
+    """Input for gads_mcc_report tool (customer_id is the manager account)."""
+
+    query: str = Field(
+        default="",
+        description="Custom GAQL SELECT run on every client; overrides report.",
+    )
+    report: MccReport = MccReport.ACCOUNT
+    start_date: str = Field(default_factory=_default_start_date)
+    end_date: str = Field(default_factory=_default_end_date)
+    client_ids: list[str] = Field(
+        default_factory=list,
+        description="Only these client accounts (default: all enabled leaves).",
+    )
+    name_contains: str = Field(
+        default="",
+        description="Only clients whose descriptive name contains this text.",
+    )
+    max_concurrency: int = Field(default=20, ge=1, le=100)
+    limit: int = Field(default=1000, ge=1, le=10000)
+    response_format: ResponseFormat = ResponseFormat.MARKDOWN
+
+    @field_validator("client_ids")
+    @classmethod
+    def validate_client_ids(cls, v: list[str]) -> list[str]:
+        return [sanitize_customer_id(c) for c in v if c.strip()]
@@ -0,0 +1,391 @@
+"""Durable outbox for upload chunks that failed with transient errors.
+
+Conversion and customer list uploads that still fail after the client's
+retries (server errors, exhausted quota) are stored in a local SQLite file
+with an idempotency key instead of being dropped. A background task started
+by the server lifespan resends due entries with exponential backoff; the
+same chunk queued twice is stored once. Customer list entries only hold
+SHA-256 digests, never raw emails or phone numbers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+from google_ads_mcp.conversions import ClickConversionInput, build_upload_request
+from google_ads_mcp.customer_match import build_user_data_request
+from google_ads_mcp.partial_failure import operation_errors
+from google_ads_mcp.utils.errors import GoogleAdsMCPError, is_transient_error
+
+if TYPE_CHECKING:
+    from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTBOX_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "google_ads_mcp", "outbox.sqlite"
+)
+
+CLICK_CONVERSIONS = "click_conversions"
+USER_DATA = "user_data"
+
+DEFAULT_MAX_ATTEMPTS = 8
+DEFAULT_BASE_DELAY = 30.0
+DEFAULT_MAX_DELAY = 3600.0
+DEFAULT_INTERVAL = 30.0
+
+# Delivered entries are kept this long for the status tool, then purged.
+DONE_RETENTION_SECONDS = 7 * 86400
+
+STATUSES = ("pending", "failed", "done")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    idempotency_key TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    customer_id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    items INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT NOT NULL DEFAULT '',
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt_at);
+"""
+
+
+def idempotency_key(kind: str, customer_id: str, payload: dict[str, Any]) -> str:
+    """Stable key of an upload chunk: SHA-256 of its canonical JSON."""
+    canonical = json.dumps(
+        [kind, customer_id, payload], sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class OutboxEntry:
+    """A queued upload chunk."""
+
+    id: int
+    idempotency_key: str
+    kind: str
+    customer_id: str
+    payload: dict[str, Any]
+    items: int
+    status: str
+    attempts: int
+    last_error: str
+
+
+class Outbox:
+    """SQLite-backed queue of upload chunks awaiting redelivery.
+
+    Args:
+        path: SQLite file (created on first use).
+        max_attempts: Deliveries tried before an entry is marked failed.
+        base_delay: Seconds before the first retry; doubled each attempt
+            up to ``max_delay``.
+        clock: Time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._clock = clock
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def enqueue(
+        self,
+        kind: str,
+        customer_id: str,
+        payload: dict[str, Any],
+        items: int,
+        error: str = "",
+    ) -> str:
+        """Store a chunk for redelivery and return its idempotency key.
+
+        The first retry is due after ``base_delay``. A chunk already in the
+        outbox (same key) is left as it is.
+        """
+        key = idempotency_key(kind, customer_id, payload)
+        now = self._clock()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR IGNORE INTO outbox (idempotency_key, kind, customer_id, "
+                    "payload, items, next_attempt_at, last_error, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, kind, customer_id, json.dumps(payload), items,
+                     now + self.base_delay, error, now, now),
+                )
+        logger.warning("Queued %d %s for %s in the outbox: %s", items, kind, customer_id, error)
+        return key
+
+    def enqueue_click_conversions(
+        self, customer_id: str, conversions: list[ClickConversionInput], error: str = ""
+    ) -> str:
+        """Queue a batch of click conversions (see :meth:`enqueue`)."""
+        payload = {"conversions": [asdict(c) for c in conversions]}
+        return self.enqueue(CLICK_CONVERSIONS, customer_id, payload, len(conversions), error)
+
+    def enqueue_user_data(
+        self,
+        customer_id: str,
+        user_list_id: str,
+        identifiers: list[tuple[str, str]],
+        remove: bool = False,
+        error: str = "",
+    ) -> str:
+        """Queue customer list members as (field, digest) pairs (see :meth:`enqueue`)."""
+        payload = {
+            "user_list_id": user_list_id,
+            "remove": remove,
+            "identifiers": [list(pair) for pair in identifiers],
+        }
+        return self.enqueue(USER_DATA, customer_id, payload, len(identifiers), error)
+
+    def due(self, limit: int = 20) -> list[OutboxEntry]:
+        """Pending entries whose next attempt is due, oldest first."""
+        with self._lock:
+            rows = self._connection().execute(
+                f"SELECT {_COLUMNS} FROM outbox WHERE status = 'pending' "
+                "AND next_attempt_at <= ? ORDER BY next_attempt_at LIMIT ?",
+                (self._clock(), limit),
+            ).fetchall()
+        return [_entry(row) for row in rows]
+
+    def get(self, key: str) -> OutboxEntry | None:
+        with self._lock:
+            row = self._connection().execute(
+                f"SELECT {_COLUMNS} FROM outbox WHERE idempotency_key = ?", (key,)
+            ).fetchone()
+        return _entry(row) if row else None
+
+    def mark_done(self, entry: OutboxEntry, note: str = "") -> None:
+        self._update(entry, "done", entry.attempts + 1, note, self._clock())
+
+    def mark_failed(self, entry: OutboxEntry, error: str) -> None:
+        self._update(entry, "failed", entry.attempts + 1, error, self._clock())
+
+    def mark_retry(self, entry: OutboxEntry, error: str) -> bool:
+        """Reschedule ``entry`` with backoff; False if it ran out of attempts."""
+        attempts = entry.attempts + 1
+        if attempts >= self.max_attempts:
+            self._update(entry, "failed", attempts, error, self._clock())
+            return False
+        delay = min(self.max_delay, self.base_delay * 2 ** attempts)
+        self._update(entry, "pending", attempts, error, self._clock() + delay)
+        return True
+
+    def counts(self) -> dict[str, dict[str, int]]:
+        """Entries and items per status."""
+        result = {status: {"entries": 0, "items": 0} for status in STATUSES}
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT status, COUNT(*), SUM(items) FROM outbox GROUP BY status"
+            ).fetchall()
+        for status, entries, items in rows:
+            result[status] = {"entries": entries, "items": items or 0}
+        return result
+
+    def entries(self, status: str, limit: int = 10) -> list[OutboxEntry]:
+        """Most recently updated entries with ``status``."""
+        with self._lock:
+            rows = self._connection().execute(
+                f"SELECT {_COLUMNS} FROM outbox WHERE status = ? "
+                "ORDER BY updated_at DESC LIMIT ?",
+                (status, limit),
+            ).fetchall()
+        return [_entry(row) for row in rows]
+
+    def purge_done(self, older_than: float = DONE_RETENTION_SECONDS) -> int:
+        """Delete delivered entries last updated more than ``older_than`` seconds ago."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                cursor = conn.execute(
+                    "DELETE FROM outbox WHERE status = 'done' AND updated_at < ?",
+                    (self._clock() - older_than,),
+                )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _update(
+        self, entry: OutboxEntry, status: str, attempts: int, error: str, next_at: float
+    ) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "UPDATE outbox SET status = ?, attempts = ?, last_error = ?, "
+                    "next_attempt_at = ?, updated_at = ? WHERE id = ?",
+                    (status, attempts, error, next_at, self._clock(), entry.id),
+                )
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+
+_COLUMNS = (
+    "id, idempotency_key, kind, customer_id, payload, items, status, attempts, last_error"
+)
+
+
+def _entry(row: tuple[Any, ...]) -> OutboxEntry:
+    entry_id, key, kind, customer_id, payload, items, status, attempts, error = row
+    return OutboxEntry(
+        entry_id, key, kind, customer_id, json.loads(payload),
+        items, status, attempts, error,
+    )
+
+
+async def _send_click_conversions(
+    client: AsyncGoogleAdsClientWrapper, entry: OutboxEntry
+) -> str:
+    conversions = [ClickConversionInput(**c) for c in entry.payload["conversions"]]
+    service = client.get_service("ConversionUploadService")
+    request = build_upload_request(client.client, entry.customer_id, conversions)
+    response = await client.acall(service.upload_click_conversions, request=request)
+    errors = operation_errors(client.client, response)
+    if not errors:
+        return ""
+    return f"{len(errors)} conversions rejected: " + "; ".join(
+        str(message) for message in list(errors.values())[:5]
+    )
+
+
+async def _send_user_data(
+    client: AsyncGoogleAdsClientWrapper, entry: OutboxEntry
+) -> str:
+    payload = entry.payload
+    service = client.get_service("UserDataService")
+    request = build_user_data_request(
+        client.client,
+        entry.customer_id,
+        payload["user_list_id"],
+        [tuple(pair) for pair in payload["identifiers"]],
+        remove=payload["remove"],
+    )
+    await client.acall(service.upload_user_data, request=request)
+    return ""
+
+
+OutboxSender = Callable[["AsyncGoogleAdsClientWrapper", OutboxEntry], Awaitable[str]]
+
+SENDERS: dict[str, OutboxSender] = {
+    CLICK_CONVERSIONS: _send_click_conversions,
+    USER_DATA: _send_user_data,
+}
+
+
+async def drain_outbox(
+    client: AsyncGoogleAdsClientWrapper, outbox: Outbox, limit: int = 20
+) -> int:
+    """Resend up to ``limit`` due entries; return how many were attempted.
+
+    Delivered entries are marked done (rows rejected by partial failure
+    are noted, not retried); transient errors reschedule the entry with
+    backoff and any other error marks it failed.
+    """
+    entries = await client.arun(outbox.due, limit)
+    for entry in entries:
+        sender = SENDERS.get(entry.kind)
+        if sender is None:
+            await client.arun(outbox.mark_failed, entry, f"unknown kind {entry.kind!r}")
+            continue
+        try:
+            note = await sender(client, entry)
+        except GoogleAdsMCPError as exc:
+            if is_transient_error(exc):
+                await client.arun(outbox.mark_retry, entry, str(exc))
+            else:
+                await client.arun(outbox.mark_failed, entry, str(exc))
+            continue
+        except Exception as exc:
+            logger.exception("Outbox entry %d could not be sent", entry.id)
+            await client.arun(outbox.mark_failed, entry, f"{type(exc).__name__}: {exc}")
+            continue
+        await client.arun(outbox.mark_done, entry, note)
+        logger.info(
+            "Delivered %d %s for %s from the outbox",
+            entry.items, entry.kind, entry.customer_id,
+        )
+    return len(entries)
+
+
+async def run_outbox_worker(
+    client: AsyncGoogleAdsClientWrapper,
+    outbox: Outbox,
+    interval: float = DEFAULT_INTERVAL,
+    sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+) -> None:
+    """Drain the outbox forever, checking for due entries every ``interval`` seconds.
+
+    Meant to run as a background task; cancel it to stop.
+    """
+    while True:
+        try:
+            attempted = await drain_outbox(client, outbox)
+            if not attempted:
+                await client.arun(outbox.purge_done)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Outbox drain failed")
+            attempted = 0
+        if not attempted:
+            await sleep(interval)
+
+
+def outbox_from_env() -> tuple[Outbox | None, float]:
+    """Build the Outbox and the drain interval from the environment.
+
+    ``GOOGLE_ADS_OUTBOX_DB`` sets the SQLite path (empty disables the
+    outbox); ``GOOGLE_ADS_OUTBOX_INTERVAL`` the seconds between checks for
+    due entries (default 30); ``GOOGLE_ADS_OUTBOX_MAX_ATTEMPTS`` the
+    deliveries tried before giving up (default 8).
+    """
+    interval = float(os.environ.get("GOOGLE_ADS_OUTBOX_INTERVAL", str(DEFAULT_INTERVAL)))
+    path = os.environ.get("GOOGLE_ADS_OUTBOX_DB", DEFAULT_OUTBOX_PATH)
+    if not path:
+        return None, interval
+    max_attempts = int(
+        os.environ.get("GOOGLE_ADS_OUTBOX_MAX_ATTEMPTS", str(DEFAULT_MAX_ATTEMPTS))
+    )
+    return Outbox(os.path.expanduser(path), max_attempts=max_attempts), max(1.0, interval)
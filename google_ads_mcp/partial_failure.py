@@ -0,0 +1,120 @@
+"""Decode partial-failure errors of mutate responses per operation."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class OperationFailure:
+    """One operation of a mutate request that the API rejected."""
+
+    index: int
+    item: Any
+    error: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"index": self.index, "item": self.item, "error": self.error}
+
+
+@dataclass
+class PartialFailureReport:
+    """Input items of a partial-failure mutate split by outcome.
+
+    ``errors`` holds messages that the API did not tie to an operation.
+    """
+
+    succeeded: list[Any] = field(default_factory=list)
+    failures: list[OperationFailure] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def failed_items(self) -> list[Any]:
+        return [f.item for f in self.failures]
+
+    @property
+    def failed_indexes(self) -> list[int]:
+        return [f.index for f in self.failures]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "succeeded": len(self.succeeded),
+            "failed": len(self.failures),
+            "failures": [f.to_dict() for f in self.failures],
+            "errors": self.errors,
+        }
+
+
+def operation_errors(client: Any, response: Any) -> dict[int | None, str]:
+    """Map operation index to the error messages in ``partial_failure_error``.
+
+    The status details are deserialized as ``GoogleAdsFailure`` (proto-plus
+    or raw protobuf, whichever ``client`` builds). Each error's operation
+    index is the first index of its field path (``mutate_operations[i]``,
+    ``operations[i]``, ``conversions[i]``...). Several errors for the same
+    operation are joined with "; "; errors without an index (no path, or
+    an unset ``index``, which reads as 0) are keyed under None.
+
+    Args:
+        client: The raw GoogleAdsClient.
+        response: Response of a request sent with ``partial_failure=True``.
+    """
+    status = getattr(response, "partial_failure_error", None)
+    messages: dict[int | None, list[str]] = {}
+    deserialize = None
+    for detail in getattr(status, "details", None) or []:
+        if deserialize is None:
+            failure_type = type(client.get_type("GoogleAdsFailure"))
+            deserialize = (
+                getattr(failure_type, "deserialize", None) or failure_type.FromString
+            )
+        failure = deserialize(detail.value)
+        for error in failure.errors:
+            elements = error.location.field_path_elements
+            index = _element_index(elements[0]) if elements else None
+            messages.setdefault(index, []).append(error.message)
+    return {index: "; ".join(m) for index, m in messages.items()}
+
+
+def _element_index(element: Any) -> int | None:
+    """Index of a field path element, or None when it is not set."""
+    has_field = getattr(element, "HasField", None)
+    if has_field is not None:  # raw protobuf
+        present = has_field("index")
+    else:
+        try:
+            present = "index" in element  # proto-plus
+        except TypeError:
+            present = getattr(element, "index", None) is not None
+    return element.index if present else None
+
+
+def decode_partial_failure(
+    client: Any, response: Any, items: Sequence[Any]
+) -> PartialFailureReport:
+    """Split ``items`` (parallel to the request operations) by outcome.
+
+    Callers can resubmit ``report.failed_items`` after fixing them instead
+    of resending everything.
+    """
+    errors = operation_errors(client, response)
+    report = PartialFailureReport()
+    for index, item in enumerate(items):
+        if index in errors:
+            report.failures.append(OperationFailure(index, item, errors[index]))
+        else:
+            report.succeeded.append(item)
+    report.errors = [
+        message for index, message in errors.items()
+        if index is None or not 0 <= index < len(items)
+    ]
+    if report.failures:
+        logger.info(
+            "Partial failure: %d of %d operations rejected",
+            len(report.failures), len(items),
+        )
+    return report
@@ -0,0 +1,289 @@
+"""Proactive rate limiting and daily quota accounting for API operations."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Callable
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from google_ads_mcp.utils.errors import QuotaExhaustedError, format_google_ads_error
+
+# Daily operation quotas reset at midnight Pacific Time.
+QUOTA_TIMEZONE = "America/Los_Angeles"
+
+# Key of the limits shared by every customer of the developer token.
+DEVELOPER_TOKEN = "developer_token"
+
+
+class TokenBucket:
+    """Token bucket with reservations, so waiting callers are served FIFO.
+
+    Instead of polling for free tokens, each request books the earliest
+    instant the bucket can pay for it (GCRA-style "theoretical arrival
+    time"). Later requests book after earlier ones, so no caller can be
+    overtaken while it sleeps.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self._tat = 0.0
+
+    def schedule(self, at: float, cost: float = 1, commit: bool = True) -> float:
+        """Return the earliest time >= ``at`` when ``cost`` tokens are available.
+
+        With ``commit`` the tokens are booked; otherwise the bucket is
+        only inspected.
+        """
+        tat = max(self._tat, at) + cost / self.rate
+        start = max(at, tat - self.burst / self.rate)
+        if commit:
+            self._tat = tat
+        return start
+
+    def backlog(self, now: float) -> float:
+        """Seconds a one-token request arriving now would wait."""
+        return self.schedule(now, commit=False) - now
+
+
+@dataclass
+class _Account:
+    """Limits and counters of one quota key (developer token or customer)."""
+
+    bucket: TokenBucket | None
+    daily_limit: int
+    day: date | None = None
+    used_today: int = 0
+    requests: int = 0
+    throttled: int = 0
+    rejected: int = 0
+    waiting: int = 0
+    wait_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class QuotaReservation:
+    """A booked slot: sleep ``delay`` seconds, then send the request."""
+
+    customer_id: str | None
+    delay: float
+
+
+class QuotaLimiter:
+    """Per-developer-token and per-customer operation limits.
+
+    Every API request takes one slot of the per-second rate and books
+    ``cost`` operations (1 per search request, one per mutate operation)
+    against the daily budgets, for the developer token and, when known,
+    the target customer. The rate paces requests, not operations: a mutate
+    of thousands of operations is a single request to the API. A request
+    over the per-second rate is delayed until its turn rather than sent to
+    fail with RESOURCE_EXHAUSTED; a request over the daily budget, or one
+    that would wait longer than ``max_wait``, is rejected locally with
+    :class:`QuotaExhaustedError`.
+
+    Limits set to 0 are disabled; consumption is counted either way.
+    """
+
+    def __init__(
+        self,
+        ops_per_second: float = 0,
+        daily_operations: int = 0,
+        customer_ops_per_second: float = 0,
+        customer_daily_operations: int = 0,
+        burst: float | None = None,
+        max_wait: float = 60.0,
+        timezone: str = QUOTA_TIMEZONE,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ops_per_second = ops_per_second
+        self.daily_operations = daily_operations
+        self.customer_ops_per_second = customer_ops_per_second
+        self.customer_daily_operations = customer_daily_operations
+        self.burst = burst
+        self.max_wait = max_wait
+        try:
+            self._tz = ZoneInfo(timezone)
+        except ZoneInfoNotFoundError:
+            self._tz = ZoneInfo("UTC")
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._lock = threading.Lock()
+        self._developer = self._new_account(ops_per_second, daily_operations)
+        self._customers: dict[str, _Account] = {}
+
+    def reserve(self, customer_id: str | None, cost: int = 1) -> QuotaReservation:
+        """Book one request slot and ``cost`` daily operations.
+
+        Returns the reservation with how long to wait before sending.
+
+        Raises:
+            QuotaExhaustedError: If a daily budget would be exceeded or the
+                wait would exceed ``max_wait``. Nothing is booked then.
+        """
+        with self._lock:
+            now = self._clock()
+            today = self._today()
+            accounts = [self._developer]
+            if customer_id:
+                accounts.insert(0, self._customer(customer_id))
+
+            for key, account in zip(self._keys(customer_id), accounts):
+                self._roll_day(account, today)
+                if account.daily_limit and account.used_today + cost > account.daily_limit:
+                    account.rejected += 1
+                    raise QuotaExhaustedError(
+                        format_google_ads_error(
+                            "QUOTA_ERROR",
+                            f"daily budget of {account.daily_limit} operations "
+                            f"exhausted for {key} ({account.used_today} used).",
+                        ),
+                        retry_after_seconds=self._seconds_to_reset(),
+                    )
+
+            # Customer first, then the developer token from that instant on.
+            start = now
+            for account in accounts:
+                if account.bucket is not None:
+                    start = account.bucket.schedule(start, commit=False)
+            delay = start - now
+            if delay > self.max_wait:
+                for account in accounts:
+                    account.rejected += 1
+                raise QuotaExhaustedError(
+                    format_google_ads_error(
+                        "QUOTA_ERROR",
+                        f"local queue full: estimated wait {delay:.1f}s "
+                        f"(maximum {self.max_wait:g}s).",
+                    ),
+                    retry_after_seconds=int(delay) + 1,
+                )
+
+            start = now
+            for account in accounts:
+                if account.bucket is not None:
+                    start = account.bucket.schedule(start)
+                account.used_today += cost
+                account.requests += 1
+                if delay > 0:
+                    account.throttled += 1
+                    account.wait_seconds += delay
+        return QuotaReservation(customer_id, delay)
+
+    def acquire(self, customer_id: str | None, cost: int = 1) -> None:
+        """Book operations and block the calling thread until their turn."""
+        reservation = self.reserve(customer_id, cost)
+        if reservation.delay > 0:
+            self._set_waiting(customer_id, 1)
+            try:
+                time.sleep(reservation.delay)
+            finally:
+                self._set_waiting(customer_id, -1)
+
+    async def aacquire(self, customer_id: str | None, cost: int = 1) -> None:
+        """Async variant of :meth:`acquire` that awaits instead of blocking."""
+        reservation = self.reserve(customer_id, cost)
+        if reservation.delay > 0:
+            self._set_waiting(customer_id, 1)
+            try:
+                await asyncio.sleep(reservation.delay)
+            finally:
+                self._set_waiting(customer_id, -1)
+
+    def status(self) -> dict[str, Any]:
+        """Current consumption of the developer token and of each customer."""
+        with self._lock:
+            now = self._clock()
+            today = self._today()
+            accounts = {DEVELOPER_TOKEN: self._developer, **self._customers}
+            rows = []
+            for key, account in accounts.items():
+                self._roll_day(account, today)
+                rows.append({
+                    "key": key,
+                    "ops_per_second": account.bucket.rate if account.bucket else 0,
+                    "daily_limit": account.daily_limit,
+                    "used_today": account.used_today,
+                    "remaining_today": (
+                        max(0, account.daily_limit - account.used_today)
+                        if account.daily_limit else None
+                    ),
+                    "requests": account.requests,
+                    "throttled": account.throttled,
+                    "rejected": account.rejected,
+                    "waiting": account.waiting,
+                    "queue_delay_seconds": round(
+                        account.bucket.backlog(now) if account.bucket else 0.0, 3
+                    ),
+                    "wait_seconds": round(account.wait_seconds, 3),
+                })
+        return {
+            "day": today.isoformat(),
+            "resets_in_seconds": self._seconds_to_reset(),
+            "accounts": rows,
+        }
+
+    def _new_account(self, rate: float, daily_limit: int) -> _Account:
+        bucket = TokenBucket(rate, self.burst) if rate > 0 else None
+        return _Account(bucket=bucket, daily_limit=daily_limit)
+
+    def _customer(self, customer_id: str) -> _Account:
+        account = self._customers.get(customer_id)
+        if account is None:
+            account = self._new_account(
+                self.customer_ops_per_second, self.customer_daily_operations
+            )
+            self._customers[customer_id] = account
+        return account
+
+    @staticmethod
+    def _keys(customer_id: str | None) -> list[str]:
+        return [customer_id, DEVELOPER_TOKEN] if customer_id else [DEVELOPER_TOKEN]
+
+    def _set_waiting(self, customer_id: str | None, delta: int) -> None:
+        with self._lock:
+            self._developer.waiting += delta
+            if customer_id:
+                self._customer(customer_id).waiting += delta
+
+    def _today(self) -> date:
+        return datetime.fromtimestamp(self._wall_clock(), self._tz).date()
+
+    @staticmethod
+    def _roll_day(account: _Account, today: date) -> None:
+        if account.day != today:
+            account.day = today
+            account.used_today = 0
+
+    def _seconds_to_reset(self) -> int:
+        now = datetime.fromtimestamp(self._wall_clock(), self._tz)
+        midnight = datetime.combine(
+            now.date() + timedelta(days=1), datetime.min.time(), self._tz
+        )
+        return max(1, int((midnight - now).total_seconds()))
+
+
+def quota_from_env() -> QuotaLimiter:
+    """Build the QuotaLimiter from environment variables.
+
+    ``GOOGLE_ADS_OPS_PER_SECOND`` / ``GOOGLE_ADS_DAILY_OPERATIONS`` limit the
+    developer token, ``GOOGLE_ADS_CUSTOMER_OPS_PER_SECOND`` /
+    ``GOOGLE_ADS_CUSTOMER_DAILY_OPERATIONS`` each customer ID, and
+    ``GOOGLE_ADS_QUOTA_MAX_WAIT`` caps the queueing delay. 0 disables a limit.
+    """
+    env = os.environ.get
+    return QuotaLimiter(
+        ops_per_second=float(env("GOOGLE_ADS_OPS_PER_SECOND", "10")),
+        daily_operations=int(env("GOOGLE_ADS_DAILY_OPERATIONS", "0")),
+        customer_ops_per_second=float(env("GOOGLE_ADS_CUSTOMER_OPS_PER_SECOND", "0")),
+        customer_daily_operations=int(env("GOOGLE_ADS_CUSTOMER_DAILY_OPERATIONS", "0")),
+        max_wait=float(env("GOOGLE_ADS_QUOTA_MAX_WAIT", "60")),
+    )
@@ -0,0 +1,97 @@
+"""Retry policy with decorrelated jitter, a total deadline and server hints."""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how long to retry a failed API call.
+
+    Backoff uses decorrelated jitter (each delay is drawn between
+    ``base_delay`` and three times the previous one, capped at
+    ``max_delay``), so calls that failed together do not retry together.
+    A delay requested by the server (``retry_after``) is honored, plus a
+    little jitter. ``deadline`` bounds the total time spent on one call,
+    waits included; 0 disables it.
+    """
+
+    max_retries: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    deadline: float = 120.0
+    rng: Callable[[float, float], float] = field(
+        default=random.uniform, compare=False, repr=False
+    )
+    clock: Callable[[], float] = field(
+        default=time.monotonic, compare=False, repr=False
+    )
+
+    def start(self) -> RetryState:
+        """Begin tracking the attempts of one call."""
+        return RetryState(self, self.clock())
+
+
+class RetryState:
+    """Attempts and elapsed time of one call under a :class:`RetryPolicy`."""
+
+    def __init__(self, policy: RetryPolicy, started: float) -> None:
+        self.policy = policy
+        self.started = started
+        self.attempts = 0
+        self._previous = policy.base_delay
+
+    def next_delay(self, retry_after: float | None = None) -> float | None:
+        """Delay before the next attempt, or None when the budget is spent.
+
+        Args:
+            retry_after: Minimum wait requested by the server, in seconds.
+        """
+        policy = self.policy
+        self.attempts += 1
+        if self.attempts > policy.max_retries:
+            return None
+
+        if retry_after is not None:
+            delay = retry_after + policy.rng(0.0, policy.base_delay)
+        else:
+            delay = min(
+                policy.max_delay,
+                policy.rng(policy.base_delay, self._previous * 3),
+            )
+        self._previous = max(delay, policy.base_delay)
+
+        if policy.deadline:
+            elapsed = policy.clock() - self.started
+            if elapsed + delay > policy.deadline:
+                return None
+        return delay
+
+
+def parse_retry_delay(failure: Any) -> float | None:
+    """Read ``quota_error_details.retry_delay`` from a GoogleAdsFailure.
+
+    Returns the largest delay among the failure's errors, in seconds, or
+    None if no error carries one. Handles both proto-plus (``timedelta``)
+    and raw protobuf (``Duration``) messages.
+    """
+    delays = []
+    for error in getattr(failure, "errors", None) or []:
+        details = getattr(error, "details", None)
+        quota_details = getattr(details, "quota_error_details", None)
+        retry_delay = getattr(quota_details, "retry_delay", None)
+        if retry_delay is None:
+            continue
+        if hasattr(retry_delay, "total_seconds"):
+            seconds = retry_delay.total_seconds()
+        else:
+            seconds = (
+                getattr(retry_delay, "seconds", 0) or 0
+            ) + (getattr(retry_delay, "nanos", 0) or 0) / 1e9
+        if seconds > 0:
+            delays.append(float(seconds))
+    return max(delays) if delays else None
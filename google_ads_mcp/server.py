@@ -2,14 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
 from mcp.server.fastmcp import FastMCP
 
-from google_ads_mcp.auth import load_config_from_env, create_google_ads_client
-from google_ads_mcp.client import GoogleAdsClientWrapper
+from google_ads_mcp.auth import (
+    create_google_ads_client,
+    load_config_from_env,
+    protobuf_rows_from_env,
+)
+from google_ads_mcp.batcher import batcher_settings_from_env
+from google_ads_mcp.bulk import bulk_settings_from_env
+from google_ads_mcp.cache import QueryCache
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
+from google_ads_mcp.hashing import hasher_from_env
+from google_ads_mcp.history import ProtoRowCodec, history_from_env
+from google_ads_mcp.outbox import outbox_from_env, run_outbox_worker
+from google_ads_mcp.quota import quota_from_env
+from google_ads_mcp.sharding import shard_settings_from_env
+from google_ads_mcp.singleflight import SingleFlight
+from google_ads_mcp.warehouse import warehouse_from_env
 
 logger = logging.getLogger(__name__)
 
@@ -20,16 +36,73 @@ SERVER_NAME = "google_ads_mcp"
 async def app_lifespan(server: FastMCP) -> AsyncIterator[dict]:
     """Initialize Google Ads client at server startup.
 
-    Yields a dict with 'ads_client' key containing the GoogleAdsClientWrapper.
+    Yields a dict with 'ads_client' key containing the
+    AsyncGoogleAdsClientWrapper (a GoogleAdsClientWrapper with async methods)
+    backed by a shared QueryCache and, unless disabled via
+    GOOGLE_ADS_HISTORY_DB, the persistent closed-day HistoryCache, and
+    rate-limited by the QuotaLimiter configured from the environment.
+    Identical concurrent reads share one request through a SingleFlight,
+    and long date-ranged reports are read as concurrent date shards.
+    Large mutations are sent in concurrent chunks (see BulkMutator) and,
+    when GOOGLE_ADS_MUTATE_BATCH_WINDOW_MS is set, small ones of the same
+    customer are merged into shared requests (see MutationBatcher).
+    Customer Match identifiers are hashed in a process pool (see
+    IdentifierHasher). With GOOGLE_ADS_PROTOBUF_ROWS set, a second client
+    created with use_proto_plus=False serves the read-only report tools.
     Tools access it via ctx.request_context.lifespan_state["ads_client"].
+    The 'warehouse' key holds the local report Warehouse (None when
+    GOOGLE_ADS_WAREHOUSE_DB is empty). The 'outbox' key holds the Outbox of
+    uploads that failed transiently (None when GOOGLE_ADS_OUTBOX_DB is
+    empty), drained by a background task for the server's lifetime.
     """
     logger.info("Initializing Google Ads MCP server...")
     config = load_config_from_env()
     raw_client = create_google_ads_client(config)
-    wrapper = GoogleAdsClientWrapper(raw_client)
+    row_type = type(raw_client.get_type("GoogleAdsRow"))
+    protobuf_client = (
+        create_google_ads_client(config, use_proto_plus=False)
+        if protobuf_rows_from_env()
+        else None
+    )
+    shard_size, shard_concurrency = shard_settings_from_env()
+    mutate_chunk_size, mutate_concurrency = bulk_settings_from_env()
+    batch_window, batch_max_operations = batcher_settings_from_env()
+    wrapper = AsyncGoogleAdsClientWrapper(
+        raw_client,
+        cache=QueryCache(),
+        history=history_from_env(ProtoRowCodec(row_type)),
+        quota=quota_from_env(),
+        singleflight=SingleFlight(),
+        shard_size=shard_size,
+        shard_concurrency=shard_concurrency,
+        mutate_chunk_size=mutate_chunk_size,
+        mutate_concurrency=mutate_concurrency,
+        mutate_batch_window=batch_window,
+        mutate_batch_max_operations=batch_max_operations,
+        hasher=hasher_from_env(),
+        protobuf_client=protobuf_client,
+    )
+    warehouse = warehouse_from_env()
+    outbox, outbox_interval = outbox_from_env()
+    outbox_worker = (
+        asyncio.create_task(run_outbox_worker(wrapper, outbox, outbox_interval))
+        if outbox is not None
+        else None
+    )
     logger.info("Google Ads client initialized successfully.")
 
-    yield {"ads_client": wrapper}
+    try:
+        yield {"ads_client": wrapper, "warehouse": warehouse, "outbox": outbox}
+    finally:
+        if outbox_worker is not None:
+            outbox_worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await outbox_worker
+        wrapper.close()
+        if warehouse is not None:
+            warehouse.close()
+        if outbox is not None:
+            outbox.close()
 
     logger.info("Google Ads MCP server shutting down.")
 
@@ -0,0 +1,66 @@
+"""Split long ``segments.date BETWEEN`` ranges into shards."""
+
+from __future__ import annotations
+
+import os
+from datetime import date, timedelta
+
+from google_ads_mcp.utils.errors import InvalidInputError
+
+ShardSize = str | int
+
+SHARD_UNITS = ("week", "month")
+
+
+def parse_shard_size(value: str) -> ShardSize | None:
+    """Parse ``week``, ``month`` or a number of days ('' / '0' disable sharding).
+
+    Raises:
+        InvalidInputError: On any other value.
+    """
+    value = value.strip().lower()
+    if value in ("", "0", "off"):
+        return None
+    if value in SHARD_UNITS:
+        return value
+    if value.isdigit():
+        return int(value)
+    raise InvalidInputError(
+        f"Invalid shard size: '{value}'. "
+        "Use 'week', 'month' or a number of days.",
+        field="shard",
+    )
+
+
+def shard_ranges(start: date, end: date, size: ShardSize) -> list[tuple[date, date]]:
+    """Cover [start, end] with consecutive, non-overlapping (first, last) ranges.
+
+    ``week`` cuts at Mondays, ``month`` at the first of each month and an
+    integer every N days from ``start``; the first and last shards may be
+    partial.
+    """
+    spans: list[tuple[date, date]] = []
+    current = start
+    while current <= end:
+        if size == "week":
+            boundary = current + timedelta(days=7 - current.weekday())
+        elif size == "month":
+            boundary = (current.replace(day=1) + timedelta(days=32)).replace(day=1)
+        else:
+            boundary = current + timedelta(days=max(1, int(size)))
+        last = min(end, boundary - timedelta(days=1))
+        spans.append((current, last))
+        current = last + timedelta(days=1)
+    return spans
+
+
+def shard_settings_from_env() -> tuple[ShardSize | None, int]:
+    """Read shard size and concurrency from the environment.
+
+    ``GOOGLE_ADS_REPORT_SHARD`` is week, month (default) or a number of
+    days (empty disables sharding); ``GOOGLE_ADS_SHARD_CONCURRENCY`` caps
+    the shards in flight per report (default 4).
+    """
+    size = parse_shard_size(os.environ.get("GOOGLE_ADS_REPORT_SHARD", "month"))
+    concurrency = int(os.environ.get("GOOGLE_ADS_SHARD_CONCURRENCY", "4"))
+    return size, max(1, concurrency)
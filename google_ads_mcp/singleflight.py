@@ -0,0 +1,123 @@
+"""In-flight deduplication of identical concurrent API reads."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable
+
+
+@dataclass(frozen=True)
+class FlightStats:
+    """Snapshot of single-flight counters."""
+
+    executed: int
+    coalesced: int
+    in_flight: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "in_flight": self.in_flight,
+        }
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Share one execution among concurrent callers with the same key.
+
+    The first caller for a key runs the function; callers arriving while it
+    is still running wait for and receive the same result (or exception)
+    instead of issuing their own request. Once the call completes the key
+    is released, so later callers start a fresh one; results are not kept
+    (that is the :class:`~google_ads_mcp.cache.QueryCache`'s job).
+
+    Threads use :meth:`do`, coroutines :meth:`ado`; the two keep separate
+    in-flight tables.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._tasks: dict[Hashable, asyncio.Future[Any]] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> tuple[Any, bool]:
+        """Run ``func`` once for all concurrent callers of ``key``.
+
+        Returns:
+            Tuple of (result, shared) where ``shared`` is True for callers
+            that received another caller's result.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            shared = call is not None
+            if shared:
+                self._coalesced += 1
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._executed += 1
+        if shared:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    async def ado(
+        self, key: Hashable, func: Callable[[], Awaitable[Any]]
+    ) -> tuple[Any, bool]:
+        """Async variant of :meth:`do`.
+
+        The shared call runs as a task, so a caller that is cancelled does
+        not cancel it for the others.
+        """
+        with self._lock:
+            task = self._tasks.get(key)
+            shared = task is not None
+            if shared:
+                self._coalesced += 1
+            else:
+                task = asyncio.ensure_future(func())
+                self._tasks[key] = task
+                self._executed += 1
+                task.add_done_callback(lambda t: self._release(key, t))
+        return await asyncio.shield(task), shared
+
+    def stats(self) -> FlightStats:
+        with self._lock:
+            return FlightStats(
+                executed=self._executed,
+                coalesced=self._coalesced,
+                in_flight=len(self._calls) + len(self._tasks),
+            )
+
+    def _release(self, key: Hashable, task: asyncio.Future[Any]) -> None:
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every waiter went away.
+            task.exception()
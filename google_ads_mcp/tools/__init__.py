@@ -12,8 +12,12 @@ from google_ads_mcp.tools import (  # noqa: F401
     keyword_planner,
     keywords,
     labels,
+    mcc,
+    outbox,
+    quota,
     search_terms,
     views,
+    warehouse,
 )
 from google_ads_mcp.tools.mutations import (  # noqa: F401
     campaign_ops,
@@ -30,4 +34,5 @@ from google_ads_mcp.tools.mutations import (  # noqa: F401
     shopping_ops,
     conversion_ops,
     customer_list_ops,
+    batch_job_ops,
 )
@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import inspect
+from dataclasses import replace
 from typing import Any
 
 from mcp.server.fastmcp import Context
 
-from google_ads_mcp.client import GoogleAdsClientWrapper
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
+from google_ads_mcp.outbox import Outbox
+from google_ads_mcp.partial_failure import OperationFailure
+from google_ads_mcp.utils.errors import GoogleAdsMCPError
+from google_ads_mcp.utils.pagination import (
+    PaginationInfo,
+    decode_cursor,
+    encode_cursor,
+    paginate_results,
+)
+from google_ads_mcp.warehouse import Warehouse
 
 
 # Maps our enum values to GAQL campaign status literals
@@ -38,11 +50,223 @@ CAMPAIGN_TYPE_MAP: dict[str, str] = {
 }
 
 
-def get_client(ctx: Context) -> GoogleAdsClientWrapper:
+def get_client(ctx: Context) -> AsyncGoogleAdsClientWrapper:
     """Extract Google Ads client from FastMCP context."""
     return ctx.request_context.lifespan_context["ads_client"]
 
 
+async def report_progress(
+    ctx: Context, progress: float, total: float | None = None
+) -> None:
+    """Send an MCP progress notification when the request asked for one."""
+    if ctx is None:
+        return
+    result = ctx.report_progress(progress, total)
+    if inspect.isawaitable(result):
+        await result
+
+
+def get_warehouse(ctx: Context) -> Warehouse:
+    """Extract the local report warehouse from FastMCP context.
+
+    Raises:
+        GoogleAdsMCPError: If the warehouse is disabled.
+    """
+    warehouse = ctx.request_context.lifespan_context.get("warehouse")
+    if warehouse is None:
+        raise GoogleAdsMCPError(
+            "Local warehouse disabled: set GOOGLE_ADS_WAREHOUSE_DB."
+        )
+    return warehouse
+
+
+def get_outbox(ctx: Context) -> Outbox | None:
+    """Extract the upload outbox from FastMCP context (None when disabled)."""
+    return ctx.request_context.lifespan_context.get("outbox")
+
+
+async def fetch_page(
+    client: AsyncGoogleAdsClientWrapper,
+    customer_id: str,
+    query: str,
+    limit: int,
+    offset: int = 0,
+    cursor: str = "",
+    protobuf: bool = False,
+    bypass_cache: bool = False,
+) -> tuple[list[Any], PaginationInfo]:
+    """Fetch one page of raw GAQL rows.
+
+    Without a cursor the page starts at ``offset``. With a cursor from a
+    previous call's ``next_cursor``, reading resumes at the stored API page
+    token, so only the requested slice is pulled. Parse the returned rows,
+    not the whole result set. Pass ``protobuf=True`` only when the rows are
+    parsed with a :class:`~google_ads_mcp.columns.RowExtractor`, which
+    reads raw protobuf rows as well as proto-plus ones. ``bypass_cache``
+    skips the client's result cache.
+
+    Raises:
+        InvalidInputError: If ``cursor`` is malformed or issued for another query.
+    """
+    if cursor:
+        start = decode_cursor(cursor, query)
+        page_token, position, offset = start.page_token, start.position, start.offset
+    else:
+        page_token, position = "", offset
+
+    result = await client.aquery_page(
+        customer_id, query, limit,
+        page_token=page_token, position=position, protobuf=protobuf,
+        bypass_cache=bypass_cache,
+    )
+    count = len(result.rows)
+    next_cursor = None
+    if result.has_more:
+        next_cursor = encode_cursor(
+            query, result.next_page_token, result.next_position, offset + count
+        )
+    total = None if result.has_more else offset - position + result.skipped + count
+    info = PaginationInfo(
+        total=total,
+        count=count,
+        offset=offset,
+        limit=limit,
+        has_more=result.has_more,
+        next_cursor=next_cursor,
+    )
+    return result.rows, info
+
+
+async def fetch_report_page(
+    client: AsyncGoogleAdsClientWrapper,
+    customer_id: str,
+    query: str,
+    limit: int,
+    offset: int = 0,
+    cursor: str = "",
+    protobuf: bool = False,
+    bypass_cache: bool = False,
+) -> tuple[list[Any], PaginationInfo]:
+    """Fetch one page of a ``segments.date BETWEEN`` report.
+
+    When the client has a history cache that supports the query, closed
+    days come from the local store and only the open tail hits the API.
+    Otherwise, a range longer than one shard is read as concurrent date
+    shards (see ``aquery_sharded``). Either way the aggregated rows are
+    paginated locally with an exact total; other queries go through
+    :func:`fetch_page`. ``protobuf`` applies to rows read from the API
+    (see :func:`fetch_page`); history rows stay proto-plus.
+    ``bypass_cache`` reads every day from the API, refreshing the history.
+    """
+    history = getattr(client, "history", None)
+    use_history = history is not None and history.supports(query)
+    use_shards = (
+        not use_history
+        and getattr(client, "shard_size", None)
+        and len(client.shards_for(query)) > 1
+    )
+    if not (use_history or use_shards):
+        return await fetch_page(
+            client, customer_id, query, limit, offset, cursor,
+            protobuf=protobuf, bypass_cache=bypass_cache,
+        )
+
+    if cursor:
+        offset = decode_cursor(cursor, query).offset
+    if use_history:
+        rows = await client.arun(
+            history.query, client, customer_id, query, bypass_cache
+        )
+    else:
+        rows = await client.aquery_sharded(
+            customer_id, query, bypass_cache=bypass_cache, protobuf=protobuf
+        )
+    page, info = paginate_results(rows, limit, offset)
+    if info.has_more:
+        next_offset = offset + info.count
+        info = replace(
+            info, next_cursor=encode_cursor(query, "", next_offset, next_offset)
+        )
+    return page, info
+
+
+async def fetch_warehouse_page(
+    client: AsyncGoogleAdsClientWrapper,
+    warehouse: Warehouse,
+    resource: str,
+    customer_id: str,
+    start_date: str,
+    end_date: str,
+    filters: dict[str, str | None],
+    order_by: str,
+    limit: int,
+    offset: int = 0,
+    cursor: str = "",
+) -> tuple[list[Any], PaginationInfo]:
+    """Fetch one page of a report from the local warehouse tables.
+
+    Rows look like GAQL rows, so the tool's row parser applies unchanged.
+    Cursors encode the offset and are bound to the report parameters.
+    """
+    signature = (
+        f"warehouse {resource} {customer_id} {start_date} {end_date} "
+        f"{sorted((k, v) for k, v in filters.items() if v)} {order_by}"
+    )
+    if cursor:
+        offset = decode_cursor(cursor, signature).offset
+    rows, total = await client.arun(
+        warehouse.report, resource, customer_id, start_date, end_date,
+        filters=filters, order_by=order_by, limit=limit, offset=offset,
+    )
+    has_more = offset + len(rows) < total
+    next_cursor = None
+    if has_more:
+        next_offset = offset + len(rows)
+        next_cursor = encode_cursor(signature, "", next_offset, next_offset)
+    info = PaginationInfo(
+        total=total,
+        count=len(rows),
+        offset=offset,
+        limit=limit,
+        has_more=has_more,
+        next_cursor=next_cursor,
+    )
+    return rows, info
+
+
+def cursor_footer(pagination: PaginationInfo) -> str:
+    """Markdown hint with the cursor to pass for the next page, if any."""
+    if not pagination.next_cursor:
+        return ""
+    return f"\n\n_Next page: cursor=`{pagination.next_cursor}`_"
+
+
+# Rejected operations listed in a tool response; the rest are counted.
+MAX_LISTED_FAILURES = 20
+
+
+def failures_footer(
+    failures: list[OperationFailure], noun: str, errors: list[str] | None = None
+) -> str:
+    """Text block listing the items rejected in a partial-failure mutate.
+
+    Args:
+        failures: Rejected operations, each carrying its input item.
+        noun: What the items are, e.g. "keyword(s)".
+        errors: Messages not tied to an operation.
+    """
+    lines: list[str] = []
+    if failures:
+        lines.append(f"\n{len(failures)} {noun} rejected:")
+        for failure in failures[:MAX_LISTED_FAILURES]:
+            lines.append(f"- {failure.item}: {failure.error}")
+        if len(failures) > MAX_LISTED_FAILURES:
+            lines.append(f"- ... (+{len(failures) - MAX_LISTED_FAILURES} more)")
+    for error in errors or []:
+        lines.append(f"\nError: {error}")
+    return "\n".join(lines)
+
+
 def safe_int(value: Any) -> int:
     """Safely convert a proto value to int, defaulting to 0."""
     try:
@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from mcp.server.fastmcp import Context
 
+from google_ads_mcp.enums import CAMPAIGN_STATUS, enum_name
 from google_ads_mcp.models.tool_inputs import GetAccountOverviewInput
 from google_ads_mcp.server import mcp
 from google_ads_mcp.tools._helpers import get_client, safe_int
 from google_ads_mcp.utils.formatting import (
     format_response,
     micros_to_currency,
+    to_json,
+    wants_json,
 )
 
 
@@ -38,7 +40,7 @@ def _build_campaign_count_query() -> str:
 
 
 @mcp.tool()
-def get_account_overview(
+async def get_account_overview(
     customer_id: str,
     start_date: str = "",
     end_date: str = "",
@@ -51,7 +53,7 @@ def get_account_overview(
         customer_id: Google Ads customer ID.
         start_date: Start date YYYY-MM-DD (default: 30 days ago).
         end_date: End date YYYY-MM-DD (default: today).
-        response_format: markdown or json.
+        response_format: markdown, json or compact (unindented json).
     """
     kwargs: dict[str, Any] = {
         "customer_id": customer_id,
@@ -67,7 +69,7 @@ def get_account_overview(
 
     # Fetch account-level metrics
     perf_query = _build_account_performance_query(params)
-    perf_rows = client.query(params.customer_id, perf_query)
+    perf_rows = await client.aquery(params.customer_id, perf_query)
 
     # Aggregate metrics across date segments
     total_impressions = 0
@@ -89,15 +91,15 @@ def get_account_overview(
 
     # Fetch campaign counts
     camp_query = _build_campaign_count_query()
-    camp_rows = client.query(params.customer_id, camp_query)
+    camp_rows = await client.aquery(params.customer_id, camp_query)
 
     enabled_count = 0
     paused_count = 0
     for row in camp_rows:
-        status = str(row.campaign.status)
-        if "ENABLED" in status:
+        status = enum_name(row.campaign.status, CAMPAIGN_STATUS)
+        if status == "ENABLED":
             enabled_count += 1
-        elif "PAUSED" in status:
+        elif status == "PAUSED":
             paused_count += 1
 
     overview = {
@@ -118,7 +120,7 @@ def get_account_overview(
         },
     }
 
-    if params.response_format.value == "json":
-        return json.dumps(overview, indent=2, ensure_ascii=False)
+    if wants_json(params.response_format):
+        return to_json(overview, params.response_format)
 
     return format_response(overview, "markdown", "Account Overview")
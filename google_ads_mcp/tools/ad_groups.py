@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from mcp.server.fastmcp import Context
 
+from google_ads_mcp.columns import Field, RowExtractor
 from google_ads_mcp.models.tool_inputs import (
     GetAdGroupPerformanceInput,
     ListAdGroupsInput,
@@ -14,15 +14,14 @@ from google_ads_mcp.models.tool_inputs import (
 from google_ads_mcp.server import mcp
 from google_ads_mcp.tools._helpers import (
     AD_GROUP_STATUS_MAP,
+    cursor_footer,
+    fetch_page,
+    fetch_report_page,
+    fetch_warehouse_page,
     get_client,
-    safe_int,
-    safe_str,
+    get_warehouse,
 )
-from google_ads_mcp.utils.formatting import (
-    format_table_markdown,
-    micros_to_currency,
-)
-from google_ads_mcp.utils.pagination import paginate_results
+from google_ads_mcp.utils.formatting import format_table_markdown, to_json, wants_json
 
 
 def _build_list_ad_groups_query(params: ListAdGroupsInput) -> str:
@@ -48,27 +47,25 @@ def _build_list_ad_groups_query(params: ListAdGroupsInput) -> str:
     return query
 
 
-def _parse_ad_group_row(row: Any) -> dict[str, Any]:
-    """Extract ad group fields from a GAQL result row."""
-    ag = row.ad_group
-    camp = row.campaign
-    return {
-        "id": safe_str(ag.id),
-        "name": safe_str(ag.name),
-        "status": safe_str(ag.status).replace("AdGroupStatus.", ""),
-        "type": safe_str(ag.type_).replace("AdGroupType.", ""),
-        "campaign_id": safe_str(camp.id),
-        "campaign_name": safe_str(camp.name),
-    }
+_AD_GROUP_ROWS = RowExtractor(
+    Field("id", "ad_group.id"),
+    Field("name", "ad_group.name"),
+    Field("status", "ad_group.status", "enum"),
+    Field("type", "ad_group.type_", "enum"),
+    Field("campaign_id", "campaign.id"),
+    Field("campaign_name", "campaign.name"),
+    name="AdGroupRow",
+)
 
 
 @mcp.tool()
-def list_ad_groups(
+async def list_ad_groups(
     customer_id: str,
     campaign_id: str | None = None,
     status: str = "all",
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -80,13 +77,15 @@ def list_ad_groups(
         status: Filter by status: all, enabled, paused, removed.
         limit: Max results (1-1000).
         offset: Starting offset.
-        response_format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: markdown, json or compact (unindented json).
     """
     kwargs: dict[str, Any] = {
         "customer_id": customer_id,
         "status": status,
         "limit": limit,
         "offset": offset,
+        "cursor": cursor,
         "response_format": response_format,
     }
     if campaign_id:
@@ -95,16 +94,16 @@ def list_ad_groups(
     params = ListAdGroupsInput(**kwargs)
     client = get_client(ctx)
     query = _build_list_ad_groups_query(params)
-    rows = client.query(params.customer_id, query)
-
-    ad_groups = [_parse_ad_group_row(row) for row in rows]
-    page, pagination = paginate_results(ad_groups, params.limit, params.offset)
+    rows, pagination = await fetch_page(
+        client, params.customer_id, query,
+        params.limit, params.offset, params.cursor, protobuf=True,
+    )
+    page = _AD_GROUP_ROWS.records(rows)
 
-    if params.response_format.value == "json":
-        return json.dumps(
+    if wants_json(params.response_format):
+        return to_json(
             {"ad_groups": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            params.response_format,
         )
 
     columns = ["id", "name", "status", "type", "campaign_name"]
@@ -117,10 +116,11 @@ def list_ad_groups(
     }
     table = format_table_markdown(page, columns, headers)
     return (
-        f"## Ad Groups ({pagination.count}/{pagination.total})\n\n"
+        f"## Ad Groups ({pagination.count}/{pagination.total_label})\n\n"
         f"{table}\n\n"
-        f"_Showing {pagination.count} of {pagination.total} ad groups"
+        f"_Showing {pagination.count} of {pagination.total_label} ad groups"
         f"{' (more available)' if pagination.has_more else ''}_"
+        f"{cursor_footer(pagination)}"
     )
 
 
@@ -155,26 +155,23 @@ def _build_ad_group_performance_query(
     return query
 
 
-def _parse_ad_group_performance_row(row: Any) -> dict[str, Any]:
-    """Extract ad group performance fields from a GAQL result row."""
-    ag = row.ad_group
-    m = row.metrics
-    return {
-        "id": safe_str(ag.id),
-        "name": safe_str(ag.name),
-        "campaign": safe_str(row.campaign.name),
-        "impressions": safe_int(m.impressions),
-        "clicks": safe_int(m.clicks),
-        "cost": micros_to_currency(safe_int(m.cost_micros)),
-        "conversions": round(float(m.conversions or 0), 2),
-        "ctr": f"{float(m.ctr or 0) * 100:.2f}%",
-        "avg_cpc": micros_to_currency(safe_int(m.average_cpc)),
-        "conv_rate": f"{float(m.conversions_from_interactions_rate or 0) * 100:.2f}%",
-    }
+_AD_GROUP_PERFORMANCE_ROWS = RowExtractor(
+    Field("id", "ad_group.id"),
+    Field("name", "ad_group.name"),
+    Field("campaign", "campaign.name"),
+    Field("impressions", "metrics.impressions", "int"),
+    Field("clicks", "metrics.clicks", "int"),
+    Field("cost", "metrics.cost_micros", "micros"),
+    Field("conversions", "metrics.conversions", "float"),
+    Field("ctr", "metrics.ctr", "percent"),
+    Field("avg_cpc", "metrics.average_cpc", "micros"),
+    Field("conv_rate", "metrics.conversions_from_interactions_rate", "percent"),
+    name="AdGroupPerfRow",
+)
 
 
 @mcp.tool()
-def get_ad_group_performance(
+async def get_ad_group_performance(
     customer_id: str,
     campaign_id: str | None = None,
     ad_group_id: str | None = None,
@@ -183,7 +180,10 @@ def get_ad_group_performance(
     end_date: str = "",
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
+    source: str = "api",
     response_format: str = "markdown",
+    bypass_cache: bool = False,
     ctx: Context = None,
 ) -> str:
     """Get performance metrics for ad groups over a date range.
@@ -197,13 +197,18 @@ def get_ad_group_performance(
         end_date: End date YYYY-MM-DD (default: today).
         limit: Max results (1-1000).
         offset: Starting offset.
-        response_format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        source: api (live query) or warehouse (local tables from gads_sync_reports).
+        response_format: markdown, json or compact (unindented json).
+        bypass_cache: Read every day from the API, refreshing the local history.
     """
     kwargs: dict[str, Any] = {
         "customer_id": customer_id,
         "status": status,
         "limit": limit,
         "offset": offset,
+        "cursor": cursor,
+        "source": source,
         "response_format": response_format,
     }
     if campaign_id:
@@ -218,16 +223,29 @@ def get_ad_group_performance(
     params = GetAdGroupPerformanceInput(**kwargs)
     client = get_client(ctx)
     query = _build_ad_group_performance_query(params)
-    rows = client.query(params.customer_id, query)
-
-    perf = [_parse_ad_group_performance_row(row) for row in rows]
-    page, pagination = paginate_results(perf, params.limit, params.offset)
+    if params.source.value == "warehouse":
+        rows, pagination = await fetch_warehouse_page(
+            client, get_warehouse(ctx), "ad_group", params.customer_id,
+            params.start_date, params.end_date,
+            {
+                "campaign_id": params.campaign_id,
+                "ad_group_id": params.ad_group_id,
+                "status": AD_GROUP_STATUS_MAP.get(params.status.value),
+            },
+            "cost_micros", params.limit, params.offset, params.cursor,
+        )
+    else:
+        rows, pagination = await fetch_report_page(
+            client, params.customer_id, query,
+            params.limit, params.offset, params.cursor, protobuf=True,
+            bypass_cache=bypass_cache,
+        )
+    page = _AD_GROUP_PERFORMANCE_ROWS.records(rows)
 
-    if params.response_format.value == "json":
-        return json.dumps(
+    if wants_json(params.response_format):
+        return to_json(
             {"performance": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            params.response_format,
         )
 
     columns = [
@@ -248,5 +266,6 @@ def get_ad_group_performance(
     return (
         f"## Ad Group Performance ({params.start_date} → {params.end_date})\n\n"
         f"{table}\n\n"
-        f"_Showing {pagination.count} of {pagination.total} ad groups_"
+        f"_Showing {pagination.count} of {pagination.total_label} ad groups_"
+        f"{cursor_footer(pagination)}"
     )
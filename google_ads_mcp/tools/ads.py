@@ -2,22 +2,20 @@
 
 from __future__ import annotations
 
-import json
 from datetime import date, timedelta
-from typing import Any
 
 from mcp.server.fastmcp import Context
 
+from google_ads_mcp.columns import Field, RowExtractor
 from google_ads_mcp.models.common import sanitize_customer_id
 from google_ads_mcp.server import mcp
 from google_ads_mcp.tools._helpers import (
     AD_GROUP_STATUS_MAP,
+    cursor_footer,
+    fetch_page,
     get_client,
-    safe_int,
-    safe_str,
 )
-from google_ads_mcp.utils.formatting import format_table_markdown, micros_to_currency
-from google_ads_mcp.utils.pagination import paginate_results
+from google_ads_mcp.utils.formatting import format_table_markdown, to_json, wants_json
 
 
 def _default_dates(start: str, end: str) -> tuple[str, str]:
@@ -67,32 +65,27 @@ def _build_list_ads_query(
     return query
 
 
-def _parse_ad_row(row: Any) -> dict[str, Any]:
-    """Extract ad group ad fields from a GAQL result row."""
-    ad = row.ad_group_ad.ad
-    aga = row.ad_group_ad
-    ag = row.ad_group
-    m = row.metrics
-    return {
-        "ad_id": safe_str(ad.id),
-        "ad_name": safe_str(ad.name),
-        "ad_type": safe_str(ad.type_).replace("AdType.", ""),
-        "status": safe_str(aga.status).replace("AdGroupAdStatus.", ""),
-        "approval_status": safe_str(aga.policy_summary.approval_status),
-        "review_status": safe_str(aga.policy_summary.review_status),
-        "ad_group_id": safe_str(ag.id),
-        "ad_group_name": safe_str(ag.name),
-        "campaign_name": safe_str(row.campaign.name),
-        "impressions": safe_int(m.impressions),
-        "clicks": safe_int(m.clicks),
-        "cost": micros_to_currency(safe_int(m.cost_micros)),
-        "conversions": round(float(m.conversions or 0), 2),
-        "ctr": f"{float(m.ctr or 0) * 100:.2f}%",
-    }
+_AD_ROWS = RowExtractor(
+    Field("ad_id", "ad_group_ad.ad.id"),
+    Field("ad_name", "ad_group_ad.ad.name"),
+    Field("ad_type", "ad_group_ad.ad.type_", "enum"),
+    Field("status", "ad_group_ad.status", "enum"),
+    Field("approval_status", "ad_group_ad.policy_summary.approval_status", "enum"),
+    Field("review_status", "ad_group_ad.policy_summary.review_status", "enum"),
+    Field("ad_group_id", "ad_group.id"),
+    Field("ad_group_name", "ad_group.name"),
+    Field("campaign_name", "campaign.name"),
+    Field("impressions", "metrics.impressions", "int"),
+    Field("clicks", "metrics.clicks", "int"),
+    Field("cost", "metrics.cost_micros", "micros"),
+    Field("conversions", "metrics.conversions", "float"),
+    Field("ctr", "metrics.ctr", "percent"),
+    name="AdRow",
+)
 
 
 @mcp.tool()
-def gads_list_ad_group_ads(
+async def gads_list_ad_group_ads(
     customer_id: str,
     campaign_id: str | None = None,
     ad_group_id: str | None = None,
@@ -101,6 +94,7 @@ def gads_list_ad_group_ads(
     end_date: str = "",
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -115,22 +109,22 @@ def gads_list_ad_group_ads(
         end_date: End date YYYY-MM-DD (default: today).
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     cid = sanitize_customer_id(customer_id)
     start, end = _default_dates(start_date, end_date)
     client = get_client(ctx)
     query = _build_list_ads_query(cid, start, end, campaign_id, ad_group_id, status)
-    rows = client.query(cid, query)
-
-    parsed = [_parse_ad_row(r) for r in rows]
-    page, pagination = paginate_results(parsed, limit, offset)
+    rows, pagination = await fetch_page(
+        client, cid, query, limit, offset, cursor, protobuf=True,
+    )
+    page = _AD_ROWS.records(rows)
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"ad_group_ads": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     columns = [
@@ -156,6 +150,7 @@ def gads_list_ad_group_ads(
     return (
         f"## Ad Group Ads ({start} \u2192 {end})\n\n"
         f"{table}\n\n"
-        f"_Showing {pagination.count} of {pagination.total} ads"
+        f"_Showing {pagination.count} of {pagination.total_label} ads"
         f"{' (more available)' if pagination.has_more else ''}_"
+        f"{cursor_footer(pagination)}"
     )
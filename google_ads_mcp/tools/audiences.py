@@ -2,20 +2,19 @@
 
 from __future__ import annotations
 
-import json
 from datetime import date, timedelta
-from typing import Any
 
 from mcp.server.fastmcp import Context
 
+from google_ads_mcp.columns import Field, RowExtractor
 from google_ads_mcp.models.common import sanitize_customer_id
 from google_ads_mcp.server import mcp
-from google_ads_mcp.tools._helpers import get_client, safe_int, safe_str
-from google_ads_mcp.utils.formatting import (
-    format_table_markdown,
-    micros_to_currency,
+from google_ads_mcp.tools._helpers import (
+    cursor_footer,
+    fetch_page,
+    get_client,
 )
-from google_ads_mcp.utils.pagination import paginate_results
+from google_ads_mcp.utils.formatting import format_table_markdown, to_json, wants_json
 
 
 def _default_dates() -> tuple[str, str]:
@@ -52,28 +51,27 @@ def _build_list_audiences_query(
     return query
 
 
-def _parse_audience_row(row: Any) -> dict[str, Any]:
-    """Extract audience fields from a GAQL result row."""
-    m = row.metrics
-    return {
-        "resource_name": safe_str(row.campaign_audience_view.resource_name),
-        "campaign": safe_str(row.campaign.name),
-        "criterion_id": safe_str(row.campaign_criterion.criterion_id),
-        "impressions": safe_int(m.impressions),
-        "clicks": safe_int(m.clicks),
-        "cost": micros_to_currency(safe_int(m.cost_micros)),
-        "conversions": round(float(m.conversions or 0), 2),
-    }
+_AUDIENCE_ROWS = RowExtractor(
+    Field("resource_name", "campaign_audience_view.resource_name"),
+    Field("campaign", "campaign.name"),
+    Field("criterion_id", "campaign_criterion.criterion_id"),
+    Field("impressions", "metrics.impressions", "int"),
+    Field("clicks", "metrics.clicks", "int"),
+    Field("cost", "metrics.cost_micros", "micros"),
+    Field("conversions", "metrics.conversions", "float"),
+    name="AudienceRow",
+)
 
 
 @mcp.tool()
-def gads_list_audiences(
+async def gads_list_audiences(
     customer_id: str,
     campaign_id: str | None = None,
     start_date: str = "",
     end_date: str = "",
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -86,7 +84,8 @@ def gads_list_audiences(
         end_date: End date YYYY-MM-DD (default: today).
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     cid = sanitize_customer_id(customer_id)
     default_start, default_end = _default_dates()
@@ -95,17 +94,15 @@ def gads_list_audiences(
 
     client = get_client(ctx)
     query = _build_list_audiences_query(cid, campaign_id, start, end)
-    rows = client.query(cid, query)
-
-    audiences = [_parse_audience_row(row) for row in rows]
-    page, pagination = paginate_results(audiences, limit, offset)
+    rows, pagination = await fetch_page(
+        client, cid, query, limit, offset, cursor, protobuf=True,
+    )
+    page = _AUDIENCE_ROWS.records(rows)
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"audiences": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
-            default=str,
+            response_format,
         )
 
     columns = [
@@ -124,8 +121,9 @@ def gads_list_audiences(
     return (
         f"## Audience Segments ({start} \u2192 {end})\n\n"
         f"{table}\n\n"
-        f"_Showing {pagination.count} of {pagination.total} audiences"
+        f"_Showing {pagination.count} of {pagination.total_label} audiences"
         f"{' (more available)' if pagination.has_more else ''}_"
+        f"{cursor_footer(pagination)}"
     )
 
 
@@ -153,25 +151,22 @@ def _build_list_user_interests_query(
     return query
 
 
-def _parse_user_interest_row(row: Any) -> dict[str, Any]:
-    """Extract user interest fields from a GAQL result row."""
-    ui = row.user_interest
-    return {
-        "id": safe_str(ui.user_interest_id),
-        "name": safe_str(ui.name),
-        "taxonomy_type": safe_str(ui.taxonomy_type).replace(
-            "UserInterestTaxonomyType.", ""
-        ),
-        "availabilities": safe_str(ui.availabilities),
-    }
+_USER_INTEREST_ROWS = RowExtractor(
+    Field("id", "user_interest.user_interest_id"),
+    Field("name", "user_interest.name"),
+    Field("taxonomy_type", "user_interest.taxonomy_type", "enum"),
+    Field("availabilities", "user_interest.availabilities"),
+    name="UserInterestRow",
+)
 
 
 @mcp.tool()
-def gads_list_user_interests(
+async def gads_list_user_interests(
     customer_id: str,
     taxonomy_type: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -182,22 +177,21 @@ def gads_list_user_interests(
         taxonomy_type: Filter by type: AFFINITY or IN_MARKET (optional, returns all if omitted).
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     cid = sanitize_customer_id(customer_id)
     client = get_client(ctx)
     query = _build_list_user_interests_query(taxonomy_type)
-    rows = client.query(cid, query)
-
-    interests = [_parse_user_interest_row(row) for row in rows]
-    page, pagination = paginate_results(interests, limit, offset)
+    rows, pagination = await fetch_page(
+        client, cid, query, limit, offset, cursor, protobuf=True,
+    )
+    page = _USER_INTEREST_ROWS.records(rows)
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"user_interests": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
-            default=str,
+            response_format,
         )
 
     columns = ["id", "name", "taxonomy_type"]
@@ -211,6 +205,7 @@ def gads_list_user_interests(
     return (
         f"## User Interests{filter_label}\n\n"
         f"{table}\n\n"
-        f"_Showing {pagination.count} of {pagination.total} interests"
+        f"_Showing {pagination.count} of {pagination.total_label} interests"
         f"{' (more available)' if pagination.has_more else ''}_"
+        f"{cursor_footer(pagination)}"
     )
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from mcp.server.fastmcp import Context
 
+from google_ads_mcp.columns import Field, RowExtractor
+from google_ads_mcp.enums import enum_name
 from google_ads_mcp.models.common import sanitize_customer_id
 from google_ads_mcp.server import mcp
-from google_ads_mcp.tools._helpers import get_client, safe_int, safe_str, safe_float
-from google_ads_mcp.utils.formatting import format_table_markdown, micros_to_currency
-from google_ads_mcp.utils.pagination import paginate_results
+from google_ads_mcp.tools._helpers import (
+    cursor_footer,
+    fetch_page,
+    get_client,
+    safe_float,
+    safe_int,
+    safe_str,
+)
+from google_ads_mcp.utils.formatting import (
+    format_table_markdown,
+    micros_to_currency,
+    to_json,
+    wants_json,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -34,30 +46,30 @@ def _build_list_campaign_budgets_query() -> str:
     )
 
 
-def _parse_budget_row(row: Any) -> dict[str, Any]:
-    """Extract campaign budget fields from a GAQL result row."""
-    b = row.campaign_budget
-    return {
-        "id": safe_str(b.id),
-        "name": safe_str(b.name),
-        "amount": micros_to_currency(safe_int(b.amount_micros)),
-        "amount_micros": safe_int(b.amount_micros),
-        "delivery_method": safe_str(b.delivery_method),
-        "status": safe_str(b.status),
-        "type": safe_str(b.type),
-        "explicitly_shared": safe_str(b.explicitly_shared),
-        "total_amount": micros_to_currency(safe_int(b.total_amount_micros)),
-        "recommended_amount": micros_to_currency(
-            safe_int(b.recommended_budget_amount_micros)
-        ),
-    }
+_BUDGET_ROWS = RowExtractor(
+    Field("id", "campaign_budget.id"),
+    Field("name", "campaign_budget.name"),
+    Field("amount", "campaign_budget.amount_micros", "micros"),
+    Field("amount_micros", "campaign_budget.amount_micros", "int"),
+    Field("delivery_method", "campaign_budget.delivery_method", "enum"),
+    Field("status", "campaign_budget.status", "enum"),
+    Field("type", "campaign_budget.type", "enum"),
+    Field("explicitly_shared", "campaign_budget.explicitly_shared"),
+    Field("total_amount", "campaign_budget.total_amount_micros", "micros"),
+    Field(
+        "recommended_amount", "campaign_budget.recommended_budget_amount_micros",
+        "micros",
+    ),
+    name="BudgetRow",
+)
 
 
 @mcp.tool()
-def gads_list_campaign_budgets(
+async def gads_list_campaign_budgets(
     customer_id: str,
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -67,21 +79,21 @@ def gads_list_campaign_budgets(
         customer_id: Google Ads customer ID (e.g. '1234567890' or '123-456-7890').
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     cid = sanitize_customer_id(customer_id)
     client = get_client(ctx)
     query = _build_list_campaign_budgets_query()
-    rows = client.query(cid, query)
-
-    parsed = [_parse_budget_row(r) for r in rows]
-    page, pagination = paginate_results(parsed, limit, offset)
+    rows, pagination = await fetch_page(
+        client, cid, query, limit, offset, cursor, protobuf=True,
+    )
+    page = _BUDGET_ROWS.records(rows)
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"budgets": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     columns = [
@@ -100,10 +112,11 @@ def gads_list_campaign_budgets(
     table = format_table_markdown(page, columns, headers)
     info = pagination.to_dict()
     return (
-        f"## Campaign Budgets ({info['count']}/{info['total']})\n\n"
+        f"## Campaign Budgets ({info['count']}/{pagination.total_label})\n\n"
         f"{table}\n\n"
-        f"_Showing {info['count']} of {info['total']} budgets"
+        f"_Showing {info['count']} of {pagination.total_label} budgets"
         f"{' (more available)' if info['has_more'] else ''}_"
+        f"{cursor_footer(pagination)}"
     )
 
 
@@ -156,9 +169,7 @@ def _parse_bidding_strategy_row(row: Any) -> dict[str, Any]:
     return {
         "id": safe_str(c.id),
         "name": safe_str(c.name),
-        "bidding_strategy_type": safe_str(c.bidding_strategy_type).replace(
-            "BiddingStrategyType.", ""
-        ),
+        "bidding_strategy_type": enum_name(c.bidding_strategy_type),
         "bidding_strategy": safe_str(c.bidding_strategy),
         "target_cpa": micros_to_currency(effective_cpa_micros) if effective_cpa_micros else "-",
         "target_roas": f"{effective_roas:.2f}" if effective_roas else "-",
@@ -166,11 +177,12 @@ def _parse_bidding_strategy_row(row: Any) -> dict[str, Any]:
 
 
 @mcp.tool()
-def gads_get_bidding_strategies(
+async def gads_get_bidding_strategies(
     customer_id: str,
     campaign_id: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -181,21 +193,21 @@ def gads_get_bidding_strategies(
         campaign_id: Filter by specific campaign ID (optional).
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     cid = sanitize_customer_id(customer_id)
     client = get_client(ctx)
     query = _build_bidding_strategies_query(campaign_id)
-    rows = client.query(cid, query)
-
-    parsed = [_parse_bidding_strategy_row(r) for r in rows]
-    page, pagination = paginate_results(parsed, limit, offset)
+    rows, pagination = await fetch_page(
+        client, cid, query, limit, offset, cursor
+    )
+    page = [_parse_bidding_strategy_row(r) for r in rows]
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"bidding_strategies": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     columns = [
@@ -211,10 +223,11 @@ def gads_get_bidding_strategies(
     table = format_table_markdown(page, columns, headers)
     info = pagination.to_dict()
     return (
-        f"## Bidding Strategies ({info['count']}/{info['total']})\n\n"
+        f"## Bidding Strategies ({info['count']}/{pagination.total_label})\n\n"
         f"{table}\n\n"
-        f"_Showing {info['count']} of {info['total']} campaigns"
+        f"_Showing {info['count']} of {pagination.total_label} campaigns"
         f"{' (more available)' if info['has_more'] else ''}_"
+        f"{cursor_footer(pagination)}"
     )
 
 
@@ -241,27 +254,27 @@ def _build_ad_group_bidding_query(
     return query
 
 
-def _parse_ad_group_bidding_row(row: Any) -> dict[str, Any]:
-    """Extract ad group bidding fields from a GAQL result row."""
-    ag = row.ad_group
-    return {
-        "id": safe_str(ag.id),
-        "name": safe_str(ag.name),
-        "cpc_bid": micros_to_currency(safe_int(ag.cpc_bid_micros)),
-        "target_cpa": micros_to_currency(safe_int(ag.target_cpa_micros)),
-        "effective_target_cpa": micros_to_currency(
-            safe_int(ag.effective_target_cpa_micros)
-        ),
-        "effective_target_roas": f"{safe_float(ag.effective_target_roas):.2f}",
-    }
+_AD_GROUP_BIDDING_ROWS = RowExtractor(
+    Field("id", "ad_group.id"),
+    Field("name", "ad_group.name"),
+    Field("cpc_bid", "ad_group.cpc_bid_micros", "micros"),
+    Field("target_cpa", "ad_group.target_cpa_micros", "micros"),
+    Field("effective_target_cpa", "ad_group.effective_target_cpa_micros", "micros"),
+    Field(
+        "effective_target_roas", "ad_group.effective_target_roas", "float",
+        "{:.2f}".format,
+    ),
+    name="AdGroupBiddingRow",
+)
 
 
 @mcp.tool()
-def gads_get_ad_group_bidding_strategies(
+async def gads_get_ad_group_bidding_strategies(
     customer_id: str,
     campaign_id: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -272,21 +285,21 @@ def gads_get_ad_group_bidding_strategies(
         campaign_id: Filter by campaign ID (optional).
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     cid = sanitize_customer_id(customer_id)
     client = get_client(ctx)
     query = _build_ad_group_bidding_query(campaign_id)
-    rows = client.query(cid, query)
-
-    parsed = [_parse_ad_group_bidding_row(r) for r in rows]
-    page, pagination = paginate_results(parsed, limit, offset)
+    rows, pagination = await fetch_page(
+        client, cid, query, limit, offset, cursor, protobuf=True,
+    )
+    page = _AD_GROUP_BIDDING_ROWS.records(rows)
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"ad_group_bidding": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     columns = [
@@ -304,10 +317,11 @@ def gads_get_ad_group_bidding_strategies(
     table = format_table_markdown(page, columns, headers)
     info = pagination.to_dict()
     return (
-        f"## Ad Group Bidding ({info['count']}/{info['total']})\n\n"
+        f"## Ad Group Bidding ({info['count']}/{pagination.total_label})\n\n"
         f"{table}\n\n"
-        f"_Showing {info['count']} of {info['total']} ad groups"
+        f"_Showing {info['count']} of {pagination.total_label} ad groups"
         f"{' (more available)' if info['has_more'] else ''}_"
+        f"{cursor_footer(pagination)}"
     )
 
 
@@ -335,23 +349,22 @@ def _build_change_history_query(
     return query
 
 
-def _parse_change_history_row(row: Any) -> dict[str, Any]:
-    """Extract change history fields from a GAQL result row."""
-    cs = row.change_status
-    return {
-        "resource_name": safe_str(cs.resource_name),
-        "resource_type": safe_str(cs.resource_type),
-        "resource_status": safe_str(cs.resource_status),
-        "last_change_date_time": safe_str(cs.last_change_date_time),
-    }
+_CHANGE_HISTORY_ROWS = RowExtractor(
+    Field("resource_name", "change_status.resource_name"),
+    Field("resource_type", "change_status.resource_type", "enum"),
+    Field("resource_status", "change_status.resource_status", "enum"),
+    Field("last_change_date_time", "change_status.last_change_date_time"),
+    name="ChangeHistoryRow",
+)
 
 
 @mcp.tool()
-def gads_list_change_history(
+async def gads_list_change_history(
     customer_id: str,
     resource_type: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -362,21 +375,21 @@ def gads_list_change_history(
         resource_type: Filter by type: CAMPAIGN, AD_GROUP, AD, CRITERION, etc. (optional).
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     cid = sanitize_customer_id(customer_id)
     client = get_client(ctx)
     query = _build_change_history_query(resource_type)
-    rows = client.query(cid, query)
-
-    parsed = [_parse_change_history_row(r) for r in rows]
-    page, pagination = paginate_results(parsed, limit, offset)
+    rows, pagination = await fetch_page(
+        client, cid, query, limit, offset, cursor, protobuf=True,
+    )
+    page = _CHANGE_HISTORY_ROWS.records(rows)
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"change_history": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     columns = [
@@ -392,8 +405,9 @@ def gads_list_change_history(
     table = format_table_markdown(page, columns, headers)
     info = pagination.to_dict()
     return (
-        f"## Change History ({info['count']}/{info['total']})\n\n"
+        f"## Change History ({info['count']}/{pagination.total_label})\n\n"
         f"{table}\n\n"
-        f"_Showing {info['count']} of {info['total']} changes"
+        f"_Showing {info['count']} of {pagination.total_label} changes"
         f"{' (more available)' if info['has_more'] else ''}_"
+        f"{cursor_footer(pagination)}"
     )
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from mcp.server.fastmcp import Context
 
+from google_ads_mcp.columns import Field, RowExtractor
 from google_ads_mcp.models.tool_inputs import (
     GetCampaignPerformanceInput,
     ListCampaignsInput,
@@ -15,15 +15,14 @@ from google_ads_mcp.server import mcp
 from google_ads_mcp.tools._helpers import (
     CAMPAIGN_STATUS_MAP,
     CAMPAIGN_TYPE_MAP,
+    cursor_footer,
+    fetch_page,
+    fetch_report_page,
+    fetch_warehouse_page,
     get_client,
-    safe_int,
-    safe_str,
+    get_warehouse,
 )
-from google_ads_mcp.utils.formatting import (
-    format_table_markdown,
-    micros_to_currency,
-)
-from google_ads_mcp.utils.pagination import paginate_results
+from google_ads_mcp.utils.formatting import format_table_markdown, to_json, wants_json
 
 
 def _build_list_campaigns_query(params: ListCampaignsInput) -> str:
@@ -51,30 +50,25 @@ def _build_list_campaigns_query(params: ListCampaignsInput) -> str:
     return query
 
 
-def _parse_campaign_row(row: Any) -> dict[str, Any]:
-    """Extract campaign fields from a GAQL result row."""
-    campaign = row.campaign
-    return {
-        "id": safe_str(campaign.id),
-        "name": safe_str(campaign.name),
-        "status": safe_str(campaign.status).replace("CampaignStatus.", ""),
-        "type": safe_str(campaign.advertising_channel_type).replace(
-            "AdvertisingChannelType.", ""
-        ),
-        "bidding_strategy": safe_str(campaign.bidding_strategy_type).replace(
-            "BiddingStrategyType.", ""
-        ),
-        "budget": safe_str(campaign.campaign_budget),
-    }
+_CAMPAIGN_ROWS = RowExtractor(
+    Field("id", "campaign.id"),
+    Field("name", "campaign.name"),
+    Field("status", "campaign.status", "enum"),
+    Field("type", "campaign.advertising_channel_type", "enum"),
+    Field("bidding_strategy", "campaign.bidding_strategy_type", "enum"),
+    Field("budget", "campaign.campaign_budget"),
+    name="CampaignRow",
+)
 
 
 @mcp.tool()
-def list_campaigns(
+async def list_campaigns(
     customer_id: str,
     status: str = "all",
     campaign_type: str = "all",
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -86,7 +80,8 @@ def list_campaigns(
         campaign_type: Filter by type: all, search, display, shopping, video, performance_max, etc.
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     params = ListCampaignsInput(
         customer_id=customer_id,
@@ -94,20 +89,21 @@ def list_campaigns(
         campaign_type=campaign_type,
         limit=limit,
         offset=offset,
+        cursor=cursor,
         response_format=response_format,
     )
     client = get_client(ctx)
     query = _build_list_campaigns_query(params)
-    rows = client.query(params.customer_id, query)
-
-    campaigns = [_parse_campaign_row(row) for row in rows]
-    page, pagination = paginate_results(campaigns, params.limit, params.offset)
+    rows, pagination = await fetch_page(
+        client, params.customer_id, query,
+        params.limit, params.offset, params.cursor, protobuf=True,
+    )
+    page = _CAMPAIGN_ROWS.records(rows)
 
-    if params.response_format.value == "json":
-        return json.dumps(
+    if wants_json(params.response_format):
+        return to_json(
             {"campaigns": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            params.response_format,
         )
 
     columns = ["id", "name", "status", "type", "bidding_strategy"]
@@ -121,10 +117,11 @@ def list_campaigns(
     table = format_table_markdown(page, columns, headers)
     info = pagination.to_dict()
     return (
-        f"## Campaigns ({info['count']}/{info['total']})\n\n"
+        f"## Campaigns ({info['count']}/{pagination.total_label})\n\n"
         f"{table}\n\n"
-        f"_Showing {info['count']} of {info['total']} campaigns"
+        f"_Showing {info['count']} of {pagination.total_label} campaigns"
         f"{' (more available)' if info['has_more'] else ''}_"
+        f"{cursor_footer(pagination)}"
     )
 
 
@@ -155,26 +152,23 @@ def _build_campaign_performance_query(
     return query
 
 
-def _parse_campaign_performance_row(row: Any) -> dict[str, Any]:
-    """Extract performance fields from a GAQL result row."""
-    campaign = row.campaign
-    m = row.metrics
-    return {
-        "id": safe_str(campaign.id),
-        "name": safe_str(campaign.name),
-        "status": safe_str(campaign.status).replace("CampaignStatus.", ""),
-        "impressions": safe_int(m.impressions),
-        "clicks": safe_int(m.clicks),
-        "cost": micros_to_currency(safe_int(m.cost_micros)),
-        "conversions": round(float(m.conversions or 0), 2),
-        "ctr": f"{float(m.ctr or 0) * 100:.2f}%",
-        "avg_cpc": micros_to_currency(safe_int(m.average_cpc)),
-        "conv_rate": f"{float(m.conversions_from_interactions_rate or 0) * 100:.2f}%",
-    }
+_CAMPAIGN_PERFORMANCE_ROWS = RowExtractor(
+    Field("id", "campaign.id"),
+    Field("name", "campaign.name"),
+    Field("status", "campaign.status", "enum"),
+    Field("impressions", "metrics.impressions", "int"),
+    Field("clicks", "metrics.clicks", "int"),
+    Field("cost", "metrics.cost_micros", "micros"),
+    Field("conversions", "metrics.conversions", "float"),
+    Field("ctr", "metrics.ctr", "percent"),
+    Field("avg_cpc", "metrics.average_cpc", "micros"),
+    Field("conv_rate", "metrics.conversions_from_interactions_rate", "percent"),
+    name="CampaignPerfRow",
+)
 
 
 @mcp.tool()
-def get_campaign_performance(
+async def get_campaign_performance(
     customer_id: str,
     campaign_id: str | None = None,
     status: str = "enabled",
@@ -182,7 +176,10 @@ def get_campaign_performance(
     end_date: str = "",
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
+    source: str = "api",
     response_format: str = "markdown",
+    bypass_cache: bool = False,
     ctx: Context = None,
 ) -> str:
     """Get performance metrics for campaigns over a date range.
@@ -195,13 +192,18 @@ def get_campaign_performance(
         end_date: End date YYYY-MM-DD (default: today).
         limit: Max results (1-1000).
         offset: Starting offset.
-        response_format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        source: api (live query) or warehouse (local tables from gads_sync_reports).
+        response_format: markdown, json or compact (unindented json).
+        bypass_cache: Read every day from the API, refreshing the local history.
     """
     kwargs: dict[str, Any] = {
         "customer_id": customer_id,
         "status": status,
         "limit": limit,
         "offset": offset,
+        "cursor": cursor,
+        "source": source,
         "response_format": response_format,
     }
     if campaign_id:
@@ -214,16 +216,28 @@ def get_campaign_performance(
     params = GetCampaignPerformanceInput(**kwargs)
     client = get_client(ctx)
     query = _build_campaign_performance_query(params)
-    rows = client.query(params.customer_id, query)
-
-    perf = [_parse_campaign_performance_row(row) for row in rows]
-    page, pagination = paginate_results(perf, params.limit, params.offset)
+    if params.source.value == "warehouse":
+        rows, pagination = await fetch_warehouse_page(
+            client, get_warehouse(ctx), "campaign", params.customer_id,
+            params.start_date, params.end_date,
+            {
+                "campaign_id": params.campaign_id,
+                "status": CAMPAIGN_STATUS_MAP.get(params.status.value),
+            },
+            "cost_micros", params.limit, params.offset, params.cursor,
+        )
+    else:
+        rows, pagination = await fetch_report_page(
+            client, params.customer_id, query,
+            params.limit, params.offset, params.cursor, protobuf=True,
+            bypass_cache=bypass_cache,
+        )
+    page = _CAMPAIGN_PERFORMANCE_ROWS.records(rows)
 
-    if params.response_format.value == "json":
-        return json.dumps(
+    if wants_json(params.response_format):
+        return to_json(
             {"performance": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            params.response_format,
         )
 
     columns = [
@@ -244,5 +258,6 @@ def get_campaign_performance(
     return (
         f"## Campaign Performance ({params.start_date} → {params.end_date})\n\n"
         f"{table}\n\n"
-        f"_Showing {pagination.count} of {pagination.total} campaigns_"
+        f"_Showing {pagination.count} of {pagination.total_label} campaigns_"
+        f"{cursor_footer(pagination)}"
     )
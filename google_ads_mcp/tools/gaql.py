@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any
+import csv
+import os
+import tempfile
+import time
+from typing import Any, Iterable
 
 from mcp.server.fastmcp import Context
 
+from google_ads_mcp.client import GoogleAdsClientWrapper
 from google_ads_mcp.models.common import sanitize_customer_id
 from google_ads_mcp.server import mcp
 from google_ads_mcp.tools._helpers import get_client
-from google_ads_mcp.utils.formatting import format_table_markdown
+from google_ads_mcp.utils.formatting import format_table_markdown, to_json, wants_json
 
 
 def _flatten_dict(d: dict, out: dict, prefix: str = "") -> None:
@@ -31,12 +35,83 @@ def _flatten_dict(d: dict, out: dict, prefix: str = "") -> None:
             out[key] = v
 
 
+EXPORT_FORMATS = ("ndjson", "csv")
+
+
+def _row_to_dict(row: Any) -> dict[str, Any]:
+    """Convert a GAQL result row to a nested dict, falling back to its repr."""
+    try:
+        return type(row).to_dict(row)
+    except Exception:
+        return {"raw": str(row)}
+
+
+def _write_ndjson(rows: Iterable[Any], fh: Any) -> int:
+    count = 0
+    for row in rows:
+        fh.write(to_json(_row_to_dict(row), "compact"))
+        fh.write("\n")
+        count += 1
+    return count
+
+
+def _write_csv(rows: Iterable[Any], fh: Any) -> int:
+    """Write flattened rows as CSV; the header comes from the first row."""
+    writer: csv.DictWriter | None = None
+    count = 0
+    for row in rows:
+        flat: dict[str, Any] = {}
+        _flatten_dict(_row_to_dict(row), flat)
+        if writer is None:
+            writer = csv.DictWriter(
+                fh, fieldnames=list(flat), extrasaction="ignore", restval=""
+            )
+            writer.writeheader()
+        writer.writerow(flat)
+        count += 1
+    return count
+
+
+def _default_export_path(customer_id: str, file_format: str) -> str:
+    stamp = time.strftime("%Y%m%d_%H%M%S")
+    return os.path.join(
+        tempfile.gettempdir(), f"gads_export_{customer_id}_{stamp}.{file_format}"
+    )
+
+
+def _export_query(
+    client: GoogleAdsClientWrapper,
+    customer_id: str,
+    query: str,
+    path: str,
+    file_format: str,
+) -> int:
+    """Stream a query into ``path`` and return the number of rows written.
+
+    Rows go to a ``.part`` file that is renamed only once the stream ends,
+    so a failed export never leaves a truncated file at ``path``.
+    """
+    rows = client.query_stream(customer_id, query)
+    writer = _write_csv if file_format == "csv" else _write_ndjson
+    partial = f"{path}.part"
+    try:
+        with open(partial, "w", encoding="utf-8", newline="") as fh:
+            count = writer(rows, fh)
+        os.replace(partial, path)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    return count
+
+
 @mcp.tool()
-def gads_execute_gaql(
+async def gads_execute_gaql(
     customer_id: str,
     query: str,
     limit: int = 100,
     response_format: str = "markdown",
+    bypass_cache: bool = False,
     ctx: Context = None,
 ) -> str:
     """Execute a custom Google Ads Query Language (GAQL) query.
@@ -48,7 +123,8 @@ def gads_execute_gaql(
         customer_id: Google Ads customer ID.
         query: GAQL SELECT query string.
         limit: Max rows to return (default 100).
-        response_format: Output format: markdown or json.
+        response_format: Output format: markdown, json or compact (unindented json).
+        bypass_cache: Skip cached results and read fresh data from the API.
     """
     cid = sanitize_customer_id(customer_id)
 
@@ -57,24 +133,15 @@ def gads_execute_gaql(
         return "Error: Only SELECT queries are allowed."
 
     client = get_client(ctx)
-    rows = client.query(cid, stripped)
-
-    results: list[dict[str, Any]] = []
-    for i, row in enumerate(rows):
-        if i >= limit:
-            break
-        try:
-            row_dict = type(row).to_dict(row)
-            results.append(row_dict)
-        except Exception:
-            results.append({"raw": str(row)})
-
-    if response_format == "json":
-        return json.dumps(
-            {"results": results, "count": len(results)},
-            indent=2,
-            ensure_ascii=False,
-            default=str,
+    rows = await client.aquery(
+        cid, stripped, max_rows=limit, bypass_cache=bypass_cache
+    )
+
+    results = [_row_to_dict(row) for row in rows]
+
+    if wants_json(response_format):
+        return to_json(
+            {"results": results, "count": len(results)}, response_format
         )
 
     if not results:
@@ -96,3 +163,59 @@ def gads_execute_gaql(
         f"## GAQL Results\n\n"
         f"{len(results)} rows returned. Use json format for full data."
     )
+
+
+@mcp.tool()
+async def gads_export_gaql(
+    customer_id: str,
+    query: str,
+    file_format: str = "ndjson",
+    output_path: str = "",
+    overwrite: bool = False,
+    response_format: str = "markdown",
+    ctx: Context = None,
+) -> str:
+    """Export the full result of a GAQL query to a local NDJSON or CSV file.
+
+    Rows are read with search_stream and written as they arrive, so
+    exports of millions of rows run in constant memory. Use this instead
+    of gads_execute_gaql when you need the whole result set rather than
+    a preview.
+
+    Args:
+        customer_id: Google Ads customer ID.
+        query: GAQL SELECT query string.
+        file_format: ndjson (one JSON object per row) or csv (flattened columns).
+        output_path: Destination file (default: a new file in the temp directory).
+        overwrite: Replace output_path if it already exists (default False).
+        response_format: Output format: markdown, json or compact (unindented json).
+    """
+    cid = sanitize_customer_id(customer_id)
+
+    stripped = query.strip()
+    if not stripped.upper().startswith("SELECT"):
+        return "Error: Only SELECT queries are allowed."
+    if file_format not in EXPORT_FORMATS:
+        return f"Error: file_format must be one of {', '.join(EXPORT_FORMATS)}."
+
+    path = os.path.abspath(os.path.expanduser(
+        output_path or _default_export_path(cid, file_format)
+    ))
+    if os.path.exists(path) and not overwrite:
+        return f"Error: {path} already exists. Pass overwrite=True to replace it."
+
+    client = get_client(ctx)
+    count = await client.arun(_export_query, client, cid, stripped, path, file_format)
+
+    if wants_json(response_format):
+        return to_json(
+            {"path": path, "format": file_format, "count": count},
+            response_format,
+        )
+
+    return (
+        f"## GAQL Export\n\n"
+        f"- **File:** `{path}`\n"
+        f"- **Format:** {file_format}\n"
+        f"- **Rows:** {count}"
+    )
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any
-
 from mcp.server.fastmcp import Context
 
+from google_ads_mcp.columns import Field, RowExtractor
 from google_ads_mcp.models.common import sanitize_customer_id
 from google_ads_mcp.server import mcp
-from google_ads_mcp.tools._helpers import get_client, safe_int, safe_str
-from google_ads_mcp.utils.formatting import format_table_markdown
-from google_ads_mcp.utils.pagination import paginate_results
+from google_ads_mcp.tools._helpers import (
+    cursor_footer,
+    fetch_page,
+    get_client,
+)
+from google_ads_mcp.utils.formatting import format_table_markdown, to_json, wants_json
 
 
 # ---------------------------------------------------------------------------
@@ -32,25 +33,24 @@ def _build_customer_clients_query() -> str:
     )
 
 
-def _parse_customer_client_row(row: Any) -> dict[str, Any]:
-    """Extract customer client fields from a GAQL result row."""
-    cc = row.customer_client
-    return {
-        "client_customer": safe_str(cc.client_customer),
-        "descriptive_name": safe_str(cc.descriptive_name),
-        "level": safe_str(cc.level),
-        "manager": safe_str(cc.manager),
-        "status": safe_str(cc.status).replace("CustomerStatus.", ""),
-        "currency_code": safe_str(cc.currency_code),
-        "time_zone": safe_str(cc.time_zone),
-    }
+_CUSTOMER_CLIENT_ROWS = RowExtractor(
+    Field("client_customer", "customer_client.client_customer"),
+    Field("descriptive_name", "customer_client.descriptive_name"),
+    Field("level", "customer_client.level"),
+    Field("manager", "customer_client.manager"),
+    Field("status", "customer_client.status", "enum"),
+    Field("currency_code", "customer_client.currency_code"),
+    Field("time_zone", "customer_client.time_zone"),
+    name="CustomerClientRow",
+)
 
 
 @mcp.tool()
-def gads_list_customer_clients(
+async def gads_list_customer_clients(
     customer_id: str,
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -60,21 +60,21 @@ def gads_list_customer_clients(
         customer_id: Google Ads manager (MCC) customer ID (e.g. '1234567890' or '123-456-7890').
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     clean_id = sanitize_customer_id(customer_id)
     client = get_client(ctx)
     query = _build_customer_clients_query()
-    rows = client.query(clean_id, query)
-
-    clients = [_parse_customer_client_row(row) for row in rows]
-    page, pagination = paginate_results(clients, limit, offset)
+    rows, pagination = await fetch_page(
+        client, clean_id, query, limit, offset, cursor, protobuf=True,
+    )
+    page = _CUSTOMER_CLIENT_ROWS.records(rows)
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"customer_clients": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     columns = [
@@ -93,10 +93,11 @@ def gads_list_customer_clients(
     table = format_table_markdown(page, columns, headers)
     info = pagination.to_dict()
     return (
-        f"## Customer Clients ({info['count']}/{info['total']})\n\n"
+        f"## Customer Clients ({info['count']}/{pagination.total_label})\n\n"
         f"{table}\n\n"
-        f"_Showing {info['count']} of {info['total']} client accounts"
+        f"_Showing {info['count']} of {pagination.total_label} client accounts"
         f"{' (more available)' if info['has_more'] else ''}_"
+        f"{cursor_footer(pagination)}"
     )
 
 
@@ -105,7 +106,7 @@ def gads_list_customer_clients(
 # ---------------------------------------------------------------------------
 
 @mcp.tool()
-def gads_list_accessible_customers(
+async def gads_list_accessible_customers(
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -115,11 +116,11 @@ def gads_list_accessible_customers(
     CustomerService.list_accessible_customers() API.
 
     Args:
-        response_format: Output format: markdown or json.
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     client = get_client(ctx)
     service = client.get_service("CustomerService")
-    response = service.list_accessible_customers()
+    response = await client.acall(service.list_accessible_customers)
     resource_names = list(response.resource_names)
 
     # Extract customer IDs from resource names (format: "customers/1234567890")
@@ -128,11 +129,10 @@ def gads_list_accessible_customers(
         cid = rn.split("/")[-1] if "/" in rn else rn
         customers.append({"resource_name": rn, "customer_id": cid})
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"accessible_customers": customers, "total": len(customers)},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     if not customers:
@@ -161,21 +161,20 @@ def _build_merchant_center_links_query() -> str:
     )
 
 
-def _parse_merchant_center_link_row(row: Any) -> dict[str, Any]:
-    """Extract Merchant Center link fields from a GAQL result row."""
-    mcl = row.merchant_center_link
-    return {
-        "merchant_id": safe_str(mcl.id),
-        "account_name": safe_str(mcl.merchant_center_account_name),
-        "status": safe_str(mcl.status).replace("MerchantCenterLinkStatus.", ""),
-    }
+_MERCHANT_CENTER_LINK_ROWS = RowExtractor(
+    Field("merchant_id", "merchant_center_link.id"),
+    Field("account_name", "merchant_center_link.merchant_center_account_name"),
+    Field("status", "merchant_center_link.status", "enum"),
+    name="MerchantCenterLinkRow",
+)
 
 
 @mcp.tool()
-def gads_list_merchant_center_links(
+async def gads_list_merchant_center_links(
     customer_id: str,
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -185,21 +184,21 @@ def gads_list_merchant_center_links(
         customer_id: Google Ads customer ID (e.g. '1234567890' or '123-456-7890').
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     clean_id = sanitize_customer_id(customer_id)
     client = get_client(ctx)
     query = _build_merchant_center_links_query()
-    rows = client.query(clean_id, query)
-
-    links = [_parse_merchant_center_link_row(row) for row in rows]
-    page, pagination = paginate_results(links, limit, offset)
+    rows, pagination = await fetch_page(
+        client, clean_id, query, limit, offset, cursor, protobuf=True,
+    )
+    page = _MERCHANT_CENTER_LINK_ROWS.records(rows)
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"merchant_center_links": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     columns = ["merchant_id", "account_name", "status"]
@@ -211,8 +210,9 @@ def gads_list_merchant_center_links(
     table = format_table_markdown(page, columns, headers)
     info = pagination.to_dict()
     return (
-        f"## Merchant Center Links ({info['count']}/{info['total']})\n\n"
+        f"## Merchant Center Links ({info['count']}/{pagination.total_label})\n\n"
         f"{table}\n\n"
-        f"_Showing {info['count']} of {info['total']} linked accounts"
+        f"_Showing {info['count']} of {pagination.total_label} linked accounts"
         f"{' (more available)' if info['has_more'] else ''}_"
+        f"{cursor_footer(pagination)}"
     )
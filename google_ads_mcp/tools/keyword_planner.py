@@ -2,23 +2,26 @@
 
 from __future__ import annotations
 
-import json
+import itertools
 from typing import Any
 
 from mcp.server.fastmcp import Context
 
+from google_ads_mcp.enums import enum_name
 from google_ads_mcp.models.common import sanitize_customer_id
 from google_ads_mcp.server import mcp
 from google_ads_mcp.tools._helpers import get_client, safe_int, safe_str
 from google_ads_mcp.utils.formatting import (
     format_table_markdown,
     micros_to_currency,
+    to_json,
+    wants_json,
 )
 from google_ads_mcp.utils.pagination import paginate_results
 
 
 @mcp.tool()
-def gads_generate_keyword_ideas(
+async def gads_generate_keyword_ideas(
     customer_id: str,
     keywords: str,
     language_id: str = "1000",
@@ -40,7 +43,7 @@ def gads_generate_keyword_ideas(
         geo_target_id: Geo target constant ID (optional, e.g. '2840' for US).
         limit: Max results to return (default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     cid = sanitize_customer_id(customer_id)
     client = get_client(ctx)
@@ -48,12 +51,7 @@ def gads_generate_keyword_ideas(
 
     keyword_list = [k.strip() for k in keywords.split(",") if k.strip()]
     if not keyword_list:
-        return json.dumps(
-            {"error": "No valid keywords provided."},
-            indent=2,
-            ensure_ascii=False,
-            default=str,
-        )
+        return to_json({"error": "No valid keywords provided."})
 
     request = client.client.get_type("GenerateKeywordIdeaRequest")
     request.customer_id = cid
@@ -65,17 +63,24 @@ def gads_generate_keyword_ideas(
             f"geoTargetConstants/{geo_target_id}"
         )
 
-    response = service.generate_keyword_ideas(request=request)
+    # The response is a pager: consume it in the worker thread so that
+    # follow-up page fetches do not block the event loop, and stop after
+    # the lookahead row needed by paginate_results.
+    response = await client.acall(
+        lambda: list(itertools.islice(
+            service.generate_keyword_ideas(request=request),
+            offset + limit + 1,
+        ))
+    )
+    ideas, pagination = paginate_results(iter(response), limit, offset)
 
-    ideas: list[dict[str, Any]] = []
-    for idea in response:
+    page: list[dict[str, Any]] = []
+    for idea in ideas:
         metrics = idea.keyword_idea_metrics
-        ideas.append({
+        page.append({
             "keyword": safe_str(idea.text),
             "avg_monthly_searches": safe_int(metrics.avg_monthly_searches),
-            "competition": safe_str(metrics.competition).replace(
-                "KeywordPlanCompetitionLevel.", ""
-            ),
+            "competition": enum_name(metrics.competition),
             "low_cpc": micros_to_currency(
                 safe_int(metrics.low_top_of_page_bid_micros)
             ),
@@ -84,18 +89,14 @@ def gads_generate_keyword_ideas(
             ),
         })
 
-    page, pagination = paginate_results(ideas, limit, offset)
-
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {
                 "keyword_ideas": page,
                 "seed_keywords": keyword_list,
                 "pagination": pagination.to_dict(),
             },
-            indent=2,
-            ensure_ascii=False,
-            default=str,
+            response_format,
         )
 
     columns = [
@@ -114,6 +115,6 @@ def gads_generate_keyword_ideas(
     return (
         f"## Keyword Ideas for: {seeds}\n\n"
         f"{table}\n\n"
-        f"_Showing {pagination.count} of {pagination.total} keyword ideas"
+        f"_Showing {pagination.count} of {pagination.total_label} keyword ideas"
         f"{' (more available)' if pagination.has_more else ''}_"
     )
@@ -2,22 +2,25 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from mcp.server.fastmcp import Context
 
+from google_ads_mcp.columns import Field, RowExtractor
 from google_ads_mcp.models.tool_inputs import (
     GetKeywordPerformanceInput,
     ListKeywordsInput,
 )
 from google_ads_mcp.server import mcp
-from google_ads_mcp.tools._helpers import get_client, safe_int, safe_str
-from google_ads_mcp.utils.formatting import (
-    format_table_markdown,
-    micros_to_currency,
+from google_ads_mcp.tools._helpers import (
+    cursor_footer,
+    fetch_page,
+    fetch_report_page,
+    fetch_warehouse_page,
+    get_client,
+    get_warehouse,
 )
-from google_ads_mcp.utils.pagination import paginate_results
+from google_ads_mcp.utils.formatting import format_table_markdown, to_json, wants_json
 
 
 def _build_list_keywords_query(params: ListKeywordsInput) -> str:
@@ -46,30 +49,25 @@ def _build_list_keywords_query(params: ListKeywordsInput) -> str:
     return query
 
 
-def _parse_keyword_row(row: Any) -> dict[str, Any]:
-    """Extract keyword fields from a GAQL result row."""
-    kw = row.ad_group_criterion
-    return {
-        "id": safe_str(kw.criterion_id),
-        "keyword": safe_str(kw.keyword.text),
-        "match_type": safe_str(kw.keyword.match_type).replace(
-            "KeywordMatchType.", ""
-        ),
-        "status": safe_str(kw.status).replace(
-            "AdGroupCriterionStatus.", ""
-        ),
-        "ad_group": safe_str(row.ad_group.name),
-        "campaign": safe_str(row.campaign.name),
-    }
+_KEYWORD_ROWS = RowExtractor(
+    Field("id", "ad_group_criterion.criterion_id"),
+    Field("keyword", "ad_group_criterion.keyword.text"),
+    Field("match_type", "ad_group_criterion.keyword.match_type", "enum"),
+    Field("status", "ad_group_criterion.status", "enum"),
+    Field("ad_group", "ad_group.name"),
+    Field("campaign", "campaign.name"),
+    name="KeywordRow",
+)
 
 
 @mcp.tool()
-def list_keywords(
+async def list_keywords(
     customer_id: str,
     campaign_id: str | None = None,
     ad_group_id: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -81,12 +79,14 @@ def list_keywords(
         ad_group_id: Filter by ad group ID (optional).
         limit: Max results (1-1000).
         offset: Starting offset.
-        response_format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: markdown, json or compact (unindented json).
     """
     kwargs: dict[str, Any] = {
         "customer_id": customer_id,
         "limit": limit,
         "offset": offset,
+        "cursor": cursor,
         "response_format": response_format,
     }
     if campaign_id:
@@ -97,16 +97,16 @@ def list_keywords(
     params = ListKeywordsInput(**kwargs)
     client = get_client(ctx)
     query = _build_list_keywords_query(params)
-    rows = client.query(params.customer_id, query)
-
-    keywords = [_parse_keyword_row(row) for row in rows]
-    page, pagination = paginate_results(keywords, params.limit, params.offset)
+    rows, pagination = await fetch_page(
+        client, params.customer_id, query,
+        params.limit, params.offset, params.cursor, protobuf=True,
+    )
+    page = _KEYWORD_ROWS.records(rows)
 
-    if params.response_format.value == "json":
-        return json.dumps(
+    if wants_json(params.response_format):
+        return to_json(
             {"keywords": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            params.response_format,
         )
 
     columns = ["keyword", "match_type", "status", "ad_group", "campaign"]
@@ -119,10 +119,11 @@ def list_keywords(
     }
     table = format_table_markdown(page, columns, headers)
     return (
-        f"## Keywords ({pagination.count}/{pagination.total})\n\n"
+        f"## Keywords ({pagination.count}/{pagination.total_label})\n\n"
         f"{table}\n\n"
-        f"_Showing {pagination.count} of {pagination.total} keywords"
+        f"_Showing {pagination.count} of {pagination.total_label} keywords"
         f"{' (more available)' if pagination.has_more else ''}_"
+        f"{cursor_footer(pagination)}"
     )
 
 
@@ -155,28 +156,23 @@ def _build_keyword_performance_query(
     return query
 
 
-def _parse_keyword_performance_row(row: Any) -> dict[str, Any]:
-    """Extract keyword performance fields from a GAQL result row."""
-    kw = row.ad_group_criterion
-    m = row.metrics
-    return {
-        "keyword": safe_str(kw.keyword.text),
-        "match_type": safe_str(kw.keyword.match_type).replace(
-            "KeywordMatchType.", ""
-        ),
-        "ad_group": safe_str(row.ad_group.name),
-        "impressions": safe_int(m.impressions),
-        "clicks": safe_int(m.clicks),
-        "cost": micros_to_currency(safe_int(m.cost_micros)),
-        "conversions": round(float(m.conversions or 0), 2),
-        "ctr": f"{float(m.ctr or 0) * 100:.2f}%",
-        "avg_cpc": micros_to_currency(safe_int(m.average_cpc)),
-        "conv_rate": f"{float(m.conversions_from_interactions_rate or 0) * 100:.2f}%",
-    }
+_KEYWORD_PERFORMANCE_ROWS = RowExtractor(
+    Field("keyword", "ad_group_criterion.keyword.text"),
+    Field("match_type", "ad_group_criterion.keyword.match_type", "enum"),
+    Field("ad_group", "ad_group.name"),
+    Field("impressions", "metrics.impressions", "int"),
+    Field("clicks", "metrics.clicks", "int"),
+    Field("cost", "metrics.cost_micros", "micros"),
+    Field("conversions", "metrics.conversions", "float"),
+    Field("ctr", "metrics.ctr", "percent"),
+    Field("avg_cpc", "metrics.average_cpc", "micros"),
+    Field("conv_rate", "metrics.conversions_from_interactions_rate", "percent"),
+    name="KeywordPerfRow",
+)
 
 
 @mcp.tool()
-def get_keyword_performance(
+async def get_keyword_performance(
     customer_id: str,
     campaign_id: str | None = None,
     ad_group_id: str | None = None,
@@ -184,7 +180,10 @@ def get_keyword_performance(
     end_date: str = "",
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
+    source: str = "api",
     response_format: str = "markdown",
+    bypass_cache: bool = False,
     ctx: Context = None,
 ) -> str:
     """Get performance metrics for keywords over a date range.
@@ -197,12 +196,17 @@ def get_keyword_performance(
         end_date: End date YYYY-MM-DD (default: today).
         limit: Max results (1-1000).
         offset: Starting offset.
-        response_format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        source: api (live query) or warehouse (local tables from gads_sync_reports).
+        response_format: markdown, json or compact (unindented json).
+        bypass_cache: Read every day from the API, refreshing the local history.
     """
     kwargs: dict[str, Any] = {
         "customer_id": customer_id,
         "limit": limit,
         "offset": offset,
+        "cursor": cursor,
+        "source": source,
         "response_format": response_format,
     }
     if campaign_id:
@@ -217,16 +221,25 @@ def get_keyword_performance(
     params = GetKeywordPerformanceInput(**kwargs)
     client = get_client(ctx)
     query = _build_keyword_performance_query(params)
-    rows = client.query(params.customer_id, query)
-
-    perf = [_parse_keyword_performance_row(row) for row in rows]
-    page, pagination = paginate_results(perf, params.limit, params.offset)
+    if params.source.value == "warehouse":
+        rows, pagination = await fetch_warehouse_page(
+            client, get_warehouse(ctx), "keyword", params.customer_id,
+            params.start_date, params.end_date,
+            {"campaign_id": params.campaign_id, "ad_group_id": params.ad_group_id},
+            "cost_micros", params.limit, params.offset, params.cursor,
+        )
+    else:
+        rows, pagination = await fetch_report_page(
+            client, params.customer_id, query,
+            params.limit, params.offset, params.cursor, protobuf=True,
+            bypass_cache=bypass_cache,
+        )
+    page = _KEYWORD_PERFORMANCE_ROWS.records(rows)
 
-    if params.response_format.value == "json":
-        return json.dumps(
+    if wants_json(params.response_format):
+        return to_json(
             {"performance": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            params.response_format,
         )
 
     columns = [
@@ -247,5 +260,6 @@ def get_keyword_performance(
     return (
         f"## Keyword Performance ({params.start_date} → {params.end_date})\n\n"
         f"{table}\n\n"
-        f"_Showing {pagination.count} of {pagination.total} keywords_"
+        f"_Showing {pagination.count} of {pagination.total_label} keywords_"
+        f"{cursor_footer(pagination)}"
     )
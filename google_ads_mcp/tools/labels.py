@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any
-
 from mcp.server.fastmcp import Context
 
+from google_ads_mcp.columns import Field, RowExtractor
 from google_ads_mcp.models.common import sanitize_customer_id
 from google_ads_mcp.server import mcp
-from google_ads_mcp.tools._helpers import get_client, safe_str
-from google_ads_mcp.utils.formatting import format_table_markdown
-from google_ads_mcp.utils.pagination import paginate_results
+from google_ads_mcp.tools._helpers import (
+    cursor_footer,
+    fetch_page,
+    get_client,
+)
+from google_ads_mcp.utils.formatting import format_table_markdown, to_json, wants_json
 
 
 # ---------------------------------------------------------------------------
@@ -28,23 +29,22 @@ def _build_list_labels_query() -> str:
     )
 
 
-def _parse_label_row(row: Any) -> dict[str, Any]:
-    """Extract label fields from a GAQL result row."""
-    label = row.label
-    return {
-        "id": safe_str(label.id),
-        "name": safe_str(label.name),
-        "status": safe_str(label.status).replace("LabelStatus.", ""),
-        "background_color": safe_str(label.text_label.background_color),
-        "description": safe_str(label.text_label.description),
-    }
+_LABEL_ROWS = RowExtractor(
+    Field("id", "label.id"),
+    Field("name", "label.name"),
+    Field("status", "label.status", "enum"),
+    Field("background_color", "label.text_label.background_color"),
+    Field("description", "label.text_label.description"),
+    name="LabelRow",
+)
 
 
 @mcp.tool()
-def gads_list_labels(
+async def gads_list_labels(
     customer_id: str,
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -54,21 +54,21 @@ def gads_list_labels(
         customer_id: Google Ads customer ID (e.g. '1234567890' or '123-456-7890').
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     clean_id = sanitize_customer_id(customer_id)
     client = get_client(ctx)
     query = _build_list_labels_query()
-    rows = client.query(clean_id, query)
-
-    labels = [_parse_label_row(row) for row in rows]
-    page, pagination = paginate_results(labels, limit, offset)
+    rows, pagination = await fetch_page(
+        client, clean_id, query, limit, offset, cursor, protobuf=True,
+    )
+    page = _LABEL_ROWS.records(rows)
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"labels": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     columns = ["id", "name", "status", "background_color", "description"]
@@ -82,10 +82,11 @@ def gads_list_labels(
     table = format_table_markdown(page, columns, headers)
     info = pagination.to_dict()
     return (
-        f"## Labels ({info['count']}/{info['total']})\n\n"
+        f"## Labels ({info['count']}/{pagination.total_label})\n\n"
         f"{table}\n\n"
-        f"_Showing {info['count']} of {info['total']} labels"
+        f"_Showing {info['count']} of {pagination.total_label} labels"
         f"{' (more available)' if info['has_more'] else ''}_"
+        f"{cursor_footer(pagination)}"
     )
 
 
@@ -115,23 +116,23 @@ def _build_campaign_labels_query(
     return query
 
 
-def _parse_campaign_label_row(row: Any) -> dict[str, Any]:
-    """Extract campaign-label fields from a GAQL result row."""
-    return {
-        "campaign_id": safe_str(row.campaign.id),
-        "campaign_name": safe_str(row.campaign.name),
-        "label_id": safe_str(row.label.id),
-        "label_name": safe_str(row.label.name),
-    }
+_CAMPAIGN_LABEL_ROWS = RowExtractor(
+    Field("campaign_id", "campaign.id"),
+    Field("campaign_name", "campaign.name"),
+    Field("label_id", "label.id"),
+    Field("label_name", "label.name"),
+    name="CampaignLabelRow",
+)
 
 
 @mcp.tool()
-def gads_list_campaign_labels(
+async def gads_list_campaign_labels(
     customer_id: str,
     campaign_id: str | None = None,
     label_id: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -143,21 +144,21 @@ def gads_list_campaign_labels(
         label_id: Optional label ID to filter by.
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     clean_id = sanitize_customer_id(customer_id)
     client = get_client(ctx)
     query = _build_campaign_labels_query(campaign_id, label_id)
-    rows = client.query(clean_id, query)
-
-    associations = [_parse_campaign_label_row(row) for row in rows]
-    page, pagination = paginate_results(associations, limit, offset)
+    rows, pagination = await fetch_page(
+        client, clean_id, query, limit, offset, cursor, protobuf=True,
+    )
+    page = _CAMPAIGN_LABEL_ROWS.records(rows)
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"campaign_labels": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     columns = ["campaign_id", "campaign_name", "label_id", "label_name"]
@@ -170,10 +171,11 @@ def gads_list_campaign_labels(
     table = format_table_markdown(page, columns, headers)
     info = pagination.to_dict()
     return (
-        f"## Campaign Labels ({info['count']}/{info['total']})\n\n"
+        f"## Campaign Labels ({info['count']}/{pagination.total_label})\n\n"
         f"{table}\n\n"
-        f"_Showing {info['count']} of {info['total']} associations"
+        f"_Showing {info['count']} of {pagination.total_label} associations"
         f"{' (more available)' if info['has_more'] else ''}_"
+        f"{cursor_footer(pagination)}"
     )
 
 
@@ -203,23 +205,23 @@ def _build_ad_group_labels_query(
     return query
 
 
-def _parse_ad_group_label_row(row: Any) -> dict[str, Any]:
-    """Extract ad group-label fields from a GAQL result row."""
-    return {
-        "ad_group_id": safe_str(row.ad_group.id),
-        "ad_group_name": safe_str(row.ad_group.name),
-        "label_id": safe_str(row.label.id),
-        "label_name": safe_str(row.label.name),
-    }
+_AD_GROUP_LABEL_ROWS = RowExtractor(
+    Field("ad_group_id", "ad_group.id"),
+    Field("ad_group_name", "ad_group.name"),
+    Field("label_id", "label.id"),
+    Field("label_name", "label.name"),
+    name="AdGroupLabelRow",
+)
 
 
 @mcp.tool()
-def gads_list_ad_group_labels(
+async def gads_list_ad_group_labels(
     customer_id: str,
     ad_group_id: str | None = None,
     label_id: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -231,21 +233,21 @@ def gads_list_ad_group_labels(
         label_id: Optional label ID to filter by.
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     clean_id = sanitize_customer_id(customer_id)
     client = get_client(ctx)
     query = _build_ad_group_labels_query(ad_group_id, label_id)
-    rows = client.query(clean_id, query)
-
-    associations = [_parse_ad_group_label_row(row) for row in rows]
-    page, pagination = paginate_results(associations, limit, offset)
+    rows, pagination = await fetch_page(
+        client, clean_id, query, limit, offset, cursor, protobuf=True,
+    )
+    page = _AD_GROUP_LABEL_ROWS.records(rows)
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"ad_group_labels": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     columns = ["ad_group_id", "ad_group_name", "label_id", "label_name"]
@@ -258,10 +260,11 @@ def gads_list_ad_group_labels(
     table = format_table_markdown(page, columns, headers)
     info = pagination.to_dict()
     return (
-        f"## Ad Group Labels ({info['count']}/{info['total']})\n\n"
+        f"## Ad Group Labels ({info['count']}/{pagination.total_label})\n\n"
         f"{table}\n\n"
-        f"_Showing {info['count']} of {info['total']} associations"
+        f"_Showing {info['count']} of {pagination.total_label} associations"
         f"{' (more available)' if info['has_more'] else ''}_"
+        f"{cursor_footer(pagination)}"
     )
 
 
@@ -289,22 +292,22 @@ def _build_ad_group_ad_labels_query(
     return query
 
 
-def _parse_ad_group_ad_label_row(row: Any) -> dict[str, Any]:
-    """Extract ad-label fields from a GAQL result row."""
-    return {
-        "ad_id": safe_str(row.ad_group_ad.ad.id),
-        "ad_name": safe_str(row.ad_group_ad.ad.name),
-        "label_id": safe_str(row.label.id),
-        "label_name": safe_str(row.label.name),
-    }
+_AD_GROUP_AD_LABEL_ROWS = RowExtractor(
+    Field("ad_id", "ad_group_ad.ad.id"),
+    Field("ad_name", "ad_group_ad.ad.name"),
+    Field("label_id", "label.id"),
+    Field("label_name", "label.name"),
+    name="AdGroupAdLabelRow",
+)
 
 
 @mcp.tool()
-def gads_list_ad_group_ad_labels(
+async def gads_list_ad_group_ad_labels(
     customer_id: str,
     label_id: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -315,21 +318,21 @@ def gads_list_ad_group_ad_labels(
         label_id: Optional label ID to filter by.
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     clean_id = sanitize_customer_id(customer_id)
     client = get_client(ctx)
     query = _build_ad_group_ad_labels_query(label_id)
-    rows = client.query(clean_id, query)
-
-    associations = [_parse_ad_group_ad_label_row(row) for row in rows]
-    page, pagination = paginate_results(associations, limit, offset)
+    rows, pagination = await fetch_page(
+        client, clean_id, query, limit, offset, cursor, protobuf=True,
+    )
+    page = _AD_GROUP_AD_LABEL_ROWS.records(rows)
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"ad_labels": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     columns = ["ad_id", "ad_name", "label_id", "label_name"]
@@ -342,10 +345,11 @@ def gads_list_ad_group_ad_labels(
     table = format_table_markdown(page, columns, headers)
     info = pagination.to_dict()
     return (
-        f"## Ad Labels ({info['count']}/{info['total']})\n\n"
+        f"## Ad Labels ({info['count']}/{pagination.total_label})\n\n"
         f"{table}\n\n"
-        f"_Showing {info['count']} of {info['total']} associations"
+        f"_Showing {info['count']} of {pagination.total_label} associations"
         f"{' (more available)' if info['has_more'] else ''}_"
+        f"{cursor_footer(pagination)}"
     )
 
 
@@ -373,21 +377,21 @@ def _build_ad_group_criterion_labels_query(
     return query
 
 
-def _parse_ad_group_criterion_label_row(row: Any) -> dict[str, Any]:
-    """Extract criterion-label fields from a GAQL result row."""
-    return {
-        "criterion_id": safe_str(row.ad_group_criterion.criterion_id),
-        "label_id": safe_str(row.label.id),
-        "label_name": safe_str(row.label.name),
-    }
+_AD_GROUP_CRITERION_LABEL_ROWS = RowExtractor(
+    Field("criterion_id", "ad_group_criterion.criterion_id"),
+    Field("label_id", "label.id"),
+    Field("label_name", "label.name"),
+    name="AdGroupCriterionLabelRow",
+)
 
 
 @mcp.tool()
-def gads_list_ad_group_criterion_labels(
+async def gads_list_ad_group_criterion_labels(
     customer_id: str,
     label_id: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -398,21 +402,21 @@ def gads_list_ad_group_criterion_labels(
         label_id: Optional label ID to filter by.
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     clean_id = sanitize_customer_id(customer_id)
     client = get_client(ctx)
     query = _build_ad_group_criterion_labels_query(label_id)
-    rows = client.query(clean_id, query)
-
-    associations = [_parse_ad_group_criterion_label_row(row) for row in rows]
-    page, pagination = paginate_results(associations, limit, offset)
+    rows, pagination = await fetch_page(
+        client, clean_id, query, limit, offset, cursor, protobuf=True,
+    )
+    page = _AD_GROUP_CRITERION_LABEL_ROWS.records(rows)
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"criterion_labels": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     columns = ["criterion_id", "label_id", "label_name"]
@@ -424,10 +428,11 @@ def gads_list_ad_group_criterion_labels(
     table = format_table_markdown(page, columns, headers)
     info = pagination.to_dict()
     return (
-        f"## Criterion Labels ({info['count']}/{info['total']})\n\n"
+        f"## Criterion Labels ({info['count']}/{pagination.total_label})\n\n"
         f"{table}\n\n"
-        f"_Showing {info['count']} of {info['total']} associations"
+        f"_Showing {info['count']} of {pagination.total_label} associations"
         f"{' (more available)' if info['has_more'] else ''}_"
+        f"{cursor_footer(pagination)}"
     )
 
 
@@ -443,20 +448,20 @@ def _build_customer_labels_query() -> str:
     )
 
 
-def _parse_customer_label_row(row: Any) -> dict[str, Any]:
-    """Extract customer-label fields from a GAQL result row."""
-    return {
-        "customer_id": safe_str(row.customer.id),
-        "label_id": safe_str(row.label.id),
-        "label_name": safe_str(row.label.name),
-    }
+_CUSTOMER_LABEL_ROWS = RowExtractor(
+    Field("customer_id", "customer.id"),
+    Field("label_id", "label.id"),
+    Field("label_name", "label.name"),
+    name="CustomerLabelRow",
+)
 
 
 @mcp.tool()
-def gads_list_customer_labels(
+async def gads_list_customer_labels(
     customer_id: str,
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -466,21 +471,21 @@ def gads_list_customer_labels(
         customer_id: Google Ads customer ID (e.g. '1234567890' or '123-456-7890').
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     clean_id = sanitize_customer_id(customer_id)
     client = get_client(ctx)
     query = _build_customer_labels_query()
-    rows = client.query(clean_id, query)
-
-    associations = [_parse_customer_label_row(row) for row in rows]
-    page, pagination = paginate_results(associations, limit, offset)
+    rows, pagination = await fetch_page(
+        client, clean_id, query, limit, offset, cursor, protobuf=True,
+    )
+    page = _CUSTOMER_LABEL_ROWS.records(rows)
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"customer_labels": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     columns = ["customer_id", "label_id", "label_name"]
@@ -492,8 +497,9 @@ def gads_list_customer_labels(
     table = format_table_markdown(page, columns, headers)
     info = pagination.to_dict()
     return (
-        f"## Customer Labels ({info['count']}/{info['total']})\n\n"
+        f"## Customer Labels ({info['count']}/{pagination.total_label})\n\n"
         f"{table}\n\n"
-        f"_Showing {info['count']} of {info['total']} associations"
+        f"_Showing {info['count']} of {pagination.total_label} associations"
         f"{' (more available)' if info['has_more'] else ''}_"
+        f"{cursor_footer(pagination)}"
     )
@@ -0,0 +1,314 @@
+"""MCC-wide fan-out reporting tool for Google Ads MCP server."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from operator import attrgetter
+from typing import Any
+
+from mcp.server.fastmcp import Context
+
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
+from google_ads_mcp.columns import Field, RowExtractor
+from google_ads_mcp.models.tool_inputs import MccReportInput
+from google_ads_mcp.server import mcp
+from google_ads_mcp.tools._helpers import get_client, safe_str
+from google_ads_mcp.tools.gaql import _flatten_dict, _row_to_dict
+from google_ads_mcp.utils.formatting import (
+    format_table_markdown,
+    micros_to_currency,
+    to_json,
+    wants_json,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _build_leaf_clients_query() -> str:
+    """Build GAQL query for the enabled non-manager accounts under an MCC."""
+    return (
+        "SELECT customer_client.id, "
+        "customer_client.descriptive_name, "
+        "customer_client.currency_code "
+        "FROM customer_client "
+        "WHERE customer_client.manager = FALSE "
+        "AND customer_client.status = 'ENABLED'"
+    )
+
+
+def _build_account_report_query(params: MccReportInput) -> str:
+    return (
+        "SELECT customer.id, "
+        "metrics.impressions, metrics.clicks, metrics.cost_micros, "
+        "metrics.conversions, metrics.conversions_value "
+        "FROM customer "
+        f"WHERE segments.date BETWEEN '{params.start_date}' AND '{params.end_date}'"
+    )
+
+
+def _build_campaign_report_query(params: MccReportInput) -> str:
+    return (
+        "SELECT campaign.id, campaign.name, campaign.status, "
+        "metrics.impressions, metrics.clicks, metrics.cost_micros, "
+        "metrics.conversions, metrics.conversions_value "
+        "FROM campaign "
+        f"WHERE segments.date BETWEEN '{params.start_date}' AND '{params.end_date}' "
+        "AND campaign.status != 'REMOVED' "
+        "ORDER BY metrics.cost_micros DESC"
+    )
+
+
+_METRIC_FIELDS = (
+    Field("impressions", "metrics.impressions", "int"),
+    Field("clicks", "metrics.clicks", "int"),
+    Field("cost_micros", "metrics.cost_micros", "int"),
+    Field("conversions", "metrics.conversions", "float"),
+    Field("conversions_value", "metrics.conversions_value", "float"),
+)
+
+# Leading fields of every fan-out row, filled from the leaf account.
+_LEAF_KEYS = ("customer_id", "account_name", "currency")
+
+_ACCOUNT_ROWS = RowExtractor(
+    *_METRIC_FIELDS, name="MccAccountRow", context=_LEAF_KEYS
+)
+
+_CAMPAIGN_ROWS = RowExtractor(
+    Field("campaign_id", "campaign.id"),
+    Field("campaign_name", "campaign.name"),
+    Field("status", "campaign.status", "enum"),
+    *_METRIC_FIELDS,
+    name="MccCampaignRow",
+    context=_LEAF_KEYS,
+)
+
+
+def _parse_custom_rows(rows: list[Any], *leaf: str) -> list[dict[str, Any]]:
+    parsed = []
+    for row in rows:
+        flat: dict[str, Any] = dict(zip(_LEAF_KEYS, leaf))
+        _flatten_dict(_row_to_dict(row), flat)
+        parsed.append(flat)
+    return parsed
+
+
+_REPORTS = {
+    "account": (_build_account_report_query, _ACCOUNT_ROWS),
+    "campaign": (_build_campaign_report_query, _CAMPAIGN_ROWS),
+}
+
+
+async def _list_leaf_clients(
+    client: AsyncGoogleAdsClientWrapper, params: MccReportInput
+) -> list[dict[str, str]]:
+    rows = await client.aquery(params.customer_id, _build_leaf_clients_query())
+    leaves = [
+        {
+            "customer_id": safe_str(row.customer_client.id),
+            "account_name": safe_str(row.customer_client.descriptive_name),
+            "currency": safe_str(row.customer_client.currency_code),
+        }
+        for row in rows
+    ]
+    if params.client_ids:
+        wanted = set(params.client_ids)
+        leaves = [c for c in leaves if c["customer_id"] in wanted]
+    if params.name_contains:
+        needle = params.name_contains.lower()
+        leaves = [c for c in leaves if needle in c["account_name"].lower()]
+    return leaves
+
+
+async def _fan_out(
+    client: AsyncGoogleAdsClientWrapper,
+    leaves: list[dict[str, str]],
+    query: str,
+    parse: Any,
+    params: MccReportInput,
+) -> tuple[list[Any], list[dict[str, str]]]:
+    """Run ``query`` on every leaf with bounded concurrency.
+
+    ``parse(rows, customer_id, account_name, currency)`` turns each
+    account's rows into output rows. Any exception raised for an account is
+    reported in the error list and does not affect the others; only
+    cancellation and other non-``Exception`` errors propagate. Built-in reports are parsed
+    into compact RowExtractor tuples from raw protobuf rows; custom
+    queries keep proto-plus rows for ``to_dict``.
+    """
+    semaphore = asyncio.Semaphore(params.max_concurrency)
+
+    async def run(leaf: dict[str, str]) -> list[Any]:
+        async with semaphore:
+            rows = await client.aquery(
+                leaf["customer_id"], query, max_rows=params.limit,
+                protobuf=not params.query,
+            )
+        return parse(rows, *(leaf[key] for key in _LEAF_KEYS))
+
+    results = await asyncio.gather(
+        *(run(leaf) for leaf in leaves), return_exceptions=True
+    )
+    merged: list[Any] = []
+    errors: list[dict[str, str]] = []
+    for leaf, result in zip(leaves, results):
+        if isinstance(result, Exception):
+            message = str(result) or type(result).__name__
+            errors.append({"customer_id": leaf["customer_id"], "error": message})
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            merged.extend(result)
+    return merged, errors
+
+
+def _totals_by_currency(rows: list[Any]) -> list[dict[str, Any]]:
+    totals: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        t = totals.setdefault(row.currency, {
+            "currency": row.currency, "impressions": 0, "clicks": 0,
+            "cost_micros": 0, "conversions": 0.0, "conversions_value": 0.0,
+        })
+        for name in ("impressions", "clicks", "cost_micros", "conversions", "conversions_value"):
+            t[name] += getattr(row, name)
+    for t in totals.values():
+        t["conversions"] = round(t["conversions"], 2)
+        t["conversions_value"] = round(t["conversions_value"], 2)
+    return list(totals.values())
+
+
+@mcp.tool()
+async def gads_mcc_report(
+    customer_id: str,
+    report: str = "account",
+    query: str = "",
+    start_date: str = "",
+    end_date: str = "",
+    client_ids: str = "",
+    name_contains: str = "",
+    max_concurrency: int = 20,
+    limit: int = 1000,
+    response_format: str = "markdown",
+    ctx: Context = None,
+) -> str:
+    """Run a report across all client accounts of a manager (MCC) at once.
+
+    Lists the enabled non-manager customer_client accounts, runs the report
+    on each of them concurrently and merges the rows into one table with a
+    customer_id column. An account that fails (e.g. no access) is listed
+    under errors and does not stop the others.
+
+    Args:
+        customer_id: Google Ads manager (MCC) customer ID.
+        report: Built-in report: account (one row per client) or campaign.
+        query: Custom GAQL SELECT to run on every client instead of report.
+        start_date: Start date YYYY-MM-DD for built-in reports (default: 30 days ago).
+        end_date: End date YYYY-MM-DD for built-in reports (default: today).
+        client_ids: Comma-separated client IDs to include (default: all).
+        name_contains: Only clients whose name contains this text.
+        max_concurrency: Accounts queried in parallel (1-100, default 20).
+        limit: Max rows per account (default 1000).
+        response_format: Output format: markdown, json or compact (unindented json).
+    """
+    kwargs: dict[str, Any] = {
+        "customer_id": customer_id,
+        "report": report,
+        "query": query.strip(),
+        "client_ids": client_ids.split(",") if client_ids else [],
+        "name_contains": name_contains,
+        "max_concurrency": max_concurrency,
+        "limit": limit,
+        "response_format": response_format,
+    }
+    if start_date:
+        kwargs["start_date"] = start_date
+    if end_date:
+        kwargs["end_date"] = end_date
+    params = MccReportInput(**kwargs)
+
+    if params.query:
+        if not params.query.upper().startswith("SELECT"):
+            return "Error: Only SELECT queries are allowed."
+        gaql, parse, extractor = params.query, _parse_custom_rows, None
+    else:
+        build, extractor = _REPORTS[params.report.value]
+        gaql, parse = build(params), extractor.rows
+
+    client = get_client(ctx)
+    started = time.monotonic()
+    leaves = await _list_leaf_clients(client, params)
+    rows, errors = await _fan_out(client, leaves, gaql, parse, params)
+    elapsed = time.monotonic() - started
+    if extractor is _ACCOUNT_ROWS:
+        rows.sort(key=attrgetter("cost_micros"), reverse=True)
+    totals = _totals_by_currency(rows) if extractor is not None else []
+    if extractor is not None:
+        rows = extractor.format(rows)
+    logger.info(
+        "MCC report on %d accounts (%d failed) in %.1fs",
+        len(leaves), len(errors), elapsed,
+    )
+
+    if wants_json(params.response_format):
+        return to_json(
+            {
+                "manager_customer_id": params.customer_id,
+                "accounts": len(leaves),
+                "failed_accounts": len(errors),
+                "rows": rows,
+                "totals": totals,
+                "errors": errors,
+                "elapsed_seconds": round(elapsed, 2),
+            },
+            params.response_format,
+        )
+
+    title = "Custom GAQL" if params.query else f"{params.report.value} report"
+    lines = [
+        f"## MCC {title} ({len(leaves)} accounts, {len(rows)} rows)",
+        "",
+    ]
+    if rows:
+        if params.query:
+            columns = ["customer_id"] + [
+                c for c in rows[0] if c not in ("customer_id", "account_name", "currency")
+            ][:9]
+            headers = {c: c for c in columns}
+            table_rows = rows
+        else:
+            columns = ["customer_id", "account_name"]
+            if params.report.value == "campaign":
+                columns += ["campaign_name", "status"]
+            columns += ["impressions", "clicks", "cost", "conversions"]
+            headers = {
+                "customer_id": "Customer ID",
+                "account_name": "Account",
+                "campaign_name": "Campaign",
+                "status": "Status",
+                "impressions": "Impr.",
+                "clicks": "Clicks",
+                "cost": "Cost",
+                "conversions": "Conv.",
+            }
+            table_rows = [
+                {**r, "cost": micros_to_currency(r["cost_micros"], r["currency"])}
+                for r in rows
+            ]
+        lines.append(format_table_markdown(table_rows, columns, headers))
+    else:
+        lines.append("_No rows returned._")
+
+    for t in totals:
+        lines.append(
+            f"\n**Total {t['currency']}:** {t['impressions']:,} impr., "
+            f"{t['clicks']:,} clicks, "
+            f"{micros_to_currency(t['cost_micros'], t['currency'])}, "
+            f"{t['conversions']} conv."
+        )
+    if errors:
+        lines.append(f"\n### Errors ({len(errors)} accounts)\n")
+        for e in errors:
+            lines.append(f"- **{e['customer_id']}**: {e['error']}")
+    lines.append(f"\n_Completed in {elapsed:.1f}s._")
+    return "\n".join(lines)
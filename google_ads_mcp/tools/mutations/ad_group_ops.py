@@ -11,7 +11,7 @@ from google_ads_mcp.tools._helpers import get_client
 
 
 @mcp.tool()
-def gads_set_ad_group_status(
+async def gads_set_ad_group_status(
     customer_id: str,
     ad_group_id: str,
     status: str,
@@ -38,6 +38,6 @@ def gads_set_ad_group_status(
         params.ad_group_id,
         params.status.value,
     )
-    client.mutate(params.customer_id, [operation])
+    await client.amutate_batched(params.customer_id, [operation])
     action_map = {"enable": "ENABLED", "pause": "PAUSED", "remove": "REMOVED"}
     return f"Ad group {params.ad_group_id} status changed to {action_map[params.status.value]}."
@@ -14,12 +14,13 @@ from google_ads_mcp.models.asset_inputs import (
     CreateAssetGroupInput,
     AddAssetGroupAssetsInput,
 )
+from google_ads_mcp.partial_failure import decode_partial_failure
 from google_ads_mcp.server import mcp
-from google_ads_mcp.tools._helpers import get_client
+from google_ads_mcp.tools._helpers import failures_footer, get_client
 
 
 @mcp.tool()
-def gads_create_asset(
+async def gads_create_asset(
     customer_id: str,
     asset_type: str,
     name: str,
@@ -72,14 +73,14 @@ def gads_create_asset(
         youtube_video_id=params.youtube_video_id,
         call_to_action_type=params.call_to_action_type,
     )
-    response = client.mutate(params.customer_id, [operation])
+    response = await client.amutate(params.customer_id, [operation])
     asset_rn = response.mutate_operation_responses[0].asset_result.resource_name
     asset_id = asset_rn.split("/")[-1]
     return f"{params.asset_type.value} asset '{params.name}' created. Asset ID: {asset_id}."
 
 
 @mcp.tool()
-def gads_create_asset_group(
+async def gads_create_asset_group(
     customer_id: str,
     campaign_id: str,
     name: str,
@@ -123,14 +124,14 @@ def gads_create_asset_group(
         path1=params.path1,
         path2=params.path2,
     )
-    response = client.mutate(params.customer_id, [operation])
+    response = await client.amutate(params.customer_id, [operation])
     ag_rn = response.mutate_operation_responses[0].asset_group_result.resource_name
     ag_id = ag_rn.split("/")[-1]
     return f"Asset group '{params.name}' created. ID: {ag_id}."
 
 
 @mcp.tool()
-def gads_add_asset_group_assets(
+async def gads_add_asset_group_assets(
     customer_id: str,
     asset_group_id: str,
     asset_ids: list[str] = [],
@@ -163,6 +164,15 @@ def gads_add_asset_group_assets(
         params.asset_group_id,
         assets=[{"asset_id": a.asset_id, "field_type": a.field_type.value} for a in params.assets],
     )
-    client.mutate(params.customer_id, operations, partial_failure=True)
-    count = len(params.assets)
-    return f"{count} asset(s) linked to asset group {params.asset_group_id}."
+    response = await client.amutate(
+        params.customer_id, operations, partial_failure=True
+    )
+    report = decode_partial_failure(
+        client.client, response,
+        [f"{a.asset_id} ({a.field_type.value})" for a in params.assets],
+    )
+    count = len(report.succeeded)
+    return (
+        f"{count} asset(s) linked to asset group {params.asset_group_id}."
+        f"{failures_footer(report.failures, 'asset(s)', report.errors)}"
+    )
@@ -0,0 +1,149 @@
+"""Batch job tools: run very large mutations server-side."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from mcp.server.fastmcp import Context
+
+from google_ads_mcp.batch_jobs import (
+    build_batch_operations,
+    list_batch_job_results,
+    poll_batch_job,
+    submit_batch_job,
+)
+from google_ads_mcp.models.mutation_inputs import PollBatchJobInput, SubmitBatchJobInput
+from google_ads_mcp.server import mcp
+from google_ads_mcp.tools._helpers import get_client
+from google_ads_mcp.utils.formatting import format_table_markdown, to_json, wants_json
+
+
+@mcp.tool()
+async def gads_submit_batch_job(
+    customer_id: str,
+    operations: list[dict[str, Any]] = [],
+    ctx: Context = None,
+) -> str:
+    """Submit a large set of changes as an asynchronous batch job.
+
+    The job runs on Google's side, so hundreds of thousands of operations
+    do not keep this request open. Follow it with gads_poll_batch_job.
+
+    Each operation is an object with an "action" and its fields:
+    add_keyword (ad_group_id, text, match_type, cpc_bid_micros),
+    add_negative_keyword (campaign_id or ad_group_id, text, match_type),
+    update_keyword (ad_group_id, criterion_id, cpc_bid_micros and/or status),
+    campaign_status (campaign_id, status), ad_group_status (ad_group_id,
+    status), ad_status (ad_group_id, ad_id, status) and update_budget
+    (budget_id, amount_micros). Status is enable, pause or remove.
+
+    Args:
+        customer_id: Google Ads customer ID.
+        operations: Changes to apply (max 1,000,000 per job).
+    """
+    params = SubmitBatchJobInput(customer_id=customer_id, operations=operations)
+    client = get_client(ctx)
+    submission = await submit_batch_job(
+        client,
+        params.customer_id,
+        build_batch_operations(client.client, params.customer_id, params.operations),
+    )
+    return (
+        f"Batch job {submission.job_id} submitted with {submission.operations} "
+        f"operation(s) in {submission.requests} upload(s). "
+        f"Use gads_poll_batch_job with batch_job_id={submission.job_id} "
+        "to follow it."
+    )
+
+
+@mcp.tool()
+async def gads_poll_batch_job(
+    customer_id: str,
+    batch_job_id: str,
+    wait_seconds: int = 0,
+    page_size: int = 100,
+    page_token: str = "",
+    failures_only: bool = True,
+    response_format: str = "markdown",
+    ctx: Context = None,
+) -> str:
+    """Check a batch job and, once done, page through its results.
+
+    Args:
+        customer_id: Google Ads customer ID.
+        batch_job_id: Batch job ID returned by gads_submit_batch_job.
+        wait_seconds: Keep polling (with backoff) up to this many seconds
+            until the job is done (0-300, default 0: check once).
+        page_size: Results per page (1-1000, default 100).
+        page_token: next_page_token of the previous page.
+        failures_only: Only list failed operations (default true).
+        response_format: Output format: markdown, json or compact (unindented json).
+    """
+    params = PollBatchJobInput(
+        customer_id=customer_id,
+        batch_job_id=batch_job_id,
+        wait_seconds=wait_seconds,
+        page_size=page_size,
+        page_token=page_token,
+        failures_only=failures_only,
+        response_format=response_format,
+    )
+    client = get_client(ctx)
+    status = await poll_batch_job(
+        client, params.customer_id, params.batch_job_id, params.wait_seconds
+    )
+    if status.status == "NOT_FOUND":
+        return f"Batch job {params.batch_job_id} not found."
+
+    page = None
+    results: list[dict[str, Any]] = []
+    if status.done:
+        page = await list_batch_job_results(
+            client, params.customer_id, params.batch_job_id,
+            page_size=params.page_size, page_token=params.page_token,
+        )
+        results = page.results
+        if params.failures_only:
+            results = [r for r in results if r["status"] == "FAILED"]
+    next_page_token = page.next_page_token if page else ""
+
+    if wants_json(params.response_format):
+        return to_json(
+            {
+                **status.to_dict(),
+                "results": results,
+                "next_page_token": next_page_token,
+            },
+            params.response_format,
+        )
+
+    lines = [
+        f"## Batch job {status.job_id}: {status.status}",
+        "",
+        f"**Operations:** {status.executed_operation_count:,}/"
+        f"{status.operation_count:,} executed "
+        f"({status.completion_ratio:.0%} estimated)",
+    ]
+    if not status.done:
+        lines.append("\n_Job still running: try again later or use wait_seconds._")
+        return "\n".join(lines)
+
+    lines.append("")
+    if results:
+        lines.append(format_table_markdown(
+            results,
+            ["operation_index", "status", "error", "resource_name"],
+            {
+                "operation_index": "Index",
+                "status": "Result",
+                "error": "Error",
+                "resource_name": "Resource",
+            },
+        ))
+    elif params.failures_only:
+        lines.append("_No failed operations on this page._")
+    else:
+        lines.append("_No results._")
+    if next_page_token:
+        lines.append(f"\n**next_page_token:** `{next_page_token}`")
+    return "\n".join(lines)
@@ -11,7 +11,7 @@ from google_ads_mcp.tools._helpers import get_client
 
 
 @mcp.tool()
-def gads_set_bidding_strategy(
+async def gads_set_bidding_strategy(
     customer_id: str,
     campaign_id: str,
     strategy_type: str,
@@ -40,5 +40,5 @@ def gads_set_bidding_strategy(
         target_cpa_micros=params.target_cpa_micros,
         target_roas=params.target_roas,
     )
-    client.mutate(params.customer_id, [operation])
+    await client.amutate(params.customer_id, [operation])
     return f"Campaign {params.campaign_id} bidding strategy set to {params.strategy_type.value}."
@@ -12,7 +12,7 @@ from google_ads_mcp.utils.formatting import micros_to_currency
 
 
 @mcp.tool()
-def gads_update_budget(
+async def gads_update_budget(
     customer_id: str,
     budget_id: str,
     amount_micros: int,
@@ -37,6 +37,6 @@ def gads_update_budget(
         params.budget_id,
         params.amount_micros,
     )
-    client.mutate(params.customer_id, [operation])
+    await client.amutate_batched(params.customer_id, [operation])
     formatted = micros_to_currency(params.amount_micros)
     return f"Budget {params.budget_id} updated to {formatted}/day."
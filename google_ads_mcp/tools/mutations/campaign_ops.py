@@ -17,7 +17,7 @@ from google_ads_mcp.tools._helpers import get_client
 
 
 @mcp.tool()
-def gads_set_campaign_status(
+async def gads_set_campaign_status(
     customer_id: str,
     campaign_id: str,
     status: str,
@@ -44,14 +44,14 @@ def gads_set_campaign_status(
         params.campaign_id,
         params.status.value,
     )
-    client.mutate(params.customer_id, [operation])
+    await client.amutate_batched(params.customer_id, [operation])
     action_map = {"enable": "ENABLED", "pause": "PAUSED", "remove": "REMOVED"}
     new_status = action_map[params.status.value]
     return f"Campaign {params.campaign_id} status changed to {new_status}."
 
 
 @mcp.tool()
-def gads_update_campaign(
+async def gads_update_campaign(
     customer_id: str,
     campaign_id: str,
     name: str | None = None,
@@ -84,7 +84,7 @@ def gads_update_campaign(
         start_date=params.start_date,
         end_date=params.end_date,
     )
-    client.mutate(params.customer_id, [operation])
+    await client.amutate(params.customer_id, [operation])
     updated = [
         f for f in ["name", "start_date", "end_date"]
         if getattr(params, f) is not None
@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
-import json
+import os
 from typing import Any
 
 from mcp.server.fastmcp import Context
 
+from google_ads_mcp.conversions import (
+    MAX_CONVERSIONS_PER_REQUEST,
+    ClickConversionInput,
+    ClickConversionUpload,
+    build_upload_request,
+    upload_click_conversions_file,
+)
 from google_ads_mcp.models.common import sanitize_customer_id
 from google_ads_mcp.server import mcp
-from google_ads_mcp.tools._helpers import get_client
+from google_ads_mcp.tools._helpers import get_client, get_outbox, report_progress
+from google_ads_mcp.utils.errors import GoogleAdsMCPError, is_transient_error
+from google_ads_mcp.utils.formatting import to_json
 
 
 @mcp.tool()
-def gads_upload_click_conversions(
+async def gads_upload_click_conversions(
     customer_id: str,
     conversion_action_id: str,
     gclid: str,
@@ -25,7 +34,9 @@ def gads_upload_click_conversions(
     """Upload an offline click conversion to Google Ads.
 
     Associates a conversion event with a previous ad click identified
-    by the Google Click ID (GCLID).
+    by the Google Click ID (GCLID). If the upload still fails transiently
+    after retries, it is queued in the local outbox and resent in the
+    background.
 
     Args:
         customer_id: Google Ads customer ID.
@@ -39,21 +50,28 @@ def gads_upload_click_conversions(
     client = get_client(ctx)
     service = client.get_service("ConversionUploadService")
 
-    click_conversion = client.client.get_type("ClickConversion")
-    click_conversion.conversion_action = (
-        f"customers/{cid}/conversionActions/{conversion_action_id}"
+    conversion = ClickConversionInput(
+        line=0,
+        conversion_action_id=conversion_action_id,
+        click_id_field="gclid",
+        click_id=gclid,
+        conversion_date_time=conversion_date_time,
+        conversion_value=conversion_value,
+        currency_code=currency_code,
     )
-    click_conversion.gclid = gclid
-    click_conversion.conversion_date_time = conversion_date_time
-    click_conversion.conversion_value = conversion_value
-    click_conversion.currency_code = currency_code
-
-    request = client.client.get_type("UploadClickConversionsRequest")
-    request.customer_id = cid
-    request.conversions.append(click_conversion)
-    request.partial_failure = True
-
-    response = service.upload_click_conversions(request=request)
+    request = build_upload_request(client.client, cid, [conversion])
+    try:
+        response = await client.acall(service.upload_click_conversions, request=request)
+    except GoogleAdsMCPError as exc:
+        outbox = get_outbox(ctx)
+        if outbox is None or not is_transient_error(exc):
+            raise
+        key = await client.arun(
+            outbox.enqueue_click_conversions, cid, [conversion], str(exc)
+        )
+        return to_json(
+            {"error": str(exc), "queued_for_retry": 1, "idempotency_key": key},
+        )
 
     results: list[dict[str, Any]] = []
     for result in response.results:
@@ -71,9 +89,54 @@ def gads_upload_click_conversions(
             ),
         })
 
-    return json.dumps(
-        {"uploaded": len(results), "results": results},
-        indent=2,
-        ensure_ascii=False,
-        default=str,
-    )
+    return to_json({"uploaded": len(results), "results": results})
+
+
+@mcp.tool()
+async def gads_upload_click_conversions_file(
+    customer_id: str,
+    file_path: str,
+    conversion_action_id: str = "",
+    batch_size: int = MAX_CONVERSIONS_PER_REQUEST,
+    max_concurrency: int = 4,
+    ctx: Context = None,
+) -> str:
+    """Upload offline click conversions in bulk from a local NDJSON or CSV file.
+
+    Each row (a JSON object per line for .ndjson/.jsonl/.json files, else a
+    CSV row with a header) has exactly one of gclid, gbraid or wbraid, a
+    conversion_date_time (or datetime), and optionally conversion_value
+    (or value), currency_code (or currency) and conversion_action_id.
+    Rows repeating the same click ID, conversion action and datetime are
+    sent once. Conversions are sent in requests of up to 2000, several at
+    a time, with partial failure: rejected rows are reported by file line
+    and do not block the others. Batches that still fail transiently after
+    retries are queued in the local outbox and resent in the background.
+
+    Args:
+        customer_id: Google Ads customer ID.
+        file_path: Path of the NDJSON or CSV file on the server machine.
+        conversion_action_id: Conversion action resource ID for rows
+            without their own conversion_action_id.
+        batch_size: Conversions per request (1-2000, default 2000).
+        max_concurrency: Requests in flight (default 4).
+    """
+    cid = sanitize_customer_id(customer_id)
+    path = os.path.abspath(os.path.expanduser(file_path))
+    if not os.path.isfile(path):
+        return to_json({"error": f"File not found: {path}"})
+    client = get_client(ctx)
+
+    async def progress(upload: ClickConversionUpload) -> None:
+        await report_progress(ctx, upload.rows)
+
+    try:
+        upload = await upload_click_conversions_file(
+            client, cid, path,
+            conversion_action_id=conversion_action_id,
+            batch_size=batch_size, max_concurrency=max_concurrency,
+            on_progress=progress, outbox=get_outbox(ctx),
+        )
+    except ValueError as exc:
+        return to_json({"error": str(exc)})
+    return to_json({"file": path, **upload.to_dict()})
@@ -26,7 +26,7 @@ from google_ads_mcp.utils.formatting import micros_to_currency
 
 
 @mcp.tool()
-def gads_create_campaign(
+async def gads_create_campaign(
     customer_id: str,
     name: str,
     campaign_type: str,
@@ -77,7 +77,7 @@ def gads_create_campaign(
         target_cpa_micros=params.target_cpa_micros,
         target_roas=params.target_roas,
     )
-    response = client.mutate(params.customer_id, operations)
+    response = await client.amutate(params.customer_id, operations)
     budget_rn = response.mutate_operation_responses[0].campaign_budget_result.resource_name
     campaign_rn = response.mutate_operation_responses[1].campaign_result.resource_name
     budget_id = budget_rn.split("/")[-1]
@@ -92,7 +92,7 @@ def gads_create_campaign(
 
 
 @mcp.tool()
-def gads_create_ad_group(
+async def gads_create_ad_group(
     customer_id: str,
     campaign_id: str,
     name: str,
@@ -106,7 +106,7 @@ def gads_create_ad_group(
         customer_id: Google Ads customer ID.
         campaign_id: Campaign ID to add the ad group to.
         name: Ad group name.
-        ad_group_type: Type — SEARCH_STANDARD, DISPLAY_STANDARD, SHOPPING_PRODUCT, or VIDEO_RESPONSIVE.
+        ad_group_type: Type — SEARCH_STANDARD, DISPLAY_STANDARD, SHOPPING_PRODUCT_ADS, or VIDEO_RESPONSIVE.
         cpc_bid_micros: Default CPC bid in micros (optional).
     """
     params = CreateAdGroupInput(
@@ -125,14 +125,14 @@ def gads_create_ad_group(
         ad_group_type=params.ad_group_type.value,
         cpc_bid_micros=params.cpc_bid_micros,
     )
-    response = client.mutate(params.customer_id, [operation])
+    response = await client.amutate(params.customer_id, [operation])
     ad_group_rn = response.mutate_operation_responses[0].ad_group_result.resource_name
     ad_group_id = ad_group_rn.split("/")[-1]
     return f"Ad group '{params.name}' created. Type: {params.ad_group_type.value}. ID: {ad_group_id}."
 
 
 @mcp.tool()
-def gads_create_responsive_search_ad(
+async def gads_create_responsive_search_ad(
     customer_id: str,
     ad_group_id: str,
     headlines: list[str] = [],
@@ -173,7 +173,7 @@ def gads_create_responsive_search_ad(
         path1=params.path1,
         path2=params.path2,
     )
-    response = client.mutate(params.customer_id, [operation])
+    response = await client.amutate(params.customer_id, [operation])
     ad_rn = response.mutate_operation_responses[0].ad_group_ad_result.resource_name
     ad_id = ad_rn.split("/")[-1]
     return (
@@ -183,7 +183,7 @@ def gads_create_responsive_search_ad(
 
 
 @mcp.tool()
-def gads_create_responsive_display_ad(
+async def gads_create_responsive_display_ad(
     customer_id: str,
     ad_group_id: str,
     marketing_image_asset_ids: list[str] = [],
@@ -238,7 +238,7 @@ def gads_create_responsive_display_ad(
         logo_asset_ids=params.logo_asset_ids,
         square_image_asset_ids=params.square_image_asset_ids,
     )
-    response = client.mutate(params.customer_id, [operation])
+    response = await client.amutate(params.customer_id, [operation])
     ad_rn = response.mutate_operation_responses[0].ad_group_ad_result.resource_name
     ad_id = ad_rn.split("/")[-1]
     return (
@@ -248,7 +248,7 @@ def gads_create_responsive_display_ad(
 
 
 @mcp.tool()
-def gads_create_demand_gen_ad(
+async def gads_create_demand_gen_ad(
     customer_id: str,
     ad_group_id: str,
     headlines: list[str] = [],
@@ -299,7 +299,7 @@ def gads_create_demand_gen_ad(
         final_urls=params.final_urls,
         call_to_action=params.call_to_action,
     )
-    response = client.mutate(params.customer_id, [operation])
+    response = await client.amutate(params.customer_id, [operation])
     ad_rn = response.mutate_operation_responses[0].ad_group_ad_result.resource_name
     ad_id = ad_rn.split("/")[-1]
     return (
@@ -2,74 +2,95 @@
 
 from __future__ import annotations
 
-import hashlib
-import json
-from typing import Any
+import os
 
 from mcp.server.fastmcp import Context
 
+from google_ads_mcp.customer_match import (
+    DEFAULT_CHUNK_SIZE,
+    CustomerMatchUpload,
+    build_user_data_request,
+    upload_customer_match_file,
+)
+from google_ads_mcp.hashing import hash_batch, phone_country_code_from_env, unique_digests
 from google_ads_mcp.models.common import sanitize_customer_id
 from google_ads_mcp.server import mcp
-from google_ads_mcp.tools._helpers import get_client
+from google_ads_mcp.tools._helpers import get_client, get_outbox, report_progress
+from google_ads_mcp.utils.errors import GoogleAdsMCPError, is_transient_error
+from google_ads_mcp.utils.formatting import to_json
 
 
-def _hash_value(value: str) -> str:
-    """SHA256-hash a normalized value for Customer Match upload.
+def _user_identifiers(emails: str, phones: str) -> list[tuple[str, str]]:
+    """Hash email and phone inputs into (UserIdentifier field, digest) pairs.
 
-    Args:
-        value: Raw value (email, phone, etc.).
-
-    Returns:
-        Lowercase hex SHA256 digest.
+    Identifiers are normalized per Google's Customer Match rules (emails
+    lowercased, Gmail dots removed, phones in E.164) and SHA256-hashed;
+    values that are already SHA256 digests are kept as they are. Invalid
+    and repeated identifiers are dropped.
     """
-    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+    country_code = phone_country_code_from_env()
+    return [
+        ("hashed_email", digest)
+        for digest in unique_digests(hash_batch("email", emails.split(",")))
+    ] + [
+        ("hashed_phone_number", digest)
+        for digest in unique_digests(
+            hash_batch("phone", phones.split(","), country_code)
+        )
+    ]
 
 
-def _build_user_data_list(
-    client: Any,
+async def _upload_user_data(
+    ctx: Context,
+    customer_id: str,
+    user_list_id: str,
     emails: str,
     phones: str,
-) -> list[Any]:
-    """Build a list of UserData objects from email and phone inputs.
-
-    Emails are lowercased and SHA256-hashed. Phone numbers are stripped
-    and SHA256-hashed.
+    remove: bool,
+) -> str:
+    """Send one UploadUserData request, queueing it in the outbox on transient errors."""
+    cid = sanitize_customer_id(customer_id)
+    identifiers = _user_identifiers(emails, phones)
+    if not identifiers:
+        return to_json({"error": "No valid emails or phones provided."})
 
-    Args:
-        client: GoogleAdsClientWrapper instance.
-        emails: Comma-separated email addresses.
-        phones: Comma-separated phone numbers.
+    client = get_client(ctx)
+    service = client.get_service("UserDataService")
+    request = build_user_data_request(
+        client.client, cid, user_list_id, identifiers, remove=remove
+    )
+    try:
+        response = await client.acall(service.upload_user_data, request=request)
+    except GoogleAdsMCPError as exc:
+        outbox = get_outbox(ctx)
+        if outbox is None or not is_transient_error(exc):
+            raise
+        key = await client.arun(
+            outbox.enqueue_user_data, cid, user_list_id, identifiers, remove, str(exc)
+        )
+        return to_json(
+            {
+                "error": str(exc),
+                "queued_for_retry": len(identifiers),
+                "idempotency_key": key,
+            },
+        )
 
-    Returns:
-        List of UserData proto objects.
-    """
-    user_data_list: list[Any] = []
-
-    if emails:
-        for email in emails.split(","):
-            email = email.strip().lower()
-            if email:
-                user_data = client.client.get_type("UserData")
-                user_identifier = client.client.get_type("UserIdentifier")
-                user_identifier.hashed_email = _hash_value(email)
-                user_data.user_identifiers.append(user_identifier)
-                user_data_list.append(user_data)
-
-    if phones:
-        for phone in phones.split(","):
-            phone = phone.strip()
-            if phone:
-                user_data = client.client.get_type("UserData")
-                user_identifier = client.client.get_type("UserIdentifier")
-                user_identifier.hashed_phone_number = _hash_value(phone)
-                user_data.user_identifiers.append(user_identifier)
-                user_data_list.append(user_data)
-
-    return user_data_list
+    received_count = (
+        response.received_operations_count
+        if hasattr(response, "received_operations_count")
+        else len(identifiers)
+    )
+    return to_json(
+        {
+            "removed" if remove else "uploaded": len(identifiers),
+            "received_operations_count": received_count,
+        },
+    )
 
 
 @mcp.tool()
-def gads_upload_customer_list(
+async def gads_upload_customer_list(
     customer_id: str,
     user_list_id: str,
     emails: str = "",
@@ -78,8 +99,11 @@ def gads_upload_customer_list(
 ) -> str:
     """Upload members to a customer match list.
 
-    Email addresses and phone numbers are automatically SHA256-hashed
-    before upload, as required by the Google Ads API.
+    Email addresses and phone numbers are normalized and SHA256-hashed
+    before upload, as required by the Google Ads API. Already hashed
+    values are accepted; duplicates are uploaded once. If the upload
+    still fails transiently after retries, it is queued in the local
+    outbox and resent in the background.
 
     Args:
         customer_id: Google Ads customer ID.
@@ -87,58 +111,13 @@ def gads_upload_customer_list(
         emails: Comma-separated email addresses (will be SHA256 hashed).
         phones: Comma-separated phone numbers (will be SHA256 hashed).
     """
-    cid = sanitize_customer_id(customer_id)
-    client = get_client(ctx)
-
-    user_data_list = _build_user_data_list(client, emails, phones)
-
-    if not user_data_list:
-        return json.dumps(
-            {"error": "No valid emails or phones provided."},
-            indent=2,
-            ensure_ascii=False,
-            default=str,
-        )
-
-    service = client.get_service("UserDataService")
-
-    request = client.client.get_type("UploadUserDataRequest")
-    request.customer_id = cid
-
-    for ud in user_data_list:
-        op = client.client.get_type("UserDataOperation")
-        op.create = ud
-        request.operations.append(op)
-
-    customer_match_metadata = client.client.get_type(
-        "CustomerMatchUserListMetadata"
-    )
-    customer_match_metadata.user_list = (
-        f"customers/{cid}/userLists/{user_list_id}"
-    )
-    request.customer_match_user_list_metadata = customer_match_metadata
-
-    response = service.upload_user_data(request=request)
-
-    received_count = (
-        response.received_operations_count
-        if hasattr(response, "received_operations_count")
-        else len(user_data_list)
-    )
-
-    return json.dumps(
-        {
-            "uploaded": len(user_data_list),
-            "received_operations_count": received_count,
-        },
-        indent=2,
-        ensure_ascii=False,
-        default=str,
+    return await _upload_user_data(
+        ctx, customer_id, user_list_id, emails, phones, remove=False
     )
 
 
 @mcp.tool()
-def gads_remove_customer_list_members(
+async def gads_remove_customer_list_members(
     customer_id: str,
     user_list_id: str,
     emails: str = "",
@@ -147,8 +126,10 @@ def gads_remove_customer_list_members(
 ) -> str:
     """Remove members from a customer match list.
 
-    Email addresses and phone numbers are automatically SHA256-hashed
-    before the removal request, as required by the Google Ads API.
+    Email addresses and phone numbers are normalized and SHA256-hashed
+    before the removal request, as required by the Google Ads API. If the
+    request still fails transiently after retries, it is queued in the
+    local outbox and resent in the background.
 
     Args:
         customer_id: Google Ads customer ID.
@@ -156,51 +137,58 @@ def gads_remove_customer_list_members(
         emails: Comma-separated email addresses to remove (will be SHA256 hashed).
         phones: Comma-separated phone numbers to remove (will be SHA256 hashed).
     """
-    cid = sanitize_customer_id(customer_id)
-    client = get_client(ctx)
+    return await _upload_user_data(
+        ctx, customer_id, user_list_id, emails, phones, remove=True
+    )
 
-    user_data_list = _build_user_data_list(client, emails, phones)
 
-    if not user_data_list:
-        return json.dumps(
-            {"error": "No valid emails or phones provided."},
-            indent=2,
-            ensure_ascii=False,
-            default=str,
-        )
-
-    service = client.get_service("UserDataService")
-
-    request = client.client.get_type("UploadUserDataRequest")
-    request.customer_id = cid
+@mcp.tool()
+async def gads_upload_customer_list_file(
+    customer_id: str,
+    user_list_id: str,
+    file_path: str,
+    remove: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_concurrency: int = 4,
+    ctx: Context = None,
+) -> str:
+    """Upload (or remove) customer match members from a local CSV file.
 
-    for ud in user_data_list:
-        op = client.client.get_type("UserDataOperation")
-        op.remove = ud
-        request.operations.append(op)
+    Streams the file into an OfflineUserDataJob: members are hashed and
+    uploaded in chunks, several chunks at a time, then the job is started.
+    Memory use does not grow with the file, so lists of millions of rows
+    work. Google processes the job asynchronously (usually within hours).
 
-    customer_match_metadata = client.client.get_type(
-        "CustomerMatchUserListMetadata"
-    )
-    customer_match_metadata.user_list = (
-        f"customers/{cid}/userLists/{user_list_id}"
-    )
-    request.customer_match_user_list_metadata = customer_match_metadata
+    The CSV needs a header with an email and/or phone column; each row is
+    one member. Values are normalized and hashed off the event loop, in
+    worker processes for chunks of 5000 values or more (already hashed
+    values are kept), and repeated members are sent once.
 
-    response = service.upload_user_data(request=request)
+    Args:
+        customer_id: Google Ads customer ID.
+        user_list_id: The user list resource ID.
+        file_path: Path of the CSV file on the server machine.
+        remove: Remove the members instead of adding them.
+        chunk_size: Members per upload request (1-100000, default 10000).
+        max_concurrency: Upload requests in flight (default 4).
+    """
+    cid = sanitize_customer_id(customer_id)
+    path = os.path.abspath(os.path.expanduser(file_path))
+    if not os.path.isfile(path):
+        return to_json({"error": f"File not found: {path}"})
+    client = get_client(ctx)
 
-    received_count = (
-        response.received_operations_count
-        if hasattr(response, "received_operations_count")
-        else len(user_data_list)
-    )
+    async def progress(upload: CustomerMatchUpload) -> None:
+        await report_progress(ctx, upload.members)
 
-    return json.dumps(
-        {
-            "removed": len(user_data_list),
-            "received_operations_count": received_count,
-        },
-        indent=2,
-        ensure_ascii=False,
-        default=str,
+    try:
+        upload = await upload_customer_match_file(
+            client, cid, user_list_id, path,
+            remove=remove, chunk_size=chunk_size,
+            max_concurrency=max_concurrency, on_progress=progress,
+        )
+    except ValueError as exc:
+        return to_json({"error": str(exc)})
+    return to_json(
+        {"file": path, "action": "remove" if remove else "add", **upload.to_dict()},
     )
@@ -11,7 +11,7 @@ from google_ads_mcp.tools._helpers import get_client
 
 
 @mcp.tool()
-def gads_create_ad_extension(
+async def gads_create_ad_extension(
     customer_id: str,
     campaign_id: str,
     extension_type: str,
@@ -59,5 +59,5 @@ def gads_create_ad_extension(
         country_code=params.country_code,
         snippet_header=params.snippet_header, snippet_values=params.snippet_values,
     )
-    client.mutate(params.customer_id, [operation])
+    await client.amutate(params.customer_id, [operation])
     return f"{params.extension_type.value} extension created for campaign {params.campaign_id}."
@@ -9,14 +9,26 @@ from google_ads_mcp.builders.operations import (
     build_negative_keyword_operations,
     build_update_keyword_operation,
 )
+from google_ads_mcp.bulk import BulkMutator
 from google_ads_mcp.models.creation_inputs import AddKeywordsInput, UpdateKeywordInput
 from google_ads_mcp.models.mutation_inputs import AddNegativeKeywordsInput
 from google_ads_mcp.server import mcp
-from google_ads_mcp.tools._helpers import get_client
+from google_ads_mcp.tools._helpers import failures_footer, get_client
+
+
+# Keyword texts echoed back in a tool response; longer lists are truncated.
+_MAX_LISTED_KEYWORDS = 20
+
+
+def _format_keywords(keywords: list[str]) -> str:
+    listed = ", ".join(keywords[:_MAX_LISTED_KEYWORDS])
+    if len(keywords) > _MAX_LISTED_KEYWORDS:
+        listed += f" ... (+{len(keywords) - _MAX_LISTED_KEYWORDS} more)"
+    return listed
 
 
 @mcp.tool()
-def gads_add_negative_keywords(
+async def gads_add_negative_keywords(
     customer_id: str,
     level: str,
     campaign_id: str | None = None,
@@ -27,12 +39,15 @@ def gads_add_negative_keywords(
 ) -> str:
     """Add negative keywords to a campaign or ad group.
 
+    Large lists are sent in concurrent chunks; keywords rejected by the API
+    are listed in the response while the others are still added.
+
     Args:
         customer_id: Google Ads customer ID.
         level: Level to add negatives — campaign or ad_group.
         campaign_id: Campaign ID (required if level=campaign).
         ad_group_id: Ad group ID (required if level=ad_group).
-        keywords: List of keyword texts to add as negatives (max 20).
+        keywords: List of keyword texts to add as negatives (max 50,000).
         match_type: Match type — exact, phrase, or broad.
     """
     params = AddNegativeKeywordsInput(
@@ -57,16 +72,18 @@ def gads_add_negative_keywords(
         params.keywords,
         params.match_type.value,
     )
-    client.mutate(params.customer_id, operations, partial_failure=True)
-    count = len(params.keywords)
+    result = await BulkMutator(client).run(
+        params.customer_id, operations, items=params.keywords
+    )
     return (
-        f"Added {count} negative keyword(s) at {params.level.value} level "
-        f"({params.match_type.value} match): {', '.join(params.keywords)}"
+        f"Added {result.succeeded} negative keyword(s) at {params.level.value} level "
+        f"({params.match_type.value} match): {_format_keywords(params.keywords)}"
+        f"{failures_footer(result.failures, 'keyword(s)', result.errors)}"
     )
 
 
 @mcp.tool()
-def gads_add_keywords(
+async def gads_add_keywords(
     customer_id: str,
     ad_group_id: str,
     keywords: list[str] = [],
@@ -76,10 +93,13 @@ def gads_add_keywords(
 ) -> str:
     """Add positive keywords to an ad group.
 
+    Large lists are sent in concurrent chunks; keywords rejected by the API
+    are listed in the response while the others are still added.
+
     Args:
         customer_id: Google Ads customer ID.
         ad_group_id: Ad group ID.
-        keywords: Keywords to add (max 20 per call).
+        keywords: Keywords to add (max 50,000 per call).
         match_type: Match type — exact, phrase, or broad.
         cpc_bid_micros: Keyword-level CPC bid in micros (optional).
     """
@@ -93,16 +113,18 @@ def gads_add_keywords(
         params.keywords, params.match_type.value,
         cpc_bid_micros=params.cpc_bid_micros,
     )
-    client.mutate(params.customer_id, operations, partial_failure=True)
-    count = len(params.keywords)
+    result = await BulkMutator(client).run(
+        params.customer_id, operations, items=params.keywords
+    )
     return (
-        f"Added {count} keyword(s) to ad group {params.ad_group_id} "
-        f"({params.match_type.value} match): {', '.join(params.keywords)}"
+        f"Added {result.succeeded} keyword(s) to ad group {params.ad_group_id} "
+        f"({params.match_type.value} match): {_format_keywords(params.keywords)}"
+        f"{failures_footer(result.failures, 'keyword(s)', result.errors)}"
     )
 
 
 @mcp.tool()
-def gads_update_keyword(
+async def gads_update_keyword(
     customer_id: str,
     ad_group_id: str,
     criterion_id: str,
@@ -131,7 +153,7 @@ def gads_update_keyword(
         params.criterion_id, cpc_bid_micros=params.cpc_bid_micros,
         status=params.status.value if params.status else None,
     )
-    client.mutate(params.customer_id, [operation])
+    await client.amutate_batched(params.customer_id, [operation])
     changes = []
     if params.cpc_bid_micros is not None:
         changes.append(f"bid={params.cpc_bid_micros}")
@@ -17,7 +17,7 @@ from google_ads_mcp.tools._helpers import get_client
 
 
 @mcp.tool()
-def gads_set_listing_group_filter(
+async def gads_set_listing_group_filter(
     customer_id: str,
     asset_group_id: str,
     filter_type: str,
@@ -56,14 +56,14 @@ def gads_set_listing_group_filter(
         value=params.value,
         parent_filter_id=params.parent_filter_id,
     )
-    response = client.mutate(params.customer_id, [operation])
+    response = await client.amutate(params.customer_id, [operation])
     filter_rn = response.mutate_operation_responses[0].asset_group_listing_group_filter_result.resource_name
     filter_id = filter_rn.split("/")[-1]
     return f"{params.filter_type} filter on {params.dimension.value} set for asset group {params.asset_group_id}. Filter ID: {filter_id}."
 
 
 @mcp.tool()
-def gads_link_merchant_center(
+async def gads_link_merchant_center(
     customer_id: str,
     campaign_id: str,
     merchant_id: str,
@@ -96,5 +96,5 @@ def gads_link_merchant_center(
         feed_label=params.feed_label,
         sales_country=params.sales_country,
     )
-    client.mutate(params.customer_id, [operation])
+    await client.amutate(params.customer_id, [operation])
     return f"Merchant Center {params.merchant_id} linked to campaign {params.campaign_id}."
@@ -20,12 +20,13 @@ from google_ads_mcp.models.creation_inputs import (
     SetDemographicTargetingInput,
     CreateAudienceSegmentInput,
 )
+from google_ads_mcp.partial_failure import decode_partial_failure
 from google_ads_mcp.server import mcp
-from google_ads_mcp.tools._helpers import get_client
+from google_ads_mcp.tools._helpers import failures_footer, get_client
 
 
 @mcp.tool()
-def gads_set_location_targeting(
+async def gads_set_location_targeting(
     customer_id: str,
     campaign_id: str,
     location_ids: list[int] = [],
@@ -54,14 +55,20 @@ def gads_set_location_targeting(
         params.location_ids,
         params.exclude,
     )
-    client.mutate(params.customer_id, operations, partial_failure=True)
+    response = await client.amutate(
+        params.customer_id, operations, partial_failure=True
+    )
+    report = decode_partial_failure(client.client, response, params.location_ids)
     action = "excluded from" if params.exclude else "targeted in"
-    count = len(params.location_ids)
-    return f"{count} location(s) {action} campaign {params.campaign_id}."
+    count = len(report.succeeded)
+    return (
+        f"{count} location(s) {action} campaign {params.campaign_id}."
+        f"{failures_footer(report.failures, 'location(s)', report.errors)}"
+    )
 
 
 @mcp.tool()
-def gads_set_language_targeting(
+async def gads_set_language_targeting(
     customer_id: str,
     campaign_id: str,
     language_ids: list[int] = [],
@@ -86,13 +93,19 @@ def gads_set_language_targeting(
         params.campaign_id,
         params.language_ids,
     )
-    client.mutate(params.customer_id, operations, partial_failure=True)
-    count = len(params.language_ids)
-    return f"{count} language(s) set for campaign {params.campaign_id}."
+    response = await client.amutate(
+        params.customer_id, operations, partial_failure=True
+    )
+    report = decode_partial_failure(client.client, response, params.language_ids)
+    count = len(report.succeeded)
+    return (
+        f"{count} language(s) set for campaign {params.campaign_id}."
+        f"{failures_footer(report.failures, 'language(s)', report.errors)}"
+    )
 
 
 @mcp.tool()
-def gads_set_device_targeting(
+async def gads_set_device_targeting(
     customer_id: str,
     campaign_id: str,
     device: str,
@@ -118,7 +131,7 @@ def gads_set_device_targeting(
         client.client, params.customer_id, params.campaign_id,
         device=params.device.value, bid_modifier=params.bid_modifier,
     )
-    client.mutate(params.customer_id, [operation])
+    await client.amutate(params.customer_id, [operation])
     pct = int((params.bid_modifier - 1.0) * 100)
     modifier_str = f"+{pct}%" if pct > 0 else f"{pct}%" if pct < 0 else "no change"
     if params.bid_modifier == 0.0:
@@ -127,7 +140,7 @@ def gads_set_device_targeting(
 
 
 @mcp.tool()
-def gads_set_demographic_targeting(
+async def gads_set_demographic_targeting(
     customer_id: str,
     campaign_id: str,
     dimension: str,
@@ -154,13 +167,19 @@ def gads_set_demographic_targeting(
         dimension=params.dimension.value, values=params.values,
         bid_modifier=params.bid_modifier,
     )
-    client.mutate(params.customer_id, operations, partial_failure=True)
-    count = len(params.values)
-    return f"{count} {params.dimension.value} target(s) set for campaign {params.campaign_id}."
+    response = await client.amutate(
+        params.customer_id, operations, partial_failure=True
+    )
+    report = decode_partial_failure(client.client, response, params.values)
+    count = len(report.succeeded)
+    return (
+        f"{count} {params.dimension.value} target(s) set for campaign {params.campaign_id}."
+        f"{failures_footer(report.failures, 'target(s)', report.errors)}"
+    )
 
 
 @mcp.tool()
-def gads_create_audience_segment(
+async def gads_create_audience_segment(
     customer_id: str,
     campaign_id: str,
     audience_type: str,
@@ -188,5 +207,5 @@ def gads_create_audience_segment(
         audience_type=params.audience_type.value,
         audience_id=params.audience_id, bid_modifier=params.bid_modifier,
     )
-    client.mutate(params.customer_id, [operation])
+    await client.amutate(params.customer_id, [operation])
     return f"{params.audience_type.value} audience {params.audience_id} added to campaign {params.campaign_id}."
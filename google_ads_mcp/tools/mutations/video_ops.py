@@ -11,7 +11,7 @@ from google_ads_mcp.tools._helpers import get_client
 
 
 @mcp.tool()
-def gads_create_video_ad(
+async def gads_create_video_ad(
     customer_id: str,
     ad_group_id: str,
     video_asset_id: str,
@@ -63,7 +63,7 @@ def gads_create_video_ad(
         display_url=params.display_url,
         companion_banner_asset_id=params.companion_banner_asset_id,
     )
-    response = client.mutate(params.customer_id, [operation])
+    response = await client.amutate(params.customer_id, [operation])
     ad_rn = response.mutate_operation_responses[0].ad_group_ad_result.resource_name
     ad_id = ad_rn.split("/")[-1]
     return f"{params.ad_format.value} video ad created. Ad ID: {ad_id}."
@@ -0,0 +1,88 @@
+"""Upload outbox status tool for Google Ads MCP server."""
+
+from __future__ import annotations
+
+from mcp.server.fastmcp import Context
+
+from google_ads_mcp.server import mcp
+from google_ads_mcp.tools._helpers import get_client, get_outbox
+from google_ads_mcp.utils.formatting import format_table_markdown, to_json, wants_json
+
+
+@mcp.tool()
+async def gads_outbox_status(
+    limit: int = 10,
+    response_format: str = "markdown",
+    ctx: Context = None,
+) -> str:
+    """Show the local outbox of conversion and customer list uploads awaiting retry.
+
+    Uploads that still fail transiently after retries (server errors,
+    exhausted quota) are stored locally and resent in the background with
+    backoff. Reports pending, failed and done counts and the most recent
+    pending and failed entries with their last error. No API call is made.
+
+    Args:
+        limit: Entries listed per status (default 10).
+        response_format: Output format: markdown, json or compact (unindented json).
+    """
+    outbox = get_outbox(ctx)
+    if outbox is None:
+        return "Outbox disabled: set GOOGLE_ADS_OUTBOX_DB."
+
+    client = get_client(ctx)
+    counts = await client.arun(outbox.counts)
+    entries = {
+        status: [
+            {
+                "id": e.id,
+                "kind": e.kind,
+                "customer_id": e.customer_id,
+                "items": e.items,
+                "attempts": e.attempts,
+                "last_error": e.last_error,
+                "idempotency_key": e.idempotency_key,
+            }
+            for e in await client.arun(outbox.entries, status, limit)
+        ]
+        for status in ("pending", "failed")
+    }
+
+    if wants_json(response_format):
+        return to_json(
+            {"counts": counts, "entries": entries, "path": outbox.path},
+            response_format,
+        )
+
+    summary = [
+        {"status": status, **counts[status]} for status in ("pending", "failed", "done")
+    ]
+    lines = [
+        "## Upload outbox",
+        "",
+        format_table_markdown(
+            summary,
+            ["status", "entries", "items"],
+            {"status": "Status", "entries": "Chunks", "items": "Items"},
+        ),
+        "",
+    ]
+    columns = ["id", "kind", "customer_id", "items", "attempts", "last_error"]
+    headers = {
+        "id": "ID",
+        "kind": "Kind",
+        "customer_id": "Customer",
+        "items": "Items",
+        "attempts": "Attempts",
+        "last_error": "Last error",
+    }
+    for status, title in (("pending", "Pending"), ("failed", "Failed")):
+        if entries[status]:
+            lines += [
+                f"### {title}",
+                "",
+                format_table_markdown(entries[status], columns, headers),
+                "",
+            ]
+    lines.append(f"_Outbox: `{outbox.path}`_")
+    return "\n".join(lines)
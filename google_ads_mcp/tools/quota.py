@@ -0,0 +1,99 @@
+"""API quota status tool for Google Ads MCP server."""
+
+from __future__ import annotations
+
+from mcp.server.fastmcp import Context
+
+from google_ads_mcp.models.common import sanitize_customer_id
+from google_ads_mcp.server import mcp
+from google_ads_mcp.tools._helpers import get_client
+from google_ads_mcp.utils.formatting import format_table_markdown, to_json, wants_json
+
+
+@mcp.tool()
+async def gads_quota_status(
+    customer_id: str = "",
+    response_format: str = "markdown",
+    ctx: Context = None,
+) -> str:
+    """Show API operations consumed today and the local rate-limit queues.
+
+    Covers the developer token and every customer ID contacted since the
+    server started, plus how many identical concurrent reads were coalesced
+    into one request and, with micro-batching on, how many small mutations
+    shared a request. Daily counters reset at midnight Pacific Time, like
+    Google Ads quotas. No API call is made.
+
+    Args:
+        customer_id: Only show this customer (optional; default all).
+        response_format: Output format: markdown, json or compact (unindented json).
+    """
+    client = get_client(ctx)
+    quota = client.quota
+    if quota is None:
+        return "Rate limiting disabled: no quota counters available."
+
+    status = quota.status()
+    singleflight = getattr(client, "singleflight", None)
+    if singleflight is not None:
+        status["coalescing"] = singleflight.stats().to_dict()
+    batcher = getattr(client, "batcher", None)
+    if batcher is not None:
+        status["batching"] = batcher.stats()
+    if customer_id:
+        cid = sanitize_customer_id(customer_id)
+        status["accounts"] = [
+            a for a in status["accounts"] if a["key"] in (cid, "developer_token")
+        ]
+
+    if wants_json(response_format):
+        return to_json(status, response_format)
+
+    rows = [
+        {
+            **a,
+            "daily_limit": a["daily_limit"] or "∞",
+            "ops_per_second": a["ops_per_second"] or "∞",
+        }
+        for a in status["accounts"]
+    ]
+    columns = [
+        "key", "used_today", "daily_limit", "ops_per_second",
+        "requests", "throttled", "rejected", "waiting", "queue_delay_seconds",
+    ]
+    headers = {
+        "key": "Key",
+        "used_today": "Operations today",
+        "daily_limit": "Daily limit",
+        "ops_per_second": "Requests/s",
+        "requests": "Requests",
+        "throttled": "Queued",
+        "rejected": "Rejected",
+        "waiting": "Waiting now",
+        "queue_delay_seconds": "Queue delay (s)",
+    }
+    hours, rest = divmod(status["resets_in_seconds"], 3600)
+    lines = [
+        f"## Quota API ({status['day']})",
+        "",
+        format_table_markdown(rows, columns, headers),
+        "",
+    ]
+    if "coalescing" in status:
+        flights = status["coalescing"]
+        lines.append(
+            f"**Shared queries:** {flights['coalesced']} requests served by "
+            f"{flights['executed']} API calls ({flights['in_flight']} in flight)"
+        )
+        lines.append("")
+    if "batching" in status:
+        batching = status["batching"]
+        lines.append(
+            f"**Batched mutates:** {batching['calls']} calls sent in "
+            f"{batching['requests']} API requests"
+        )
+        lines.append("")
+    lines.append(
+        f"_Counters reset in {hours}h {rest // 60}m (midnight Pacific Time)._"
+    )
+    return "\n".join(lines)
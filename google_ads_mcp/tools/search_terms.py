@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from mcp.server.fastmcp import Context
 
+from google_ads_mcp.columns import Field, RowExtractor
 from google_ads_mcp.models.tool_inputs import SearchTermsReportInput
 from google_ads_mcp.server import mcp
-from google_ads_mcp.tools._helpers import get_client, safe_int, safe_str
-from google_ads_mcp.utils.formatting import (
-    format_table_markdown,
-    micros_to_currency,
+from google_ads_mcp.tools._helpers import (
+    cursor_footer,
+    fetch_report_page,
+    fetch_warehouse_page,
+    get_client,
+    get_warehouse,
 )
-from google_ads_mcp.utils.pagination import paginate_results
+from google_ads_mcp.utils.formatting import format_table_markdown, to_json, wants_json
 
 
 def _build_search_terms_query(params: SearchTermsReportInput) -> str:
@@ -42,28 +44,23 @@ def _build_search_terms_query(params: SearchTermsReportInput) -> str:
     return query
 
 
-def _parse_search_term_row(row: Any) -> dict[str, Any]:
-    """Extract search term fields from a GAQL result row."""
-    st = row.search_term_view
-    m = row.metrics
-    return {
-        "search_term": safe_str(st.search_term),
-        "status": safe_str(st.status).replace(
-            "SearchTermTargetingStatus.", ""
-        ),
-        "campaign": safe_str(row.campaign.name),
-        "ad_group": safe_str(row.ad_group.name),
-        "impressions": safe_int(m.impressions),
-        "clicks": safe_int(m.clicks),
-        "cost": micros_to_currency(safe_int(m.cost_micros)),
-        "conversions": round(float(m.conversions or 0), 2),
-        "ctr": f"{float(m.ctr or 0) * 100:.2f}%",
-        "avg_cpc": micros_to_currency(safe_int(m.average_cpc)),
-    }
+_SEARCH_TERM_ROWS = RowExtractor(
+    Field("search_term", "search_term_view.search_term"),
+    Field("status", "search_term_view.status", "enum"),
+    Field("campaign", "campaign.name"),
+    Field("ad_group", "ad_group.name"),
+    Field("impressions", "metrics.impressions", "int"),
+    Field("clicks", "metrics.clicks", "int"),
+    Field("cost", "metrics.cost_micros", "micros"),
+    Field("conversions", "metrics.conversions", "float"),
+    Field("ctr", "metrics.ctr", "percent"),
+    Field("avg_cpc", "metrics.average_cpc", "micros"),
+    name="SearchTermRow",
+)
 
 
 @mcp.tool()
-def search_terms_report(
+async def search_terms_report(
     customer_id: str,
     campaign_id: str | None = None,
     ad_group_id: str | None = None,
@@ -71,7 +68,10 @@ def search_terms_report(
     end_date: str = "",
     limit: int = 100,
     offset: int = 0,
+    cursor: str = "",
+    source: str = "api",
     response_format: str = "markdown",
+    bypass_cache: bool = False,
     ctx: Context = None,
 ) -> str:
     """Get search terms report showing actual queries that triggered ads.
@@ -84,12 +84,17 @@ def search_terms_report(
         end_date: End date YYYY-MM-DD (default: today).
         limit: Max results (1-5000, default 100).
         offset: Starting offset.
-        response_format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        source: api (live query) or warehouse (local tables from gads_sync_reports).
+        response_format: markdown, json or compact (unindented json).
+        bypass_cache: Read every day from the API, refreshing the local history.
     """
     kwargs: dict[str, Any] = {
         "customer_id": customer_id,
         "limit": limit,
         "offset": offset,
+        "cursor": cursor,
+        "source": source,
         "response_format": response_format,
     }
     if campaign_id:
@@ -104,16 +109,25 @@ def search_terms_report(
     params = SearchTermsReportInput(**kwargs)
     client = get_client(ctx)
     query = _build_search_terms_query(params)
-    rows = client.query(params.customer_id, query)
-
-    terms = [_parse_search_term_row(row) for row in rows]
-    page, pagination = paginate_results(terms, params.limit, params.offset)
+    if params.source.value == "warehouse":
+        rows, pagination = await fetch_warehouse_page(
+            client, get_warehouse(ctx), "search_term", params.customer_id,
+            params.start_date, params.end_date,
+            {"campaign_id": params.campaign_id, "ad_group_id": params.ad_group_id},
+            "impressions", params.limit, params.offset, params.cursor,
+        )
+    else:
+        rows, pagination = await fetch_report_page(
+            client, params.customer_id, query,
+            params.limit, params.offset, params.cursor, protobuf=True,
+            bypass_cache=bypass_cache,
+        )
+    page = _SEARCH_TERM_ROWS.records(rows)
 
-    if params.response_format.value == "json":
-        return json.dumps(
+    if wants_json(params.response_format):
+        return to_json(
             {"search_terms": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            params.response_format,
         )
 
     columns = [
@@ -133,6 +147,7 @@ def search_terms_report(
     return (
         f"## Search Terms Report ({params.start_date} → {params.end_date})\n\n"
         f"{table}\n\n"
-        f"_Showing {pagination.count} of {pagination.total} search terms"
+        f"_Showing {pagination.count} of {pagination.total_label} search terms"
         f"{' (more available)' if pagination.has_more else ''}_"
+        f"{cursor_footer(pagination)}"
     )
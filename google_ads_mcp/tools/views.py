@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
-import json
 from datetime import date, timedelta
 from typing import Any
 
 from mcp.server.fastmcp import Context
 
+from google_ads_mcp.columns import Field, RowExtractor
 from google_ads_mcp.models.common import sanitize_customer_id
 from google_ads_mcp.server import mcp
-from google_ads_mcp.tools._helpers import get_client, safe_int, safe_str, safe_float
-from google_ads_mcp.utils.formatting import format_table_markdown, micros_to_currency
-from google_ads_mcp.utils.pagination import paginate_results
+from google_ads_mcp.tools._helpers import (
+    cursor_footer,
+    fetch_page,
+    fetch_report_page,
+    get_client,
+    safe_int,
+    safe_str,
+)
+from google_ads_mcp.utils.formatting import (
+    format_table_markdown,
+    micros_to_currency,
+    to_json,
+    wants_json,
+)
 
 
 def _default_dates(start: str, end: str) -> tuple[str, str]:
@@ -53,30 +64,29 @@ def _build_geographic_view_query(
     return query
 
 
-def _parse_geographic_row(row: Any) -> dict[str, Any]:
-    """Extract geographic view fields from a GAQL result row."""
-    geo = row.geographic_view
-    m = row.metrics
-    return {
-        "country_criterion_id": safe_str(geo.country_criterion_id),
-        "location_type": safe_str(geo.location_type),
-        "campaign": safe_str(row.campaign.name),
-        "impressions": safe_int(m.impressions),
-        "clicks": safe_int(m.clicks),
-        "cost": micros_to_currency(safe_int(m.cost_micros)),
-        "conversions": round(float(m.conversions or 0), 2),
-    }
+_GEOGRAPHIC_ROWS = RowExtractor(
+    Field("country_criterion_id", "geographic_view.country_criterion_id"),
+    Field("location_type", "geographic_view.location_type", "enum"),
+    Field("campaign", "campaign.name"),
+    Field("impressions", "metrics.impressions", "int"),
+    Field("clicks", "metrics.clicks", "int"),
+    Field("cost", "metrics.cost_micros", "micros"),
+    Field("conversions", "metrics.conversions", "float"),
+    name="GeographicRow",
+)
 
 
 @mcp.tool()
-def gads_geographic_view(
+async def gads_geographic_view(
     customer_id: str,
     campaign_id: str | None = None,
     start_date: str = "",
     end_date: str = "",
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
+    bypass_cache: bool = False,
     ctx: Context = None,
 ) -> str:
     """Get location-based performance data from geographic view.
@@ -88,22 +98,24 @@ def gads_geographic_view(
         end_date: End date YYYY-MM-DD (default: today).
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
+        bypass_cache: Read every day from the API, refreshing the local history.
     """
     cid = sanitize_customer_id(customer_id)
     start, end = _default_dates(start_date, end_date)
     client = get_client(ctx)
     query = _build_geographic_view_query(cid, start, end, campaign_id)
-    rows = client.query(cid, query)
-
-    parsed = [_parse_geographic_row(r) for r in rows]
-    page, pagination = paginate_results(parsed, limit, offset)
+    rows, pagination = await fetch_report_page(
+        client, cid, query, limit, offset, cursor, protobuf=True,
+        bypass_cache=bypass_cache,
+    )
+    page = _GEOGRAPHIC_ROWS.records(rows)
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"geographic_data": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     columns = [
@@ -123,8 +135,9 @@ def gads_geographic_view(
     return (
         f"## Geographic View ({start} \u2192 {end})\n\n"
         f"{table}\n\n"
-        f"_Showing {pagination.count} of {pagination.total} locations"
+        f"_Showing {pagination.count} of {pagination.total_label} locations"
         f"{' (more available)' if pagination.has_more else ''}_"
+        f"{cursor_footer(pagination)}"
     )
 
 
@@ -158,30 +171,28 @@ def _build_shopping_performance_query(
     return query
 
 
-def _parse_shopping_performance_row(row: Any) -> dict[str, Any]:
-    """Extract shopping performance fields from a GAQL result row."""
-    seg = row.segments
-    m = row.metrics
-    return {
-        "product_item_id": safe_str(seg.product_item_id),
-        "product_title": safe_str(seg.product_title),
-        "product_brand": safe_str(seg.product_brand),
-        "product_category_l1": safe_str(seg.product_category_level1),
-        "impressions": safe_int(m.impressions),
-        "clicks": safe_int(m.clicks),
-        "cost": micros_to_currency(safe_int(m.cost_micros)),
-        "conversions": round(float(m.conversions or 0), 2),
-    }
+_SHOPPING_PERFORMANCE_ROWS = RowExtractor(
+    Field("product_item_id", "segments.product_item_id"),
+    Field("product_title", "segments.product_title"),
+    Field("product_brand", "segments.product_brand"),
+    Field("product_category_l1", "segments.product_category_level1"),
+    Field("impressions", "metrics.impressions", "int"),
+    Field("clicks", "metrics.clicks", "int"),
+    Field("cost", "metrics.cost_micros", "micros"),
+    Field("conversions", "metrics.conversions", "float"),
+    name="ShoppingPerfRow",
+)
 
 
 @mcp.tool()
-def gads_shopping_performance_view(
+async def gads_shopping_performance_view(
     customer_id: str,
     campaign_id: str | None = None,
     start_date: str = "",
     end_date: str = "",
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -194,22 +205,22 @@ def gads_shopping_performance_view(
         end_date: End date YYYY-MM-DD (default: today).
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     cid = sanitize_customer_id(customer_id)
     start, end = _default_dates(start_date, end_date)
     client = get_client(ctx)
     query = _build_shopping_performance_query(cid, start, end, campaign_id)
-    rows = client.query(cid, query)
-
-    parsed = [_parse_shopping_performance_row(r) for r in rows]
-    page, pagination = paginate_results(parsed, limit, offset)
+    rows, pagination = await fetch_page(
+        client, cid, query, limit, offset, cursor, protobuf=True,
+    )
+    page = _SHOPPING_PERFORMANCE_ROWS.records(rows)
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"shopping_performance": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     columns = [
@@ -229,8 +240,9 @@ def gads_shopping_performance_view(
     return (
         f"## Shopping Performance ({start} \u2192 {end})\n\n"
         f"{table}\n\n"
-        f"_Showing {pagination.count} of {pagination.total} products"
+        f"_Showing {pagination.count} of {pagination.total_label} products"
         f"{' (more available)' if pagination.has_more else ''}_"
+        f"{cursor_footer(pagination)}"
     )
 
 
@@ -263,30 +275,27 @@ def _build_display_keyword_view_query(
     return query
 
 
-def _parse_display_keyword_row(row: Any) -> dict[str, Any]:
-    """Extract display keyword view fields from a GAQL result row."""
-    dkv = row.display_keyword_view
-    agc = row.ad_group_criterion
-    m = row.metrics
-    return {
-        "resource_name": safe_str(dkv.resource_name),
-        "display_name": safe_str(agc.display_name),
-        "keyword_text": safe_str(agc.keyword.text),
-        "impressions": safe_int(m.impressions),
-        "clicks": safe_int(m.clicks),
-        "cost": micros_to_currency(safe_int(m.cost_micros)),
-        "conversions": round(float(m.conversions or 0), 2),
-    }
+_DISPLAY_KEYWORD_ROWS = RowExtractor(
+    Field("resource_name", "display_keyword_view.resource_name"),
+    Field("display_name", "ad_group_criterion.display_name"),
+    Field("keyword_text", "ad_group_criterion.keyword.text"),
+    Field("impressions", "metrics.impressions", "int"),
+    Field("clicks", "metrics.clicks", "int"),
+    Field("cost", "metrics.cost_micros", "micros"),
+    Field("conversions", "metrics.conversions", "float"),
+    name="DisplayKeywordRow",
+)
 
 
 @mcp.tool()
-def gads_display_keyword_view(
+async def gads_display_keyword_view(
     customer_id: str,
     campaign_id: str | None = None,
     start_date: str = "",
     end_date: str = "",
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -299,22 +308,22 @@ def gads_display_keyword_view(
         end_date: End date YYYY-MM-DD (default: today).
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     cid = sanitize_customer_id(customer_id)
     start, end = _default_dates(start_date, end_date)
     client = get_client(ctx)
     query = _build_display_keyword_view_query(cid, start, end, campaign_id)
-    rows = client.query(cid, query)
-
-    parsed = [_parse_display_keyword_row(r) for r in rows]
-    page, pagination = paginate_results(parsed, limit, offset)
+    rows, pagination = await fetch_page(
+        client, cid, query, limit, offset, cursor, protobuf=True,
+    )
+    page = _DISPLAY_KEYWORD_ROWS.records(rows)
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"display_keywords": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     columns = [
@@ -333,8 +342,9 @@ def gads_display_keyword_view(
     return (
         f"## Display Keyword View ({start} \u2192 {end})\n\n"
         f"{table}\n\n"
-        f"_Showing {pagination.count} of {pagination.total} keywords"
+        f"_Showing {pagination.count} of {pagination.total_label} keywords"
         f"{' (more available)' if pagination.has_more else ''}_"
+        f"{cursor_footer(pagination)}"
     )
 
 
@@ -388,13 +398,14 @@ def _parse_topic_row(row: Any) -> dict[str, Any]:
 
 
 @mcp.tool()
-def gads_topic_view(
+async def gads_topic_view(
     customer_id: str,
     campaign_id: str | None = None,
     start_date: str = "",
     end_date: str = "",
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -407,22 +418,22 @@ def gads_topic_view(
         end_date: End date YYYY-MM-DD (default: today).
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     cid = sanitize_customer_id(customer_id)
     start, end = _default_dates(start_date, end_date)
     client = get_client(ctx)
     query = _build_topic_view_query(cid, start, end, campaign_id)
-    rows = client.query(cid, query)
-
-    parsed = [_parse_topic_row(r) for r in rows]
-    page, pagination = paginate_results(parsed, limit, offset)
+    rows, pagination = await fetch_page(
+        client, cid, query, limit, offset, cursor
+    )
+    page = [_parse_topic_row(r) for r in rows]
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"topics": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     columns = [
@@ -439,8 +450,9 @@ def gads_topic_view(
     return (
         f"## Topic View ({start} \u2192 {end})\n\n"
         f"{table}\n\n"
-        f"_Showing {pagination.count} of {pagination.total} topics"
+        f"_Showing {pagination.count} of {pagination.total_label} topics"
         f"{' (more available)' if pagination.has_more else ''}_"
+        f"{cursor_footer(pagination)}"
     )
 
 
@@ -472,28 +484,26 @@ def _build_user_location_view_query(
     return query
 
 
-def _parse_user_location_row(row: Any) -> dict[str, Any]:
-    """Extract user location view fields from a GAQL result row."""
-    ulv = row.user_location_view
-    m = row.metrics
-    return {
-        "country_criterion_id": safe_str(ulv.country_criterion_id),
-        "targeting_location": safe_str(ulv.targeting_location),
-        "impressions": safe_int(m.impressions),
-        "clicks": safe_int(m.clicks),
-        "cost": micros_to_currency(safe_int(m.cost_micros)),
-        "conversions": round(float(m.conversions or 0), 2),
-    }
+_USER_LOCATION_ROWS = RowExtractor(
+    Field("country_criterion_id", "user_location_view.country_criterion_id"),
+    Field("targeting_location", "user_location_view.targeting_location"),
+    Field("impressions", "metrics.impressions", "int"),
+    Field("clicks", "metrics.clicks", "int"),
+    Field("cost", "metrics.cost_micros", "micros"),
+    Field("conversions", "metrics.conversions", "float"),
+    name="UserLocationRow",
+)
 
 
 @mcp.tool()
-def gads_user_location_view(
+async def gads_user_location_view(
     customer_id: str,
     campaign_id: str | None = None,
     start_date: str = "",
     end_date: str = "",
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -506,22 +516,22 @@ def gads_user_location_view(
         end_date: End date YYYY-MM-DD (default: today).
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     cid = sanitize_customer_id(customer_id)
     start, end = _default_dates(start_date, end_date)
     client = get_client(ctx)
     query = _build_user_location_view_query(cid, start, end, campaign_id)
-    rows = client.query(cid, query)
-
-    parsed = [_parse_user_location_row(r) for r in rows]
-    page, pagination = paginate_results(parsed, limit, offset)
+    rows, pagination = await fetch_page(
+        client, cid, query, limit, offset, cursor, protobuf=True,
+    )
+    page = _USER_LOCATION_ROWS.records(rows)
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"user_locations": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     columns = [
@@ -540,8 +550,9 @@ def gads_user_location_view(
     return (
         f"## User Location View ({start} \u2192 {end})\n\n"
         f"{table}\n\n"
-        f"_Showing {pagination.count} of {pagination.total} user locations"
+        f"_Showing {pagination.count} of {pagination.total_label} user locations"
         f"{' (more available)' if pagination.has_more else ''}_"
+        f"{cursor_footer(pagination)}"
     )
 
 
@@ -576,30 +587,27 @@ def _build_click_view_query(
     return query
 
 
-def _parse_click_row(row: Any) -> dict[str, Any]:
-    """Extract click view fields from a GAQL result row."""
-    cv = row.click_view
-    seg = row.segments
-    m = row.metrics
-    return {
-        "gclid": safe_str(cv.gclid),
-        "city": safe_str(cv.area_of_interest.city),
-        "country": safe_str(cv.area_of_interest.country),
-        "campaign_location_target": safe_str(cv.campaign_location_target),
-        "ad_network_type": safe_str(seg.ad_network_type),
-        "device": safe_str(seg.device),
-        "clicks": safe_int(m.clicks),
-    }
+_CLICK_ROWS = RowExtractor(
+    Field("gclid", "click_view.gclid"),
+    Field("city", "click_view.area_of_interest.city"),
+    Field("country", "click_view.area_of_interest.country"),
+    Field("campaign_location_target", "click_view.campaign_location_target"),
+    Field("ad_network_type", "segments.ad_network_type", "enum"),
+    Field("device", "segments.device", "enum"),
+    Field("clicks", "metrics.clicks", "int"),
+    name="ClickRow",
+)
 
 
 @mcp.tool()
-def gads_click_view(
+async def gads_click_view(
     customer_id: str,
     campaign_id: str | None = None,
     start_date: str = "",
     end_date: str = "",
     limit: int = 50,
     offset: int = 0,
+    cursor: str = "",
     response_format: str = "markdown",
     ctx: Context = None,
 ) -> str:
@@ -612,22 +620,22 @@ def gads_click_view(
         end_date: End date YYYY-MM-DD (default: today).
         limit: Max results (1-1000, default 50).
         offset: Starting offset for pagination.
-        response_format: Output format: markdown or json.
+        cursor: next_cursor from a previous call; resumes there (overrides offset).
+        response_format: Output format: markdown, json or compact (unindented json).
     """
     cid = sanitize_customer_id(customer_id)
     start, end = _default_dates(start_date, end_date)
     client = get_client(ctx)
     query = _build_click_view_query(cid, start, end, campaign_id)
-    rows = client.query(cid, query)
-
-    parsed = [_parse_click_row(r) for r in rows]
-    page, pagination = paginate_results(parsed, limit, offset)
+    rows, pagination = await fetch_page(
+        client, cid, query, limit, offset, cursor, protobuf=True,
+    )
+    page = _CLICK_ROWS.records(rows)
 
-    if response_format == "json":
-        return json.dumps(
+    if wants_json(response_format):
+        return to_json(
             {"clicks": page, "pagination": pagination.to_dict()},
-            indent=2,
-            ensure_ascii=False,
+            response_format,
         )
 
     columns = [
@@ -645,6 +653,7 @@ def gads_click_view(
     return (
         f"## Click View ({start} \u2192 {end})\n\n"
         f"{table}\n\n"
-        f"_Showing {pagination.count} of {pagination.total} clicks"
+        f"_Showing {pagination.count} of {pagination.total_label} clicks"
         f"{' (more available)' if pagination.has_more else ''}_"
+        f"{cursor_footer(pagination)}"
     )
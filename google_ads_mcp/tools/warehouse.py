@@ -0,0 +1,73 @@
+"""Local warehouse sync tool for Google Ads MCP server."""
+
+from __future__ import annotations
+
+from mcp.server.fastmcp import Context
+
+from google_ads_mcp.models.common import sanitize_customer_id
+from google_ads_mcp.server import mcp
+from google_ads_mcp.tools._helpers import get_client, get_warehouse
+from google_ads_mcp.utils.formatting import format_table_markdown, to_json, wants_json
+from google_ads_mcp.warehouse import REPORTS, sync_reports
+
+
+@mcp.tool()
+async def gads_sync_reports(
+    customer_id: str,
+    resources: str = "all",
+    start_date: str = "",
+    initial_days: int = 30,
+    lookback_days: int = 1,
+    response_format: str = "markdown",
+    ctx: Context = None,
+) -> str:
+    """Sync daily report metrics into the local SQLite warehouse.
+
+    Each resource resumes from its own watermark, so after the first run
+    only the newest days are read from the API. Afterwards call the report
+    tools (get_campaign_performance, get_ad_group_performance,
+    get_keyword_performance, search_terms_report) with source="warehouse".
+
+    Args:
+        customer_id: Google Ads customer ID.
+        resources: Comma-separated: campaign, ad_group, keyword, search_term (default all).
+        start_date: Re-sync from this date YYYY-MM-DD, ignoring the watermark (optional).
+        initial_days: Days to backfill on the first sync of a resource (default 30).
+        lookback_days: Days before the watermark to refresh, for late conversions (default 1).
+        response_format: Output format: markdown, json or compact (unindented json).
+    """
+    cid = sanitize_customer_id(customer_id)
+    if resources.strip().lower() == "all":
+        selected = list(REPORTS)
+    else:
+        selected = [r.strip().lower() for r in resources.split(",") if r.strip()]
+
+    client = get_client(ctx)
+    warehouse = get_warehouse(ctx)
+    results = await client.arun(
+        sync_reports, client, warehouse, cid, selected,
+        start_date=start_date,
+        initial_days=initial_days,
+        lookback_days=lookback_days,
+    )
+    synced = [r.to_dict() for r in results]
+
+    if wants_json(response_format):
+        return to_json(
+            {"customer_id": cid, "synced": synced, "path": warehouse.path},
+            response_format,
+        )
+
+    columns = ["resource", "start_date", "end_date", "rows"]
+    headers = {
+        "resource": "Resource",
+        "start_date": "From",
+        "end_date": "To (watermark)",
+        "rows": "Rows",
+    }
+    table = format_table_markdown(synced, columns, headers)
+    return (
+        f"## Warehouse Sync ({cid})\n\n"
+        f"{table}\n\n"
+        f"_Warehouse: `{warehouse.path}`_"
+    )
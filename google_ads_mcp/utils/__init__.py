@@ -6,7 +6,9 @@ from google_ads_mcp.utils.errors import (
     QuotaExhaustedError,
     ResourceNotFoundError,
     InvalidInputError,
+    TransientError,
     format_google_ads_error,
+    is_transient_error,
 )
 from google_ads_mcp.utils.formatting import (
     micros_to_currency,
@@ -14,7 +16,12 @@ from google_ads_mcp.utils.formatting import (
     format_response,
     format_table_markdown,
 )
-from google_ads_mcp.utils.pagination import paginate_results, PaginationInfo
+from google_ads_mcp.utils.pagination import (
+    paginate_results,
+    PaginationInfo,
+    encode_cursor,
+    decode_cursor,
+)
 
 __all__ = [
     "GoogleAdsMCPError",
@@ -22,11 +29,15 @@ __all__ = [
     "QuotaExhaustedError",
     "ResourceNotFoundError",
     "InvalidInputError",
+    "TransientError",
     "format_google_ads_error",
+    "is_transient_error",
     "micros_to_currency",
     "format_percentage",
     "format_response",
     "format_table_markdown",
     "paginate_results",
     "PaginationInfo",
+    "encode_cursor",
+    "decode_cursor",
 ]
@@ -32,6 +32,15 @@ class QuotaExhaustedError(GoogleAdsMCPError):
         self.retry_after_seconds = retry_after_seconds
 
 
+class TransientError(GoogleAdsMCPError):
+    """Raised when a transient API error persists after all retries."""
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Whether ``exc`` may succeed if the same request is sent again later."""
+    return isinstance(exc, (TransientError, QuotaExhaustedError))
+
+
 class ResourceNotFoundError(GoogleAdsMCPError):
     """Raised when a requested resource does not exist."""
 
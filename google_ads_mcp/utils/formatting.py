@@ -3,8 +3,17 @@
 from __future__ import annotations
 
 import json
+from decimal import Decimal
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install orjson
+    orjson = None
+
+# response_format values answered with JSON; "compact" drops indentation.
+JSON_FORMATS = ("json", "compact")
+
 
 def micros_to_currency(
     micros: int | None,
@@ -41,6 +50,49 @@ def format_percentage(value: float | None) -> str:
     return f"{value * 100:.2f}%"
 
 
+def wants_json(response_format: str) -> bool:
+    """Whether ``response_format`` (a string or ResponseFormat) asks for JSON."""
+    return response_format in JSON_FORMATS
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values json/orjson do not handle natively."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, tuple):  # named tuple rows
+        return list(value)
+    return str(value)
+
+
+if orjson is not None:
+    # Dates and dataclasses go through _json_default, as with stdlib json.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def to_json(data: Any, response_format: str = "json") -> str:
+    """Serialize a tool response, with orjson when it is installed.
+
+    Output is indented by two spaces, or written on one line without
+    spaces when ``response_format`` is ``compact``. Non-ASCII text is not
+    escaped. Micros and other ints stay integers, Decimal values become
+    numbers, named tuples become arrays and anything else unknown (dates,
+    proto values) is written as its ``str()``.
+    """
+    compact = response_format == "compact"
+    if orjson is not None:
+        options = _ORJSON_OPTIONS if compact else _ORJSON_OPTIONS | orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_json_default, option=options).decode()
+    if compact:
+        return json.dumps(
+            data, ensure_ascii=False, separators=(",", ":"), default=_json_default
+        )
+    return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default)
+
+
 def format_response(
     data: dict[str, Any],
     response_format: str = "markdown",
@@ -50,14 +102,14 @@ def format_response(
 
     Args:
         data: Response data dictionary.
-        response_format: 'markdown' or 'json'.
+        response_format: 'markdown', 'json' or 'compact'.
         title: Optional title for markdown output.
 
     Returns:
         Formatted string.
     """
-    if response_format == "json":
-        return json.dumps(data, indent=2, ensure_ascii=False, default=str)
+    if wants_json(response_format):
+        return to_json(data, response_format)
 
     lines: list[str] = []
     if title:
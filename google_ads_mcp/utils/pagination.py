@@ -2,21 +2,44 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
+import hashlib
+import itertools
+import json
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from typing import Any, TypeVar
 
+from google_ads_mcp.utils.errors import InvalidInputError
+
 T = TypeVar("T")
 
+_END = object()
+
 
 @dataclass(frozen=True)
 class PaginationInfo:
-    """Immutable pagination metadata."""
+    """Immutable pagination metadata.
+
+    ``total`` is None when the items came from a stream that was not read
+    to the end, i.e. only a lower bound is known. ``next_cursor`` is set
+    when the next page can be resumed from an API page token.
+    """
 
-    total: int
+    total: int | None
     count: int
     offset: int
     limit: int
     has_more: bool
+    next_cursor: str | None = None
+
+    @property
+    def total_label(self) -> str:
+        """Total for display: exact when known, otherwise a lower bound (e.g. '51+')."""
+        if self.total is not None:
+            return str(self.total)
+        return f"{self.offset + self.count + 1}+"
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -25,27 +48,101 @@ class PaginationInfo:
             "offset": self.offset,
             "limit": self.limit,
             "has_more": self.has_more,
+            "next_cursor": self.next_cursor,
         }
 
 
+@dataclass(frozen=True)
+class Cursor:
+    """Decoded continuation cursor.
+
+    Attributes:
+        page_token: API page token of the page holding the next row.
+        position: Index of the next row within that page.
+        offset: Absolute index of the next row in the full result set.
+    """
+
+    page_token: str
+    position: int
+    offset: int
+
+
+def query_fingerprint(query: str) -> str:
+    """Short stable hash of a GAQL query, insensitive to whitespace."""
+    normalized = " ".join(query.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_cursor(query: str, page_token: str, position: int, offset: int) -> str:
+    """Encode an opaque continuation cursor bound to ``query``."""
+    payload = {
+        "q": query_fingerprint(query),
+        "t": page_token,
+        "p": position,
+        "o": offset,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, query: str) -> Cursor:
+    """Decode a cursor from :func:`encode_cursor` and check it matches ``query``.
+
+    Raises:
+        InvalidInputError: If the cursor is malformed or was issued for a
+            different query (e.g. filters changed between calls).
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        decoded = Cursor(
+            page_token=str(payload["t"]),
+            position=int(payload["p"]),
+            offset=int(payload["o"]),
+        )
+        fingerprint = payload["q"]
+    except (binascii.Error, ValueError, KeyError, TypeError, UnicodeError) as exc:
+        raise InvalidInputError("Invalid cursor.", field="cursor") from exc
+
+    if fingerprint != query_fingerprint(query):
+        raise InvalidInputError(
+            "The cursor belongs to a different query: repeat the search "
+            "without a cursor if you changed the filters.",
+            field="cursor",
+        )
+    return decoded
+
+
 def paginate_results(
-    items: list[T],
+    items: Iterable[T],
     limit: int,
     offset: int = 0,
 ) -> tuple[list[T], PaginationInfo]:
-    """Paginate a list of results.
+    """Paginate a list or a stream of results.
+
+    Sequences are sliced and report an exact total. Any other iterable is
+    consumed lazily: ``offset`` items are skipped, ``limit`` are kept and a
+    single lookahead item decides ``has_more``, so at most
+    ``offset + limit + 1`` items are ever read.
 
     Args:
-        items: Full list of items.
+        items: Full list of items, or an iterator over them.
         limit: Maximum items per page.
         offset: Starting index.
 
     Returns:
         Tuple of (page_items, pagination_info).
     """
-    total = len(items)
-    page = items[offset : offset + limit]
-    has_more = (offset + limit) < total
+    if isinstance(items, Sequence):
+        total: int | None = len(items)
+        page = list(items[offset : offset + limit])
+        has_more = (offset + limit) < total
+    else:
+        iterator = iter(items)
+        skipped = sum(1 for _ in itertools.islice(iterator, offset))
+        page = list(itertools.islice(iterator, limit))
+        has_more = next(iterator, _END) is not _END
+        total = None if has_more else skipped + len(page)
 
     info = PaginationInfo(
         total=total,
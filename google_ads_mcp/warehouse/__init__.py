@@ -0,0 +1,27 @@
+"""Local SQLite warehouse of daily report metrics.
+
+``gads_sync_reports`` pulls daily campaign, ad group, keyword and search
+term metrics incrementally (per-customer, per-resource watermarks); report
+tools called with ``source="warehouse"`` answer from the local tables.
+"""
+
+from google_ads_mcp.warehouse.schema import REPORTS, ReportSpec
+from google_ads_mcp.warehouse.store import (
+    DEFAULT_WAREHOUSE_PATH,
+    Warehouse,
+    get_report,
+    warehouse_from_env,
+)
+from google_ads_mcp.warehouse.sync import SyncResult, sync_reports, sync_resource
+
+__all__ = [
+    "DEFAULT_WAREHOUSE_PATH",
+    "REPORTS",
+    "ReportSpec",
+    "SyncResult",
+    "Warehouse",
+    "get_report",
+    "sync_reports",
+    "sync_resource",
+    "warehouse_from_env",
+]
@@ -0,0 +1,158 @@
+"""Report definitions and SQLite schema for the local warehouse."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Dimension:
+    """A report attribute: GAQL field path and warehouse column."""
+
+    field: str
+    column: str
+    is_enum: bool = False
+
+
+# Metrics synced for every report; ratios (CTR, CPC, rates) are derived
+# from these sums at read time.
+METRIC_COLUMNS: tuple[str, ...] = (
+    "impressions",
+    "clicks",
+    "cost_micros",
+    "interactions",
+    "conversions",
+    "conversions_value",
+)
+
+_REAL_METRICS = frozenset({"conversions", "conversions_value"})
+
+
+@dataclass(frozen=True)
+class ReportSpec:
+    """One daily report synced into its own table.
+
+    Attributes:
+        name: Resource name used by tools and watermarks.
+        table: SQLite table holding one row per entity per day.
+        from_resource: GAQL FROM resource.
+        dimensions: Attributes stored alongside the metrics.
+        key: Columns identifying an entity (with customer_id and date they
+            form the primary key).
+        filters: Tool filter name -> column.
+    """
+
+    name: str
+    table: str
+    from_resource: str
+    dimensions: tuple[Dimension, ...]
+    key: tuple[str, ...]
+    filters: dict[str, str]
+
+    def gaql(self, start: str, end: str) -> str:
+        """Daily GAQL query for the given inclusive date range."""
+        fields = ["segments.date"]
+        fields += [d.field for d in self.dimensions]
+        fields += [f"metrics.{m}" for m in METRIC_COLUMNS]
+        return (
+            f"SELECT {', '.join(fields)} FROM {self.from_resource} "
+            f"WHERE segments.date BETWEEN '{start}' AND '{end}'"
+        )
+
+    def ddl(self) -> str:
+        columns = ["customer_id TEXT NOT NULL", "date TEXT NOT NULL"]
+        columns += [f"{d.column} TEXT" for d in self.dimensions]
+        columns += [
+            f"{m} {'REAL' if m in _REAL_METRICS else 'INTEGER'} NOT NULL DEFAULT 0"
+            for m in METRIC_COLUMNS
+        ]
+        key = ", ".join(("customer_id", "date", *self.key))
+        return (
+            f"CREATE TABLE IF NOT EXISTS {self.table} (\n    "
+            + ",\n    ".join(columns)
+            + f",\n    PRIMARY KEY ({key})\n);\n"
+            f"CREATE INDEX IF NOT EXISTS idx_{self.table}_date "
+            f"ON {self.table} (customer_id, date);\n"
+        )
+
+
+_CAMPAIGN = (
+    Dimension("campaign.id", "campaign_id"),
+    Dimension("campaign.name", "campaign_name"),
+)
+_AD_GROUP = (
+    Dimension("ad_group.id", "ad_group_id"),
+    Dimension("ad_group.name", "ad_group_name"),
+)
+
+REPORTS: dict[str, ReportSpec] = {
+    spec.name: spec
+    for spec in (
+        ReportSpec(
+            name="campaign",
+            table="campaign_daily",
+            from_resource="campaign",
+            dimensions=(
+                *_CAMPAIGN,
+                Dimension("campaign.status", "campaign_status", is_enum=True),
+            ),
+            key=("campaign_id",),
+            filters={"campaign_id": "campaign_id", "status": "campaign_status"},
+        ),
+        ReportSpec(
+            name="ad_group",
+            table="ad_group_daily",
+            from_resource="ad_group",
+            dimensions=(
+                *_AD_GROUP,
+                Dimension("ad_group.status", "ad_group_status", is_enum=True),
+                *_CAMPAIGN,
+            ),
+            key=("ad_group_id",),
+            filters={
+                "campaign_id": "campaign_id",
+                "ad_group_id": "ad_group_id",
+                "status": "ad_group_status",
+            },
+        ),
+        ReportSpec(
+            name="keyword",
+            table="keyword_daily",
+            from_resource="keyword_view",
+            dimensions=(
+                Dimension("ad_group_criterion.criterion_id", "criterion_id"),
+                Dimension("ad_group_criterion.keyword.text", "keyword_text"),
+                Dimension(
+                    "ad_group_criterion.keyword.match_type", "match_type", is_enum=True
+                ),
+                *_AD_GROUP,
+                *_CAMPAIGN,
+            ),
+            key=("ad_group_id", "criterion_id"),
+            filters={"campaign_id": "campaign_id", "ad_group_id": "ad_group_id"},
+        ),
+        ReportSpec(
+            name="search_term",
+            table="search_term_daily",
+            from_resource="search_term_view",
+            dimensions=(
+                Dimension("search_term_view.search_term", "search_term"),
+                Dimension("search_term_view.status", "search_term_status", is_enum=True),
+                *_AD_GROUP,
+                *_CAMPAIGN,
+            ),
+            key=("ad_group_id", "search_term"),
+            filters={"campaign_id": "campaign_id", "ad_group_id": "ad_group_id"},
+        ),
+    )
+}
+
+WATERMARKS_DDL = """
+CREATE TABLE IF NOT EXISTS sync_watermarks (
+    customer_id TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    last_date TEXT NOT NULL,
+    synced_at TEXT NOT NULL,
+    PRIMARY KEY (customer_id, resource)
+);
+"""
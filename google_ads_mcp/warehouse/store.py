@@ -0,0 +1,237 @@
+"""SQLite storage for synced daily report rows."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Iterable
+
+from google_ads_mcp.history import DERIVED_METRICS
+from google_ads_mcp.utils.errors import InvalidInputError
+from google_ads_mcp.warehouse.schema import (
+    METRIC_COLUMNS,
+    REPORTS,
+    WATERMARKS_DDL,
+    ReportSpec,
+)
+
+DEFAULT_WAREHOUSE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "google_ads_mcp", "warehouse.sqlite"
+)
+
+
+def get_report(resource: str) -> ReportSpec:
+    """Look up a report spec by name.
+
+    Raises:
+        InvalidInputError: If the resource is not synced by the warehouse.
+    """
+    try:
+        return REPORTS[resource]
+    except KeyError:
+        raise InvalidInputError(
+            f"Invalid warehouse resource: '{resource}'. "
+            f"Allowed values: {', '.join(REPORTS)}.",
+            field="resources",
+        ) from None
+
+
+def _to_namespace(flat: dict[str, Any]) -> SimpleNamespace:
+    """Turn {'campaign.name': x, ...} into nested attribute access."""
+    root = SimpleNamespace()
+    for path, value in flat.items():
+        node = root
+        *parents, leaf = path.split(".")
+        for part in parents:
+            child = getattr(node, part, None)
+            if child is None:
+                child = SimpleNamespace()
+                setattr(node, part, child)
+            node = child
+        setattr(node, leaf, value)
+    return root
+
+
+class Warehouse:
+    """Local SQLite warehouse of daily campaign, ad group, keyword and search term metrics.
+
+    The connection is opened lazily and shared across worker threads
+    behind a lock.
+    """
+
+    def __init__(self, path: str = DEFAULT_WAREHOUSE_PATH) -> None:
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_watermark(self, customer_id: str, resource: str) -> str | None:
+        """Last date synced for a customer and resource (YYYY-MM-DD), if any."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT last_date FROM sync_watermarks "
+                "WHERE customer_id = ? AND resource = ?",
+                (customer_id, resource),
+            ).fetchone()
+        return row[0] if row else None
+
+    def watermarks(self, customer_id: str) -> dict[str, str]:
+        """All watermarks of a customer, keyed by resource."""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT resource, last_date FROM sync_watermarks WHERE customer_id = ?",
+                (customer_id,),
+            ).fetchall()
+        return dict(rows)
+
+    def replace_range(
+        self,
+        spec: ReportSpec,
+        customer_id: str,
+        start: str,
+        end: str,
+        records: Iterable[tuple[Any, ...]],
+        batch_size: int = 1000,
+    ) -> int:
+        """Replace a customer's rows in [start, end] and advance the watermark.
+
+        ``records`` are tuples in table column order (without customer_id)
+        and may be a lazy stream; they are inserted in batches inside one
+        transaction, so a failed sync leaves the previous data untouched.
+
+        Returns:
+            Number of rows written.
+        """
+        columns = ["customer_id", "date", *(d.column for d in spec.dimensions)]
+        columns += METRIC_COLUMNS
+        insert = (
+            f"INSERT OR REPLACE INTO {spec.table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})"
+        )
+        count = 0
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    f"DELETE FROM {spec.table} WHERE customer_id = ? "
+                    "AND date BETWEEN ? AND ?",
+                    (customer_id, start, end),
+                )
+                batch: list[tuple[Any, ...]] = []
+                for record in records:
+                    batch.append((customer_id, *record))
+                    if len(batch) >= batch_size:
+                        conn.executemany(insert, batch)
+                        count += len(batch)
+                        batch = []
+                if batch:
+                    conn.executemany(insert, batch)
+                    count += len(batch)
+                conn.execute(
+                    "INSERT OR REPLACE INTO sync_watermarks "
+                    "(customer_id, resource, last_date, synced_at) VALUES (?, ?, ?, ?)",
+                    (
+                        customer_id,
+                        spec.name,
+                        end,
+                        datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    ),
+                )
+        return count
+
+    def report(
+        self,
+        resource: str,
+        customer_id: str,
+        start: str,
+        end: str,
+        filters: dict[str, str] | None = None,
+        order_by: str = "cost_micros",
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[SimpleNamespace], int]:
+        """Aggregate stored daily rows per entity over [start, end].
+
+        Rows mimic GAQL result rows (``row.campaign.name``,
+        ``row.metrics.ctr``...) so the report tools' row parsers work
+        unchanged. Ratio metrics are derived from the summed metrics.
+
+        Returns:
+            Tuple of (rows for the requested page, total entity count).
+        """
+        spec = get_report(resource)
+        where = ["customer_id = ?", "date BETWEEN ? AND ?"]
+        args: list[Any] = [customer_id, start, end]
+        for name, value in (filters or {}).items():
+            if value:
+                where.append(f"{spec.filters[name]} = ?")
+                args.append(value)
+        if order_by not in METRIC_COLUMNS:
+            raise ValueError(f"Unsupported order: {order_by}")
+
+        # With MAX(date) in the select list, SQLite takes the bare dimension
+        # columns from the most recent day, i.e. the current names/statuses.
+        sql = (
+            f"SELECT {', '.join(d.column for d in spec.dimensions)}, "
+            + ", ".join(f"SUM({m})" for m in METRIC_COLUMNS)
+            + ", MAX(date), COUNT(*) OVER () "
+            f"FROM {spec.table} WHERE {' AND '.join(where)} "
+            f"GROUP BY {', '.join(spec.key)} "
+            f"ORDER BY SUM({order_by}) DESC, {', '.join(spec.key)} "
+            "LIMIT ? OFFSET ?"
+        )
+        with self._lock:
+            fetched = self._connection().execute(sql, (*args, limit, offset)).fetchall()
+            if fetched:
+                total = fetched[0][-1]
+            else:
+                total = self._connection().execute(
+                    f"SELECT COUNT(*) FROM (SELECT 1 FROM {spec.table} "
+                    f"WHERE {' AND '.join(where)} GROUP BY {', '.join(spec.key)})",
+                    args,
+                ).fetchone()[0]
+
+        return [self._to_row(spec, values) for values in fetched], total
+
+    def _to_row(self, spec: ReportSpec, values: tuple[Any, ...]) -> SimpleNamespace:
+        n_dims = len(spec.dimensions)
+        flat: dict[str, Any] = {
+            d.field: value for d, value in zip(spec.dimensions, values[:n_dims])
+        }
+        sums = dict(zip(METRIC_COLUMNS, values[n_dims:n_dims + len(METRIC_COLUMNS)]))
+        for name, value in sums.items():
+            flat[f"metrics.{name}"] = value or 0
+        for name, (numerator, denominator, scale) in DERIVED_METRICS.items():
+            if numerator in sums and denominator in sums:
+                den = sums[denominator] or 0
+                flat[f"metrics.{name}"] = (
+                    (sums[numerator] or 0) * scale / den if den else 0.0
+                )
+        return _to_namespace(flat)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript(
+                WATERMARKS_DDL + "".join(spec.ddl() for spec in REPORTS.values())
+            )
+        return self._conn
+
+
+def warehouse_from_env() -> Warehouse | None:
+    """Build the Warehouse from ``GOOGLE_ADS_WAREHOUSE_DB`` (empty disables it)."""
+    path = os.environ.get("GOOGLE_ADS_WAREHOUSE_DB", DEFAULT_WAREHOUSE_PATH)
+    if not path:
+        return None
+    return Warehouse(os.path.expanduser(path))
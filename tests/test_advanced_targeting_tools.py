@@ -1,7 +1,7 @@
 """Tests for device, demographic, and audience targeting tools."""
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from google_ads_mcp.tools.mutations.targeting_ops import (
     gads_set_device_targeting,
     gads_set_demographic_targeting,
@@ -13,8 +13,9 @@ from google_ads_mcp.tools.mutations.targeting_ops import (
 def mock_ctx():
     ctx = MagicMock()
     wrapper = MagicMock()
+    wrapper.amutate = AsyncMock()
     wrapper.client = MagicMock()
-    wrapper.mutate.return_value = MagicMock(
+    wrapper.amutate.return_value = MagicMock(
         mutate_operation_responses=[MagicMock()]
     )
     ctx.request_context.lifespan_context = {"ads_client": wrapper}
@@ -22,17 +23,19 @@ def mock_ctx():
 
 
 class TestSetDeviceTargeting:
-    def test_mobile_boost(self, mock_ctx):
-        result = gads_set_device_targeting(
+    @pytest.mark.asyncio
+    async def test_mobile_boost(self, mock_ctx):
+        result = await gads_set_device_targeting(
             customer_id="1234567890", campaign_id="111",
             device="MOBILE", bid_modifier=1.5, ctx=mock_ctx,
         )
         wrapper = mock_ctx.request_context.lifespan_context["ads_client"]
-        wrapper.mutate.assert_called_once()
+        wrapper.amutate.assert_awaited_once()
         assert "MOBILE" in result
 
-    def test_exclude_tablet(self, mock_ctx):
-        result = gads_set_device_targeting(
+    @pytest.mark.asyncio
+    async def test_exclude_tablet(self, mock_ctx):
+        result = await gads_set_device_targeting(
             customer_id="1234567890", campaign_id="111",
             device="TABLET", bid_modifier=0.0, ctx=mock_ctx,
         )
@@ -40,16 +43,18 @@ class TestSetDeviceTargeting:
 
 
 class TestSetDemographicTargeting:
-    def test_age_targeting(self, mock_ctx):
-        result = gads_set_demographic_targeting(
+    @pytest.mark.asyncio
+    async def test_age_targeting(self, mock_ctx):
+        result = await gads_set_demographic_targeting(
             customer_id="1234567890", campaign_id="111",
             dimension="AGE", values=["AGE_RANGE_25_34", "AGE_RANGE_35_44"],
             ctx=mock_ctx,
         )
         assert "2" in result
 
-    def test_with_bid_modifier(self, mock_ctx):
-        result = gads_set_demographic_targeting(
+    @pytest.mark.asyncio
+    async def test_with_bid_modifier(self, mock_ctx):
+        result = await gads_set_demographic_targeting(
             customer_id="1234567890", campaign_id="111",
             dimension="GENDER", values=["MALE"],
             bid_modifier=1.2, ctx=mock_ctx,
@@ -58,16 +63,18 @@ class TestSetDemographicTargeting:
 
 
 class TestCreateAudienceSegment:
-    def test_in_market(self, mock_ctx):
-        result = gads_create_audience_segment(
+    @pytest.mark.asyncio
+    async def test_in_market(self, mock_ctx):
+        result = await gads_create_audience_segment(
             customer_id="1234567890", campaign_id="111",
             audience_type="IN_MARKET", audience_id="123456",
             ctx=mock_ctx,
         )
         assert "IN_MARKET" in result
 
-    def test_remarketing_with_modifier(self, mock_ctx):
-        result = gads_create_audience_segment(
+    @pytest.mark.asyncio
+    async def test_remarketing_with_modifier(self, mock_ctx):
+        result = await gads_create_audience_segment(
             customer_id="1234567890", campaign_id="111",
             audience_type="REMARKETING", audience_id="789",
             bid_modifier=1.5, ctx=mock_ctx,
@@ -1,7 +1,7 @@
 """Tests for asset management tools."""
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from google_ads_mcp.tools.mutations.asset_ops import (
     gads_create_asset,
     gads_create_asset_group,
@@ -13,12 +13,13 @@ from google_ads_mcp.tools.mutations.asset_ops import (
 def mock_ctx():
     ctx = MagicMock()
     wrapper = MagicMock()
+    wrapper.amutate = AsyncMock()
     wrapper.client = MagicMock()
     response = MagicMock()
     response.mutate_operation_responses = [
         MagicMock(asset_result=MagicMock(resource_name="customers/1234567890/assets/12345")),
     ]
-    wrapper.mutate.return_value = response
+    wrapper.amutate.return_value = response
     ctx.request_context.lifespan_context = {"ads_client": wrapper}
     return ctx
 
@@ -27,12 +28,13 @@ def mock_ctx():
 def mock_ctx_asset_group():
     ctx = MagicMock()
     wrapper = MagicMock()
+    wrapper.amutate = AsyncMock()
     wrapper.client = MagicMock()
     response = MagicMock()
     response.mutate_operation_responses = [
         MagicMock(asset_group_result=MagicMock(resource_name="customers/1234567890/assetGroups/555")),
     ]
-    wrapper.mutate.return_value = response
+    wrapper.amutate.return_value = response
     ctx.request_context.lifespan_context = {"ads_client": wrapper}
     return ctx
 
@@ -41,17 +43,19 @@ def mock_ctx_asset_group():
 def mock_ctx_batch():
     ctx = MagicMock()
     wrapper = MagicMock()
+    wrapper.amutate = AsyncMock()
     wrapper.client = MagicMock()
     response = MagicMock()
     response.mutate_operation_responses = [MagicMock(), MagicMock(), MagicMock()]
-    wrapper.mutate.return_value = response
+    wrapper.amutate.return_value = response
     ctx.request_context.lifespan_context = {"ads_client": wrapper}
     return ctx
 
 
 class TestCreateAsset:
-    def test_text_asset(self, mock_ctx):
-        result = gads_create_asset(
+    @pytest.mark.asyncio
+    async def test_text_asset(self, mock_ctx):
+        result = await gads_create_asset(
             customer_id="1234567890",
             asset_type="TEXT",
             name="My Headline",
@@ -59,12 +63,13 @@ class TestCreateAsset:
             ctx=mock_ctx,
         )
         wrapper = mock_ctx.request_context.lifespan_context["ads_client"]
-        wrapper.mutate.assert_called_once()
+        wrapper.amutate.assert_awaited_once()
         assert "12345" in result
         assert "TEXT" in result
 
-    def test_youtube_video_asset(self, mock_ctx):
-        result = gads_create_asset(
+    @pytest.mark.asyncio
+    async def test_youtube_video_asset(self, mock_ctx):
+        result = await gads_create_asset(
             customer_id="1234567890",
             asset_type="YOUTUBE_VIDEO",
             name="Product Video",
@@ -73,11 +78,12 @@ class TestCreateAsset:
         )
         assert "12345" in result
 
-    def test_invalid_type(self):
+    @pytest.mark.asyncio
+    async def test_invalid_type(self):
         ctx = MagicMock()
         ctx.request_context.lifespan_context = {"ads_client": MagicMock()}
         with pytest.raises(Exception):
-            gads_create_asset(
+            await gads_create_asset(
                 customer_id="1234567890",
                 asset_type="UNKNOWN",
                 name="Bad",
@@ -86,8 +92,9 @@ class TestCreateAsset:
 
 
 class TestCreateAssetGroup:
-    def test_creates_asset_group(self, mock_ctx_asset_group):
-        result = gads_create_asset_group(
+    @pytest.mark.asyncio
+    async def test_creates_asset_group(self, mock_ctx_asset_group):
+        result = await gads_create_asset_group(
             customer_id="1234567890",
             campaign_id="111",
             name="PMax Group 1",
@@ -95,12 +102,13 @@ class TestCreateAssetGroup:
             ctx=mock_ctx_asset_group,
         )
         wrapper = mock_ctx_asset_group.request_context.lifespan_context["ads_client"]
-        wrapper.mutate.assert_called_once()
+        wrapper.amutate.assert_awaited_once()
         assert "555" in result
         assert "PMax Group 1" in result
 
-    def test_with_optional_fields(self, mock_ctx_asset_group):
-        result = gads_create_asset_group(
+    @pytest.mark.asyncio
+    async def test_with_optional_fields(self, mock_ctx_asset_group):
+        result = await gads_create_asset_group(
             customer_id="1234567890",
             campaign_id="111",
             name="Full Group",
@@ -114,8 +122,9 @@ class TestCreateAssetGroup:
 
 
 class TestAddAssetGroupAssets:
-    def test_links_assets(self, mock_ctx_batch):
-        result = gads_add_asset_group_assets(
+    @pytest.mark.asyncio
+    async def test_links_assets(self, mock_ctx_batch):
+        result = await gads_add_asset_group_assets(
             customer_id="1234567890",
             asset_group_id="555",
             asset_ids=["100", "200", "300"],
@@ -123,11 +132,12 @@ class TestAddAssetGroupAssets:
             ctx=mock_ctx_batch,
         )
         wrapper = mock_ctx_batch.request_context.lifespan_context["ads_client"]
-        wrapper.mutate.assert_called_once()
+        wrapper.amutate.assert_awaited_once()
         assert "3" in result
 
-    def test_single_asset(self, mock_ctx):
-        result = gads_add_asset_group_assets(
+    @pytest.mark.asyncio
+    async def test_single_asset(self, mock_ctx):
+        result = await gads_add_asset_group_assets(
             customer_id="1234567890",
             asset_group_id="555",
             asset_ids=["100"],
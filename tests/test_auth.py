@@ -7,6 +7,7 @@ from google_ads_mcp.auth import (
     GoogleAdsConfig,
     load_config_from_env,
     create_google_ads_client,
+    protobuf_rows_from_env,
 )
 from google_ads_mcp.utils.errors import AuthenticationError
 
@@ -105,3 +106,24 @@ class TestCreateGoogleAdsClient:
         mock_client_cls.load_from_dict.side_effect = Exception("SDK error")
         with pytest.raises(AuthenticationError, match="SDK error"):
             create_google_ads_client(config)
+
+    @patch("google_ads_mcp.auth.GoogleAdsClient")
+    def test_raw_protobuf_client(self, mock_client_cls):
+        config = GoogleAdsConfig(
+            developer_token="dev",
+            client_id="cid",
+            client_secret="csec",
+            refresh_token="rtok",
+        )
+        create_google_ads_client(config, use_proto_plus=False)
+        call_args = mock_client_cls.load_from_dict.call_args[0][0]
+        assert call_args["use_proto_plus"] is False
+
+
+class TestProtobufRowsFromEnv:
+    @pytest.mark.parametrize("value, expected", [
+        ("", False), ("0", False), ("1", True), ("true", True), ("Yes", True),
+    ])
+    def test_flag(self, value, expected):
+        with patch.dict(os.environ, {"GOOGLE_ADS_PROTOBUF_ROWS": value}):
+            assert protobuf_rows_from_env() is expected
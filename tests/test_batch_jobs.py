@@ -0,0 +1,255 @@
+"""Tests for BatchJobService submission, polling and results."""
+
+import enum
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from google_ads_mcp.batch_jobs import (
+    build_batch_operations,
+    list_batch_job_results,
+    poll_batch_job,
+    submit_batch_job,
+)
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
+from google_ads_mcp.models.mutation_inputs import BatchOperation, SubmitBatchJobInput
+from google_ads_mcp.tools.mutations.batch_job_ops import (
+    gads_poll_batch_job,
+    gads_submit_batch_job,
+)
+
+CID = "1234567890"
+JOB = f"customers/{CID}/batchJobs/77"
+
+
+class FakeBatchJobService:
+    """Records uploads and hands out increasing sequence tokens."""
+
+    def __init__(self, result_pages=()):
+        self.uploads = []
+        self.started = []
+        self.result_requests = []
+        self.result_pages = list(result_pages)
+
+    def mutate_batch_job(self, customer_id, operation):
+        return SimpleNamespace(result=SimpleNamespace(resource_name=JOB))
+
+    def add_batch_job_operations(self, resource_name, sequence_token, mutate_operations):
+        self.uploads.append((sequence_token, list(mutate_operations)))
+        return SimpleNamespace(next_sequence_token=f"t{len(self.uploads)}")
+
+    def run_batch_job(self, resource_name):
+        self.started.append(resource_name)
+
+    def list_batch_job_results(self, request):
+        self.result_requests.append(request)
+        return SimpleNamespace(pages=iter(self.result_pages[:1]))
+
+
+def _wrapper(service):
+    raw = MagicMock()
+    raw.get_service.return_value = service
+    return AsyncGoogleAdsClientWrapper(raw)
+
+
+class JobStatus(enum.IntEnum):
+    """proto-plus enums are IntEnums: str() is the number on Python 3.11+."""
+
+    PENDING = 2
+    RUNNING = 3
+    DONE = 4
+
+
+def _status_row(status, executed=0, total=10):
+    return SimpleNamespace(batch_job=SimpleNamespace(
+        id=77,
+        status=JobStatus[status],
+        metadata=SimpleNamespace(
+            operation_count=total,
+            executed_operation_count=executed,
+            estimated_completion_ratio=executed / total,
+            creation_date_time="2026-01-01 10:00:00",
+            completion_date_time="",
+        ),
+    ))
+
+
+def _result(index, message=""):
+    return SimpleNamespace(
+        operation_index=index,
+        status=SimpleNamespace(code=3 if message else 0, message=message),
+        mutate_operation_response=SimpleNamespace(),
+    )
+
+
+class TestBuildBatchOperations:
+    def test_dispatches_each_action(self):
+        client = MagicMock()
+        specs = [
+            BatchOperation(action="add_keyword", ad_group_id="1", text="shoes"),
+            BatchOperation(action="add_negative_keyword", campaign_id="2", text="free"),
+            BatchOperation(action="campaign_status", campaign_id="2", status="pause"),
+            BatchOperation(action="update_budget", budget_id="3", amount_micros=1_000_000),
+        ]
+        ops = list(build_batch_operations(client, CID, specs))
+        assert len(ops) == 4
+        negative = ops[1].campaign_criterion_operation.create
+        assert negative.campaign == f"customers/{CID}/campaigns/2"
+        assert negative.negative is True
+        assert negative.keyword.match_type == 2  # EXACT by default
+        assert ops[2].campaign_operation.update.status == 3
+
+    def test_negative_at_ad_group_level(self):
+        spec = BatchOperation(action="add_negative_keyword", ad_group_id="5", text="x")
+        (op,) = build_batch_operations(MagicMock(), CID, [spec])
+        criterion = op.ad_group_criterion_operation.create
+        assert criterion.ad_group == f"customers/{CID}/adGroups/5"
+
+    def test_missing_fields_rejected(self):
+        with pytest.raises(ValidationError, match="ad_id"):
+            BatchOperation(action="ad_status", ad_group_id="1", status="pause")
+        with pytest.raises(ValidationError, match="campaign_id or ad_group_id"):
+            BatchOperation(action="add_negative_keyword", text="free")
+        with pytest.raises(ValidationError, match="cpc_bid_micros or status"):
+            BatchOperation(action="update_keyword", ad_group_id="1", criterion_id="2")
+
+    def test_empty_job_rejected(self):
+        with pytest.raises(ValidationError):
+            SubmitBatchJobInput(customer_id=CID, operations=[])
+
+
+class TestSubmit:
+    @pytest.mark.asyncio
+    async def test_uploads_in_order_with_sequence_tokens(self):
+        service = FakeBatchJobService()
+        submission = await submit_batch_job(
+            _wrapper(service), CID, iter(range(7)), chunk_size=3
+        )
+        assert [token for token, _ in service.uploads] == ["", "t1", "t2"]
+        assert [ops for _, ops in service.uploads] == [[0, 1, 2], [3, 4, 5], [6]]
+        assert service.started == [JOB]
+        assert submission.job_id == "77"
+        assert submission.operations == 7
+        assert submission.requests == 3
+
+
+class TestPoll:
+    @pytest.mark.asyncio
+    async def test_backs_off_until_done(self):
+        client = _wrapper(FakeBatchJobService())
+        client.aquery = AsyncMock(side_effect=[
+            [_status_row("PENDING")],
+            [_status_row("RUNNING", executed=4)],
+            [_status_row("RUNNING", executed=8)],
+            [_status_row("DONE", executed=10)],
+        ])
+        sleeps = []
+
+        async def sleep(seconds):
+            sleeps.append(seconds)
+
+        status = await poll_batch_job(client, CID, "77", wait_seconds=60, sleep=sleep)
+        assert status.done
+        assert status.executed_operation_count == 10
+        assert sleeps == [1.0, 2.0, 4.0]
+        assert all(call.kwargs["bypass_cache"] for call in client.aquery.await_args_list)
+
+    @pytest.mark.asyncio
+    async def test_wait_is_bounded(self):
+        client = _wrapper(FakeBatchJobService())
+        client.aquery = AsyncMock(return_value=[_status_row("RUNNING")])
+        sleeps = []
+
+        async def sleep(seconds):
+            sleeps.append(seconds)
+
+        status = await poll_batch_job(client, CID, "77", wait_seconds=5, sleep=sleep)
+        assert not status.done
+        assert sleeps == [1.0, 2.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_no_wait_reads_once(self):
+        client = _wrapper(FakeBatchJobService())
+        client.aquery = AsyncMock(return_value=[_status_row("RUNNING")])
+        await poll_batch_job(client, CID, "77")
+        assert client.aquery.await_count == 1
+
+
+class TestResults:
+    @pytest.mark.asyncio
+    async def test_reads_one_page(self):
+        page = SimpleNamespace(
+            results=[_result(0), _result(1, "Keyword troppo lunga")],
+            next_page_token="next",
+        )
+        service = FakeBatchJobService(result_pages=[page])
+        result = await list_batch_job_results(
+            _wrapper(service), CID, "77", page_size=2, page_token="abc"
+        )
+        assert service.result_requests == [
+            {"resource_name": JOB, "page_size": 2, "page_token": "abc"}
+        ]
+        assert [r["status"] for r in result.results] == ["OK", "FAILED"]
+        assert result.results[1]["error"] == "Keyword troppo lunga"
+        assert result.next_page_token == "next"
+
+
+class TestTools:
+    @staticmethod
+    def _ctx(client):
+        ctx = MagicMock()
+        ctx.request_context.lifespan_context = {"ads_client": client}
+        return ctx
+
+    @pytest.mark.asyncio
+    async def test_submit(self):
+        service = FakeBatchJobService()
+        result = await gads_submit_batch_job(
+            customer_id=CID,
+            operations=[
+                {"action": "add_negative_keyword", "campaign_id": "2", "text": f"kw{i}"}
+                for i in range(3)
+            ],
+            ctx=self._ctx(_wrapper(service)),
+        )
+        assert "Batch job 77 submitted with 3 operation(s) in 1 upload(s)" in result
+        assert len(service.uploads[0][1]) == 3
+
+    @pytest.mark.asyncio
+    async def test_poll_running_job(self):
+        client = _wrapper(FakeBatchJobService())
+        client.aquery = AsyncMock(return_value=[_status_row("RUNNING", executed=5)])
+        result = await gads_poll_batch_job(
+            customer_id=CID, batch_job_id="77", ctx=self._ctx(client)
+        )
+        assert "RUNNING" in result
+        assert "5/10" in result
+        assert "Job still running" in result
+
+    @pytest.mark.asyncio
+    async def test_poll_done_lists_failures(self):
+        page = SimpleNamespace(
+            results=[_result(0), _result(1, "Policy violation")],
+            next_page_token="next",
+        )
+        client = _wrapper(FakeBatchJobService(result_pages=[page]))
+        client.aquery = AsyncMock(return_value=[_status_row("DONE", executed=10)])
+        result = await gads_poll_batch_job(
+            customer_id=CID, batch_job_id="77", ctx=self._ctx(client)
+        )
+        assert "Policy violation" in result
+        assert "| 0 |" not in result
+        assert "Index" in result and "Resource" in result
+        assert "**Operations:**" in result
+        assert "`next`" in result
+
+    @pytest.mark.asyncio
+    async def test_poll_unknown_job(self):
+        client = _wrapper(FakeBatchJobService())
+        client.aquery = AsyncMock(return_value=[])
+        result = await gads_poll_batch_job(
+            customer_id=CID, batch_job_id="78", ctx=self._ctx(client)
+        )
+        assert "not found" in result
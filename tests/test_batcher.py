@@ -0,0 +1,159 @@
+"""Tests for time-window micro-batching of mutations."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from google_ads_mcp.batcher import MutationBatcher, batcher_settings_from_env
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
+from google_ads_mcp.utils.errors import GoogleAdsMCPError
+
+
+class FakeSend:
+    """Echoes each operation back as its response; rejects chosen ones."""
+
+    def __init__(self, rejected=(), error=None, unattributed=None):
+        self.rejected = set(rejected)
+        self.error = error
+        self.unattributed = unattributed
+        self.requests = []
+
+    async def __call__(self, customer_id, operations):
+        self.requests.append((customer_id, list(operations)))
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        errors = {
+            i: f"rejected {op}" for i, op in enumerate(operations) if op in self.rejected
+        }
+        if self.unattributed is not None:
+            errors[None] = self.unattributed
+        return [f"done {op}" for op in operations], errors
+
+
+class TestMutationBatcher:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_request(self):
+        send = FakeSend()
+        batcher = MutationBatcher(send, window_seconds=0.01)
+        results = await asyncio.gather(
+            batcher.submit("111", ["a"]),
+            batcher.submit("111", ["b", "c"]),
+            batcher.submit("111", ["d"]),
+        )
+        assert send.requests == [("111", ["a", "b", "c", "d"])]
+        assert [r.mutate_operation_responses for r in results] == [
+            ["done a"], ["done b", "done c"], ["done d"],
+        ]
+        assert batcher.stats() == {"calls": 3, "requests": 1}
+
+    @pytest.mark.asyncio
+    async def test_customers_are_batched_separately(self):
+        send = FakeSend()
+        batcher = MutationBatcher(send, window_seconds=0.01)
+        await asyncio.gather(batcher.submit("111", ["a"]), batcher.submit("222", ["b"]))
+        assert sorted(send.requests) == [("111", ["a"]), ("222", ["b"])]
+
+    @pytest.mark.asyncio
+    async def test_rejected_operation_fails_only_its_caller(self):
+        batcher = MutationBatcher(FakeSend(rejected={"b"}), window_seconds=0.01)
+        ok, failed = await asyncio.gather(
+            batcher.submit("111", ["a"]),
+            batcher.submit("111", ["b"]),
+            return_exceptions=True,
+        )
+        assert ok.mutate_operation_responses == ["done a"]
+        assert isinstance(failed, GoogleAdsMCPError)
+        assert "rejected b" in str(failed)
+
+    @pytest.mark.asyncio
+    async def test_request_error_reaches_every_caller(self):
+        error = GoogleAdsMCPError("quota")
+        batcher = MutationBatcher(FakeSend(error=error), window_seconds=0.01)
+        results = await asyncio.gather(
+            batcher.submit("111", ["a"]),
+            batcher.submit("111", ["b"]),
+            return_exceptions=True,
+        )
+        assert results == [error, error]
+
+    @pytest.mark.asyncio
+    async def test_unattributed_error_reaches_every_caller(self):
+        send = FakeSend(rejected={"b"}, unattributed="request too large")
+        batcher = MutationBatcher(send, window_seconds=0.01)
+        results = await asyncio.gather(
+            batcher.submit("111", ["a"]),
+            batcher.submit("111", ["b"]),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, GoogleAdsMCPError) for r in results)
+        assert "request too large" in str(results[0])
+        assert "rejected b" in str(results[1])
+        assert "request too large" in str(results[1])
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_early(self):
+        send = FakeSend()
+        batcher = MutationBatcher(send, window_seconds=10, max_operations=2)
+        await asyncio.wait_for(
+            asyncio.gather(batcher.submit("111", ["a"]), batcher.submit("111", ["b"])),
+            timeout=1,
+        )
+        assert send.requests == [("111", ["a", "b"])]
+
+    @pytest.mark.asyncio
+    async def test_overflowing_call_starts_next_batch(self):
+        send = FakeSend()
+        batcher = MutationBatcher(send, window_seconds=0.01, max_operations=3)
+        await asyncio.gather(
+            batcher.submit("111", ["a", "b"]), batcher.submit("111", ["c", "d"])
+        )
+        assert send.requests == [("111", ["a", "b"]), ("111", ["c", "d"])]
+
+    @pytest.mark.asyncio
+    async def test_later_calls_open_a_new_batch(self):
+        send = FakeSend()
+        batcher = MutationBatcher(send, window_seconds=0.001)
+        await batcher.submit("111", ["a"])
+        await batcher.submit("111", ["b"])
+        assert len(send.requests) == 2
+
+
+class TestWrapperBatching:
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        client = AsyncGoogleAdsClientWrapper(MagicMock())
+        client.amutate = AsyncMock(return_value="response")
+        assert client.batcher is None
+        assert await client.amutate_batched("111", ["op"]) == "response"
+        client.amutate.assert_awaited_once_with("111", ["op"])
+
+    @pytest.mark.asyncio
+    async def test_merges_with_partial_failure(self):
+        client = AsyncGoogleAdsClientWrapper(MagicMock(), mutate_batch_window=0.01)
+        client.amutate = AsyncMock(return_value=SimpleNamespace(
+            mutate_operation_responses=["r1", "r2"], partial_failure_error=None,
+        ))
+        first, second = await asyncio.gather(
+            client.amutate_batched("111", ["op1"]),
+            client.amutate_batched("111", ["op2"]),
+        )
+        client.amutate.assert_awaited_once_with(
+            "111", ["op1", "op2"], partial_failure=True
+        )
+        assert first.mutate_operation_responses == ["r1"]
+        assert second.mutate_operation_responses == ["r2"]
+
+
+class TestBatcherSettings:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("GOOGLE_ADS_MUTATE_BATCH_WINDOW_MS", raising=False)
+        monkeypatch.delenv("GOOGLE_ADS_MUTATE_BATCH_MAX_OPERATIONS", raising=False)
+        assert batcher_settings_from_env() == (0.0, 1000)
+
+    def test_reads_milliseconds(self, monkeypatch):
+        monkeypatch.setenv("GOOGLE_ADS_MUTATE_BATCH_WINDOW_MS", "25")
+        monkeypatch.setenv("GOOGLE_ADS_MUTATE_BATCH_MAX_OPERATIONS", "500")
+        assert batcher_settings_from_env() == (0.025, 500)
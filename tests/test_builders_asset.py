@@ -20,10 +20,10 @@ def mock_google_client():
 
 class TestAssetTypeToEnum:
     def test_text(self):
-        assert ASSET_TYPE_TO_ENUM["TEXT"] == 4
+        assert ASSET_TYPE_TO_ENUM["TEXT"] == 5
 
     def test_image(self):
-        assert ASSET_TYPE_TO_ENUM["IMAGE"] == 5
+        assert ASSET_TYPE_TO_ENUM["IMAGE"] == 4
 
     def test_youtube_video(self):
         assert ASSET_TYPE_TO_ENUM["YOUTUBE_VIDEO"] == 2
@@ -34,10 +34,10 @@ class TestAssetFieldTypeToEnum:
         assert ASSET_FIELD_TYPE_TO_ENUM["HEADLINE"] == 2
 
     def test_marketing_image(self):
-        assert ASSET_FIELD_TYPE_TO_ENUM["MARKETING_IMAGE"] == 4
+        assert ASSET_FIELD_TYPE_TO_ENUM["MARKETING_IMAGE"] == 5
 
     def test_logo(self):
-        assert ASSET_FIELD_TYPE_TO_ENUM["LOGO"] == 5
+        assert ASSET_FIELD_TYPE_TO_ENUM["LOGO"] == 21
 
 
 class TestBuildCreateAssetOperation:
@@ -28,7 +28,7 @@ class TestCampaignTypeToEnum:
         assert CAMPAIGN_TYPE_TO_ENUM["DISPLAY"] == 3
 
     def test_performance_max(self):
-        assert CAMPAIGN_TYPE_TO_ENUM["PERFORMANCE_MAX"] == 14
+        assert CAMPAIGN_TYPE_TO_ENUM["PERFORMANCE_MAX"] == 10
 
 
 class TestAdGroupTypeToEnum:
@@ -36,7 +36,7 @@ class TestAdGroupTypeToEnum:
         assert AD_GROUP_TYPE_TO_ENUM["SEARCH_STANDARD"] == 2
 
     def test_video_responsive(self):
-        assert AD_GROUP_TYPE_TO_ENUM["VIDEO_RESPONSIVE"] == 9
+        assert AD_GROUP_TYPE_TO_ENUM["VIDEO_RESPONSIVE"] == 16
 
 
 class TestBiddingStrategyMap:
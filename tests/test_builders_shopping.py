@@ -18,13 +18,13 @@ def mock_google_client():
 
 class TestListingGroupFilterTypeToEnum:
     def test_unit_included(self):
-        assert LISTING_GROUP_FILTER_TYPE_TO_ENUM["UNIT_INCLUDED"] == 2
+        assert LISTING_GROUP_FILTER_TYPE_TO_ENUM["UNIT_INCLUDED"] == 3
 
     def test_unit_excluded(self):
-        assert LISTING_GROUP_FILTER_TYPE_TO_ENUM["UNIT_EXCLUDED"] == 3
+        assert LISTING_GROUP_FILTER_TYPE_TO_ENUM["UNIT_EXCLUDED"] == 4
 
     def test_subdivision(self):
-        assert LISTING_GROUP_FILTER_TYPE_TO_ENUM["SUBDIVISION"] == 4
+        assert LISTING_GROUP_FILTER_TYPE_TO_ENUM["SUBDIVISION"] == 2
 
 
 class TestBuildListingGroupFilterOperation:
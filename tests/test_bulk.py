@@ -0,0 +1,179 @@
+"""Tests for chunked bulk mutations."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from google_ads_mcp.bulk import (
+    MAX_MUTATE_OPERATIONS,
+    BulkMutator,
+    bulk_settings_from_env,
+)
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
+from google_ads_mcp.quota import quota_from_env
+from google_ads_mcp.utils.errors import QuotaExhaustedError
+
+
+class FakeFailure:
+    """Stand-in for the GoogleAdsFailure proto: ``value`` holds the errors."""
+
+    @classmethod
+    def deserialize(cls, value):
+        return SimpleNamespace(errors=value)
+
+
+def _error(index, message):
+    return SimpleNamespace(
+        message=message,
+        location=SimpleNamespace(
+            field_path_elements=[
+                SimpleNamespace(field_name="mutate_operations", index=index)
+            ]
+        ),
+    )
+
+
+def _partial_failure(*errors):
+    return SimpleNamespace(
+        partial_failure_error=SimpleNamespace(
+            details=[SimpleNamespace(value=list(errors))]
+        )
+    )
+
+
+class BulkWrapper(AsyncGoogleAdsClientWrapper):
+    """Wrapper whose amutate records chunks and rejects chosen operations."""
+
+    def __init__(self, rejected=(), failing_chunks=(), **kwargs):
+        raw = MagicMock()
+        raw.get_type.return_value = FakeFailure()
+        super().__init__(raw, **kwargs)
+        self.rejected = set(rejected)
+        self.failing_chunks = set(failing_chunks)
+        self.chunks = []
+        self.active = 0
+        self.peak = 0
+
+    async def amutate(self, customer_id, operations, partial_failure=False):
+        assert partial_failure is True
+        number = len(self.chunks)
+        self.chunks.append(list(operations))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if number in self.failing_chunks:
+            raise QuotaExhaustedError("quota esaurita")
+        errors = [
+            _error(i, f"bad {op}")
+            for i, op in enumerate(operations)
+            if op in self.rejected
+        ]
+        return _partial_failure(*errors) if errors else SimpleNamespace(
+            partial_failure_error=None
+        )
+
+
+class TestBulkMutator:
+    @pytest.mark.asyncio
+    async def test_splits_into_chunks(self):
+        client = BulkWrapper(mutate_chunk_size=3, mutate_concurrency=2)
+        result = await BulkMutator(client).run("123", range(10))
+        assert sorted(len(c) for c in client.chunks) == [1, 3, 3, 3]
+        assert sorted(op for c in client.chunks for op in c) == list(range(10))
+        assert result.total == 10
+        assert result.chunks == 4
+        assert result.succeeded == 10
+        assert result.failures == []
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        client = BulkWrapper()
+        await BulkMutator(client, chunk_size=1, max_concurrency=3).run(
+            "123", range(12)
+        )
+        assert client.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_failure_indexes_are_offset_per_chunk(self):
+        client = BulkWrapper(rejected={1, 7})
+        items = [f"kw{i}" for i in range(10)]
+        result = await BulkMutator(client, chunk_size=4).run(
+            "123", range(10), items=items
+        )
+        assert result.failed_indexes == [1, 7]
+        assert [f.item for f in result.failures] == ["kw1", "kw7"]
+        assert result.failures[1].error == "bad 7"
+        assert result.succeeded == 8
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_marks_all_its_operations(self):
+        client = BulkWrapper(failing_chunks={0})
+        result = await BulkMutator(client, chunk_size=5, max_concurrency=1).run(
+            "123", range(8)
+        )
+        assert result.failed_indexes == [0, 1, 2, 3, 4]
+        assert "quota esaurita" in result.failures[0].error
+        assert result.succeeded == 3
+
+    @pytest.mark.asyncio
+    async def test_consumes_generators_lazily(self):
+        pulled = []
+
+        def operations():
+            for i in range(6):
+                pulled.append(i)
+                yield i
+
+        client = BulkWrapper()
+        result = await BulkMutator(client, chunk_size=2, max_concurrency=1).run(
+            "123", operations()
+        )
+        assert result.total == 6
+        assert [len(c) for c in client.chunks] == [2, 2, 2]
+
+    @pytest.mark.asyncio
+    async def test_default_chunks_pass_the_default_limiter(self, monkeypatch):
+        for name in ("GOOGLE_ADS_OPS_PER_SECOND", "GOOGLE_ADS_QUOTA_MAX_WAIT"):
+            monkeypatch.delenv(name, raising=False)
+        raw = MagicMock()
+        service = raw.get_service.return_value
+        service.mutate.return_value = SimpleNamespace(partial_failure_error=None)
+        client = AsyncGoogleAdsClientWrapper(raw, quota=quota_from_env())
+        try:
+            result = await BulkMutator(client).run("123", range(12_000))
+        finally:
+            client.close()
+        assert result.chunks == 3
+        assert result.succeeded == 12_000
+        assert result.failures == []
+        sizes = sorted(
+            len(c.kwargs["mutate_operations"]) for c in service.mutate.call_args_list
+        )
+        assert sizes == [2_000, 5_000, 5_000]
+
+    def test_chunk_size_capped_at_api_limit(self):
+        mutator = BulkMutator(BulkWrapper(), chunk_size=50_000)
+        assert mutator.chunk_size == MAX_MUTATE_OPERATIONS
+
+    def test_to_dict(self):
+        client = BulkWrapper(rejected={0})
+        result = asyncio.run(BulkMutator(client).run("123", [0, 1], items=["a", "b"]))
+        data = result.to_dict()
+        assert data["total"] == 2
+        assert data["succeeded"] == 1
+        assert data["failures"] == [{"index": 0, "item": "a", "error": "bad 0"}]
+
+
+class TestBulkSettings:
+    def test_defaults(self, monkeypatch):
+        monkeypatch.delenv("GOOGLE_ADS_MUTATE_CHUNK_SIZE", raising=False)
+        monkeypatch.delenv("GOOGLE_ADS_MUTATE_CONCURRENCY", raising=False)
+        assert bulk_settings_from_env() == (5000, 4)
+
+    def test_chunk_size_capped(self, monkeypatch):
+        monkeypatch.setenv("GOOGLE_ADS_MUTATE_CHUNK_SIZE", "20000")
+        monkeypatch.setenv("GOOGLE_ADS_MUTATE_CONCURRENCY", "8")
+        assert bulk_settings_from_env() == (MAX_MUTATE_OPERATIONS, 8)
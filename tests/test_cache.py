@@ -0,0 +1,166 @@
+"""Tests for the GAQL query result cache."""
+
+from unittest.mock import MagicMock
+
+from google_ads_mcp.cache import (
+    QueryCache,
+    estimate_rows_size,
+    normalize_query,
+    query_resource,
+)
+from google_ads_mcp.client import GoogleAdsClientWrapper, QueryPage
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+QUERY = "SELECT campaign.id FROM campaign"
+
+
+class TestNormalizeQuery:
+    def test_whitespace_and_case(self):
+        assert normalize_query("select  campaign.id\n FROM Campaign") == (
+            "select campaign.id from campaign"
+        )
+
+    def test_literals_keep_case(self):
+        normalized = normalize_query(
+            "SELECT campaign.id FROM campaign WHERE campaign.name = 'Brand  X'"
+        )
+        assert normalized.endswith("= 'Brand  X'")
+        assert normalized != normalize_query(
+            "SELECT campaign.id FROM campaign WHERE campaign.name = 'brand  x'"
+        )
+
+    def test_query_resource(self):
+        assert query_resource("SELECT label.id FROM label WHERE x = 1") == "label"
+        assert query_resource("SELECT 1") == ""
+
+
+class TestQueryCache:
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.cache = QueryCache(max_bytes=1000, default_ttl=10, clock=self.clock)
+        self.key = QueryCache.make_key("123", None, QUERY)
+
+    def test_miss_then_hit(self):
+        assert self.cache.get(self.key) is None
+        self.cache.put(self.key, QUERY, "value", size=10)
+        assert self.cache.get(self.key) == "value"
+        stats = self.cache.stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_key_normalizes_query(self):
+        other = QueryCache.make_key("123", None, "select  campaign.id from CAMPAIGN")
+        assert other == self.key
+
+    def test_key_includes_login_customer(self):
+        assert QueryCache.make_key("123", "999", QUERY) != self.key
+
+    def test_expiry(self):
+        self.cache.put(self.key, QUERY, "value", size=10)
+        self.clock.now = 10
+        assert self.cache.get(self.key) is None
+        assert self.cache.stats().entries == 0
+
+    def test_per_resource_ttl(self):
+        cache = QueryCache(ttls={"campaign": 1, "label": 0}, clock=self.clock)
+        assert cache.ttl_for(QUERY) == 1
+        assert cache.ttl_for("SELECT customer_client.id FROM customer_client") == 3600
+        label_query = "SELECT label.id FROM label"
+        label_key = QueryCache.make_key("123", None, label_query)
+        cache.put(label_key, label_query, "value", size=1)
+        assert cache.get(label_key) is None
+
+    def test_lru_eviction_under_budget(self):
+        keys = [QueryCache.make_key("123", None, QUERY, i) for i in range(3)]
+        self.cache.put(keys[0], QUERY, "a", size=400)
+        self.cache.put(keys[1], QUERY, "b", size=400)
+        self.cache.get(keys[0])
+        self.cache.put(keys[2], QUERY, "c", size=400)
+        assert self.cache.get(keys[1]) is None
+        assert self.cache.get(keys[0]) == "a"
+        stats = self.cache.stats()
+        assert stats.evictions == 1
+        assert stats.size_bytes == 800
+
+    def test_oversized_value_not_stored(self):
+        self.cache.put(self.key, QUERY, "huge", size=5000)
+        assert self.cache.get(self.key) is None
+
+    def test_truncated_rows_only_serve_smaller_reads(self):
+        self.cache.put_rows(self.key, QUERY, [1, 2, 3], max_rows=3)
+        assert self.cache.get_rows(self.key, 2) == [1, 2]
+        assert self.cache.get_rows(self.key, 3) == [1, 2, 3]
+        assert self.cache.get_rows(self.key, 4) is None
+        assert self.cache.get_rows(self.key, None) is None
+
+    def test_complete_rows_serve_any_read(self):
+        self.cache.put_rows(self.key, QUERY, [1, 2], max_rows=5)
+        assert self.cache.get_rows(self.key, None) == [1, 2]
+        assert self.cache.get_rows(self.key, 100) == [1, 2]
+
+    def test_invalidate_customer(self):
+        other = QueryCache.make_key("456", None, QUERY)
+        self.cache.put(self.key, QUERY, "a", size=1)
+        self.cache.put(other, QUERY, "b", size=1)
+        assert self.cache.invalidate("123") == 1
+        assert self.cache.get(self.key) is None
+        assert self.cache.get(other) == "b"
+
+    def test_estimate_rows_size_uses_protobuf_size(self):
+        row = MagicMock()
+        row.ByteSize.return_value = 42
+        assert estimate_rows_size([row, row]) == 84
+
+
+class TestClientCaching:
+    def setup_method(self):
+        self.mock_client = MagicMock()
+        self.mock_client.login_customer_id = None
+        self.service = MagicMock()
+        self.mock_client.get_service.return_value = self.service
+        self.service.search.side_effect = lambda request: iter([1, 2, 3])
+        self.cache = QueryCache()
+        self.wrapper = GoogleAdsClientWrapper(self.mock_client, cache=self.cache)
+
+    def test_repeated_query_hits_cache(self):
+        first = self.wrapper.query("1234567890", QUERY)
+        second = self.wrapper.query("1234567890", "  select campaign.id FROM campaign ")
+        assert first == second == [1, 2, 3]
+        assert self.service.search.call_count == 1
+
+    def test_bypass_cache_refreshes(self):
+        self.wrapper.query("1234567890", QUERY)
+        self.wrapper.query("1234567890", QUERY, bypass_cache=True)
+        assert self.service.search.call_count == 2
+
+    def test_mutate_invalidates_customer(self):
+        self.wrapper.query("1234567890", QUERY)
+        self.wrapper.mutate("1234567890", [MagicMock()])
+        self.wrapper.query("1234567890", QUERY)
+        assert self.service.search.call_count == 2
+
+    def test_query_page_cached_per_position(self):
+        response = MagicMock()
+        response.pages = [MagicMock(results=[1, 2, 3], next_page_token="")]
+        self.service.search.side_effect = None
+        self.service.search.return_value = response
+
+        page = self.wrapper.query_page("1234567890", QUERY, 2)
+        assert self.wrapper.query_page("1234567890", QUERY, 2) is page
+        self.wrapper.query_page("1234567890", QUERY, 2, position=2)
+        assert self.service.search.call_count == 2
+        assert isinstance(page, QueryPage)
+
+    def test_no_cache_by_default(self):
+        wrapper = GoogleAdsClientWrapper(self.mock_client)
+        wrapper.query("1234567890", QUERY)
+        wrapper.query("1234567890", QUERY)
+        assert self.service.search.call_count == 2
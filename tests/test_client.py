@@ -1,8 +1,23 @@
 """Tests for Google Ads API client wrapper."""
 
 import pytest
-from unittest.mock import MagicMock
-from google_ads_mcp.client import GoogleAdsClientWrapper
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+from google.ads.googleads.errors import GoogleAdsException
+from google.api_core.exceptions import ServiceUnavailable
+
+from google_ads_mcp.cache import QueryCache
+from google_ads_mcp.client import (
+    AsyncGoogleAdsClientWrapper,
+    GoogleAdsClientWrapper,
+    QueryPage,
+)
+from google_ads_mcp.quota import quota_from_env
+from google_ads_mcp.retry import RetryPolicy
+from google_ads_mcp.utils.errors import GoogleAdsMCPError, QuotaExhaustedError
 
 
 class TestGoogleAdsClientWrapper:
@@ -45,6 +60,85 @@ class TestGoogleAdsClientWrapper:
         with pytest.raises(ValueError, match="SELECT"):
             self.wrapper.query("1234567890", "UPDATE campaign SET name='test'")
 
+    def test_query_max_rows_stops_reading(self):
+        mock_service = MagicMock()
+        self.mock_client.get_service.return_value = mock_service
+        source = iter(range(1000))
+        mock_service.search.return_value = source
+
+        rows = self.wrapper.query(
+            "1234567890", "SELECT campaign.id FROM campaign", max_rows=3
+        )
+        assert rows == [0, 1, 2]
+        assert next(source) == 3
+
+    def test_iter_query_is_lazy(self):
+        mock_service = MagicMock()
+        self.mock_client.get_service.return_value = mock_service
+        mock_service.search.side_effect = [
+            _fake_pages(([0, 1], "p2")), _fake_pages(([2, 3], "")),
+        ]
+
+        rows = self.wrapper.iter_query("1234567890", "SELECT campaign.id FROM campaign")
+        assert next(rows) == 0
+        assert next(rows) == 1
+        assert mock_service.search.call_count == 1
+        assert list(rows) == [2, 3]
+        assert mock_service.search.call_args.kwargs["request"].page_token == "p2"
+
+    def test_iter_query_retries_later_pages(self):
+        mock_service = MagicMock()
+        self.mock_client.get_service.return_value = mock_service
+        mock_service.search.side_effect = [
+            _fake_pages(([0, 1], "p2")),
+            ServiceUnavailable("down"),
+            _fake_pages(([2], "")),
+        ]
+        wrapper = GoogleAdsClientWrapper(
+            self.mock_client, retry_policy=RetryPolicy(rng=lambda low, high: low)
+        )
+        with patch("google_ads_mcp.client.time.sleep") as sleep:
+            rows = list(
+                wrapper.iter_query("1234567890", "SELECT campaign.id FROM campaign")
+            )
+        assert rows == [0, 1, 2]
+        sleep.assert_called_once()
+
+    def test_iter_query_maps_later_page_errors(self):
+        mock_service = MagicMock()
+        self.mock_client.get_service.return_value = mock_service
+        mock_service.search.side_effect = [
+            _fake_pages(([0], "p2")),
+            _quota_exception("authentication_error: NOT_ADS_USER"),
+        ]
+        rows = self.wrapper.iter_query("1234567890", "SELECT campaign.id FROM campaign")
+        assert next(rows) == 0
+        with pytest.raises(GoogleAdsMCPError, match="auth"):
+            next(rows)
+        assert mock_service.search.call_count == 2
+
+    def test_iter_query_retries_later_page_quota_errors(self):
+        mock_service = MagicMock()
+        self.mock_client.get_service.return_value = mock_service
+        mock_service.search.side_effect = [
+            _fake_pages(([0], "p2")),
+            _quota_exception(delay=timedelta(seconds=2)),
+            _fake_pages(([1], "")),
+        ]
+        wrapper = GoogleAdsClientWrapper(
+            self.mock_client, retry_policy=RetryPolicy(rng=lambda low, high: low)
+        )
+        with patch("google_ads_mcp.client.time.sleep") as sleep:
+            rows = list(
+                wrapper.iter_query("1234567890", "SELECT campaign.id FROM campaign")
+            )
+        assert rows == [0, 1]
+        sleep.assert_called_once_with(2.0)
+
+    def test_iter_query_validates_eagerly(self):
+        with pytest.raises(ValueError, match="SELECT"):
+            self.wrapper.iter_query("1234567890", "DELETE FROM campaign")
+
     def test_mutate_calls_service(self):
         mock_service = MagicMock()
         self.mock_client.get_service.return_value = mock_service
@@ -55,6 +149,133 @@ class TestGoogleAdsClientWrapper:
         mock_service.mutate.assert_called_once()
 
 
+
+def _fake_pages(*pages):
+    """Build a search response exposing ``pages`` like the API pager."""
+    response = MagicMock()
+    response.pages = iter([
+        MagicMock(results=list(rows), next_page_token=token)
+        for rows, token in pages
+    ])
+    return response
+
+
+class TestQueryPage:
+    QUERY = "SELECT campaign.id FROM campaign"
+
+    def setup_method(self):
+        self.mock_client = MagicMock()
+        self.service = MagicMock()
+        self.mock_client.get_service.return_value = self.service
+        self.wrapper = GoogleAdsClientWrapper(self.mock_client)
+
+    def test_first_page_within_api_page(self):
+        self.service.search.return_value = _fake_pages(([1, 2, 3, 4], ""))
+        page = self.wrapper.query_page("1234567890", self.QUERY, 2)
+        assert isinstance(page, QueryPage)
+        assert page.rows == [1, 2]
+        assert page.has_more is True
+        assert page.next_page_token == ""
+        assert page.next_position == 2
+
+    def test_resume_across_api_pages(self):
+        self.service.search.return_value = _fake_pages(
+            ([1, 2, 3], "p2"), ([4, 5, 6], "p3"), ([7], "")
+        )
+        page = self.wrapper.query_page("1234567890", self.QUERY, 3, position=2)
+        assert page.rows == [3, 4, 5]
+        assert page.skipped == 2
+        assert page.next_page_token == "p2"
+        assert page.next_position == 2
+
+    def test_page_token_is_forwarded(self):
+        self.service.search.return_value = _fake_pages(([4, 5], ""))
+        page = self.wrapper.query_page(
+            "1234567890", self.QUERY, 5, page_token="p2", position=1
+        )
+        request = self.service.search.call_args.kwargs["request"]
+        assert request.page_token == "p2"
+        assert page.rows == [5]
+        assert page.has_more is False
+
+
+
+class TestProtobufClient:
+    QUERY = "SELECT campaign.id FROM campaign"
+
+    def setup_method(self):
+        self.client = MagicMock()
+        self.client.get_service.return_value.search.return_value = iter(["plus"])
+        self.protobuf_client = MagicMock()
+        self.protobuf_client.get_service.return_value.search.return_value = iter(["pb"])
+
+    def test_protobuf_reads_use_second_client(self):
+        wrapper = GoogleAdsClientWrapper(
+            self.client, protobuf_client=self.protobuf_client
+        )
+        assert wrapper.query("1234567890", self.QUERY, protobuf=True) == ["pb"]
+        assert wrapper.query("1234567890", self.QUERY) == ["plus"]
+
+    def test_representations_cached_separately(self):
+        wrapper = GoogleAdsClientWrapper(
+            self.client, cache=QueryCache(), protobuf_client=self.protobuf_client
+        )
+        wrapper.query("1234567890", self.QUERY)
+        assert wrapper.query("1234567890", self.QUERY, protobuf=True) == ["pb"]
+        assert wrapper.query("1234567890", self.QUERY) == ["plus"]
+        assert wrapper.query("1234567890", self.QUERY, protobuf=True) == ["pb"]
+
+    def test_falls_back_to_proto_plus_client(self):
+        wrapper = GoogleAdsClientWrapper(self.client, cache=QueryCache())
+        assert wrapper.query("1234567890", self.QUERY) == ["plus"]
+        assert wrapper.query("1234567890", self.QUERY, protobuf=True) == ["plus"]
+        assert self.client.get_service.return_value.search.call_count == 1
+
+
+class TestQueryStream:
+    def setup_method(self):
+        self.mock_client = MagicMock()
+        self.service = MagicMock()
+        self.mock_client.get_service.return_value = self.service
+        self.wrapper = GoogleAdsClientWrapper(self.mock_client)
+
+    def test_yields_rows_across_batches(self):
+        self.service.search_stream.return_value = iter([
+            MagicMock(results=[1, 2]), MagicMock(results=[3]),
+        ])
+        rows = self.wrapper.query_stream(
+            "1234567890", "SELECT campaign.id FROM campaign"
+        )
+        assert list(rows) == [1, 2, 3]
+        self.service.search.assert_not_called()
+
+    def test_is_lazy(self):
+        batches = iter([MagicMock(results=[1]), MagicMock(results=[2])])
+        self.service.search_stream.return_value = batches
+        rows = self.wrapper.query_stream(
+            "1234567890", "SELECT campaign.id FROM campaign"
+        )
+        assert next(rows) == 1
+        assert next(batches).results == [2]
+
+    def test_validates_eagerly(self):
+        with pytest.raises(ValueError, match="SELECT"):
+            self.wrapper.query_stream("1234567890", "DELETE FROM campaign")
+
+    def test_interrupted_stream_raises_mcp_error(self):
+        def stream():
+            yield MagicMock(results=[1])
+            raise ServiceUnavailable("reset")
+
+        self.service.search_stream.return_value = stream()
+        rows = self.wrapper.query_stream(
+            "1234567890", "SELECT campaign.id FROM campaign"
+        )
+        assert next(rows) == 1
+        with pytest.raises(GoogleAdsMCPError, match="Stream"):
+            next(rows)
+
+
 class TestClientWrapperRetry:
     def test_retry_on_transient_error(self):
         mock_client = MagicMock()
@@ -65,3 +286,187 @@ class TestClientWrapperRetry:
         mock_client = MagicMock()
         wrapper = GoogleAdsClientWrapper(mock_client)
         assert wrapper.max_retries == 3
+
+
+def _quota_exception(code="quota_error: RESOURCE_TEMPORARILY_EXHAUSTED", delay=None):
+    error = SimpleNamespace(
+        error_code=code,
+        message="Too many requests",
+        details=SimpleNamespace(
+            quota_error_details=SimpleNamespace(retry_delay=delay)
+        ),
+    )
+    return GoogleAdsException(
+        None, None, SimpleNamespace(errors=[error]), "request-id"
+    )
+
+
+class TestQuotaErrorRetry:
+    def _wrapper(self, **policy):
+        policy.setdefault("rng", lambda low, high: low)
+        return GoogleAdsClientWrapper(MagicMock(), retry_policy=RetryPolicy(**policy))
+
+    def test_retries_after_server_delay(self):
+        wrapper = self._wrapper()
+        func = MagicMock(side_effect=[
+            _quota_exception(delay=timedelta(seconds=4)), "ok",
+        ])
+        with patch("google_ads_mcp.client.time.sleep") as sleep:
+            assert wrapper._execute_with_retry(func) == "ok"
+        sleep.assert_called_once_with(4.0)
+
+    def test_temporary_exhaustion_uses_backoff(self):
+        wrapper = self._wrapper(base_delay=0.5)
+        func = MagicMock(side_effect=[_quota_exception(), "ok"])
+        with patch("google_ads_mcp.client.time.sleep") as sleep:
+            assert wrapper._execute_with_retry(func) == "ok"
+        sleep.assert_called_once_with(0.5)
+
+    def test_delay_beyond_deadline_raises_with_retry_after(self):
+        wrapper = self._wrapper(deadline=60.0)
+        func = MagicMock(side_effect=_quota_exception(
+            "quota_error: RESOURCE_EXHAUSTED", delay=timedelta(hours=2)
+        ))
+        with patch("google_ads_mcp.client.time.sleep") as sleep:
+            with pytest.raises(QuotaExhaustedError) as exc_info:
+                wrapper._execute_with_retry(func)
+        sleep.assert_not_called()
+        assert exc_info.value.retry_after_seconds == 7200
+        assert func.call_count == 1
+
+    def test_daily_exhaustion_without_delay_is_not_retried(self):
+        wrapper = self._wrapper()
+        func = MagicMock(side_effect=_quota_exception("quota_error: RESOURCE_EXHAUSTED"))
+        with pytest.raises(QuotaExhaustedError):
+            wrapper._execute_with_retry(func)
+        assert func.call_count == 1
+
+    def test_other_errors_are_not_retried(self):
+        wrapper = self._wrapper()
+        func = MagicMock(side_effect=_quota_exception("authentication_error: NOT_ADS_USER"))
+        with pytest.raises(GoogleAdsMCPError, match="auth"):
+            wrapper._execute_with_retry(func)
+        assert func.call_count == 1
+
+    def test_policy_built_from_legacy_arguments(self):
+        wrapper = GoogleAdsClientWrapper(MagicMock(), max_retries=5, base_delay=0.2)
+        assert wrapper.retry_policy.max_retries == 5
+        assert wrapper.retry_policy.base_delay == 0.2
+
+
+class TestAsyncGoogleAdsClientWrapper:
+    def setup_method(self):
+        self.mock_client = MagicMock()
+        self.wrapper = AsyncGoogleAdsClientWrapper(self.mock_client, base_delay=0.01)
+
+    def teardown_method(self):
+        self.wrapper.close()
+
+    def test_is_client_wrapper(self):
+        assert isinstance(self.wrapper, GoogleAdsClientWrapper)
+
+    @pytest.mark.asyncio
+    async def test_aquery_returns_rows(self):
+        mock_service = MagicMock()
+        self.mock_client.get_service.return_value = mock_service
+        mock_service.search.return_value = iter([MagicMock(), MagicMock()])
+
+        rows = await self.wrapper.aquery(
+            "1234567890", "SELECT campaign.name FROM campaign"
+        )
+        assert len(rows) == 2
+
+    @pytest.mark.asyncio
+    async def test_aquery_validates_select_only(self):
+        with pytest.raises(ValueError, match="SELECT"):
+            await self.wrapper.aquery("1234567890", "DELETE FROM campaign")
+
+    @pytest.mark.asyncio
+    async def test_amutate_calls_service(self):
+        mock_service = MagicMock()
+        self.mock_client.get_service.return_value = mock_service
+
+        await self.wrapper.amutate("1234567890", [MagicMock()], partial_failure=True)
+        kwargs = mock_service.mutate.call_args.kwargs
+        assert kwargs["customer_id"] == "1234567890"
+        assert kwargs["partial_failure"] is True
+
+    @pytest.mark.asyncio
+    async def test_acall_passes_arguments(self):
+        func = MagicMock(return_value="ok")
+        assert await self.wrapper.acall(func, 1, key="value") == "ok"
+        func.assert_called_once_with(1, key="value")
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_error_with_async_sleep(self):
+        func = MagicMock(side_effect=[ServiceUnavailable("down"), "ok"])
+        with patch("google_ads_mcp.client.asyncio.sleep", new=AsyncMock()) as sleep, \
+                patch("google_ads_mcp.client.time.sleep") as blocking_sleep:
+            assert await self.wrapper.acall(func) == "ok"
+        sleep.assert_awaited_once()
+        blocking_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_raises_after_max_retries(self):
+        func = MagicMock(side_effect=ServiceUnavailable("down"))
+        with patch("google_ads_mcp.client.asyncio.sleep", new=AsyncMock()):
+            with pytest.raises(GoogleAdsMCPError, match="4 tentativi"):
+                await self.wrapper.acall(func)
+        assert func.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_arun_skips_retry(self):
+        func = MagicMock(side_effect=ServiceUnavailable("down"))
+        with pytest.raises(ServiceUnavailable):
+            await self.wrapper.arun(func)
+        assert func.call_count == 1
+
+
+class TestClientQuota:
+    def test_mutate_books_one_operation_each(self):
+        quota = MagicMock()
+        wrapper = GoogleAdsClientWrapper(MagicMock(), quota=quota)
+        wrapper.mutate("1234567890", [MagicMock(), MagicMock(), MagicMock()])
+        quota.acquire.assert_called_once_with("1234567890", 3)
+
+    @pytest.mark.asyncio
+    async def test_large_mutate_passes_default_limiter(self, monkeypatch):
+        for name in ("GOOGLE_ADS_OPS_PER_SECOND", "GOOGLE_ADS_QUOTA_MAX_WAIT"):
+            monkeypatch.delenv(name, raising=False)
+        quota = quota_from_env()
+        mock_client = MagicMock()
+        wrapper = AsyncGoogleAdsClientWrapper(mock_client, quota=quota)
+        operations = [MagicMock() for _ in range(5000)]
+        with patch("google_ads_mcp.quota.asyncio.sleep", new=AsyncMock()) as sleep:
+            try:
+                await wrapper.amutate("1234567890", operations)
+            finally:
+                wrapper.close()
+        sleep.assert_not_called()
+        service = mock_client.get_service.return_value
+        assert len(service.mutate.call_args.kwargs["mutate_operations"]) == 5000
+        developer = quota.status()["accounts"][0]
+        assert developer["used_today"] == 5000
+        assert developer["queue_delay_seconds"] == 0
+
+    def test_every_retry_books_quota(self):
+        quota = MagicMock()
+        wrapper = GoogleAdsClientWrapper(MagicMock(), quota=quota)
+        func = MagicMock(side_effect=[ServiceUnavailable("down"), "ok"])
+        with patch("google_ads_mcp.client.time.sleep"):
+            assert wrapper._execute_with_retry(func, customer_id="1234567890") == "ok"
+        assert quota.acquire.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_query_awaits_quota(self):
+        quota = MagicMock()
+        quota.aacquire = AsyncMock()
+        mock_client = MagicMock()
+        mock_client.get_service.return_value.search.return_value = iter([MagicMock()])
+        wrapper = AsyncGoogleAdsClientWrapper(mock_client, quota=quota)
+        try:
+            await wrapper.aquery("1234567890", "SELECT campaign.name FROM campaign")
+        finally:
+            wrapper.close()
+        quota.aacquire.assert_awaited_once_with("1234567890", 1)
+        quota.acquire.assert_not_called()
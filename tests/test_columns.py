@@ -0,0 +1,159 @@
+"""Tests for columnar GAQL row extraction."""
+
+import enum
+from types import SimpleNamespace
+
+import proto
+import pytest
+
+from google_ads_mcp.columns import Field, RowExtractor
+
+__protobuf__ = proto.module(package="google_ads_mcp.tests.columns")
+
+
+class CampaignStatus(enum.IntEnum):
+    ENABLED = 2
+    PAUSED = 3
+
+
+class AdGroupStatus(proto.Enum):
+    UNSPECIFIED = 0
+    ENABLED = 2
+    PAUSED = 3
+
+
+class AdGroup(proto.Message):
+    id = proto.Field(proto.INT64, number=1)
+    status = proto.Field(AdGroupStatus, number=2)
+
+
+class AdGroupMetrics(proto.Message):
+    clicks = proto.Field(proto.INT64, number=1)
+    ctr = proto.Field(proto.DOUBLE, number=2)
+
+
+class AdGroupRow(proto.Message):
+    ad_group = proto.Field(AdGroup, number=1)
+    metrics = proto.Field(AdGroupMetrics, number=2)
+
+
+def _row(status=CampaignStatus.ENABLED, cost_micros=1_500_000, ctr=0.0123, clicks=7):
+    return SimpleNamespace(
+        campaign=SimpleNamespace(id=42, name="Brand", status=status),
+        metrics=SimpleNamespace(
+            clicks=clicks, cost_micros=cost_micros, ctr=ctr, conversions=1.234
+        ),
+    )
+
+
+EXTRACTOR = RowExtractor(
+    Field("id", "campaign.id"),
+    Field("status", "campaign.status", "enum"),
+    Field("clicks", "metrics.clicks", "int"),
+    Field("cost", "metrics.cost_micros", "micros"),
+    Field("ctr", "metrics.ctr", "percent"),
+    Field("conversions", "metrics.conversions", "float"),
+)
+
+
+class TestExtract:
+    def test_typed_columns(self):
+        batch = EXTRACTOR.extract([_row(), _row(CampaignStatus.PAUSED, None, None, None)])
+        assert len(batch) == 2
+        assert batch.column("id") == ["42", "42"]
+        assert batch.column("status") == ["ENABLED", "PAUSED"]
+        assert batch.column("clicks") == [7, 0]
+        assert batch.column("cost") == [1_500_000, 0]
+        assert batch.column("ctr") == [0.0123, 0.0]
+
+    def test_enum_names_are_shared(self):
+        batch = EXTRACTOR.extract([_row(), _row()])
+        first, second = batch.column("status")
+        assert first is second
+
+    def test_records_format_only_the_slice(self):
+        batch = EXTRACTOR.extract([_row(clicks=i) for i in range(5)])
+        page = batch.records(1, 3)
+        assert [r["clicks"] for r in page] == [1, 2]
+        assert page[0] == {
+            "id": "42", "status": "ENABLED", "clicks": 1,
+            "cost": "1.50", "ctr": "1.23%", "conversions": 1.23,
+        }
+
+    def test_parent_resolved_once_per_row(self):
+        class Row:
+            reads = 0
+
+            @property
+            def metrics(self):
+                Row.reads += 1
+                return SimpleNamespace(clicks=1, cost_micros=0, ctr=0, conversions=0)
+
+            campaign = SimpleNamespace(id=1, name="x", status="CampaignStatus.ENABLED")
+
+        EXTRACTOR.extract([Row(), Row()])
+        assert Row.reads == 2
+
+    def test_bad_numbers_default_to_zero(self):
+        batch = EXTRACTOR.extract([_row(clicks="n/a")])
+        assert batch.column("clicks") == [0]
+
+    def test_empty(self):
+        assert EXTRACTOR.records([]) == []
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError, match="kind"):
+            Field("x", "metrics.x", "money")
+
+
+class TestTypedRows:
+    EXTRACTOR = RowExtractor(
+        *EXTRACTOR.fields, name="CampaignPerfRow", context=("customer_id",)
+    )
+
+    def test_raw_values_with_context(self):
+        (row,) = self.EXTRACTOR.rows([_row()], "123")
+        assert type(row).__name__ == "CampaignPerfRow"
+        assert row == ("123", "42", "ENABLED", 7, 1_500_000, 0.0123, 1.234)
+        assert row.cost == 1_500_000
+        assert not hasattr(row, "__dict__")
+
+    def test_slice(self):
+        batch = self.EXTRACTOR.extract([_row(clicks=i) for i in range(5)])
+        assert [r.clicks for r in batch.rows("1", start=3)] == [3, 4]
+
+    def test_sort_then_format(self):
+        rows = self.EXTRACTOR.rows([_row(clicks=i) for i in range(3)], "123")
+        rows.sort(key=lambda r: r.clicks, reverse=True)
+        records = self.EXTRACTOR.format(rows)
+        assert [r["clicks"] for r in records] == [2, 1, 0]
+        assert records[-1] == {"customer_id": "123", **EXTRACTOR.records([_row(clicks=0)])[0]}
+        assert self.EXTRACTOR.format([]) == []
+
+class TestRowRepresentations:
+    EXTRACTOR = RowExtractor(
+        Field("id", "ad_group.id"),
+        Field("status", "ad_group.status", "enum"),
+        Field("clicks", "metrics.clicks", "int"),
+        Field("ctr", "metrics.ctr", "percent"),
+    )
+
+    def test_raw_protobuf_matches_proto_plus(self):
+        rows = [
+            AdGroupRow(
+                ad_group=AdGroup(id=i, status=AdGroupStatus.PAUSED),
+                metrics=AdGroupMetrics(clicks=i, ctr=0.5),
+            )
+            for i in range(3)
+        ]
+        raw = [AdGroupRow.pb(row) for row in rows]
+        assert self.EXTRACTOR.records(raw) == self.EXTRACTOR.records(rows)
+        assert self.EXTRACTOR.records(raw)[2] == {
+            "id": "2", "status": "PAUSED", "clicks": 2, "ctr": "50.00%",
+        }
+
+    def test_proto_plus_renamed_field(self):
+        row = SimpleNamespace(ad_group=SimpleNamespace(type="SEARCH_STANDARD"))
+        extractor = RowExtractor(Field("type", "ad_group.type_", "enum"))
+        assert extractor.records([row]) == [{"type": "SEARCH_STANDARD"}]
+
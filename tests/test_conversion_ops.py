@@ -1,7 +1,7 @@
 """Tests for conversion upload mutation tools."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -11,9 +11,11 @@ from google_ads_mcp.tools.mutations.conversion_ops import (
 
 
 class TestGadsUploadClickConversions:
+    @pytest.mark.asyncio
     @patch("google_ads_mcp.tools.mutations.conversion_ops.get_client")
-    def test_successful_upload(self, mock_get_client):
+    async def test_successful_upload(self, mock_get_client):
         mock_client = MagicMock()
+        mock_client.acall = AsyncMock(side_effect=lambda f, *a, **k: f(*a, **k))
         mock_service = MagicMock()
 
         mock_result = MagicMock()
@@ -29,7 +31,7 @@ class TestGadsUploadClickConversions:
         mock_client.client.get_type.return_value = MagicMock()
         mock_get_client.return_value = mock_client
 
-        result = gads_upload_click_conversions(
+        result = await gads_upload_click_conversions(
             customer_id="1234567890",
             conversion_action_id="456",
             gclid="test_gclid_123",
@@ -43,10 +45,12 @@ class TestGadsUploadClickConversions:
         assert len(data["results"]) == 1
         assert data["results"][0]["gclid"] == "test_gclid_123"
 
+    @pytest.mark.asyncio
     @patch("google_ads_mcp.tools.mutations.conversion_ops.get_client")
-    def test_default_values(self, mock_get_client):
+    async def test_default_values(self, mock_get_client):
         """Test upload with default conversion_value and currency_code."""
         mock_client = MagicMock()
+        mock_client.acall = AsyncMock(side_effect=lambda f, *a, **k: f(*a, **k))
         mock_service = MagicMock()
 
         mock_result = MagicMock()
@@ -62,7 +66,7 @@ class TestGadsUploadClickConversions:
         mock_client.client.get_type.return_value = MagicMock()
         mock_get_client.return_value = mock_client
 
-        result = gads_upload_click_conversions(
+        result = await gads_upload_click_conversions(
             customer_id="1234567890",
             conversion_action_id="789",
             gclid="gclid_abc",
@@ -72,10 +76,12 @@ class TestGadsUploadClickConversions:
         data = json.loads(result)
         assert data["uploaded"] == 1
 
+    @pytest.mark.asyncio
     @patch("google_ads_mcp.tools.mutations.conversion_ops.get_client")
-    def test_empty_response_results(self, mock_get_client):
+    async def test_empty_response_results(self, mock_get_client):
         """Test when API returns no results (possible partial failure)."""
         mock_client = MagicMock()
+        mock_client.acall = AsyncMock(side_effect=lambda f, *a, **k: f(*a, **k))
         mock_service = MagicMock()
 
         mock_response = MagicMock()
@@ -86,7 +92,7 @@ class TestGadsUploadClickConversions:
         mock_client.client.get_type.return_value = MagicMock()
         mock_get_client.return_value = mock_client
 
-        result = gads_upload_click_conversions(
+        result = await gads_upload_click_conversions(
             customer_id="1234567890",
             conversion_action_id="456",
             gclid="test_gclid",
@@ -97,10 +103,12 @@ class TestGadsUploadClickConversions:
         assert data["uploaded"] == 0
         assert data["results"] == []
 
+    @pytest.mark.asyncio
     @patch("google_ads_mcp.tools.mutations.conversion_ops.get_client")
-    def test_service_called_correctly(self, mock_get_client):
+    async def test_service_called_correctly(self, mock_get_client):
         """Verify the service is called with the right request structure."""
         mock_client = MagicMock()
+        mock_client.acall = AsyncMock(side_effect=lambda f, *a, **k: f(*a, **k))
         mock_service = MagicMock()
 
         mock_response = MagicMock()
@@ -111,7 +119,7 @@ class TestGadsUploadClickConversions:
         mock_client.client.get_type.return_value = MagicMock()
         mock_get_client.return_value = mock_client
 
-        gads_upload_click_conversions(
+        await gads_upload_click_conversions(
             customer_id="1234567890",
             conversion_action_id="456",
             gclid="test_gclid",
@@ -122,10 +130,11 @@ class TestGadsUploadClickConversions:
         mock_client.get_service.assert_called_once_with("ConversionUploadService")
         mock_service.upload_click_conversions.assert_called_once()
 
-    def test_invalid_customer_id(self):
+    @pytest.mark.asyncio
+    async def test_invalid_customer_id(self):
         """Invalid customer ID should raise ValueError."""
         with pytest.raises(ValueError):
-            gads_upload_click_conversions(
+            await gads_upload_click_conversions(
                 customer_id="bad",
                 conversion_action_id="456",
                 gclid="test",
@@ -0,0 +1,231 @@
+"""Tests for bulk offline click conversion uploads from files."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
+from google_ads_mcp.conversions import (
+    parse_click_conversion,
+    upload_click_conversions_file,
+)
+from google_ads_mcp.tools.mutations.conversion_ops import (
+    gads_upload_click_conversions_file,
+)
+from google_ads_mcp.utils.errors import GoogleAdsMCPError
+
+CID = "1234567890"
+
+
+class FakeFailure:
+    @classmethod
+    def deserialize(cls, value):
+        return SimpleNamespace(errors=value)
+
+
+def _error(index, message):
+    return SimpleNamespace(
+        message=message,
+        location=SimpleNamespace(field_path_elements=[SimpleNamespace(index=index)]),
+    )
+
+
+class FakeConversionUploadService:
+    """Records requests; ``rejected`` maps request number to errors or an exception."""
+
+    def __init__(self, rejected=None):
+        self.requests = []
+        self.rejected = rejected or {}
+
+    def upload_click_conversions(self, request):
+        self.requests.append(request)
+        outcome = self.rejected.get(len(self.requests) - 1)
+        if isinstance(outcome, Exception):
+            raise outcome
+        details = [SimpleNamespace(value=outcome)] if outcome else []
+        return SimpleNamespace(partial_failure_error=SimpleNamespace(details=details))
+
+
+def _wrapper(service):
+    raw = MagicMock()
+    raw.get_service.return_value = service
+
+    def get_type(name):
+        if name == "GoogleAdsFailure":
+            return FakeFailure()
+        if name == "UploadClickConversionsRequest":
+            return SimpleNamespace(conversions=[])
+        return SimpleNamespace()
+
+    raw.get_type.side_effect = get_type
+    return AsyncGoogleAdsClientWrapper(raw, max_retries=0)
+
+
+def _file(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def _ndjson(tmp_path, records):
+    return _file(tmp_path, "conv.ndjson", "".join(json.dumps(r) + "\n" for r in records))
+
+
+class TestParse:
+    def test_aliases_and_datetime(self):
+        item = parse_click_conversion(3, {
+            "GCLID": "abc", "datetime": "2026-01-15T12:00:00+01:00",
+            "value": "9.5", "currency": "eur",
+        }, "456")
+        assert item.click_id_field == "gclid"
+        assert item.conversion_action_id == "456"
+        assert item.conversion_date_time == "2026-01-15 12:00:00+01:00"
+        assert item.conversion_value == 9.5
+        assert item.currency_code == "EUR"
+
+    def test_action_resource_name(self):
+        item = parse_click_conversion(2, {
+            "wbraid": "w", "conversion_date_time": "2026-01-15 12:00:00+00:00",
+            "conversion_action": f"customers/{CID}/conversionActions/77",
+        })
+        assert item.conversion_action_id == "77"
+        assert item.click_id_field == "wbraid"
+
+    @pytest.mark.parametrize("record, message", [
+        ({"conversion_date_time": "x"}, "exactly one"),
+        ({"gclid": "a", "gbraid": "b", "conversion_date_time": "x"}, "exactly one"),
+        ({"gclid": "a"}, "conversion_date_time"),
+        ({"gclid": "a", "conversion_date_time": "x", "value": "dieci"}, "conversion_value"),
+    ])
+    def test_invalid(self, record, message):
+        with pytest.raises(ValueError, match=message):
+            parse_click_conversion(2, record, "456")
+
+
+class TestUpload:
+    @pytest.mark.asyncio
+    async def test_batches_and_dedupes(self, tmp_path):
+        records = [
+            {"gclid": f"g{i}", "datetime": "2026-01-15 12:00:00+00:00", "value": i}
+            for i in range(5)
+        ]
+        records.append(dict(records[0]))
+        path = _ndjson(tmp_path, records)
+        service = FakeConversionUploadService()
+        progress = []
+
+        async def on_progress(upload):
+            progress.append(upload.uploaded)
+
+        result = await upload_click_conversions_file(
+            _wrapper(service), CID, path, conversion_action_id="456",
+            batch_size=2, max_concurrency=1, on_progress=on_progress,
+        )
+        assert [len(r.conversions) for r in service.requests] == [2, 2, 1]
+        first = service.requests[0].conversions[0]
+        assert first.gclid == "g0"
+        assert first.conversion_action == f"customers/{CID}/conversionActions/456"
+        assert first.conversion_value == 0.0
+        assert all(r.partial_failure for r in service.requests)
+        assert result.rows == 6
+        assert result.duplicate_rows == 1
+        assert result.succeeded == 5
+        assert progress == [2, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_batch_size_capped_at_api_maximum(self, tmp_path):
+        path = _ndjson(tmp_path, [
+            {"gclid": f"g{i}", "datetime": "2026-01-15 12:00:00+00:00"}
+            for i in range(2001)
+        ])
+        service = FakeConversionUploadService()
+        await upload_click_conversions_file(
+            _wrapper(service), CID, path, conversion_action_id="456", batch_size=5000
+        )
+        assert sorted(len(r.conversions) for r in service.requests) == [1, 2000]
+
+    @pytest.mark.asyncio
+    async def test_failures_reported_by_line(self, tmp_path):
+        path = _file(
+            tmp_path, "conv.csv",
+            "gclid,conversion_date_time\n"
+            "a,2026-01-15 12:00:00+00:00\n"
+            ",2026-01-15 12:00:00+00:00\n"
+            "b,2026-01-15 12:00:00+00:00\n"
+            "c,2026-01-15 12:00:00+00:00\n",
+        )
+        service = FakeConversionUploadService(rejected={
+            0: [_error(1, "Click too old")],
+            1: GoogleAdsMCPError("Quota esaurita"),
+        })
+        result = await upload_click_conversions_file(
+            _wrapper(service), CID, path, conversion_action_id="456",
+            batch_size=2, max_concurrency=1,
+        )
+        assert result.invalid_rows == 1
+        assert result.uploaded == 3
+        assert result.failed == 2
+        assert result.succeeded == 1
+        assert [(f.index, f.error) for f in result.failures] == [
+            (3, "exactly one of gclid, gbraid or wbraid is required"),
+            (4, "Click too old"),
+            (5, "Quota esaurita"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bad_ndjson_line(self, tmp_path):
+        path = _file(tmp_path, "conv.jsonl", "not json\n\n[1]\n")
+        result = await upload_click_conversions_file(
+            _wrapper(FakeConversionUploadService()), CID, path, "456"
+        )
+        assert result.invalid_rows == 2
+        assert [f.index for f in result.failures] == [1, 3]
+
+    @pytest.mark.asyncio
+    async def test_csv_without_click_id_column(self, tmp_path):
+        path = _file(tmp_path, "conv.csv", "order_id,datetime\n1,x\n")
+        service = FakeConversionUploadService()
+        with pytest.raises(ValueError, match="needs a gclid, gbraid or wbraid column"):
+            await upload_click_conversions_file(_wrapper(service), CID, path, "456")
+        assert service.requests == []
+
+    @pytest.mark.asyncio
+    async def test_csv_without_datetime_column(self, tmp_path):
+        path = _file(tmp_path, "conv.csv", "gclid,value\nabc,1\n")
+        service = FakeConversionUploadService()
+        with pytest.raises(ValueError, match="needs a conversion_date_time or datetime"):
+            await upload_click_conversions_file(_wrapper(service), CID, path, "456")
+        assert service.requests == []
+
+
+class TestTool:
+    @staticmethod
+    def _ctx(client):
+        ctx = MagicMock()
+        ctx.request_context.lifespan_context = {"ads_client": client}
+        return ctx
+
+    @pytest.mark.asyncio
+    async def test_returns_summary(self, tmp_path):
+        path = _ndjson(tmp_path, [
+            {"gbraid": "g", "datetime": "2026-01-15 12:00:00+00:00",
+             "conversion_action_id": "9"},
+        ])
+        service = FakeConversionUploadService()
+        result = json.loads(await gads_upload_click_conversions_file(
+            customer_id="123-456-7890", file_path=path,
+            ctx=self._ctx(_wrapper(service)),
+        ))
+        assert result["succeeded"] == 1
+        assert result["requests"] == 1
+        assert service.requests[0].conversions[0].gbraid == "g"
+
+    @pytest.mark.asyncio
+    async def test_missing_file(self, tmp_path):
+        result = json.loads(await gads_upload_click_conversions_file(
+            customer_id=CID, file_path=str(tmp_path / "nope.csv"),
+            ctx=self._ctx(_wrapper(FakeConversionUploadService())),
+        ))
+        assert "File not found" in result["error"]
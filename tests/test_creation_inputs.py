@@ -252,12 +252,12 @@ class TestAddKeywordsInput:
         )
         assert inp.cpc_bid_micros == 1_500_000
 
-    def test_max_20(self):
-        with pytest.raises(ValidationError, match="at most 20"):
+    def test_max_50000(self):
+        with pytest.raises(ValidationError, match="at most 50000"):
             AddKeywordsInput(
                 customer_id="1234567890",
                 ad_group_id="222",
-                keywords=[f"kw{i}" for i in range(21)],
+                keywords=[f"kw{i}" for i in range(50_001)],
             )
 
     def test_empty_rejected(self):
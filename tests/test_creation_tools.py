@@ -1,7 +1,7 @@
 """Tests for creation tools (campaign, ad group, RSA)."""
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from google_ads_mcp.tools.mutations.creation_ops import (
     gads_create_campaign,
     gads_create_ad_group,
@@ -13,6 +13,7 @@ from google_ads_mcp.tools.mutations.creation_ops import (
 def mock_ctx():
     ctx = MagicMock()
     wrapper = MagicMock()
+    wrapper.amutate = AsyncMock()
     wrapper.client = MagicMock()
     # mutate returns response with resource names
     response = MagicMock()
@@ -20,14 +21,15 @@ def mock_ctx():
         MagicMock(campaign_budget_result=MagicMock(resource_name="customers/1234567890/campaignBudgets/999")),
         MagicMock(campaign_result=MagicMock(resource_name="customers/1234567890/campaigns/888")),
     ]
-    wrapper.mutate.return_value = response
+    wrapper.amutate.return_value = response
     ctx.request_context.lifespan_context = {"ads_client": wrapper}
     return ctx
 
 
 class TestCreateCampaign:
-    def test_creates_campaign(self, mock_ctx):
-        result = gads_create_campaign(
+    @pytest.mark.asyncio
+    async def test_creates_campaign(self, mock_ctx):
+        result = await gads_create_campaign(
             customer_id="1234567890",
             name="Test Campaign",
             campaign_type="SEARCH",
@@ -36,7 +38,7 @@ class TestCreateCampaign:
             ctx=mock_ctx,
         )
         wrapper = mock_ctx.request_context.lifespan_context["ads_client"]
-        wrapper.mutate.assert_called_once()
+        wrapper.amutate.assert_awaited_once()
         assert "Test Campaign" in result
         assert "PAUSED" in result
         assert "SEARCH" in result
@@ -44,8 +46,9 @@ class TestCreateCampaign:
         assert "888" in result
         assert "999" in result
 
-    def test_with_dates(self, mock_ctx):
-        result = gads_create_campaign(
+    @pytest.mark.asyncio
+    async def test_with_dates(self, mock_ctx):
+        result = await gads_create_campaign(
             customer_id="1234567890",
             name="Dated Campaign",
             campaign_type="DISPLAY",
@@ -59,8 +62,9 @@ class TestCreateCampaign:
         assert "Dated Campaign" in result
         assert "DISPLAY" in result
 
-    def test_with_target_cpa(self, mock_ctx):
-        result = gads_create_campaign(
+    @pytest.mark.asyncio
+    async def test_with_target_cpa(self, mock_ctx):
+        result = await gads_create_campaign(
             customer_id="1234567890",
             name="CPA Campaign",
             campaign_type="SEARCH",
@@ -72,8 +76,9 @@ class TestCreateCampaign:
         assert "CPA Campaign" in result
         assert "TARGET_CPA" in result
 
-    def test_with_target_roas(self, mock_ctx):
-        result = gads_create_campaign(
+    @pytest.mark.asyncio
+    async def test_with_target_roas(self, mock_ctx):
+        result = await gads_create_campaign(
             customer_id="1234567890",
             name="ROAS Campaign",
             campaign_type="SEARCH",
@@ -85,11 +90,12 @@ class TestCreateCampaign:
         assert "ROAS Campaign" in result
         assert "TARGET_ROAS" in result
 
-    def test_target_cpa_without_micros_raises(self):
+    @pytest.mark.asyncio
+    async def test_target_cpa_without_micros_raises(self):
         ctx = MagicMock()
         ctx.request_context.lifespan_context = {"ads_client": MagicMock()}
         with pytest.raises(Exception):
-            gads_create_campaign(
+            await gads_create_campaign(
                 customer_id="1234567890",
                 name="Bad CPA",
                 campaign_type="SEARCH",
@@ -98,11 +104,12 @@ class TestCreateCampaign:
                 ctx=ctx,
             )
 
-    def test_target_roas_without_value_raises(self):
+    @pytest.mark.asyncio
+    async def test_target_roas_without_value_raises(self):
         ctx = MagicMock()
         ctx.request_context.lifespan_context = {"ads_client": MagicMock()}
         with pytest.raises(Exception):
-            gads_create_campaign(
+            await gads_create_campaign(
                 customer_id="1234567890",
                 name="Bad ROAS",
                 campaign_type="SEARCH",
@@ -111,11 +118,12 @@ class TestCreateCampaign:
                 ctx=ctx,
             )
 
-    def test_invalid_campaign_type_raises(self):
+    @pytest.mark.asyncio
+    async def test_invalid_campaign_type_raises(self):
         ctx = MagicMock()
         ctx.request_context.lifespan_context = {"ads_client": MagicMock()}
         with pytest.raises(Exception):
-            gads_create_campaign(
+            await gads_create_campaign(
                 customer_id="1234567890",
                 name="Bad Type",
                 campaign_type="INVALID",
@@ -124,8 +132,9 @@ class TestCreateCampaign:
                 ctx=ctx,
             )
 
-    def test_budget_formatted_in_result(self, mock_ctx):
-        result = gads_create_campaign(
+    @pytest.mark.asyncio
+    async def test_budget_formatted_in_result(self, mock_ctx):
+        result = await gads_create_campaign(
             customer_id="1234567890",
             name="Budget Test",
             campaign_type="SEARCH",
@@ -138,15 +147,16 @@ class TestCreateCampaign:
 
 
 class TestCreateAdGroup:
-    def test_creates_ad_group(self, mock_ctx):
+    @pytest.mark.asyncio
+    async def test_creates_ad_group(self, mock_ctx):
         # Override mock for ad group response
         response = MagicMock()
         response.mutate_operation_responses = [
             MagicMock(ad_group_result=MagicMock(resource_name="customers/1234567890/adGroups/777")),
         ]
-        mock_ctx.request_context.lifespan_context["ads_client"].mutate.return_value = response
+        mock_ctx.request_context.lifespan_context["ads_client"].amutate.return_value = response
 
-        result = gads_create_ad_group(
+        result = await gads_create_ad_group(
             customer_id="1234567890",
             campaign_id="111",
             name="My Ad Group",
@@ -157,14 +167,15 @@ class TestCreateAdGroup:
         assert "SEARCH_STANDARD" in result
         assert "777" in result
 
-    def test_with_cpc_bid(self, mock_ctx):
+    @pytest.mark.asyncio
+    async def test_with_cpc_bid(self, mock_ctx):
         response = MagicMock()
         response.mutate_operation_responses = [
             MagicMock(ad_group_result=MagicMock(resource_name="customers/1234567890/adGroups/555")),
         ]
-        mock_ctx.request_context.lifespan_context["ads_client"].mutate.return_value = response
+        mock_ctx.request_context.lifespan_context["ads_client"].amutate.return_value = response
 
-        result = gads_create_ad_group(
+        result = await gads_create_ad_group(
             customer_id="1234567890",
             campaign_id="111",
             name="CPC Ad Group",
@@ -175,11 +186,12 @@ class TestCreateAdGroup:
         assert "CPC Ad Group" in result
         assert "555" in result
 
-    def test_invalid_ad_group_type_raises(self):
+    @pytest.mark.asyncio
+    async def test_invalid_ad_group_type_raises(self):
         ctx = MagicMock()
         ctx.request_context.lifespan_context = {"ads_client": MagicMock()}
         with pytest.raises(Exception):
-            gads_create_ad_group(
+            await gads_create_ad_group(
                 customer_id="1234567890",
                 campaign_id="111",
                 name="Bad Type",
@@ -187,14 +199,15 @@ class TestCreateAdGroup:
                 ctx=ctx,
             )
 
-    def test_mutate_called_with_single_operation(self, mock_ctx):
+    @pytest.mark.asyncio
+    async def test_mutate_called_with_single_operation(self, mock_ctx):
         response = MagicMock()
         response.mutate_operation_responses = [
             MagicMock(ad_group_result=MagicMock(resource_name="customers/1234567890/adGroups/777")),
         ]
-        mock_ctx.request_context.lifespan_context["ads_client"].mutate.return_value = response
+        mock_ctx.request_context.lifespan_context["ads_client"].amutate.return_value = response
 
-        gads_create_ad_group(
+        await gads_create_ad_group(
             customer_id="1234567890",
             campaign_id="111",
             name="Test",
@@ -202,20 +215,21 @@ class TestCreateAdGroup:
             ctx=mock_ctx,
         )
         wrapper = mock_ctx.request_context.lifespan_context["ads_client"]
-        args = wrapper.mutate.call_args
+        args = wrapper.amutate.call_args
         # Second argument is the operations list
         assert len(args[0][1]) == 1
 
 
 class TestCreateResponsiveSearchAd:
-    def test_creates_rsa(self, mock_ctx):
+    @pytest.mark.asyncio
+    async def test_creates_rsa(self, mock_ctx):
         response = MagicMock()
         response.mutate_operation_responses = [
             MagicMock(ad_group_ad_result=MagicMock(resource_name="customers/1234567890/adGroupAds/222~666")),
         ]
-        mock_ctx.request_context.lifespan_context["ads_client"].mutate.return_value = response
+        mock_ctx.request_context.lifespan_context["ads_client"].amutate.return_value = response
 
-        result = gads_create_responsive_search_ad(
+        result = await gads_create_responsive_search_ad(
             customer_id="1234567890",
             ad_group_id="222",
             headlines=["H1", "H2", "H3"],
@@ -227,14 +241,15 @@ class TestCreateResponsiveSearchAd:
         assert "2 descriptions" in result
         assert "666" in result
 
-    def test_with_paths(self, mock_ctx):
+    @pytest.mark.asyncio
+    async def test_with_paths(self, mock_ctx):
         response = MagicMock()
         response.mutate_operation_responses = [
             MagicMock(ad_group_ad_result=MagicMock(resource_name="customers/1234567890/adGroupAds/222~777")),
         ]
-        mock_ctx.request_context.lifespan_context["ads_client"].mutate.return_value = response
+        mock_ctx.request_context.lifespan_context["ads_client"].amutate.return_value = response
 
-        result = gads_create_responsive_search_ad(
+        result = await gads_create_responsive_search_ad(
             customer_id="1234567890",
             ad_group_id="222",
             headlines=["H1", "H2", "H3"],
@@ -247,11 +262,12 @@ class TestCreateResponsiveSearchAd:
         assert isinstance(result, str)
         assert "3 headlines" in result
 
-    def test_too_few_headlines_raises(self):
+    @pytest.mark.asyncio
+    async def test_too_few_headlines_raises(self):
         ctx = MagicMock()
         ctx.request_context.lifespan_context = {"ads_client": MagicMock()}
         with pytest.raises(Exception):
-            gads_create_responsive_search_ad(
+            await gads_create_responsive_search_ad(
                 customer_id="1234567890",
                 ad_group_id="222",
                 headlines=["H1"],
@@ -260,11 +276,12 @@ class TestCreateResponsiveSearchAd:
                 ctx=ctx,
             )
 
-    def test_too_few_descriptions_raises(self):
+    @pytest.mark.asyncio
+    async def test_too_few_descriptions_raises(self):
         ctx = MagicMock()
         ctx.request_context.lifespan_context = {"ads_client": MagicMock()}
         with pytest.raises(Exception):
-            gads_create_responsive_search_ad(
+            await gads_create_responsive_search_ad(
                 customer_id="1234567890",
                 ad_group_id="222",
                 headlines=["H1", "H2", "H3"],
@@ -273,11 +290,12 @@ class TestCreateResponsiveSearchAd:
                 ctx=ctx,
             )
 
-    def test_no_final_urls_raises(self):
+    @pytest.mark.asyncio
+    async def test_no_final_urls_raises(self):
         ctx = MagicMock()
         ctx.request_context.lifespan_context = {"ads_client": MagicMock()}
         with pytest.raises(Exception):
-            gads_create_responsive_search_ad(
+            await gads_create_responsive_search_ad(
                 customer_id="1234567890",
                 ad_group_id="222",
                 headlines=["H1", "H2", "H3"],
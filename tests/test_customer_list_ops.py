@@ -2,95 +2,90 @@
 
 import hashlib
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from google_ads_mcp.customer_match import build_user_data_request
 from google_ads_mcp.tools.mutations.customer_list_ops import (
-    _build_user_data_list,
-    _hash_value,
+    _user_identifiers,
     gads_remove_customer_list_members,
     gads_upload_customer_list,
 )
 
 
-class TestHashValue:
-    def test_basic_hash(self):
-        result = _hash_value("test@example.com")
-        expected = hashlib.sha256(b"test@example.com").hexdigest()
-        assert result == expected
+EMAIL_A = hashlib.sha256(b"test@a.com").hexdigest()
+EMAIL_B = hashlib.sha256(b"test@b.com").hexdigest()
 
-    def test_deterministic(self):
-        assert _hash_value("hello") == _hash_value("hello")
 
-    def test_different_inputs(self):
-        assert _hash_value("a") != _hash_value("b")
-
-
-class TestBuildUserDataList:
+class TestUserIdentifiers:
     def test_emails_only(self):
-        mock_client = MagicMock()
-        mock_client.client.get_type.return_value = MagicMock()
-
-        result = _build_user_data_list(
-            mock_client,
-            emails="test@a.com, test@b.com",
-            phones="",
-        )
-        assert len(result) == 2
+        result = _user_identifiers(emails="test@a.com, test@b.com", phones="")
+        assert result == [("hashed_email", EMAIL_A), ("hashed_email", EMAIL_B)]
 
     def test_phones_only(self):
-        mock_client = MagicMock()
-        mock_client.client.get_type.return_value = MagicMock()
-
-        result = _build_user_data_list(
-            mock_client,
-            emails="",
-            phones="+1234567890, +0987654321",
-        )
-        assert len(result) == 2
+        result = _user_identifiers(emails="", phones="+1234567890, +39 06 1234 5678")
+        assert [field for field, _ in result] == ["hashed_phone_number"] * 2
 
     def test_both_emails_and_phones(self):
-        mock_client = MagicMock()
-        mock_client.client.get_type.return_value = MagicMock()
-
-        result = _build_user_data_list(
-            mock_client,
-            emails="test@a.com",
-            phones="+1234567890",
-        )
-        assert len(result) == 2
+        result = _user_identifiers(emails="test@a.com", phones="+1234567890")
+        assert [field for field, _ in result] == ["hashed_email", "hashed_phone_number"]
 
     def test_empty_inputs(self):
-        mock_client = MagicMock()
-        result = _build_user_data_list(mock_client, emails="", phones="")
-        assert len(result) == 0
+        assert _user_identifiers(emails="", phones="") == []
 
     def test_whitespace_only_entries(self):
-        mock_client = MagicMock()
-        result = _build_user_data_list(
-            mock_client,
-            emails="  ,  ,  ",
-            phones="  ,  ",
+        assert _user_identifiers(emails="  ,  ,  ", phones="  ,  ") == []
+
+    def test_normalizes_and_dedupes(self):
+        result = _user_identifiers(
+            emails="John.Doe@Gmail.com, johndoe@gmail.com, not-an-email",
+            phones="",
         )
-        assert len(result) == 0
+        assert result == [
+            ("hashed_email", hashlib.sha256(b"johndoe@gmail.com").hexdigest())
+        ]
 
     def test_mixed_valid_and_empty(self):
-        mock_client = MagicMock()
-        mock_client.client.get_type.return_value = MagicMock()
+        result = _user_identifiers(emails="test@a.com, , test@b.com", phones="")
+        assert len(result) == 2
 
-        result = _build_user_data_list(
-            mock_client,
-            emails="test@a.com, , test@b.com",
-            phones="",
+
+class TestBuildUserDataRequest:
+    def test_one_operation_per_identifier(self):
+        raw = MagicMock()
+        raw.get_type.side_effect = lambda name: MagicMock()
+
+        request = build_user_data_request(
+            raw, "1234567890", "42",
+            _user_identifiers(emails="test@a.com", phones="+1234567890"),
         )
-        assert len(result) == 2
+        operations = [c.args[0] for c in request.operations.append.call_args_list]
+        assert len(operations) == 2
+        user_data = operations[0].create
+        identifier = user_data.user_identifiers.append.call_args.args[0]
+        assert identifier.hashed_email == EMAIL_A
+        assert request.customer_match_user_list_metadata.user_list == (
+            "customers/1234567890/userLists/42"
+        )
+
+    def test_remove_sets_remove_operations(self):
+        raw = MagicMock()
+        raw.get_type.side_effect = lambda name: MagicMock()
+
+        request = build_user_data_request(
+            raw, "1234567890", "42", [("hashed_email", EMAIL_A)], remove=True
+        )
+        operation = request.operations.append.call_args.args[0]
+        assert operation.remove.user_identifiers.append.called
 
 
 class TestGadsUploadCustomerList:
+    @pytest.mark.asyncio
     @patch("google_ads_mcp.tools.mutations.customer_list_ops.get_client")
-    def test_upload_emails(self, mock_get_client):
+    async def test_upload_emails(self, mock_get_client):
         mock_client = MagicMock()
+        mock_client.acall = AsyncMock(side_effect=lambda f, *a, **k: f(*a, **k))
         mock_service = MagicMock()
         mock_response = MagicMock()
         mock_response.received_operations_count = 2
@@ -100,7 +95,7 @@ class TestGadsUploadCustomerList:
         mock_client.client.get_type.return_value = MagicMock()
         mock_get_client.return_value = mock_client
 
-        result = gads_upload_customer_list(
+        result = await gads_upload_customer_list(
             customer_id="1234567890",
             user_list_id="555",
             emails="user1@test.com, user2@test.com",
@@ -110,9 +105,11 @@ class TestGadsUploadCustomerList:
         assert data["uploaded"] == 2
         assert data["received_operations_count"] == 2
 
+    @pytest.mark.asyncio
     @patch("google_ads_mcp.tools.mutations.customer_list_ops.get_client")
-    def test_upload_phones(self, mock_get_client):
+    async def test_upload_phones(self, mock_get_client):
         mock_client = MagicMock()
+        mock_client.acall = AsyncMock(side_effect=lambda f, *a, **k: f(*a, **k))
         mock_service = MagicMock()
         mock_response = MagicMock()
         mock_response.received_operations_count = 1
@@ -122,7 +119,7 @@ class TestGadsUploadCustomerList:
         mock_client.client.get_type.return_value = MagicMock()
         mock_get_client.return_value = mock_client
 
-        result = gads_upload_customer_list(
+        result = await gads_upload_customer_list(
             customer_id="1234567890",
             user_list_id="555",
             phones="+1234567890",
@@ -131,9 +128,11 @@ class TestGadsUploadCustomerList:
         data = json.loads(result)
         assert data["uploaded"] == 1
 
+    @pytest.mark.asyncio
     @patch("google_ads_mcp.tools.mutations.customer_list_ops.get_client")
-    def test_upload_emails_and_phones(self, mock_get_client):
+    async def test_upload_emails_and_phones(self, mock_get_client):
         mock_client = MagicMock()
+        mock_client.acall = AsyncMock(side_effect=lambda f, *a, **k: f(*a, **k))
         mock_service = MagicMock()
         mock_response = MagicMock()
         mock_response.received_operations_count = 3
@@ -143,7 +142,7 @@ class TestGadsUploadCustomerList:
         mock_client.client.get_type.return_value = MagicMock()
         mock_get_client.return_value = mock_client
 
-        result = gads_upload_customer_list(
+        result = await gads_upload_customer_list(
             customer_id="1234567890",
             user_list_id="555",
             emails="user1@test.com, user2@test.com",
@@ -153,9 +152,10 @@ class TestGadsUploadCustomerList:
         data = json.loads(result)
         assert data["uploaded"] == 3
 
-    def test_empty_input_validation(self):
+    @pytest.mark.asyncio
+    async def test_empty_input_validation(self):
         """Empty emails and phones should return error without calling API."""
-        result = gads_upload_customer_list(
+        result = await gads_upload_customer_list(
             customer_id="1234567890",
             user_list_id="555",
             emails="",
@@ -165,9 +165,11 @@ class TestGadsUploadCustomerList:
         data = json.loads(result)
         assert "error" in data
 
+    @pytest.mark.asyncio
     @patch("google_ads_mcp.tools.mutations.customer_list_ops.get_client")
-    def test_service_called_correctly(self, mock_get_client):
+    async def test_service_called_correctly(self, mock_get_client):
         mock_client = MagicMock()
+        mock_client.acall = AsyncMock(side_effect=lambda f, *a, **k: f(*a, **k))
         mock_service = MagicMock()
         mock_response = MagicMock()
         mock_response.received_operations_count = 1
@@ -177,7 +179,7 @@ class TestGadsUploadCustomerList:
         mock_client.client.get_type.return_value = MagicMock()
         mock_get_client.return_value = mock_client
 
-        gads_upload_customer_list(
+        await gads_upload_customer_list(
             customer_id="1234567890",
             user_list_id="555",
             emails="test@example.com",
@@ -187,20 +189,23 @@ class TestGadsUploadCustomerList:
         mock_client.get_service.assert_called_once_with("UserDataService")
         mock_service.upload_user_data.assert_called_once()
 
-    def test_invalid_customer_id(self):
+    @pytest.mark.asyncio
+    async def test_invalid_customer_id(self):
         """Invalid customer ID should raise ValueError."""
         with pytest.raises(ValueError):
-            gads_upload_customer_list(
+            await gads_upload_customer_list(
                 customer_id="bad",
                 user_list_id="555",
                 emails="test@example.com",
                 ctx=MagicMock(),
             )
 
+    @pytest.mark.asyncio
     @patch("google_ads_mcp.tools.mutations.customer_list_ops.get_client")
-    def test_response_without_received_operations_count(self, mock_get_client):
+    async def test_response_without_received_operations_count(self, mock_get_client):
         """Fallback when response lacks received_operations_count attribute."""
         mock_client = MagicMock()
+        mock_client.acall = AsyncMock(side_effect=lambda f, *a, **k: f(*a, **k))
         mock_service = MagicMock()
         mock_response = MagicMock(spec=[])  # Empty spec = no attributes
 
@@ -209,7 +214,7 @@ class TestGadsUploadCustomerList:
         mock_client.client.get_type.return_value = MagicMock()
         mock_get_client.return_value = mock_client
 
-        result = gads_upload_customer_list(
+        result = await gads_upload_customer_list(
             customer_id="1234567890",
             user_list_id="555",
             emails="test@example.com",
@@ -221,9 +226,11 @@ class TestGadsUploadCustomerList:
 
 
 class TestGadsRemoveCustomerListMembers:
+    @pytest.mark.asyncio
     @patch("google_ads_mcp.tools.mutations.customer_list_ops.get_client")
-    def test_remove_emails(self, mock_get_client):
+    async def test_remove_emails(self, mock_get_client):
         mock_client = MagicMock()
+        mock_client.acall = AsyncMock(side_effect=lambda f, *a, **k: f(*a, **k))
         mock_service = MagicMock()
         mock_response = MagicMock()
         mock_response.received_operations_count = 2
@@ -233,7 +240,7 @@ class TestGadsRemoveCustomerListMembers:
         mock_client.client.get_type.return_value = MagicMock()
         mock_get_client.return_value = mock_client
 
-        result = gads_remove_customer_list_members(
+        result = await gads_remove_customer_list_members(
             customer_id="1234567890",
             user_list_id="555",
             emails="user1@test.com, user2@test.com",
@@ -243,9 +250,11 @@ class TestGadsRemoveCustomerListMembers:
         assert data["removed"] == 2
         assert data["received_operations_count"] == 2
 
+    @pytest.mark.asyncio
     @patch("google_ads_mcp.tools.mutations.customer_list_ops.get_client")
-    def test_remove_phones(self, mock_get_client):
+    async def test_remove_phones(self, mock_get_client):
         mock_client = MagicMock()
+        mock_client.acall = AsyncMock(side_effect=lambda f, *a, **k: f(*a, **k))
         mock_service = MagicMock()
         mock_response = MagicMock()
         mock_response.received_operations_count = 1
@@ -255,7 +264,7 @@ class TestGadsRemoveCustomerListMembers:
         mock_client.client.get_type.return_value = MagicMock()
         mock_get_client.return_value = mock_client
 
-        result = gads_remove_customer_list_members(
+        result = await gads_remove_customer_list_members(
             customer_id="1234567890",
             user_list_id="555",
             phones="+9876543210",
@@ -264,9 +273,10 @@ class TestGadsRemoveCustomerListMembers:
         data = json.loads(result)
         assert data["removed"] == 1
 
-    def test_empty_input_validation(self):
+    @pytest.mark.asyncio
+    async def test_empty_input_validation(self):
         """Empty emails and phones should return error."""
-        result = gads_remove_customer_list_members(
+        result = await gads_remove_customer_list_members(
             customer_id="1234567890",
             user_list_id="555",
             emails="",
@@ -276,20 +286,23 @@ class TestGadsRemoveCustomerListMembers:
         data = json.loads(result)
         assert "error" in data
 
-    def test_invalid_customer_id(self):
+    @pytest.mark.asyncio
+    async def test_invalid_customer_id(self):
         """Invalid customer ID should raise ValueError."""
         with pytest.raises(ValueError):
-            gads_remove_customer_list_members(
+            await gads_remove_customer_list_members(
                 customer_id="invalid",
                 user_list_id="555",
                 emails="test@example.com",
                 ctx=MagicMock(),
             )
 
+    @pytest.mark.asyncio
     @patch("google_ads_mcp.tools.mutations.customer_list_ops.get_client")
-    def test_uses_remove_operation(self, mock_get_client):
+    async def test_uses_remove_operation(self, mock_get_client):
         """Verify remove operation is used (not create)."""
         mock_client = MagicMock()
+        mock_client.acall = AsyncMock(side_effect=lambda f, *a, **k: f(*a, **k))
         mock_service = MagicMock()
         mock_response = MagicMock()
         mock_response.received_operations_count = 1
@@ -301,7 +314,7 @@ class TestGadsRemoveCustomerListMembers:
         mock_client.client.get_type.return_value = mock_op
         mock_get_client.return_value = mock_client
 
-        gads_remove_customer_list_members(
+        await gads_remove_customer_list_members(
             customer_id="1234567890",
             user_list_id="555",
             emails="test@example.com",
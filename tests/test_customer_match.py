@@ -0,0 +1,206 @@
+"""Tests for streaming Customer Match uploads from CSV files."""
+
+import enum
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
+from google_ads_mcp.customer_match import upload_customer_match_file
+from google_ads_mcp.enums import enum_name
+from google_ads_mcp.hashing import hash_identifier
+from google_ads_mcp.tools.mutations.customer_list_ops import (
+    gads_upload_customer_list_file,
+)
+
+CID = "1234567890"
+JOB = f"customers/{CID}/offlineUserDataJobs/42"
+
+
+class FakeFailure:
+    @classmethod
+    def deserialize(cls, value):
+        return SimpleNamespace(errors=value)
+
+
+def _error(index, message):
+    return SimpleNamespace(
+        message=message,
+        location=SimpleNamespace(field_path_elements=[SimpleNamespace(index=index)]),
+    )
+
+
+class FakeOfflineUserDataJobService:
+    """Records uploaded chunks; ``rejected`` maps chunk number to errors."""
+
+    def __init__(self, rejected=None):
+        self.jobs = []
+        self.chunks = []
+        self.started = []
+        self.rejected = rejected or {}
+
+    def create_offline_user_data_job(self, customer_id, job):
+        self.jobs.append(job)
+        return SimpleNamespace(resource_name=JOB)
+
+    def add_offline_user_data_job_operations(self, request):
+        self.chunks.append(list(request.operations))
+        errors = self.rejected.get(len(self.chunks) - 1)
+        details = [SimpleNamespace(value=errors)] if errors else []
+        return SimpleNamespace(partial_failure_error=SimpleNamespace(details=details))
+
+    def run_offline_user_data_job(self, resource_name):
+        self.started.append(resource_name)
+
+
+class OfflineUserDataJobType(enum.IntEnum):
+    STORE_SALES_UPLOAD_FIRST_PARTY = 2
+    STORE_SALES_UPLOAD_THIRD_PARTY = 3
+    CUSTOMER_MATCH_USER_LIST = 4
+    CUSTOMER_MATCH_WITH_ATTRIBUTES = 5
+
+
+def _wrapper(service):
+    raw = MagicMock()
+    raw.get_service.return_value = service
+    raw.enums.OfflineUserDataJobTypeEnum = OfflineUserDataJobType
+
+    def get_type(name):
+        if name == "GoogleAdsFailure":
+            return FakeFailure()
+        if name in ("AddOfflineUserDataJobOperationsRequest", "UserData"):
+            return SimpleNamespace(operations=[], user_identifiers=[])
+        if name in ("UserIdentifier", "OfflineUserDataJobOperation"):
+            return SimpleNamespace()
+        return MagicMock()
+
+    raw.get_type.side_effect = get_type
+    return AsyncGoogleAdsClientWrapper(raw)
+
+
+def _csv(tmp_path, text):
+    path = tmp_path / "members.csv"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+class TestUpload:
+    @pytest.mark.asyncio
+    async def test_chunks_hashes_and_runs_job(self, tmp_path):
+        rows = "".join(f"User{i}@Example.com,\n" for i in range(5))
+        path = _csv(tmp_path, "Email,Phone\n" + rows + ",\n,+391234567\n")
+        service = FakeOfflineUserDataJobService()
+        progress = []
+
+        async def on_progress(upload):
+            progress.append(upload.members)
+
+        result = await upload_customer_match_file(
+            _wrapper(service), CID, "9", path,
+            chunk_size=2, max_concurrency=1, on_progress=on_progress,
+        )
+        assert [len(chunk) for chunk in service.chunks] == [2, 2, 2]
+        first = service.chunks[0][0].create.user_identifiers
+        assert first[0].hashed_email == hash_identifier("user0@example.com")
+        last = service.chunks[2][1].create.user_identifiers
+        assert last[0].hashed_phone_number == hash_identifier("+391234567")
+        assert enum_name(service.jobs[0].type_) == "CUSTOMER_MATCH_USER_LIST"
+        assert service.jobs[0].customer_match_user_list_metadata.user_list == (
+            f"customers/{CID}/userLists/9"
+        )
+        assert service.started == [JOB]
+        assert result.rows == 7
+        assert result.members == 6
+        assert result.skipped_rows == 1
+        assert progress == [2, 4, 6]
+
+    @pytest.mark.asyncio
+    async def test_failures_reported_by_csv_line(self, tmp_path):
+        rows = "".join(f"u{i}@example.com\n" for i in range(4))
+        path = _csv(tmp_path, "email\n" + rows)
+        service = FakeOfflineUserDataJobService(
+            rejected={1: [_error(1, "Invalid email"), _error(1, "again")]}
+        )
+        result = await upload_customer_match_file(
+            _wrapper(service), CID, "9", path, chunk_size=2, max_concurrency=1
+        )
+        assert result.failed == 1
+        (failure,) = result.failures
+        assert failure.index == 5  # header is line 1
+        assert failure.error == "Invalid email; again"
+
+    @pytest.mark.asyncio
+    async def test_dedupes_and_skips_invalid(self, tmp_path):
+        digest = hash_identifier("ab@gmail.com")
+        path = _csv(
+            tmp_path,
+            f"email\na.b@gmail.com\nAB@gmail.com\n{digest.upper()}\nnot-an-email\n",
+        )
+        service = FakeOfflineUserDataJobService()
+        result = await upload_customer_match_file(_wrapper(service), CID, "9", path)
+        (chunk,) = service.chunks
+        assert [op.create.user_identifiers[0].hashed_email for op in chunk] == [digest]
+        assert result.duplicate_rows == 2
+        assert result.skipped_rows == 1
+
+    @pytest.mark.asyncio
+    async def test_remove_members(self, tmp_path):
+        path = _csv(tmp_path, "email\na@example.com\n")
+        service = FakeOfflineUserDataJobService()
+        await upload_customer_match_file(_wrapper(service), CID, "9", path, remove=True)
+        assert service.chunks[0][0].remove.user_identifiers
+
+    @pytest.mark.asyncio
+    async def test_missing_columns_rejected_before_job(self, tmp_path):
+        path = _csv(tmp_path, "name\nMario\n")
+        service = FakeOfflineUserDataJobService()
+        with pytest.raises(ValueError, match="email and/or phone column"):
+            await upload_customer_match_file(_wrapper(service), CID, "9", path)
+        assert service.jobs == []
+
+    @pytest.mark.asyncio
+    async def test_empty_file_does_not_run_job(self, tmp_path):
+        path = _csv(tmp_path, "email\n")
+        service = FakeOfflineUserDataJobService()
+        result = await upload_customer_match_file(_wrapper(service), CID, "9", path)
+        assert result.members == 0
+        assert service.started == []
+
+
+class TestTool:
+    @staticmethod
+    def _ctx(client):
+        ctx = MagicMock()
+        ctx.request_context.lifespan_context = {"ads_client": client}
+        return ctx
+
+    @pytest.mark.asyncio
+    async def test_returns_summary(self, tmp_path):
+        path = _csv(tmp_path, "email\na@example.com\nb@example.com\n")
+        service = FakeOfflineUserDataJobService()
+        result = json.loads(await gads_upload_customer_list_file(
+            customer_id="123-456-7890", user_list_id="9", file_path=path,
+            ctx=self._ctx(_wrapper(service)),
+        ))
+        assert result["job_resource_name"] == JOB
+        assert result["members"] == 2
+        assert result["action"] == "add"
+
+    @pytest.mark.asyncio
+    async def test_missing_file(self, tmp_path):
+        result = json.loads(await gads_upload_customer_list_file(
+            customer_id=CID, user_list_id="9", file_path=str(tmp_path / "nope.csv"),
+            ctx=self._ctx(_wrapper(FakeOfflineUserDataJobService())),
+        ))
+        assert "File not found" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_bad_columns(self, tmp_path):
+        path = _csv(tmp_path, "name\nMario\n")
+        result = json.loads(await gads_upload_customer_list_file(
+            customer_id=CID, user_list_id="9", file_path=path,
+            ctx=self._ctx(_wrapper(FakeOfflineUserDataJobService())),
+        ))
+        assert "email and/or phone column" in result["error"]
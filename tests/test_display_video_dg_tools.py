@@ -1,7 +1,7 @@
 """Tests for display, video, and demand gen ad tools."""
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from google_ads_mcp.tools.mutations.creation_ops import (
     gads_create_responsive_display_ad,
     gads_create_demand_gen_ad,
@@ -13,6 +13,7 @@ from google_ads_mcp.tools.mutations.video_ops import gads_create_video_ad
 def mock_ctx():
     ctx = MagicMock()
     wrapper = MagicMock()
+    wrapper.amutate = AsyncMock()
     wrapper.client = MagicMock()
     response = MagicMock()
     response.mutate_operation_responses = [
@@ -20,14 +21,15 @@ def mock_ctx():
             resource_name="customers/1234567890/adGroupAds/222~777"
         )),
     ]
-    wrapper.mutate.return_value = response
+    wrapper.amutate.return_value = response
     ctx.request_context.lifespan_context = {"ads_client": wrapper}
     return ctx
 
 
 class TestCreateResponsiveDisplayAd:
-    def test_creates_ad(self, mock_ctx):
-        result = gads_create_responsive_display_ad(
+    @pytest.mark.asyncio
+    async def test_creates_ad(self, mock_ctx):
+        result = await gads_create_responsive_display_ad(
             customer_id="1234567890",
             ad_group_id="222",
             marketing_image_asset_ids=["100"],
@@ -39,11 +41,12 @@ class TestCreateResponsiveDisplayAd:
             ctx=mock_ctx,
         )
         wrapper = mock_ctx.request_context.lifespan_context["ads_client"]
-        wrapper.mutate.assert_called_once()
+        wrapper.amutate.assert_awaited_once()
         assert "777" in result or "222~777" in result
 
-    def test_with_logos(self, mock_ctx):
-        result = gads_create_responsive_display_ad(
+    @pytest.mark.asyncio
+    async def test_with_logos(self, mock_ctx):
+        result = await gads_create_responsive_display_ad(
             customer_id="1234567890",
             ad_group_id="222",
             marketing_image_asset_ids=["100"],
@@ -60,8 +63,9 @@ class TestCreateResponsiveDisplayAd:
 
 
 class TestCreateVideoAd:
-    def test_in_stream(self, mock_ctx):
-        result = gads_create_video_ad(
+    @pytest.mark.asyncio
+    async def test_in_stream(self, mock_ctx):
+        result = await gads_create_video_ad(
             customer_id="1234567890",
             ad_group_id="222",
             video_asset_id="vid_001",
@@ -71,11 +75,12 @@ class TestCreateVideoAd:
             ctx=mock_ctx,
         )
         wrapper = mock_ctx.request_context.lifespan_context["ads_client"]
-        wrapper.mutate.assert_called_once()
+        wrapper.amutate.assert_awaited_once()
         assert "IN_STREAM_SKIPPABLE" in result
 
-    def test_bumper(self, mock_ctx):
-        result = gads_create_video_ad(
+    @pytest.mark.asyncio
+    async def test_bumper(self, mock_ctx):
+        result = await gads_create_video_ad(
             customer_id="1234567890",
             ad_group_id="222",
             video_asset_id="vid_002",
@@ -84,8 +89,9 @@ class TestCreateVideoAd:
         )
         assert "BUMPER" in result
 
-    def test_video_responsive(self, mock_ctx):
-        result = gads_create_video_ad(
+    @pytest.mark.asyncio
+    async def test_video_responsive(self, mock_ctx):
+        result = await gads_create_video_ad(
             customer_id="1234567890",
             ad_group_id="222",
             video_asset_id="vid_003",
@@ -99,8 +105,9 @@ class TestCreateVideoAd:
 
 
 class TestCreateDemandGenAd:
-    def test_creates_ad(self, mock_ctx):
-        result = gads_create_demand_gen_ad(
+    @pytest.mark.asyncio
+    async def test_creates_ad(self, mock_ctx):
+        result = await gads_create_demand_gen_ad(
             customer_id="1234567890",
             ad_group_id="222",
             headlines=["Discover More"],
@@ -112,11 +119,12 @@ class TestCreateDemandGenAd:
             ctx=mock_ctx,
         )
         wrapper = mock_ctx.request_context.lifespan_context["ads_client"]
-        wrapper.mutate.assert_called_once()
+        wrapper.amutate.assert_awaited_once()
         assert "Demand Gen" in result or "demand_gen" in result.lower() or "222" in result
 
-    def test_with_cta(self, mock_ctx):
-        result = gads_create_demand_gen_ad(
+    @pytest.mark.asyncio
+    async def test_with_cta(self, mock_ctx):
+        result = await gads_create_demand_gen_ad(
             customer_id="1234567890",
             ad_group_id="222",
             headlines=["H1"],
@@ -0,0 +1,96 @@
+"""Tests for the shared enum name registry."""
+
+import enum
+
+import proto
+import pytest
+
+from google_ads_mcp.builders.operations import MATCH_TYPE_TO_ENUM, STATUS_TO_ENUM
+from google_ads_mcp.enums import (
+    AD_GROUP_TYPE,
+    ADVERTISING_CHANNEL_TYPE,
+    ASSET_TYPE,
+    CAMPAIGN_STATUS,
+    KEYWORD_MATCH_TYPE,
+    LISTING_GROUP_FILTER_TYPE,
+    EnumTable,
+    enum_name,
+    field_enum_names,
+    names_for,
+)
+
+__protobuf__ = proto.module(package="google_ads_mcp.tests.enums")
+
+
+class CampaignStatus(enum.IntEnum):
+    ENABLED = 2
+    PAUSED = 3
+
+
+class Level(proto.Enum):
+    UNSPECIFIED = 0
+    LOW = 2
+    HIGH = 4
+
+
+class Metrics(proto.Message):
+    competition = proto.Field(Level, number=1)
+    clicks = proto.Field(proto.INT64, number=2)
+
+
+@pytest.mark.parametrize("value, name", [
+    (CampaignStatus.PAUSED, "PAUSED"),
+    (Level.HIGH, "HIGH"),
+    ("CampaignStatus.ENABLED", "ENABLED"),
+    ("ENABLED", "ENABLED"),
+    (None, ""),
+])
+def test_enum_name(value, name):
+    assert enum_name(value) == name
+
+
+def test_int_decoded_with_table():
+    assert enum_name(3, CAMPAIGN_STATUS) == "PAUSED"
+    assert enum_name(3, "CampaignStatus") == "PAUSED"
+    assert enum_name(1, CAMPAIGN_STATUS) == "UNKNOWN"
+    assert enum_name(99, CAMPAIGN_STATUS) == "99"
+    assert enum_name(3) == "3"
+
+
+def test_names_for_is_cached():
+    names = names_for(Level)
+    assert names == {0: "UNSPECIFIED", 2: "LOW", 4: "HIGH"}
+    assert names_for(Level) is names
+    assert names_for(object()) == {}
+
+
+def test_field_enum_names_from_descriptor():
+    raw = Metrics.pb(Metrics(competition=Level.LOW))
+    names = field_enum_names(raw, "competition")
+    assert names[raw.competition] == "LOW"
+    assert names is names_for(Metrics.pb().DESCRIPTOR.fields_by_name["competition"].enum_type)
+    assert field_enum_names(raw, "clicks") == {}
+
+
+def test_builder_maps_share_numbers():
+    assert STATUS_TO_ENUM["pause"] == CAMPAIGN_STATUS["PAUSED"]
+    assert MATCH_TYPE_TO_ENUM == {"exact": 2, "phrase": 3, "broad": 4}
+    assert KEYWORD_MATCH_TYPE.names[MATCH_TYPE_TO_ENUM["broad"]] == "BROAD"
+    table = EnumTable("TestOnlyEnum", {"ON": 2})
+    assert table["ON"] == 2
+    assert names_for("TestOnlyEnum") == {0: "UNSPECIFIED", 1: "UNKNOWN", 2: "ON"}
+
+
+def test_library_tables_match_the_protos():
+    assert ADVERTISING_CHANNEL_TYPE["PERFORMANCE_MAX"] == 10
+    assert ADVERTISING_CHANNEL_TYPE["DEMAND_GEN"] == 14
+    assert AD_GROUP_TYPE["VIDEO_RESPONSIVE"] == 16
+    assert "SHOPPING_PRODUCT" not in AD_GROUP_TYPE.numbers
+    assert (ASSET_TYPE["IMAGE"], ASSET_TYPE["TEXT"]) == (4, 5)
+    assert ASSET_TYPE["CALL_TO_ACTION"] == 18
+    assert LISTING_GROUP_FILTER_TYPE["SUBDIVISION"] == 2
+    # Names cover every member, not only the settable ones.
+    assert names_for("AdvertisingChannelType")[10] == "PERFORMANCE_MAX"
+    assert enum_name(5, "AdvertisingChannelType") == "HOTEL"
+    with pytest.raises(KeyError):
+        EnumTable.from_library("AdGroupType", ("SHOPPING_PRODUCT",))
@@ -1,12 +1,19 @@
 """Tests for response formatting utilities."""
 
 import json
+from collections import namedtuple
+from datetime import date
+from decimal import Decimal
+
 import pytest
+from google_ads_mcp.utils import formatting
 from google_ads_mcp.utils.formatting import (
     micros_to_currency,
     format_percentage,
     format_response,
     format_table_markdown,
+    to_json,
+    wants_json,
 )
 
 
@@ -61,6 +68,54 @@ class TestFormatResponse:
         assert json.loads(result) == data
 
 
+    def test_compact_format(self):
+        data = {"key": "valore è"}
+        assert format_response(data, response_format="compact") == '{"key":"valore è"}'
+
+
+Row = namedtuple("Row", "name cost_micros")
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(formatting, "orjson", None)
+    return request.param
+
+
+class TestToJson:
+    DATA = {
+        "rows": [Row("Città", 1_500_000)],
+        "amount": Decimal("12.50"),
+        "count": Decimal("3"),
+        "day": date(2026, 1, 31),
+        7: "int key",
+    }
+    EXPECTED = {
+        "rows": [["Città", 1_500_000]],
+        "amount": 12.5,
+        "count": 3,
+        "day": "2026-01-31",
+        "7": "int key",
+    }
+
+    def test_indented(self, json_backend):
+        result = to_json(self.DATA)
+        assert json.loads(result) == self.EXPECTED
+        assert result == json.dumps(self.EXPECTED, indent=2, ensure_ascii=False)
+
+    def test_compact(self, json_backend):
+        result = to_json(self.DATA, "compact")
+        assert "\n" not in result and ", " not in result
+        assert json.loads(result) == self.EXPECTED
+
+    def test_wants_json(self):
+        assert wants_json("json") and wants_json("compact")
+        assert not wants_json("markdown")
+
+
 class TestFormatTableMarkdown:
     def test_basic_table(self):
         rows = [
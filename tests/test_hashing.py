@@ -0,0 +1,130 @@
+"""Tests for Customer Match identifier normalization and hashing."""
+
+import hashlib
+import threading
+
+import pytest
+
+from google_ads_mcp import hashing
+from google_ads_mcp.customer_match import DEFAULT_CHUNK_SIZE
+from google_ads_mcp.hashing import (
+    IdentifierHasher,
+    hash_batch,
+    hasher_from_env,
+    normalize_email,
+    normalize_phone,
+    unique_digests,
+)
+
+
+def _sha(value):
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+class TestNormalizeEmail:
+    def test_lowercases_and_strips(self):
+        assert normalize_email("  Mario.Rossi@Example.COM ") == "mario.rossi@example.com"
+
+    def test_gmail_dots_removed(self):
+        assert normalize_email("Mario.Rossi@gmail.com") == "mariorossi@gmail.com"
+        assert normalize_email("m.r@googlemail.com") == "mr@googlemail.com"
+
+    def test_invalid(self):
+        assert normalize_email("mario") is None
+        assert normalize_email("@example.com") is None
+        assert normalize_email("mario@localhost") is None
+
+
+class TestNormalizePhone:
+    def test_formatting_removed(self):
+        assert normalize_phone("+1 (800) 555-0100") == "+18005550100"
+
+    def test_double_zero_prefix(self):
+        assert normalize_phone("0039 06 1234 5678") == "+390612345678"
+
+    def test_default_country_code(self):
+        assert normalize_phone("020 7946 0958", "44") == "+442079460958"
+        assert normalize_phone("06 1234 5678", "+39") == "+390612345678"
+
+    def test_without_country_code_assumes_international(self):
+        assert normalize_phone("18005550100") == "+18005550100"
+
+    def test_invalid(self):
+        assert normalize_phone("12345") is None
+        assert normalize_phone("+0123456789") is None
+        assert normalize_phone("call me") is None
+
+
+class TestHashBatch:
+    def test_normalizes_before_hashing(self):
+        assert hash_batch("email", ["A.B@Gmail.com"]) == [_sha("ab@gmail.com")]
+        assert hash_batch("phone", ["+39 333 123 4567"]) == [_sha("+393331234567")]
+
+    def test_keeps_existing_digests(self):
+        digest = _sha("x@example.com")
+        assert hash_batch("email", [digest.upper()]) == [digest]
+
+    def test_invalid_are_none(self):
+        assert hash_batch("email", ["", "nope", "a@b.it"]) == [None, None, _sha("a@b.it")]
+
+    def test_unique_digests(self):
+        assert unique_digests(["b", None, "a", "b"]) == ["b", "a"]
+
+
+class TestIdentifierHasher:
+    def test_small_input_runs_inline(self):
+        hasher = IdentifierHasher(workers=4)
+        assert hasher.hash("email", ["a@b.it"]) == [_sha("a@b.it")]
+        assert hasher._pool is None
+
+    def test_process_pool_preserves_order(self):
+        hasher = IdentifierHasher(workers=2, batch_size=3, min_parallel=1)
+        values = [f"user{i}@example.com" for i in range(10)]
+        try:
+            assert hasher.hash("email", values) == [_sha(v) for v in values]
+        finally:
+            hasher.close()
+
+    @pytest.mark.asyncio
+    async def test_async_process_pool(self):
+        hasher = IdentifierHasher(workers=2, batch_size=2, min_parallel=1)
+        values = ["+39 333 000 0001", "bad", "+39 333 000 0002"]
+        try:
+            assert await hasher.ahash("phone", values) == [
+                _sha("+393330000001"), None, _sha("+393330000002"),
+            ]
+        finally:
+            hasher.close()
+
+    @pytest.mark.asyncio
+    async def test_async_small_input_runs_in_thread(self, monkeypatch):
+        threads = []
+
+        def recording_hash_batch(*args):
+            threads.append(threading.current_thread())
+            return hash_batch(*args)
+
+        monkeypatch.setattr(hashing, "hash_batch", recording_hash_batch)
+        hasher = IdentifierHasher(workers=4)
+        assert await hasher.ahash("email", ["a@b.it"]) == [_sha("a@b.it")]
+        assert hasher._pool is None
+        assert threads and threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_default_chunk_uses_pool(self):
+        hasher = IdentifierHasher(workers=2)
+        values = [f"user{i}@example.com" for i in range(DEFAULT_CHUNK_SIZE)]
+        try:
+            digests = await hasher.ahash("email", values)
+            assert hasher._pool is not None
+            assert digests[-1] == _sha(values[-1])
+        finally:
+            hasher.close()
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("GOOGLE_ADS_HASH_WORKERS", "3")
+        monkeypatch.setenv("GOOGLE_ADS_HASH_BATCH_SIZE", "500")
+        monkeypatch.setenv("GOOGLE_ADS_PHONE_COUNTRY_CODE", "+39")
+        hasher = hasher_from_env()
+        assert (hasher.workers, hasher.batch_size) == (3, 500)
+        assert hasher.default_country_code == "39"
@@ -0,0 +1,314 @@
+"""Tests for the closed-day history cache."""
+
+import pickle
+import re
+import sqlite3
+from datetime import date, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
+from google_ads_mcp.history import HistoryCache, history_from_env, parse_daily_report
+from google_ads_mcp.tools._helpers import fetch_report_page
+
+TODAY = date(2024, 3, 31)
+
+QUERY = (
+    "SELECT campaign.id, campaign.name, "
+    "metrics.impressions, metrics.clicks, metrics.cost_micros, metrics.ctr "
+    "FROM campaign "
+    "WHERE segments.date BETWEEN '2024-03-01' AND '2024-03-31' "
+    "AND campaign.status = 'ENABLED' "
+    "ORDER BY metrics.cost_micros DESC"
+)
+
+
+class PickleCodec:
+    def dumps(self, row):
+        return pickle.dumps(row)
+
+    def loads(self, data):
+        return pickle.loads(data)
+
+
+def _row(cid, day, impressions, clicks, cost):
+    return SimpleNamespace(
+        campaign=SimpleNamespace(
+            id=cid, name=f"Campaign {cid}", resource_name=f"customers/1/campaigns/{cid}"
+        ),
+        segments=SimpleNamespace(date=day),
+        metrics=SimpleNamespace(
+            impressions=impressions, clicks=clicks, cost_micros=cost, ctr=0.0
+        ),
+    )
+
+
+class FakeClient:
+    """Returns one row per campaign per day for the queried range.
+
+    Queries without a date range list the campaigns in ``enabled``.
+    """
+
+    def __init__(self):
+        self.queries = []
+        self.entity_queries = []
+        self.bypassed = []
+        self.enabled = {"1", "2"}
+
+    def query(self, customer_id, query, bypass_cache=False):
+        if "BETWEEN" not in query:
+            self.entity_queries.append(query)
+            return [
+                SimpleNamespace(campaign=SimpleNamespace(
+                    resource_name=f"customers/1/campaigns/{cid}"
+                ))
+                for cid in sorted(self.enabled)
+            ]
+        self.queries.append(query)
+        self.bypassed.append(bypass_cache)
+        start, end = re.search(r"BETWEEN '([\d-]+)' AND '([\d-]+)'", query).groups()
+        day = date.fromisoformat(start)
+        rows = []
+        while day <= date.fromisoformat(end):
+            rows.append(_row("1", day.isoformat(), 100, 10, 1_000_000))
+            rows.append(_row("2", day.isoformat(), 50, 1, 3_000_000))
+            day += timedelta(days=1)
+        return rows
+
+
+@pytest.fixture
+def history(tmp_path):
+    cache = HistoryCache(
+        str(tmp_path / "history.sqlite"), PickleCodec(), lag_days=3, today=lambda: TODAY
+    )
+    yield cache
+    cache.close()
+
+
+class TestParseDailyReport:
+    def test_rewrites_to_daily_query(self):
+        report = parse_daily_report(QUERY)
+        assert report.start == date(2024, 3, 1)
+        assert report.end == date(2024, 3, 31)
+        daily = report.query_for(date(2024, 3, 1), date(2024, 3, 2))
+        assert daily.startswith("select segments.date, campaign.id")
+        assert "'2024-03-01' AND '2024-03-02'" in daily
+        assert "order by" not in daily
+        assert "'ENABLED'" not in daily
+        assert report.filters == "campaign.status = 'ENABLED'"
+        assert report.entity_query == (
+            "select campaign.resource_name from campaign "
+            "where campaign.status = 'ENABLED'"
+        )
+
+    def test_segment_conditions_stay_in_daily_query(self):
+        report = parse_daily_report(
+            "SELECT campaign.id, metrics.clicks FROM campaign "
+            "WHERE campaign.name = 'A AND B' AND segments.device = 'MOBILE' "
+            "AND segments.date BETWEEN '2024-01-01' AND '2024-01-31'"
+        )
+        assert "segments.device = 'MOBILE'" in report.template
+        assert report.filters == "campaign.name = 'A AND B'"
+
+    def test_fingerprint_ignores_attribute_filters(self):
+        other = QUERY.replace("'ENABLED'", "'PAUSED'")
+        assert parse_daily_report(other).fingerprint == parse_daily_report(QUERY).fingerprint
+
+    def test_ratio_inputs_added(self):
+        report = parse_daily_report(
+            "SELECT campaign.id, metrics.conversions_from_interactions_rate "
+            "FROM campaign WHERE segments.date BETWEEN '2024-01-01' AND '2024-01-31'"
+        )
+        assert report.additive == ("conversions", "interactions")
+        assert "metrics.interactions" in report.template
+
+    def test_fingerprint_ignores_dates(self):
+        other = QUERY.replace("'2024-03-01'", "'2024-01-01'")
+        assert parse_daily_report(other).fingerprint == parse_daily_report(QUERY).fingerprint
+
+    @pytest.mark.parametrize("query", [
+        "SELECT campaign.id, metrics.clicks FROM campaign",
+        "SELECT segments.date, metrics.clicks FROM campaign "
+        "WHERE segments.date BETWEEN '2024-01-01' AND '2024-01-31'",
+        "SELECT campaign.id, metrics.search_impression_share FROM campaign "
+        "WHERE segments.date BETWEEN '2024-01-01' AND '2024-01-31'",
+        "SELECT campaign.id, metrics.clicks FROM campaign "
+        "WHERE segments.date BETWEEN '2024-01-01' AND '2024-01-31' LIMIT 5",
+        "SELECT campaign.id, metrics.clicks FROM campaign "
+        "WHERE segments.date BETWEEN '2024-01-01' AND '2024-01-31' "
+        "AND metrics.clicks > 10",
+    ])
+    def test_unsupported(self, query):
+        assert parse_daily_report(query) is None
+
+
+class TestHistoryCache:
+    def test_aggregates_and_orders(self, history):
+        client = FakeClient()
+        rows = history.query(client, "1234567890", QUERY)
+        assert [r.campaign.id for r in rows] == ["2", "1"]
+        first = rows[1]
+        assert first.metrics.impressions == 3100
+        assert first.metrics.clicks == 310
+        assert first.metrics.ctr == pytest.approx(0.1)
+
+    def test_only_open_tail_requeried(self, history):
+        client = FakeClient()
+        history.query(client, "1234567890", QUERY)
+        assert len(client.queries) == 2
+
+        client.queries.clear()
+        rows = history.query(client, "1234567890", QUERY)
+        assert len(client.queries) == 1
+        assert "'2024-03-29' AND '2024-03-31'" in client.queries[0]
+        assert sum(r.metrics.impressions for r in rows) == 31 * 150
+
+    def test_only_missing_span_fetched(self, history):
+        client = FakeClient()
+        history.query(client, "1234567890", QUERY)
+        client.queries.clear()
+
+        wider = QUERY.replace("'2024-03-01'", "'2024-02-20'")
+        history.query(client, "1234567890", wider)
+        assert "'2024-02-20' AND '2024-02-29'" in client.queries[0]
+        assert len(client.queries) == 2
+
+    def test_store_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "history.sqlite")
+        first = HistoryCache(path, PickleCodec(), today=lambda: TODAY)
+        first.query(FakeClient(), "1234567890", QUERY)
+        first.close()
+
+        client = FakeClient()
+        second = HistoryCache(path, PickleCodec(), today=lambda: TODAY)
+        second.query(client, "1234567890", QUERY)
+        second.close()
+        assert len(client.queries) == 1
+
+    def test_attribute_filters_applied_at_read_time(self, history):
+        client = FakeClient()
+        history.query(client, "1234567890", QUERY)
+        client.enabled = {"1"}
+        client.queries.clear()
+
+        rows = history.query(client, "1234567890", QUERY)
+        assert [r.campaign.id for r in rows] == ["1"]
+        assert rows[0].metrics.impressions == 3100
+        assert len(client.queries) == 1
+        assert len(client.entity_queries) == 2
+
+    def test_expired_days_refetched(self, tmp_path):
+        now = [1_000_000.0]
+        history = HistoryCache(
+            str(tmp_path / "history.sqlite"), PickleCodec(), lag_days=3,
+            ttl_days=7, today=lambda: TODAY, clock=lambda: now[0],
+        )
+        client = FakeClient()
+        history.query(client, "1234567890", QUERY)
+        client.queries.clear()
+
+        now[0] += 6 * 86400
+        history.query(client, "1234567890", QUERY)
+        assert len(client.queries) == 1
+
+        now[0] += 2 * 86400
+        history.query(client, "1234567890", QUERY)
+        assert "'2024-03-01' AND '2024-03-28'" in client.queries[1]
+        history.close()
+
+    def test_refresh_bypasses_store_and_cache(self, history):
+        client = FakeClient()
+        history.query(client, "1234567890", QUERY)
+        client.queries.clear()
+        client.bypassed.clear()
+
+        history.query(client, "1234567890", QUERY, refresh=True)
+        assert "'2024-03-01' AND '2024-03-28'" in client.queries[0]
+        assert client.bypassed == [True, True]
+
+    def test_store_without_fetch_times_is_migrated(self, tmp_path):
+        path = tmp_path / "history.sqlite"
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE history_days (customer_id TEXT NOT NULL, "
+            "template TEXT NOT NULL, day TEXT NOT NULL, "
+            "PRIMARY KEY (customer_id, template, day))"
+        )
+        conn.commit()
+        conn.close()
+
+        history = HistoryCache(str(path), PickleCodec(), lag_days=3, today=lambda: TODAY)
+        client = FakeClient()
+        history.query(client, "1234567890", QUERY)
+        history.close()
+        assert len(client.queries) == 2
+
+    def test_unsupported_query_rejected(self, history):
+        with pytest.raises(ValueError, match="not supported"):
+            history.query(FakeClient(), "1234567890", "SELECT campaign.id FROM campaign")
+
+    def test_customers_are_isolated(self, history):
+        client = FakeClient()
+        history.query(client, "1111111111", QUERY)
+        client.queries.clear()
+        history.query(client, "2222222222", QUERY)
+        assert len(client.queries) == 2
+
+
+class TestHistoryFromEnv:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("GOOGLE_ADS_HISTORY_DB", raising=False)
+        assert history_from_env(PickleCodec()) is None
+
+    def test_enabled_with_path(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("GOOGLE_ADS_HISTORY_DB", str(tmp_path / "h.sqlite"))
+        monkeypatch.delenv("GOOGLE_ADS_HISTORY_LAG_DAYS", raising=False)
+        monkeypatch.setenv("GOOGLE_ADS_HISTORY_TTL_DAYS", "0")
+        history = history_from_env(PickleCodec())
+        assert history.lag_days == 30
+        assert history.ttl_days == 0
+
+
+class TestFetchReportPage:
+    @pytest.mark.asyncio
+    async def test_uses_history_and_paginates(self, history):
+        fake = FakeClient()
+        client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        client.history = history
+        client.arun.side_effect = lambda func, *args: func(fake, *args[1:])
+
+        rows, info = await fetch_report_page(client, "1234567890", QUERY, limit=1)
+        assert [r.campaign.id for r in rows] == ["2"]
+        assert info.total == 2
+        assert info.next_cursor
+
+        rows, info = await fetch_report_page(
+            client, "1234567890", QUERY, limit=1, cursor=info.next_cursor
+        )
+        assert [r.campaign.id for r in rows] == ["1"]
+        assert info.offset == 1
+        assert info.has_more is False
+        client.aquery_page.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bypass_cache_refreshes_history(self, history):
+        client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        client.history = history
+        client.arun.return_value = []
+
+        await fetch_report_page(client, "1234567890", QUERY, limit=5, bypass_cache=True)
+        client.arun.assert_called_once_with(
+            history.query, client, "1234567890", QUERY, True
+        )
+
+    @pytest.mark.asyncio
+    async def test_falls_back_without_history(self):
+        client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        client.aquery_page.return_value = MagicMock(
+            rows=[], has_more=False, skipped=0
+        )
+        rows, info = await fetch_report_page(client, "1234567890", QUERY, limit=5)
+        assert rows == []
+        client.aquery_page.assert_called_once()
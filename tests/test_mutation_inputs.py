@@ -116,13 +116,22 @@ class TestAddNegativeKeywordsInput:
         )
         assert inp.level == NegativeKeywordLevel.AD_GROUP
 
-    def test_max_20_keywords(self):
-        with pytest.raises(ValidationError, match="at most 20"):
+    def test_bulk_keywords_accepted(self):
+        inp = AddNegativeKeywordsInput(
+            customer_id="1234567890",
+            level="campaign",
+            campaign_id="111",
+            keywords=[f"kw{i}" for i in range(50_000)],
+        )
+        assert len(inp.keywords) == 50_000
+
+    def test_max_50000_keywords(self):
+        with pytest.raises(ValidationError, match="at most 50000"):
             AddNegativeKeywordsInput(
                 customer_id="1234567890",
                 level="campaign",
                 campaign_id="111",
-                keywords=[f"kw{i}" for i in range(21)],
+                keywords=[f"kw{i}" for i in range(50_001)],
             )
 
     def test_empty_keywords_rejected(self):
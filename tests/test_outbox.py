@@ -0,0 +1,232 @@
+"""Tests for the durable upload outbox and its background worker."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
+from google_ads_mcp.conversions import ClickConversionInput, upload_click_conversions_file
+from google_ads_mcp.outbox import Outbox, drain_outbox, run_outbox_worker
+from google_ads_mcp.tools.mutations.customer_list_ops import gads_upload_customer_list
+from google_ads_mcp.tools.outbox import gads_outbox_status
+from google_ads_mcp.utils.errors import (
+    GoogleAdsMCPError,
+    QuotaExhaustedError,
+    TransientError,
+)
+
+CID = "1234567890"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _conversion(click_id="g1"):
+    return ClickConversionInput(
+        line=2,
+        conversion_action_id="456",
+        click_id_field="gclid",
+        click_id=click_id,
+        conversion_date_time="2026-01-15 12:00:00+00:00",
+        conversion_value=10.0,
+        currency_code="EUR",
+    )
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def outbox(tmp_path, clock):
+    box = Outbox(str(tmp_path / "outbox.sqlite"), max_attempts=3, base_delay=10, clock=clock)
+    yield box
+    box.close()
+
+
+class FakeServices:
+    """ConversionUploadService and UserDataService failing as scripted."""
+
+    def __init__(self, outcomes=()):
+        self.outcomes = list(outcomes)
+        self.conversion_requests = []
+        self.user_data_requests = []
+
+    def _next(self):
+        outcome = self.outcomes.pop(0) if self.outcomes else None
+        if isinstance(outcome, Exception):
+            raise outcome
+        return SimpleNamespace(
+            partial_failure_error=None, received_operations_count=1, results=[]
+        )
+
+    def upload_click_conversions(self, request):
+        self.conversion_requests.append(request)
+        return self._next()
+
+    def upload_user_data(self, request):
+        self.user_data_requests.append(request)
+        return self._next()
+
+
+def _wrapper(services):
+    raw = MagicMock()
+    raw.get_service.return_value = services
+
+    def get_type(name):
+        if name in ("UploadClickConversionsRequest", "UploadUserDataRequest"):
+            return SimpleNamespace(conversions=[], operations=[])
+        if name == "UserData":
+            return SimpleNamespace(user_identifiers=[])
+        return SimpleNamespace()
+
+    raw.get_type.side_effect = get_type
+    return AsyncGoogleAdsClientWrapper(raw, max_retries=0)
+
+
+class TestOutbox:
+    def test_same_chunk_stored_once(self, outbox):
+        first = outbox.enqueue_click_conversions(CID, [_conversion()], "boom")
+        second = outbox.enqueue_click_conversions(CID, [_conversion()], "boom again")
+        assert first == second
+        assert outbox.counts()["pending"] == {"entries": 1, "items": 1}
+
+    def test_due_after_base_delay(self, outbox, clock):
+        outbox.enqueue_user_data(CID, "9", [("hashed_email", "ab" * 32)])
+        assert outbox.due() == []
+        clock.now += 10
+        (entry,) = outbox.due()
+        assert entry.payload["identifiers"] == [["hashed_email", "ab" * 32]]
+
+    def test_backoff_then_failed(self, outbox, clock):
+        key = outbox.enqueue_click_conversions(CID, [_conversion()])
+        clock.now += 10
+        entry = outbox.get(key)
+        assert outbox.mark_retry(entry, "still down")
+        clock.now += 19
+        assert outbox.due() == []
+        clock.now += 1
+        entry = outbox.get(key)
+        assert entry.attempts == 1
+        assert outbox.mark_retry(entry, "still down")
+        assert not outbox.mark_retry(outbox.get(key), "still down")
+        assert outbox.get(key).status == "failed"
+
+    def test_purge_done(self, outbox, clock):
+        key = outbox.enqueue_click_conversions(CID, [_conversion()])
+        outbox.mark_done(outbox.get(key))
+        assert outbox.purge_done(older_than=60) == 0
+        clock.now += 61
+        assert outbox.purge_done(older_than=60) == 1
+
+
+class TestDrain:
+    @pytest.mark.asyncio
+    async def test_outcomes(self, outbox, clock):
+        delivered = outbox.enqueue_click_conversions(CID, [_conversion("a")])
+        retried = outbox.enqueue_click_conversions(CID, [_conversion("b")])
+        failed = outbox.enqueue_user_data(CID, "9", [("hashed_email", "cd" * 32)])
+        clock.now += 10
+        services = FakeServices([
+            None,
+            TransientError("server down"),
+            GoogleAdsMCPError("user list not found"),
+        ])
+        assert await drain_outbox(_wrapper(services), outbox) == 3
+
+        assert outbox.get(delivered).status == "done"
+        assert outbox.get(retried).status == "pending"
+        assert outbox.get(retried).last_error == "server down"
+        assert outbox.get(failed).status == "failed"
+        resent = services.conversion_requests[0].conversions[0]
+        assert resent.gclid == "a"
+        assert resent.conversion_action == f"customers/{CID}/conversionActions/456"
+
+    @pytest.mark.asyncio
+    async def test_worker_sleeps_when_idle(self, outbox):
+        sleeps = []
+
+        async def sleep(seconds):
+            sleeps.append(seconds)
+            raise asyncio.CancelledError
+
+        with pytest.raises(asyncio.CancelledError):
+            await run_outbox_worker(_wrapper(FakeServices()), outbox, 5, sleep=sleep)
+        assert sleeps == [5]
+
+
+class TestQueueing:
+    @staticmethod
+    def _ctx(client, outbox):
+        ctx = MagicMock()
+        ctx.request_context.lifespan_context = {"ads_client": client, "outbox": outbox}
+        return ctx
+
+    @pytest.mark.asyncio
+    async def test_customer_list_queued_on_transient_error(self, outbox):
+        services = FakeServices([QuotaExhaustedError("Quota esaurita")])
+        result = json.loads(await gads_upload_customer_list(
+            customer_id=CID, user_list_id="9", emails="a@example.com",
+            ctx=self._ctx(_wrapper(services), outbox),
+        ))
+        assert result["queued_for_retry"] == 1
+        entry = outbox.get(result["idempotency_key"])
+        assert entry.kind == "user_data"
+        assert "a@example.com" not in json.dumps(entry.payload)
+
+    @pytest.mark.asyncio
+    async def test_customer_list_permanent_error_raises(self, outbox):
+        services = FakeServices([GoogleAdsMCPError("invalid list")])
+        with pytest.raises(GoogleAdsMCPError):
+            await gads_upload_customer_list(
+                customer_id=CID, user_list_id="9", emails="a@example.com",
+                ctx=self._ctx(_wrapper(services), outbox),
+            )
+        assert outbox.counts()["pending"]["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_conversion_file_batches_queued(self, outbox, tmp_path):
+        path = tmp_path / "conv.ndjson"
+        path.write_text("".join(
+            json.dumps({"gclid": f"g{i}", "datetime": "2026-01-15 12:00:00+00:00"}) + "\n"
+            for i in range(3)
+        ))
+        services = FakeServices([None, TransientError("server down")])
+        result = await upload_click_conversions_file(
+            _wrapper(services), CID, str(path), "456",
+            batch_size=2, max_concurrency=1, outbox=outbox,
+        )
+        assert (result.succeeded, result.queued, result.failed) == (2, 1, 0)
+        assert outbox.counts()["pending"] == {"entries": 1, "items": 1}
+
+
+class TestStatusTool:
+    @pytest.mark.asyncio
+    async def test_counts_and_entries(self, outbox):
+        key = outbox.enqueue_click_conversions(CID, [_conversion()], "server down")
+        outbox.mark_failed(outbox.get(key), "invalid gclid")
+        outbox.enqueue_user_data(CID, "9", [("hashed_email", "ef" * 32)], error="quota")
+        ctx = TestQueueing._ctx(_wrapper(FakeServices()), outbox)
+
+        markdown = await gads_outbox_status(ctx=ctx)
+        assert "invalid gclid" in markdown
+        assert "### Pending" in markdown
+
+        data = json.loads(await gads_outbox_status(response_format="json", ctx=ctx))
+        assert data["counts"]["failed"] == {"entries": 1, "items": 1}
+        assert data["counts"]["pending"]["entries"] == 1
+        assert data["entries"]["pending"][0]["kind"] == "user_data"
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        ctx = TestQueueing._ctx(_wrapper(FakeServices()), None)
+        assert "disabled" in await gads_outbox_status(ctx=ctx)
@@ -1,7 +1,13 @@
 """Tests for pagination utilities."""
 
 import pytest
-from google_ads_mcp.utils.pagination import paginate_results, PaginationInfo
+from google_ads_mcp.utils.errors import InvalidInputError
+from google_ads_mcp.utils.pagination import (
+    PaginationInfo,
+    decode_cursor,
+    encode_cursor,
+    paginate_results,
+)
 
 
 class TestPaginateResults:
@@ -40,6 +46,40 @@ class TestPaginateResults:
         assert info.count == 0
 
 
+class TestPaginateIterator:
+    def test_lookahead_sets_has_more(self):
+        consumed = []
+
+        def stream():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        result, info = paginate_results(stream(), limit=10, offset=5)
+        assert result == list(range(5, 15))
+        assert info.has_more is True
+        assert info.total is None
+        # offset + limit + one lookahead row, nothing more
+        assert len(consumed) == 16
+
+    def test_exhausted_stream_reports_total(self):
+        result, info = paginate_results(iter(range(12)), limit=10, offset=10)
+        assert result == [10, 11]
+        assert info.total == 12
+        assert info.has_more is False
+
+    def test_offset_beyond_end(self):
+        result, info = paginate_results(iter(range(5)), limit=10, offset=100)
+        assert result == []
+        assert info.total == 5
+
+    def test_total_label(self):
+        _, info = paginate_results(iter(range(100)), limit=10, offset=20)
+        assert info.total_label == "31+"
+        _, info = paginate_results(list(range(100)), limit=10, offset=20)
+        assert info.total_label == "100"
+
+
 class TestPaginationInfo:
     def test_to_dict(self):
         info = PaginationInfo(total=100, count=10, offset=0, limit=10, has_more=True)
@@ -47,3 +87,35 @@ class TestPaginationInfo:
         assert d["total"] == 100
         assert d["count"] == 10
         assert d["has_more"] is True
+
+
+class TestCursor:
+    QUERY = "SELECT campaign.id FROM campaign"
+
+    def test_round_trip(self):
+        cursor = encode_cursor(self.QUERY, "tok", position=7, offset=57)
+        decoded = decode_cursor(cursor, self.QUERY)
+        assert decoded.page_token == "tok"
+        assert decoded.position == 7
+        assert decoded.offset == 57
+
+    def test_whitespace_insensitive(self):
+        cursor = encode_cursor(self.QUERY, "", position=3, offset=3)
+        decoded = decode_cursor(cursor, "SELECT  campaign.id\n  FROM campaign")
+        assert decoded.offset == 3
+
+    def test_other_query_rejected(self):
+        cursor = encode_cursor(self.QUERY, "tok", position=0, offset=10)
+        with pytest.raises(InvalidInputError, match="different query") as exc:
+            decode_cursor(cursor, self.QUERY + " WHERE campaign.status = 'PAUSED'")
+        assert exc.value.field == "cursor"
+
+    def test_malformed_rejected(self):
+        with pytest.raises(InvalidInputError, match="Invalid cursor"):
+            decode_cursor("not-a-cursor!", self.QUERY)
+
+    def test_to_dict_includes_next_cursor(self):
+        info = PaginationInfo(
+            total=None, count=1, offset=0, limit=1, has_more=True, next_cursor="abc"
+        )
+        assert info.to_dict()["next_cursor"] == "abc"
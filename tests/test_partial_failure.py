@@ -0,0 +1,167 @@
+"""Tests for partial-failure decoding."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from google_ads_mcp.partial_failure import decode_partial_failure, operation_errors
+from google_ads_mcp.tools.mutations.asset_ops import gads_add_asset_group_assets
+from google_ads_mcp.tools.mutations.targeting_ops import gads_set_location_targeting
+
+
+class ProtoPlusFailure:
+    @classmethod
+    def deserialize(cls, value):
+        return SimpleNamespace(errors=value)
+
+
+class RawFailure:
+    @classmethod
+    def FromString(cls, value):
+        return SimpleNamespace(errors=value)
+
+
+def _error(message, *indexes):
+    return SimpleNamespace(
+        message=message,
+        location=SimpleNamespace(field_path_elements=[
+            SimpleNamespace(field_name="mutate_operations", index=i) for i in indexes
+        ]),
+    )
+
+
+class RawElement:
+    """Raw protobuf FieldPathElement: unset ``index`` reads as 0."""
+
+    def __init__(self, index=None):
+        self.field_name = "operations"
+        self.index = index or 0
+        self._set = index is not None
+
+    def HasField(self, name):
+        return name == "index" and self._set
+
+
+class ProtoPlusElement(RawElement):
+    """proto-plus FieldPathElement: presence through ``in``."""
+
+    HasField = None
+
+    def __contains__(self, name):
+        return name == "index" and self._set
+
+
+def _element_error(message, element):
+    return SimpleNamespace(
+        message=message,
+        location=SimpleNamespace(field_path_elements=[element]),
+    )
+
+
+def _response(*errors):
+    return SimpleNamespace(partial_failure_error=SimpleNamespace(
+        code=3, details=[SimpleNamespace(value=list(errors))]
+    ))
+
+
+def _client(failure_type=ProtoPlusFailure):
+    client = MagicMock()
+    client.get_type.side_effect = lambda name: (
+        failure_type() if name == "GoogleAdsFailure" else MagicMock()
+    )
+    return client
+
+
+class TestOperationErrors:
+    def test_no_partial_failure(self):
+        ok = SimpleNamespace(partial_failure_error=SimpleNamespace(code=0, details=[]))
+        assert operation_errors(_client(), ok) == {}
+        assert operation_errors(_client(), SimpleNamespace()) == {}
+
+    def test_maps_first_path_index(self):
+        response = _response(_error("bad", 2, 0), _error("worse", 5))
+        assert operation_errors(_client(), response) == {2: "bad", 5: "worse"}
+
+    def test_joins_errors_of_same_operation(self):
+        response = _response(_error("too long", 1), _error("policy", 1))
+        assert operation_errors(_client(), response) == {1: "too long; policy"}
+
+    def test_raw_protobuf_failure(self):
+        response = _response(_error("bad", 0))
+        assert operation_errors(_client(RawFailure), response) == {0: "bad"}
+
+    def test_error_without_location(self):
+        response = _response(_error("whole request"))
+        assert operation_errors(_client(), response) == {None: "whole request"}
+
+    def test_unset_index_is_not_operation_zero(self):
+        for element_type in (RawElement, ProtoPlusElement):
+            response = _response(
+                _element_error("first", element_type(0)),
+                _element_error("whole request", element_type()),
+            )
+            assert operation_errors(_client(), response) == {
+                0: "first", None: "whole request",
+            }
+
+
+class TestDecodePartialFailure:
+    def test_splits_items(self):
+        items = ["a", "b", "c", "d"]
+        response = _response(_error("bad b", 1), _error("bad d", 3))
+        report = decode_partial_failure(_client(), response, items)
+        assert report.succeeded == ["a", "c"]
+        assert report.failed_items == ["b", "d"]
+        assert report.failed_indexes == [1, 3]
+        assert report.failures[0].error == "bad b"
+        assert report.errors == []
+
+    def test_unindexed_errors_kept_apart(self):
+        report = decode_partial_failure(
+            _client(), _response(_error("general"), _error("out of range", 9)), ["a"]
+        )
+        assert report.succeeded == ["a"]
+        assert report.errors == ["general", "out of range"]
+
+    def test_to_dict(self):
+        report = decode_partial_failure(_client(), _response(_error("x", 0)), ["a", "b"])
+        assert report.to_dict() == {
+            "succeeded": 1,
+            "failed": 1,
+            "failures": [{"index": 0, "item": "a", "error": "x"}],
+            "errors": [],
+        }
+
+
+class TestToolsReportFailures:
+    @staticmethod
+    def _ctx(response):
+        ctx = MagicMock()
+        wrapper = MagicMock()
+        wrapper.client = _client()
+        wrapper.amutate = AsyncMock(return_value=response)
+        ctx.request_context.lifespan_context = {"ads_client": wrapper}
+        return ctx
+
+    @pytest.mark.asyncio
+    async def test_location_targeting(self):
+        ctx = self._ctx(_response(_error("Invalid geo target", 1)))
+        result = await gads_set_location_targeting(
+            customer_id="1234567890", campaign_id="111",
+            location_ids=[2380, 9999999, 2826], ctx=ctx,
+        )
+        assert result.startswith("2 location(s) targeted in campaign 111.")
+        assert "1 location(s) rejected:" in result
+        assert "- 9999999: Invalid geo target" in result
+
+    @pytest.mark.asyncio
+    async def test_asset_group_assets(self):
+        ctx = self._ctx(_response(_error("Wrong aspect ratio", 0)))
+        result = await gads_add_asset_group_assets(
+            customer_id="1234567890", asset_group_id="55",
+            asset_ids=["1", "2"], field_types=["MARKETING_IMAGE", "HEADLINE"],
+            ctx=ctx,
+        )
+        assert result.startswith("1 asset(s) linked to asset group 55.")
+        assert "- 1 (MARKETING_IMAGE): Wrong aspect ratio" in result
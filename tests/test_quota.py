@@ -0,0 +1,144 @@
+"""Tests for the proactive rate limiter and quota accounting."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from google_ads_mcp.quota import DEVELOPER_TOKEN, QuotaLimiter, TokenBucket
+from google_ads_mcp.utils.errors import QuotaExhaustedError
+
+PACIFIC = ZoneInfo("America/Los_Angeles")
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _wall(*args):
+    return datetime(*args, tzinfo=PACIFIC).timestamp()
+
+
+def _limiter(**kwargs):
+    clock = FakeClock()
+    wall = FakeClock(_wall(2024, 1, 10, 12, 0))
+    return QuotaLimiter(clock=clock, wall_clock=wall, **kwargs), clock, wall
+
+
+def _account(limiter, key):
+    return next(a for a in limiter.status()["accounts"] if a["key"] == key)
+
+
+class TestTokenBucket:
+    def test_burst_then_paced(self):
+        bucket = TokenBucket(rate=2, burst=2)
+        assert bucket.schedule(0.0) == 0.0
+        assert bucket.schedule(0.0) == 0.0
+        assert bucket.schedule(0.0) == pytest.approx(0.5)
+        assert bucket.schedule(0.0) == pytest.approx(1.0)
+
+    def test_refills_over_time(self):
+        bucket = TokenBucket(rate=1, burst=1)
+        bucket.schedule(0.0)
+        assert bucket.schedule(5.0) == 5.0
+
+    def test_peek_does_not_book(self):
+        bucket = TokenBucket(rate=1, burst=1)
+        bucket.schedule(0.0)
+        assert bucket.schedule(0.0, commit=False) == pytest.approx(1.0)
+        assert bucket.backlog(0.0) == pytest.approx(1.0)
+
+
+class TestQuotaLimiter:
+    def test_waiting_callers_are_served_in_arrival_order(self):
+        limiter, _, _ = _limiter(ops_per_second=1)
+        delays = [limiter.reserve("1111111111").delay for _ in range(3)]
+        assert delays == pytest.approx([0.0, 1.0, 2.0])
+        assert _account(limiter, DEVELOPER_TOKEN)["throttled"] == 2
+
+    def test_customer_limit_is_independent(self):
+        limiter, _, _ = _limiter(customer_ops_per_second=1)
+        assert limiter.reserve("1111111111").delay == 0.0
+        assert limiter.reserve("2222222222").delay == 0.0
+        assert limiter.reserve("1111111111").delay == pytest.approx(1.0)
+
+    def test_daily_budget_rejects_without_booking(self):
+        limiter, _, _ = _limiter(customer_daily_operations=5)
+        limiter.reserve("1111111111", cost=4)
+        with pytest.raises(QuotaExhaustedError, match="daily budget of 5") as exc_info:
+            limiter.reserve("1111111111", cost=2)
+        # Noon Pacific: twelve hours until the quota day resets.
+        assert exc_info.value.retry_after_seconds == 12 * 3600
+        account = _account(limiter, "1111111111")
+        assert account["used_today"] == 4
+        assert account["remaining_today"] == 1
+        assert account["rejected"] == 1
+        limiter.reserve("2222222222", cost=5)
+
+    def test_daily_counters_reset_at_pacific_midnight(self):
+        limiter, _, wall = _limiter(daily_operations=3)
+        limiter.reserve(None, cost=3)
+        with pytest.raises(QuotaExhaustedError):
+            limiter.reserve(None)
+        wall.now = _wall(2024, 1, 11, 0, 1)
+        limiter.reserve(None)
+        assert _account(limiter, DEVELOPER_TOKEN)["used_today"] == 1
+
+    def test_wait_above_max_wait_is_rejected(self):
+        limiter, clock, _ = _limiter(ops_per_second=1, max_wait=1.5)
+        limiter.reserve(None)
+        assert limiter.reserve(None).delay == pytest.approx(1.0)
+        with pytest.raises(QuotaExhaustedError, match="local queue full"):
+            limiter.reserve(None)
+        clock.now = 10.0
+        assert limiter.reserve(None).delay == 0.0
+
+    def test_mutate_operations_take_one_rate_slot(self):
+        limiter, _, _ = _limiter(ops_per_second=10, daily_operations=20_000)
+        assert limiter.reserve("1111111111", cost=5000).delay == 0.0
+        assert limiter.reserve("1111111111", cost=5000).delay == 0.0
+        assert _account(limiter, DEVELOPER_TOKEN)["used_today"] == 10_000
+        with pytest.raises(QuotaExhaustedError):
+            limiter.reserve("1111111111", cost=10_001)
+
+    def test_no_limits_only_counts(self):
+        limiter, _, _ = _limiter()
+        for _ in range(100):
+            assert limiter.reserve("1111111111").delay == 0.0
+        assert _account(limiter, "1111111111")["used_today"] == 100
+        assert _account(limiter, DEVELOPER_TOKEN)["ops_per_second"] == 0
+
+    def test_acquire_sleeps_for_its_turn(self):
+        limiter, _, _ = _limiter(ops_per_second=1)
+        with patch("google_ads_mcp.quota.time.sleep") as sleep:
+            limiter.acquire("1111111111")
+            limiter.acquire("1111111111")
+        sleep.assert_called_once_with(pytest.approx(1.0))
+
+    @pytest.mark.asyncio
+    async def test_aacquire_awaits_and_tracks_waiting(self):
+        limiter, _, _ = _limiter(ops_per_second=1)
+        limiter.reserve("1111111111")
+        seen = []
+
+        async def fake_sleep(delay):
+            seen.append((delay, _account(limiter, "1111111111")["waiting"]))
+
+        with patch("google_ads_mcp.quota.asyncio.sleep", new=AsyncMock(side_effect=fake_sleep)):
+            await limiter.aacquire("1111111111")
+        assert seen == [(pytest.approx(1.0), 1)]
+        assert _account(limiter, "1111111111")["waiting"] == 0
+
+    @pytest.mark.asyncio
+    async def test_real_concurrent_acquire_is_paced(self):
+        limiter = QuotaLimiter(ops_per_second=50, burst=1)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*(limiter.aacquire("1111111111") for _ in range(5)))
+        assert loop.time() - start >= 0.07
@@ -0,0 +1,88 @@
+"""Tests for the retry policy and server retry-delay parsing."""
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from google_ads_mcp.retry import RetryPolicy, parse_retry_delay
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _upper(low, high):
+    return high
+
+
+def _failure(*delays):
+    return SimpleNamespace(errors=[
+        SimpleNamespace(
+            details=SimpleNamespace(
+                quota_error_details=SimpleNamespace(retry_delay=delay)
+            )
+        )
+        for delay in delays
+    ])
+
+
+class TestRetryPolicy:
+    def test_decorrelated_jitter_grows_and_caps(self):
+        policy = RetryPolicy(max_retries=5, base_delay=1.0, max_delay=10.0, rng=_upper)
+        state = policy.start()
+        assert [state.next_delay() for _ in range(4)] == [3.0, 9.0, 10.0, 10.0]
+
+    def test_delays_stay_within_jitter_bounds(self):
+        policy = RetryPolicy(max_retries=50, base_delay=0.5, max_delay=8.0)
+        state = policy.start()
+        previous = 0.5
+        for _ in range(50):
+            delay = state.next_delay()
+            assert 0.5 <= delay <= min(8.0, previous * 3)
+            previous = max(delay, 0.5)
+
+    def test_stops_after_max_retries(self):
+        state = RetryPolicy(max_retries=2, rng=_upper).start()
+        assert state.next_delay() is not None
+        assert state.next_delay() is not None
+        assert state.next_delay() is None
+        assert state.attempts == 3
+
+    def test_server_delay_is_honored(self):
+        policy = RetryPolicy(base_delay=1.0, rng=lambda low, high: low)
+        assert policy.start().next_delay(retry_after=7.0) == 7.0
+
+    def test_deadline_bounds_total_time(self):
+        clock = FakeClock()
+        policy = RetryPolicy(max_retries=10, deadline=20.0, rng=_upper, clock=clock)
+        state = policy.start()
+        assert state.next_delay(retry_after=5.0) == 6.0
+        clock.now = 15.0
+        assert state.next_delay(retry_after=5.0) is None
+
+    def test_zero_deadline_disables_it(self):
+        policy = RetryPolicy(deadline=0, rng=_upper)
+        assert policy.start().next_delay(retry_after=3600.0) == 3601.0
+
+
+class TestParseRetryDelay:
+    def test_timedelta(self):
+        assert parse_retry_delay(_failure(timedelta(seconds=30))) == 30.0
+
+    def test_duration_message(self):
+        duration = SimpleNamespace(seconds=2, nanos=500_000_000)
+        assert parse_retry_delay(_failure(duration)) == 2.5
+
+    def test_largest_delay_wins(self):
+        failure = _failure(timedelta(seconds=5), timedelta(seconds=12))
+        assert parse_retry_delay(failure) == 12.0
+
+    def test_missing_delay(self):
+        assert parse_retry_delay(_failure(None)) is None
+        assert parse_retry_delay(SimpleNamespace(errors=[SimpleNamespace()])) is None
+        assert parse_retry_delay(None) is None
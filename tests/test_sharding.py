@@ -0,0 +1,184 @@
+"""Tests for date-range sharding of long report queries."""
+
+import asyncio
+import re
+import threading
+from datetime import date, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
+from google_ads_mcp.history import HistoryCache
+from google_ads_mcp.sharding import parse_shard_size, shard_ranges
+from google_ads_mcp.tools._helpers import fetch_report_page
+from google_ads_mcp.utils.errors import InvalidInputError
+from tests.test_history import PickleCodec
+
+QUERY = (
+    "SELECT campaign.id, campaign.name, "
+    "metrics.clicks, metrics.impressions, metrics.ctr "
+    "FROM campaign "
+    "WHERE segments.date BETWEEN '2024-01-01' AND '2024-03-31' "
+    "ORDER BY metrics.clicks DESC"
+)
+
+
+def _range(query):
+    start, end = re.search(r"BETWEEN '([\d-]+)' AND '([\d-]+)'", query).groups()
+    return date.fromisoformat(start), date.fromisoformat(end)
+
+
+def _campaign(cid, name, days, clicks_per_day, impressions_per_day):
+    return SimpleNamespace(
+        campaign=SimpleNamespace(
+            id=cid, name=name, resource_name=f"customers/1/campaigns/{cid}"
+        ),
+        metrics=SimpleNamespace(
+            clicks=clicks_per_day * days,
+            impressions=impressions_per_day * days,
+            ctr=0.0,
+        ),
+    )
+
+
+class ShardedWrapper(AsyncGoogleAdsClientWrapper):
+    """Wrapper whose aquery answers range queries from a fake dataset."""
+
+    def __init__(self, **kwargs):
+        super().__init__(MagicMock(), **kwargs)
+        self.queries = []
+        self.active = 0
+        self.peak = 0
+
+    async def aquery(self, customer_id, query, page_size=10000, max_rows=None,
+                     bypass_cache=False, protobuf=False):
+        self.queries.append(query)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        start, end = _range(query)
+        days = (end - start).days + 1
+        name = f"Campaign 1 ({end.isoformat()})"
+        return [_campaign("1", name, days, 10, 100), _campaign("2", "Campaign 2", days, 1, 50)]
+
+
+class TestShardRanges:
+    def test_month_cuts_at_calendar_months(self):
+        spans = shard_ranges(date(2024, 1, 15), date(2024, 3, 10), "month")
+        assert spans == [
+            (date(2024, 1, 15), date(2024, 1, 31)),
+            (date(2024, 2, 1), date(2024, 2, 29)),
+            (date(2024, 3, 1), date(2024, 3, 10)),
+        ]
+
+    def test_week_cuts_at_mondays(self):
+        # 2024-01-03 is a Wednesday.
+        spans = shard_ranges(date(2024, 1, 3), date(2024, 1, 16), "week")
+        assert spans == [
+            (date(2024, 1, 3), date(2024, 1, 7)),
+            (date(2024, 1, 8), date(2024, 1, 14)),
+            (date(2024, 1, 15), date(2024, 1, 16)),
+        ]
+
+    def test_fixed_days_cover_range_without_overlap(self):
+        start, end = date(2024, 1, 1), date(2024, 12, 31)
+        spans = shard_ranges(start, end, 30)
+        assert spans[0][0] == start and spans[-1][1] == end
+        for (_, last), (first, _) in zip(spans, spans[1:]):
+            assert first == last + timedelta(days=1)
+        assert len(spans) == 13
+
+    def test_parse_shard_size(self):
+        assert parse_shard_size("Month") == "month"
+        assert parse_shard_size("14") == 14
+        assert parse_shard_size("") is None
+        with pytest.raises(InvalidInputError, match="Invalid shard size"):
+            parse_shard_size("fortnight")
+
+
+class TestAquerySharded:
+    @pytest.mark.asyncio
+    async def test_merges_shards_by_entity(self):
+        wrapper = ShardedWrapper(shard_size="month", shard_concurrency=2)
+        try:
+            rows = await wrapper.aquery_sharded("1234567890", QUERY)
+        finally:
+            wrapper.close()
+
+        assert len(wrapper.queries) == 3
+        assert all("segments.date" not in q.split(" from ")[0] for q in wrapper.queries)
+        assert wrapper.peak == 2
+        assert [r.campaign.id for r in rows] == ["1", "2"]
+        top = rows[0]
+        assert top.metrics.clicks == 910
+        assert top.metrics.impressions == 9100
+        assert top.metrics.ctr == pytest.approx(0.1)
+        # Attributes come from the most recent shard.
+        assert top.campaign.name == "Campaign 1 (2024-03-31)"
+
+    @pytest.mark.asyncio
+    async def test_single_shard_runs_plain_query(self):
+        wrapper = ShardedWrapper(shard_size="month")
+        short = QUERY.replace("'2024-03-31'", "'2024-01-20'")
+        try:
+            await wrapper.aquery_sharded("1234567890", short)
+        finally:
+            wrapper.close()
+        assert wrapper.queries == [short]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_shards_cut_wall_clock(self):
+        year = QUERY.replace("'2024-03-31'", "'2024-12-31'")
+        loop = asyncio.get_running_loop()
+        timings = {}
+        for concurrency in (1, 12):
+            wrapper = ShardedWrapper(shard_size="month", shard_concurrency=concurrency)
+            start = loop.time()
+            try:
+                await wrapper.aquery_sharded("1234567890", year)
+            finally:
+                wrapper.close()
+            timings[concurrency] = loop.time() - start
+        assert timings[12] * 3 < timings[1]
+
+    @pytest.mark.asyncio
+    async def test_fetch_report_page_uses_shards(self):
+        wrapper = ShardedWrapper(shard_size="month")
+        try:
+            rows, info = await fetch_report_page(wrapper, "1234567890", QUERY, limit=1)
+        finally:
+            wrapper.close()
+        assert [r.campaign.id for r in rows] == ["1"]
+        assert info.total == 2
+        assert info.next_cursor
+
+
+class TestHistoryShardedFill:
+    def test_first_fill_fetches_shards_concurrently(self, tmp_path):
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0, "queries": []}
+        barrier = threading.Barrier(3, timeout=5)
+
+        def query(customer_id, query, bypass_cache=False):
+            with lock:
+                state["queries"].append(query)
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            barrier.wait()
+            with lock:
+                state["active"] -= 1
+            return []
+
+        client = SimpleNamespace(query=query, shard_size="month", shard_concurrency=3)
+        history = HistoryCache(
+            str(tmp_path / "h.sqlite"), PickleCodec(), today=lambda: date(2024, 6, 30)
+        )
+        try:
+            history.query(client, "1234567890", QUERY)
+        finally:
+            history.close()
+        assert len(state["queries"]) == 3
+        assert state["peak"] == 3
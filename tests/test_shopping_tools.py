@@ -1,7 +1,7 @@
 """Tests for shopping tools."""
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from google_ads_mcp.tools.mutations.shopping_ops import (
     gads_set_listing_group_filter,
     gads_link_merchant_center,
@@ -12,6 +12,7 @@ from google_ads_mcp.tools.mutations.shopping_ops import (
 def mock_ctx():
     ctx = MagicMock()
     wrapper = MagicMock()
+    wrapper.amutate = AsyncMock()
     wrapper.client = MagicMock()
     response = MagicMock()
     response.mutate_operation_responses = [
@@ -21,7 +22,7 @@ def mock_ctx():
             )
         ),
     ]
-    wrapper.mutate.return_value = response
+    wrapper.amutate.return_value = response
     ctx.request_context.lifespan_context = {"ads_client": wrapper}
     return ctx
 
@@ -30,15 +31,17 @@ def mock_ctx():
 def mock_ctx_campaign():
     ctx = MagicMock()
     wrapper = MagicMock()
+    wrapper.amutate = AsyncMock()
     wrapper.client = MagicMock()
-    wrapper.mutate.return_value = MagicMock(mutate_operation_responses=[MagicMock()])
+    wrapper.amutate.return_value = MagicMock(mutate_operation_responses=[MagicMock()])
     ctx.request_context.lifespan_context = {"ads_client": wrapper}
     return ctx
 
 
 class TestSetListingGroupFilter:
-    def test_unit_included_brand(self, mock_ctx):
-        result = gads_set_listing_group_filter(
+    @pytest.mark.asyncio
+    async def test_unit_included_brand(self, mock_ctx):
+        result = await gads_set_listing_group_filter(
             customer_id="1234567890",
             asset_group_id="555",
             filter_type="UNIT_INCLUDED",
@@ -47,11 +50,12 @@ class TestSetListingGroupFilter:
             ctx=mock_ctx,
         )
         wrapper = mock_ctx.request_context.lifespan_context["ads_client"]
-        wrapper.mutate.assert_called_once()
+        wrapper.amutate.assert_awaited_once()
         assert "BRAND" in result
 
-    def test_subdivision(self, mock_ctx):
-        result = gads_set_listing_group_filter(
+    @pytest.mark.asyncio
+    async def test_subdivision(self, mock_ctx):
+        result = await gads_set_listing_group_filter(
             customer_id="1234567890",
             asset_group_id="555",
             filter_type="SUBDIVISION",
@@ -60,8 +64,9 @@ class TestSetListingGroupFilter:
         )
         assert "SUBDIVISION" in result
 
-    def test_with_parent_filter(self, mock_ctx):
-        result = gads_set_listing_group_filter(
+    @pytest.mark.asyncio
+    async def test_with_parent_filter(self, mock_ctx):
+        result = await gads_set_listing_group_filter(
             customer_id="1234567890",
             asset_group_id="555",
             filter_type="UNIT_INCLUDED",
@@ -74,19 +79,21 @@ class TestSetListingGroupFilter:
 
 
 class TestLinkMerchantCenter:
-    def test_basic_link(self, mock_ctx_campaign):
-        result = gads_link_merchant_center(
+    @pytest.mark.asyncio
+    async def test_basic_link(self, mock_ctx_campaign):
+        result = await gads_link_merchant_center(
             customer_id="1234567890",
             campaign_id="111",
             merchant_id="12345678",
             ctx=mock_ctx_campaign,
         )
         wrapper = mock_ctx_campaign.request_context.lifespan_context["ads_client"]
-        wrapper.mutate.assert_called_once()
+        wrapper.amutate.assert_awaited_once()
         assert "12345678" in result
 
-    def test_with_feed_label(self, mock_ctx_campaign):
-        result = gads_link_merchant_center(
+    @pytest.mark.asyncio
+    async def test_with_feed_label(self, mock_ctx_campaign):
+        result = await gads_link_merchant_center(
             customer_id="1234567890",
             campaign_id="111",
             merchant_id="12345678",
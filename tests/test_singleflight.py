@@ -0,0 +1,142 @@
+"""Tests for single-flight coalescing of identical concurrent reads."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper, GoogleAdsClientWrapper
+from google_ads_mcp.singleflight import SingleFlight
+
+
+class TestSingleFlightSync:
+    def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait(5)
+            return "rows"
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(flight.do, "k", slow) for _ in range(4)]
+            while flight.stats().coalesced < 3:
+                threading.Event().wait(0.001)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert sorted(shared for _, shared in results) == [False, True, True, True]
+        assert {value for value, _ in results} == {"rows"}
+        stats = flight.stats()
+        assert (stats.executed, stats.coalesced, stats.in_flight) == (1, 3, 0)
+
+    def test_sequential_calls_are_not_shared(self):
+        flight = SingleFlight()
+        assert flight.do("k", lambda: 1) == (1, False)
+        assert flight.do("k", lambda: 2) == (2, False)
+        assert flight.stats().executed == 2
+
+    def test_error_releases_key(self):
+        flight = SingleFlight()
+
+        def boom():
+            raise RuntimeError("down")
+
+        with pytest.raises(RuntimeError):
+            flight.do("k", boom)
+        assert flight.do("k", lambda: "ok") == ("ok", False)
+
+
+class TestSingleFlightAsync:
+    @pytest.mark.asyncio
+    async def test_concurrent_coroutines_share_one_task(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return ["row"]
+
+        results = await asyncio.gather(*(flight.ado("k", fetch) for _ in range(5)))
+        assert len(calls) == 1
+        assert [shared for _, shared in results].count(True) == 4
+        assert flight.stats().in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_all_callers(self):
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("down")
+
+        results = await asyncio.gather(
+            flight.ado("k", fail), flight.ado("k", fail), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flight.stats().executed == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        first = asyncio.ensure_future(flight.ado("k", fetch))
+        second = asyncio.ensure_future(flight.ado("k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == ("ok", True)
+
+
+class TestClientCoalescing:
+    def _mock_client(self, delay=0.0):
+        mock_client = MagicMock()
+        calls = []
+
+        def search(request):
+            calls.append(request)
+            threading.Event().wait(delay)
+            return iter([MagicMock(), MagicMock()])
+
+        mock_client.get_service.return_value.search.side_effect = search
+        return mock_client, calls
+
+    @pytest.mark.asyncio
+    async def test_aquery_coalesces_equivalent_queries(self):
+        mock_client, calls = self._mock_client(delay=0.05)
+        wrapper = AsyncGoogleAdsClientWrapper(mock_client, singleflight=SingleFlight())
+        try:
+            results = await asyncio.gather(
+                wrapper.aquery("1234567890", "SELECT campaign.id FROM campaign"),
+                wrapper.aquery("1234567890", "select  campaign.id\nFROM campaign"),
+                wrapper.aquery("9999999999", "SELECT campaign.id FROM campaign"),
+            )
+        finally:
+            wrapper.close()
+        assert len(calls) == 2
+        assert results[0] == results[1]
+        assert results[0] is not results[1]
+        assert wrapper.singleflight.stats().coalesced == 1
+
+    def test_sync_query_coalesces_across_threads(self):
+        mock_client, calls = self._mock_client(delay=0.05)
+        wrapper = GoogleAdsClientWrapper(mock_client, singleflight=SingleFlight())
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [
+                pool.submit(wrapper.query, "1234567890", "SELECT campaign.id FROM campaign")
+                for _ in range(3)
+            ]
+            results = [f.result() for f in futures]
+        assert all(len(rows) == 2 for rows in results)
+        assert len(calls) < 3
+        stats = wrapper.singleflight.stats()
+        assert stats.executed + stats.coalesced == 3
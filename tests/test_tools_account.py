@@ -1,8 +1,12 @@
 """Tests for account overview tool."""
 
+import enum
 import json
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
 from google_ads_mcp.models.tool_inputs import GetAccountOverviewInput
 from google_ads_mcp.tools.account import (
     _build_account_performance_query,
@@ -68,11 +72,12 @@ class TestBuildCampaignCountQuery:
 
 class TestGetAccountOverview:
     @patch("google_ads_mcp.tools.account.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
         # First call: account performance
         # Second call: campaign counts
-        mock_client.query.side_effect = [
+        mock_client.aquery.side_effect = [
             [
                 _make_account_perf_row(impressions=5000, clicks=250, cost_micros=25000000, conversions=25.0),
                 _make_account_perf_row(impressions=5000, clicks=250, cost_micros=25000000, conversions=25.0),
@@ -85,7 +90,7 @@ class TestGetAccountOverview:
         ]
         mock_get_client.return_value = mock_client
 
-        result = get_account_overview(
+        result = await get_account_overview(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -94,9 +99,10 @@ class TestGetAccountOverview:
         assert "Account Overview" in result
 
     @patch("google_ads_mcp.tools.account.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.side_effect = [
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery.side_effect = [
             [_make_account_perf_row()],
             [
                 _make_campaign_status_row("ENABLED"),
@@ -105,7 +111,7 @@ class TestGetAccountOverview:
         ]
         mock_get_client.return_value = mock_client
 
-        result = get_account_overview(
+        result = await get_account_overview(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -120,9 +126,35 @@ class TestGetAccountOverview:
         assert data["campaigns"]["paused"] == 1
 
     @patch("google_ads_mcp.tools.account.get_client")
-    def test_aggregation(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.side_effect = [
+    @pytest.mark.asyncio
+    async def test_counts_int_enum_statuses(self, mock_get_client):
+        # proto-plus statuses are IntEnums: str() is "2" on Python 3.11+.
+        status = enum.IntEnum("CampaignStatus", {"ENABLED": 2, "PAUSED": 3})
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery.side_effect = [
+            [_make_account_perf_row()],
+            [
+                _make_campaign_status_row(status.ENABLED),
+                _make_campaign_status_row(status.PAUSED),
+                _make_campaign_status_row(3),
+            ],
+        ]
+        mock_get_client.return_value = mock_client
+
+        data = json.loads(await get_account_overview(
+            customer_id="1234567890",
+            start_date="2026-01-01",
+            end_date="2026-01-31",
+            response_format="json",
+            ctx=MagicMock(),
+        ))
+        assert data["campaigns"] == {"active": 1, "paused": 2, "total": 3}
+
+    @patch("google_ads_mcp.tools.account.get_client")
+    @pytest.mark.asyncio
+    async def test_aggregation(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery.side_effect = [
             [
                 _make_account_perf_row(impressions=3000, clicks=150, cost_micros=15000000, conversions=15.0),
                 _make_account_perf_row(impressions=7000, clicks=350, cost_micros=35000000, conversions=35.0),
@@ -131,7 +163,7 @@ class TestGetAccountOverview:
         ]
         mock_get_client.return_value = mock_client
 
-        result = get_account_overview(
+        result = await get_account_overview(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -149,12 +181,13 @@ class TestGetAccountOverview:
         assert data["metrics"]["conversions"] == 50.0
 
     @patch("google_ads_mcp.tools.account.get_client")
-    def test_zero_impressions(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.side_effect = [[], []]
+    @pytest.mark.asyncio
+    async def test_zero_impressions(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery.side_effect = [[], []]
         mock_get_client.return_value = mock_client
 
-        result = get_account_overview(
+        result = await get_account_overview(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -3,6 +3,9 @@
 import json
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper, QueryPage
 from google_ads_mcp.models.tool_inputs import (
     GetAdGroupPerformanceInput,
     ListAdGroupsInput,
@@ -10,7 +13,7 @@ from google_ads_mcp.models.tool_inputs import (
 from google_ads_mcp.tools.ad_groups import (
     _build_ad_group_performance_query,
     _build_list_ad_groups_query,
-    _parse_ad_group_row,
+    _AD_GROUP_ROWS,
     list_ad_groups,
     get_ad_group_performance,
 )
@@ -75,7 +78,7 @@ class TestBuildListAdGroupsQuery:
 class TestParseAdGroupRow:
     def test_basic_parsing(self):
         row = _make_ad_group_row()
-        result = _parse_ad_group_row(row)
+        result = _AD_GROUP_ROWS.records([row])[0]
         assert result["id"] == "100"
         assert result["name"] == "Ad Group 1"
         assert result["campaign_name"] == "Campaign 1"
@@ -83,24 +86,26 @@ class TestParseAdGroupRow:
 
 class TestListAdGroups:
     @patch("google_ads_mcp.tools.ad_groups.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_ad_group_row()]
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_ad_group_row()])
         mock_get_client.return_value = mock_client
 
-        result = list_ad_groups(
+        result = await list_ad_groups(
             customer_id="1234567890", ctx=MagicMock()
         )
         assert "## Ad Groups" in result
         assert "Ad Group 1" in result
 
     @patch("google_ads_mcp.tools.ad_groups.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_ad_group_row()]
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_ad_group_row()])
         mock_get_client.return_value = mock_client
 
-        result = list_ad_groups(
+        result = await list_ad_groups(
             customer_id="1234567890",
             response_format="json",
             ctx=MagicMock(),
@@ -110,18 +115,19 @@ class TestListAdGroups:
         assert len(data["ad_groups"]) == 1
 
     @patch("google_ads_mcp.tools.ad_groups.get_client")
-    def test_with_campaign_filter(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_with_campaign_filter(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = list_ad_groups(
+        result = await list_ad_groups(
             customer_id="1234567890",
             campaign_id="555",
             ctx=MagicMock(),
         )
         # Verify the query was built with the campaign filter
-        call_args = mock_client.query.call_args
+        call_args = mock_client.aquery_page.call_args
         assert "campaign.id = 555" in call_args[0][1]
 
 
@@ -152,12 +158,13 @@ class TestBuildAdGroupPerformanceQuery:
 
 class TestGetAdGroupPerformance:
     @patch("google_ads_mcp.tools.ad_groups.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_ag_perf_row()]
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_ag_perf_row()])
         mock_get_client.return_value = mock_client
 
-        result = get_ad_group_performance(
+        result = await get_ad_group_performance(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -166,12 +173,13 @@ class TestGetAdGroupPerformance:
         assert "## Ad Group Performance" in result
 
     @patch("google_ads_mcp.tools.ad_groups.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_ag_perf_row()]
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_ag_perf_row()])
         mock_get_client.return_value = mock_client
 
-        result = get_ad_group_performance(
+        result = await get_ad_group_performance(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
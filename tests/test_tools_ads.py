@@ -3,9 +3,12 @@
 import json
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper, QueryPage
 from google_ads_mcp.tools.ads import (
     _build_list_ads_query,
-    _parse_ad_row,
+    _AD_ROWS,
     gads_list_ad_group_ads,
 )
 
@@ -86,7 +89,7 @@ class TestBuildListAdsQuery:
 class TestParseAdRow:
     def test_basic_parsing(self):
         row = _make_ad_row()
-        result = _parse_ad_row(row)
+        result = _AD_ROWS.records([row])[0]
         assert result["ad_id"] == "200"
         assert result["ad_name"] == "Test Ad"
         assert result["ad_group_name"] == "Ad Group 1"
@@ -98,19 +101,20 @@ class TestParseAdRow:
 
     def test_approval_fields(self):
         row = _make_ad_row(approval_status="APPROVED", review_status="REVIEWED")
-        result = _parse_ad_row(row)
+        result = _AD_ROWS.records([row])[0]
         assert result["approval_status"] == "APPROVED"
         assert result["review_status"] == "REVIEWED"
 
 
 class TestGadsListAdGroupAds:
     @patch("google_ads_mcp.tools.ads.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_ad_row()]
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_ad_row()])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_ad_group_ads(
+        result = await gads_list_ad_group_ads(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -120,12 +124,13 @@ class TestGadsListAdGroupAds:
         assert "Test Ad" in result
 
     @patch("google_ads_mcp.tools.ads.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_ad_row()]
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_ad_row()])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_ad_group_ads(
+        result = await gads_list_ad_group_ads(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -139,44 +144,47 @@ class TestGadsListAdGroupAds:
         assert data["ad_group_ads"][0]["clicks"] == 50
 
     @patch("google_ads_mcp.tools.ads.get_client")
-    def test_with_campaign_filter(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_with_campaign_filter(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        gads_list_ad_group_ads(
+        await gads_list_ad_group_ads(
             customer_id="1234567890",
             campaign_id="555",
             start_date="2026-01-01",
             end_date="2026-01-31",
             ctx=MagicMock(),
         )
-        call_args = mock_client.query.call_args
+        call_args = mock_client.aquery_page.call_args
         assert "campaign.id = 555" in call_args[0][1]
 
     @patch("google_ads_mcp.tools.ads.get_client")
-    def test_with_ad_group_filter(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_with_ad_group_filter(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        gads_list_ad_group_ads(
+        await gads_list_ad_group_ads(
             customer_id="1234567890",
             ad_group_id="100",
             start_date="2026-01-01",
             end_date="2026-01-31",
             ctx=MagicMock(),
         )
-        call_args = mock_client.query.call_args
+        call_args = mock_client.aquery_page.call_args
         assert "ad_group.id = 100" in call_args[0][1]
 
     @patch("google_ads_mcp.tools.ads.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_ad_group_ads(
+        result = await gads_list_ad_group_ads(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
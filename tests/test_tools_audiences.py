@@ -5,11 +5,12 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper, QueryPage
 from google_ads_mcp.tools.audiences import (
     _build_list_audiences_query,
     _build_list_user_interests_query,
-    _parse_audience_row,
-    _parse_user_interest_row,
+    _AUDIENCE_ROWS,
+    _USER_INTEREST_ROWS,
     gads_list_audiences,
     gads_list_user_interests,
 )
@@ -83,7 +84,7 @@ class TestBuildListAudiencesQuery:
 class TestParseAudienceRow:
     def test_basic_parsing(self):
         row = _make_audience_row()
-        result = _parse_audience_row(row)
+        result = _AUDIENCE_ROWS.records([row])[0]
         assert result["criterion_id"] == "789"
         assert result["campaign"] == "Test Campaign"
         assert result["impressions"] == 1000
@@ -94,15 +95,16 @@ class TestParseAudienceRow:
 
 class TestGadsListAudiences:
     @patch("google_ads_mcp.tools.audiences.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_audience_row(criterion_id="100", campaign_name="Campaign A"),
             _make_audience_row(criterion_id="200", campaign_name="Campaign B"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_audiences(
+        result = await gads_list_audiences(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -113,14 +115,15 @@ class TestGadsListAudiences:
         assert "Campaign B" in result
 
     @patch("google_ads_mcp.tools.audiences.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_audience_row(criterion_id="100"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_audiences(
+        result = await gads_list_audiences(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -134,12 +137,13 @@ class TestGadsListAudiences:
         assert data["audiences"][0]["criterion_id"] == "100"
 
     @patch("google_ads_mcp.tools.audiences.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_audiences(
+        result = await gads_list_audiences(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -148,15 +152,16 @@ class TestGadsListAudiences:
         assert "0 of 0" in result
 
     @patch("google_ads_mcp.tools.audiences.get_client")
-    def test_pagination(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_pagination(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_audience_row(criterion_id=str(i))
-            for i in range(5)
-        ]
+            for i in range(2)
+        ], next_page_token="tok", has_more=True)
         mock_get_client.return_value = mock_client
 
-        result = gads_list_audiences(
+        result = await gads_list_audiences(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -166,18 +171,19 @@ class TestGadsListAudiences:
             ctx=MagicMock(),
         )
         data = json.loads(result)
-        assert data["pagination"]["total"] == 5
+        assert data["pagination"]["total"] is None
         assert data["pagination"]["count"] == 2
         assert data["pagination"]["has_more"] is True
 
     @patch("google_ads_mcp.tools.audiences.get_client")
-    def test_default_dates(self, mock_get_client):
+    @pytest.mark.asyncio
+    async def test_default_dates(self, mock_get_client):
         """Verify that omitting dates uses defaults (no error)."""
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_audiences(
+        result = await gads_list_audiences(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -207,7 +213,7 @@ class TestBuildListUserInterestsQuery:
 class TestParseUserInterestRow:
     def test_basic_parsing(self):
         row = _make_user_interest_row()
-        result = _parse_user_interest_row(row)
+        result = _USER_INTEREST_ROWS.records([row])[0]
         assert result["id"] == "10001"
         assert result["name"] == "Travel"
         assert "AFFINITY" in result["taxonomy_type"]
@@ -215,15 +221,16 @@ class TestParseUserInterestRow:
 
 class TestGadsListUserInterests:
     @patch("google_ads_mcp.tools.audiences.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_user_interest_row(interest_id="1", name="Travel"),
             _make_user_interest_row(interest_id="2", name="Sports"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_user_interests(
+        result = await gads_list_user_interests(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -232,14 +239,15 @@ class TestGadsListUserInterests:
         assert "Sports" in result
 
     @patch("google_ads_mcp.tools.audiences.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_user_interest_row(interest_id="1", name="Travel"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_user_interests(
+        result = await gads_list_user_interests(
             customer_id="1234567890",
             response_format="json",
             ctx=MagicMock(),
@@ -250,14 +258,15 @@ class TestGadsListUserInterests:
         assert len(data["user_interests"]) == 1
 
     @patch("google_ads_mcp.tools.audiences.get_client")
-    def test_with_taxonomy_filter(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_with_taxonomy_filter(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_user_interest_row(taxonomy_type="AFFINITY"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_user_interests(
+        result = await gads_list_user_interests(
             customer_id="1234567890",
             taxonomy_type="AFFINITY",
             ctx=MagicMock(),
@@ -265,12 +274,13 @@ class TestGadsListUserInterests:
         assert "(AFFINITY)" in result
 
     @patch("google_ads_mcp.tools.audiences.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_user_interests(
+        result = await gads_list_user_interests(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
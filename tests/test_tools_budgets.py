@@ -5,15 +5,16 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper, QueryPage
 from google_ads_mcp.tools.budgets import (
     _build_list_campaign_budgets_query,
     _build_bidding_strategies_query,
     _build_ad_group_bidding_query,
     _build_change_history_query,
-    _parse_budget_row,
+    _BUDGET_ROWS,
     _parse_bidding_strategy_row,
-    _parse_ad_group_bidding_row,
-    _parse_change_history_row,
+    _AD_GROUP_BIDDING_ROWS,
+    _CHANGE_HISTORY_ROWS,
     gads_list_campaign_budgets,
     gads_get_bidding_strategies,
     gads_get_ad_group_bidding_strategies,
@@ -119,7 +120,7 @@ class TestBuildListCampaignBudgetsQuery:
 class TestParseBudgetRow:
     def test_basic_parsing(self):
         row = _make_budget_row()
-        result = _parse_budget_row(row)
+        result = _BUDGET_ROWS.records([row])[0]
         assert result["id"] == "100"
         assert result["name"] == "Daily Budget"
         assert result["amount"] == "50.00"
@@ -130,22 +131,23 @@ class TestParseBudgetRow:
 
     def test_zero_amounts(self):
         row = _make_budget_row(amount_micros=0, recommended_micros=0)
-        result = _parse_budget_row(row)
+        result = _BUDGET_ROWS.records([row])[0]
         assert result["amount"] == "0.00"
         assert result["recommended_amount"] == "0.00"
 
 
 class TestGadsListCampaignBudgets:
     @patch("google_ads_mcp.tools.budgets.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_budget_row(budget_id="1", name="Budget A"),
             _make_budget_row(budget_id="2", name="Budget B"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_campaign_budgets(
+        result = await gads_list_campaign_budgets(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -154,12 +156,13 @@ class TestGadsListCampaignBudgets:
         assert "Budget B" in result
 
     @patch("google_ads_mcp.tools.budgets.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_budget_row()]
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_budget_row()])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_campaign_budgets(
+        result = await gads_list_campaign_budgets(
             customer_id="1234567890",
             response_format="json",
             ctx=MagicMock(),
@@ -171,34 +174,36 @@ class TestGadsListCampaignBudgets:
         assert data["budgets"][0]["amount"] == "50.00"
 
     @patch("google_ads_mcp.tools.budgets.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_campaign_budgets(
+        result = await gads_list_campaign_budgets(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
         assert "0/0" in result
 
     @patch("google_ads_mcp.tools.budgets.get_client")
-    def test_pagination(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_pagination(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_budget_row(budget_id=str(i), name=f"Budget {i}")
-            for i in range(8)
-        ]
+            for i in range(3)
+        ], next_page_token="tok", has_more=True)
         mock_get_client.return_value = mock_client
 
-        result = gads_list_campaign_budgets(
+        result = await gads_list_campaign_budgets(
             customer_id="1234567890",
             limit=3,
             response_format="json",
             ctx=MagicMock(),
         )
         data = json.loads(result)
-        assert data["pagination"]["total"] == 8
+        assert data["pagination"]["total"] is None
         assert data["pagination"]["count"] == 3
         assert data["pagination"]["has_more"] is True
 
@@ -271,15 +276,16 @@ class TestParseBiddingStrategyRow:
 
 class TestGadsGetBiddingStrategies:
     @patch("google_ads_mcp.tools.budgets.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_bidding_strategy_row(name="Campaign Alpha"),
             _make_bidding_strategy_row(name="Campaign Beta"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_get_bidding_strategies(
+        result = await gads_get_bidding_strategies(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -288,12 +294,13 @@ class TestGadsGetBiddingStrategies:
         assert "Campaign Beta" in result
 
     @patch("google_ads_mcp.tools.budgets.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_bidding_strategy_row()]
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_bidding_strategy_row()])
         mock_get_client.return_value = mock_client
 
-        result = gads_get_bidding_strategies(
+        result = await gads_get_bidding_strategies(
             customer_id="1234567890",
             response_format="json",
             ctx=MagicMock(),
@@ -304,26 +311,28 @@ class TestGadsGetBiddingStrategies:
         assert data["bidding_strategies"][0]["id"] == "200"
 
     @patch("google_ads_mcp.tools.budgets.get_client")
-    def test_campaign_id_filter(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_bidding_strategy_row()]
+    @pytest.mark.asyncio
+    async def test_campaign_id_filter(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_bidding_strategy_row()])
         mock_get_client.return_value = mock_client
 
-        gads_get_bidding_strategies(
+        await gads_get_bidding_strategies(
             customer_id="1234567890",
             campaign_id="50",
             ctx=MagicMock(),
         )
-        called_query = mock_client.query.call_args[0][1]
+        called_query = mock_client.aquery_page.call_args[0][1]
         assert "campaign.id = 50" in called_query
 
     @patch("google_ads_mcp.tools.budgets.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_get_bidding_strategies(
+        result = await gads_get_bidding_strategies(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -354,7 +363,7 @@ class TestBuildAdGroupBiddingQuery:
 class TestParseAdGroupBiddingRow:
     def test_basic_parsing(self):
         row = _make_ad_group_bidding_row()
-        result = _parse_ad_group_bidding_row(row)
+        result = _AD_GROUP_BIDDING_ROWS.records([row])[0]
         assert result["id"] == "300"
         assert result["name"] == "Ad Group 1"
         assert result["cpc_bid"] == "1.50"
@@ -365,15 +374,16 @@ class TestParseAdGroupBiddingRow:
 
 class TestGadsGetAdGroupBiddingStrategies:
     @patch("google_ads_mcp.tools.budgets.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_ad_group_bidding_row(name="AG Alpha"),
             _make_ad_group_bidding_row(name="AG Beta"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_get_ad_group_bidding_strategies(
+        result = await gads_get_ad_group_bidding_strategies(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -382,12 +392,13 @@ class TestGadsGetAdGroupBiddingStrategies:
         assert "AG Beta" in result
 
     @patch("google_ads_mcp.tools.budgets.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_ad_group_bidding_row()]
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_ad_group_bidding_row()])
         mock_get_client.return_value = mock_client
 
-        result = gads_get_ad_group_bidding_strategies(
+        result = await gads_get_ad_group_bidding_strategies(
             customer_id="1234567890",
             response_format="json",
             ctx=MagicMock(),
@@ -398,26 +409,28 @@ class TestGadsGetAdGroupBiddingStrategies:
         assert data["ad_group_bidding"][0]["cpc_bid"] == "1.50"
 
     @patch("google_ads_mcp.tools.budgets.get_client")
-    def test_campaign_id_filter(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_campaign_id_filter(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        gads_get_ad_group_bidding_strategies(
+        await gads_get_ad_group_bidding_strategies(
             customer_id="1234567890",
             campaign_id="60",
             ctx=MagicMock(),
         )
-        called_query = mock_client.query.call_args[0][1]
+        called_query = mock_client.aquery_page.call_args[0][1]
         assert "campaign.id = 60" in called_query
 
     @patch("google_ads_mcp.tools.budgets.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_get_ad_group_bidding_strategies(
+        result = await gads_get_ad_group_bidding_strategies(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -448,7 +461,7 @@ class TestBuildChangeHistoryQuery:
 class TestParseChangeHistoryRow:
     def test_basic_parsing(self):
         row = _make_change_history_row()
-        result = _parse_change_history_row(row)
+        result = _CHANGE_HISTORY_ROWS.records([row])[0]
         assert result["resource_name"] == "customers/123/campaigns/456"
         assert result["resource_type"] == "CAMPAIGN"
         assert result["resource_status"] == "ENABLED"
@@ -457,15 +470,16 @@ class TestParseChangeHistoryRow:
 
 class TestGadsListChangeHistory:
     @patch("google_ads_mcp.tools.budgets.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_change_history_row(resource_type="CAMPAIGN"),
             _make_change_history_row(resource_type="AD_GROUP"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_change_history(
+        result = await gads_list_change_history(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -474,12 +488,13 @@ class TestGadsListChangeHistory:
         assert "AD_GROUP" in result
 
     @patch("google_ads_mcp.tools.budgets.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_change_history_row()]
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_change_history_row()])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_change_history(
+        result = await gads_list_change_history(
             customer_id="1234567890",
             response_format="json",
             ctx=MagicMock(),
@@ -490,63 +505,67 @@ class TestGadsListChangeHistory:
         assert data["change_history"][0]["resource_type"] == "CAMPAIGN"
 
     @patch("google_ads_mcp.tools.budgets.get_client")
-    def test_resource_type_filter(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_change_history_row()]
+    @pytest.mark.asyncio
+    async def test_resource_type_filter(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_change_history_row()])
         mock_get_client.return_value = mock_client
 
-        gads_list_change_history(
+        await gads_list_change_history(
             customer_id="1234567890",
             resource_type="CAMPAIGN",
             ctx=MagicMock(),
         )
-        called_query = mock_client.query.call_args[0][1]
+        called_query = mock_client.aquery_page.call_args[0][1]
         assert "change_status.resource_type = 'CAMPAIGN'" in called_query
 
     @patch("google_ads_mcp.tools.budgets.get_client")
-    def test_no_resource_type_filter(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_change_history_row()]
+    @pytest.mark.asyncio
+    async def test_no_resource_type_filter(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_change_history_row()])
         mock_get_client.return_value = mock_client
 
-        gads_list_change_history(
+        await gads_list_change_history(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
-        called_query = mock_client.query.call_args[0][1]
+        called_query = mock_client.aquery_page.call_args[0][1]
         assert "WHERE" not in called_query
 
     @patch("google_ads_mcp.tools.budgets.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_change_history(
+        result = await gads_list_change_history(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
         assert "0/0" in result
 
     @patch("google_ads_mcp.tools.budgets.get_client")
-    def test_pagination(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_pagination(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_change_history_row(
                 resource_name=f"customers/123/campaigns/{i}",
                 last_change=f"2026-02-0{i+1}T10:00:00Z",
             )
-            for i in range(6)
-        ]
+            for i in range(2)
+        ], next_page_token="tok", has_more=True)
         mock_get_client.return_value = mock_client
 
-        result = gads_list_change_history(
+        result = await gads_list_change_history(
             customer_id="1234567890",
             limit=2,
             response_format="json",
             ctx=MagicMock(),
         )
         data = json.loads(result)
-        assert data["pagination"]["total"] == 6
+        assert data["pagination"]["total"] is None
         assert data["pagination"]["count"] == 2
         assert data["pagination"]["has_more"] is True
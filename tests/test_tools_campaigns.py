@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper, QueryPage
 from google_ads_mcp.models.tool_inputs import (
     GetCampaignPerformanceInput,
     ListCampaignsInput,
@@ -12,11 +13,12 @@ from google_ads_mcp.models.tool_inputs import (
 from google_ads_mcp.tools.campaigns import (
     _build_campaign_performance_query,
     _build_list_campaigns_query,
-    _parse_campaign_row,
-    _parse_campaign_performance_row,
+    _CAMPAIGN_ROWS,
+    _CAMPAIGN_PERFORMANCE_ROWS,
     list_campaigns,
     get_campaign_performance,
 )
+from google_ads_mcp.utils.errors import InvalidInputError
 
 
 def _make_campaign_row(
@@ -88,7 +90,7 @@ class TestBuildListCampaignsQuery:
 class TestParseCampaignRow:
     def test_basic_parsing(self):
         row = _make_campaign_row()
-        result = _parse_campaign_row(row)
+        result = _CAMPAIGN_ROWS.records([row])[0]
         assert result["id"] == "123"
         assert result["name"] == "Test Campaign"
         assert result["budget"] == "budgets/456"
@@ -96,15 +98,16 @@ class TestParseCampaignRow:
 
 class TestListCampaigns:
     @patch("google_ads_mcp.tools.campaigns.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_campaign_row(cid="1", name="Campaign A"),
             _make_campaign_row(cid="2", name="Campaign B", status="PAUSED"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = list_campaigns(
+        result = await list_campaigns(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -113,14 +116,15 @@ class TestListCampaigns:
         assert "Campaign B" in result
 
     @patch("google_ads_mcp.tools.campaigns.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_campaign_row(cid="1", name="Test"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = list_campaigns(
+        result = await list_campaigns(
             customer_id="1234567890",
             response_format="json",
             ctx=MagicMock(),
@@ -131,27 +135,29 @@ class TestListCampaigns:
         assert len(data["campaigns"]) == 1
 
     @patch("google_ads_mcp.tools.campaigns.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = list_campaigns(
+        result = await list_campaigns(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
         assert "0/0" in result
 
     @patch("google_ads_mcp.tools.campaigns.get_client")
-    def test_pagination(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_pagination(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_campaign_row(cid=str(i), name=f"Campaign {i}")
-            for i in range(5)
-        ]
+            for i in range(2)
+        ], next_page_token="tok", has_more=True)
         mock_get_client.return_value = mock_client
 
-        result = list_campaigns(
+        result = await list_campaigns(
             customer_id="1234567890",
             limit=2,
             offset=0,
@@ -159,9 +165,72 @@ class TestListCampaigns:
             ctx=MagicMock(),
         )
         data = json.loads(result)
-        assert data["pagination"]["total"] == 5
+        assert data["pagination"]["total"] is None
         assert data["pagination"]["count"] == 2
         assert data["pagination"]["has_more"] is True
+        assert data["pagination"]["next_cursor"]
+        # Only the requested page is pulled from the API
+        args, kwargs = mock_client.aquery_page.call_args
+        assert args[2] == 2
+        assert kwargs["position"] == 0
+
+    @patch("google_ads_mcp.tools.campaigns.get_client")
+    @pytest.mark.asyncio
+    async def test_cursor_resumes_from_page_token(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage(
+            [_make_campaign_row(cid="1")], next_page_token="tok2",
+            next_position=3, has_more=True,
+        )
+        mock_get_client.return_value = mock_client
+
+        first = json.loads(await list_campaigns(
+            customer_id="1234567890", limit=1, response_format="json",
+            ctx=MagicMock(),
+        ))
+        cursor = first["pagination"]["next_cursor"]
+
+        second = json.loads(await list_campaigns(
+            customer_id="1234567890", limit=1, cursor=cursor,
+            response_format="json", ctx=MagicMock(),
+        ))
+        kwargs = mock_client.aquery_page.call_args.kwargs
+        assert kwargs["page_token"] == "tok2"
+        assert kwargs["position"] == 3
+        assert second["pagination"]["offset"] == 1
+
+    @patch("google_ads_mcp.tools.campaigns.get_client")
+    @pytest.mark.asyncio
+    async def test_compact_json(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_campaign_row()])
+        mock_get_client.return_value = mock_client
+
+        kwargs = dict(customer_id="1234567890", ctx=MagicMock())
+        compact = await list_campaigns(response_format="compact", **kwargs)
+        indented = await list_campaigns(response_format="json", **kwargs)
+        assert "\n" not in compact
+        assert json.loads(compact) == json.loads(indented)
+        assert len(compact) < len(indented)
+
+    @patch("google_ads_mcp.tools.campaigns.get_client")
+    @pytest.mark.asyncio
+    async def test_cursor_for_other_query_rejected(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage(
+            [_make_campaign_row(cid="1")], next_page_token="tok2", has_more=True,
+        )
+        mock_get_client.return_value = mock_client
+
+        first = json.loads(await list_campaigns(
+            customer_id="1234567890", limit=1, response_format="json",
+            ctx=MagicMock(),
+        ))
+        with pytest.raises(InvalidInputError):
+            await list_campaigns(
+                customer_id="1234567890", limit=1, status="paused",
+                cursor=first["pagination"]["next_cursor"], ctx=MagicMock(),
+            )
 
 
 class TestBuildCampaignPerformanceQuery:
@@ -197,12 +266,13 @@ class TestBuildCampaignPerformanceQuery:
 
 class TestGetCampaignPerformance:
     @patch("google_ads_mcp.tools.campaigns.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_perf_row()]
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_perf_row()])
         mock_get_client.return_value = mock_client
 
-        result = get_campaign_performance(
+        result = await get_campaign_performance(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -212,12 +282,13 @@ class TestGetCampaignPerformance:
         assert "2026-01-01" in result
 
     @patch("google_ads_mcp.tools.campaigns.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_perf_row()]
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_perf_row()])
         mock_get_client.return_value = mock_client
 
-        result = get_campaign_performance(
+        result = await get_campaign_performance(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -5,12 +5,24 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
 from google_ads_mcp.tools.gaql import (
     _flatten_dict,
     gads_execute_gaql,
+    gads_export_gaql,
 )
 
 
+async def _call_inline(func, *args, **kwargs):
+    return func(*args, **kwargs)
+
+
+def _dict_row(data):
+    row = MagicMock()
+    type(row).to_dict = MagicMock(return_value=data)
+    return row
+
+
 class TestFlattenDict:
     def test_flat_dict(self):
         out = {}
@@ -41,8 +53,9 @@ class TestFlattenDict:
 
 
 class TestGadsExecuteGaql:
-    def test_non_select_query_rejected(self):
-        result = gads_execute_gaql(
+    @pytest.mark.asyncio
+    async def test_non_select_query_rejected(self):
+        result = await gads_execute_gaql(
             customer_id="1234567890",
             query="DELETE FROM campaign WHERE campaign.id = 1",
             ctx=MagicMock(),
@@ -50,16 +63,18 @@ class TestGadsExecuteGaql:
         assert "Error" in result
         assert "SELECT" in result
 
-    def test_update_query_rejected(self):
-        result = gads_execute_gaql(
+    @pytest.mark.asyncio
+    async def test_update_query_rejected(self):
+        result = await gads_execute_gaql(
             customer_id="1234567890",
             query="UPDATE campaign SET name = 'test'",
             ctx=MagicMock(),
         )
         assert "Error" in result
 
-    def test_insert_query_rejected(self):
-        result = gads_execute_gaql(
+    @pytest.mark.asyncio
+    async def test_insert_query_rejected(self):
+        result = await gads_execute_gaql(
             customer_id="1234567890",
             query="INSERT INTO campaign VALUES ('test')",
             ctx=MagicMock(),
@@ -67,18 +82,19 @@ class TestGadsExecuteGaql:
         assert "Error" in result
 
     @patch("google_ads_mcp.tools.gaql.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
 
         mock_row = MagicMock()
         type(mock_row).to_dict = MagicMock(return_value={
             "campaign": {"name": "Test Campaign", "id": "123"},
             "metrics": {"clicks": 50},
         })
-        mock_client.query.return_value = [mock_row]
+        mock_client.aquery.return_value = [mock_row]
         mock_get_client.return_value = mock_client
 
-        result = gads_execute_gaql(
+        result = await gads_execute_gaql(
             customer_id="1234567890",
             query="SELECT campaign.name, metrics.clicks FROM campaign",
             ctx=MagicMock(),
@@ -87,17 +103,18 @@ class TestGadsExecuteGaql:
         assert "1 rows" in result
 
     @patch("google_ads_mcp.tools.gaql.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
 
         mock_row = MagicMock()
         type(mock_row).to_dict = MagicMock(return_value={
             "campaign": {"name": "Test", "id": "456"},
         })
-        mock_client.query.return_value = [mock_row]
+        mock_client.aquery.return_value = [mock_row]
         mock_get_client.return_value = mock_client
 
-        result = gads_execute_gaql(
+        result = await gads_execute_gaql(
             customer_id="1234567890",
             query="SELECT campaign.name FROM campaign",
             response_format="json",
@@ -109,12 +126,13 @@ class TestGadsExecuteGaql:
         assert data["count"] == 1
 
     @patch("google_ads_mcp.tools.gaql.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery.return_value = []
         mock_get_client.return_value = mock_client
 
-        result = gads_execute_gaql(
+        result = await gads_execute_gaql(
             customer_id="1234567890",
             query="SELECT campaign.name FROM campaign WHERE campaign.id = 99999",
             ctx=MagicMock(),
@@ -122,12 +140,13 @@ class TestGadsExecuteGaql:
         assert "No results found" in result
 
     @patch("google_ads_mcp.tools.gaql.get_client")
-    def test_empty_results_json(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results_json(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery.return_value = []
         mock_get_client.return_value = mock_client
 
-        result = gads_execute_gaql(
+        result = await gads_execute_gaql(
             customer_id="1234567890",
             query="SELECT campaign.name FROM campaign WHERE campaign.id = 99999",
             response_format="json",
@@ -138,18 +157,19 @@ class TestGadsExecuteGaql:
         assert data["results"] == []
 
     @patch("google_ads_mcp.tools.gaql.get_client")
-    def test_limit_enforcement(self, mock_get_client):
-        mock_client = MagicMock()
+    @pytest.mark.asyncio
+    async def test_limit_enforcement(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
 
         mock_rows = []
         for i in range(10):
             mock_row = MagicMock()
             type(mock_row).to_dict = MagicMock(return_value={"id": str(i)})
             mock_rows.append(mock_row)
-        mock_client.query.return_value = mock_rows
+        mock_client.aquery.return_value = mock_rows[:3]
         mock_get_client.return_value = mock_client
 
-        result = gads_execute_gaql(
+        result = await gads_execute_gaql(
             customer_id="1234567890",
             query="SELECT campaign.id FROM campaign",
             limit=3,
@@ -158,19 +178,21 @@ class TestGadsExecuteGaql:
         )
         data = json.loads(result)
         assert data["count"] == 3
+        assert mock_client.aquery.call_args.kwargs["max_rows"] == 3
 
     @patch("google_ads_mcp.tools.gaql.get_client")
-    def test_row_serialization_fallback(self, mock_get_client):
+    @pytest.mark.asyncio
+    async def test_row_serialization_fallback(self, mock_get_client):
         """Test fallback when proto to_dict fails."""
-        mock_client = MagicMock()
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
 
         mock_row = MagicMock()
         type(mock_row).to_dict = MagicMock(side_effect=Exception("Serialization error"))
         mock_row.__str__ = MagicMock(return_value="raw row data")
-        mock_client.query.return_value = [mock_row]
+        mock_client.aquery.return_value = [mock_row]
         mock_get_client.return_value = mock_client
 
-        result = gads_execute_gaql(
+        result = await gads_execute_gaql(
             customer_id="1234567890",
             query="SELECT campaign.name FROM campaign",
             response_format="json",
@@ -187,24 +209,148 @@ class TestGadsExecuteGaql:
         pass
 
     @patch("google_ads_mcp.tools.gaql.get_client")
-    def test_select_with_whitespace(self, mock_get_client):
+    @pytest.mark.asyncio
+    async def test_select_with_whitespace(self, mock_get_client):
         """Query with leading whitespace should work."""
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery.return_value = []
         mock_get_client.return_value = mock_client
 
-        result = gads_execute_gaql(
+        result = await gads_execute_gaql(
             customer_id="1234567890",
             query="  SELECT campaign.name FROM campaign",
             ctx=MagicMock(),
         )
         assert "No results found" in result
 
-    def test_invalid_customer_id(self):
+    @pytest.mark.asyncio
+    async def test_invalid_customer_id(self):
         """Invalid customer ID should raise ValueError."""
         with pytest.raises(ValueError):
-            gads_execute_gaql(
+            await gads_execute_gaql(
                 customer_id="invalid",
                 query="SELECT campaign.name FROM campaign",
                 ctx=MagicMock(),
             )
+
+
+class TestGadsExportGaql:
+    def _client(self, rows):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.query_stream.return_value = iter(rows)
+        mock_client.arun.side_effect = _call_inline
+        return mock_client
+
+    @pytest.mark.asyncio
+    async def test_non_select_query_rejected(self):
+        result = await gads_export_gaql(
+            customer_id="1234567890",
+            query="DELETE FROM campaign",
+            ctx=MagicMock(),
+        )
+        assert "Error" in result
+
+    @pytest.mark.asyncio
+    async def test_unknown_format_rejected(self):
+        result = await gads_export_gaql(
+            customer_id="1234567890",
+            query="SELECT campaign.id FROM campaign",
+            file_format="xlsx",
+            ctx=MagicMock(),
+        )
+        assert "Error" in result
+
+    @patch("google_ads_mcp.tools.gaql.get_client")
+    @pytest.mark.asyncio
+    async def test_ndjson_export(self, mock_get_client, tmp_path):
+        rows = [_dict_row({"campaign": {"id": str(i)}}) for i in range(3)]
+        mock_client = self._client(rows)
+        mock_get_client.return_value = mock_client
+        out = tmp_path / "export.ndjson"
+
+        result = await gads_export_gaql(
+            customer_id="123-456-7890",
+            query="SELECT campaign.id FROM campaign",
+            output_path=str(out),
+            response_format="json",
+            ctx=MagicMock(),
+        )
+        data = json.loads(result)
+        assert data["count"] == 3
+        assert data["path"] == str(out)
+        lines = out.read_text().splitlines()
+        assert [json.loads(line)["campaign"]["id"] for line in lines] == ["0", "1", "2"]
+        mock_client.query_stream.assert_called_once_with(
+            "1234567890", "SELECT campaign.id FROM campaign"
+        )
+
+    @patch("google_ads_mcp.tools.gaql.get_client")
+    @pytest.mark.asyncio
+    async def test_csv_export_flattens_columns(self, mock_get_client, tmp_path):
+        rows = [
+            _dict_row({"campaign": {"id": "1", "name": "A"}, "metrics": {"clicks": 5}}),
+            _dict_row({"campaign": {"id": "2", "name": "B"}, "metrics": {"clicks": 7}}),
+        ]
+        mock_get_client.return_value = self._client(rows)
+        out = tmp_path / "export.csv"
+
+        result = await gads_export_gaql(
+            customer_id="1234567890",
+            query="SELECT campaign.id, campaign.name, metrics.clicks FROM campaign",
+            file_format="csv",
+            output_path=str(out),
+            ctx=MagicMock(),
+        )
+        assert "**Rows:** 2" in result
+        lines = out.read_text().splitlines()
+        assert lines[0] == "campaign.id,campaign.name,metrics.clicks"
+        assert lines[2] == "2,B,7"
+
+    @patch("google_ads_mcp.tools.gaql.get_client")
+    @pytest.mark.asyncio
+    async def test_existing_file_needs_overwrite(self, mock_get_client, tmp_path):
+        mock_client = self._client([_dict_row({"campaign": {"id": "1"}})])
+        mock_get_client.return_value = mock_client
+        out = tmp_path / "export.ndjson"
+        out.write_text("keep me\n")
+
+        result = await gads_export_gaql(
+            customer_id="1234567890",
+            query="SELECT campaign.id FROM campaign",
+            output_path=str(out),
+            ctx=MagicMock(),
+        )
+        assert "already exists" in result
+        assert out.read_text() == "keep me\n"
+        mock_client.query_stream.assert_not_called()
+
+        result = await gads_export_gaql(
+            customer_id="1234567890",
+            query="SELECT campaign.id FROM campaign",
+            output_path=str(out),
+            overwrite=True,
+            ctx=MagicMock(),
+        )
+        assert "**Rows:** 1" in result
+        assert json.loads(out.read_text())["campaign"]["id"] == "1"
+
+    @patch("google_ads_mcp.tools.gaql.get_client")
+    @pytest.mark.asyncio
+    async def test_failed_export_leaves_no_file(self, mock_get_client, tmp_path):
+        def broken_stream():
+            yield _dict_row({"id": "1"})
+            raise RuntimeError("stream reset")
+
+        mock_client = self._client([])
+        mock_client.query_stream.return_value = broken_stream()
+        mock_get_client.return_value = mock_client
+        out = tmp_path / "export.ndjson"
+
+        with pytest.raises(RuntimeError):
+            await gads_export_gaql(
+                customer_id="1234567890",
+                query="SELECT campaign.id FROM campaign",
+                output_path=str(out),
+                ctx=MagicMock(),
+            )
+        assert list(tmp_path.iterdir()) == []
@@ -5,11 +5,12 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper, QueryPage
 from google_ads_mcp.tools.hierarchy import (
     _build_customer_clients_query,
     _build_merchant_center_links_query,
-    _parse_customer_client_row,
-    _parse_merchant_center_link_row,
+    _CUSTOMER_CLIENT_ROWS,
+    _MERCHANT_CENTER_LINK_ROWS,
     gads_list_customer_clients,
     gads_list_accessible_customers,
     gads_list_merchant_center_links,
@@ -40,6 +41,11 @@ def _make_customer_client_row(
     return row
 
 
+def _call_inline(func, *args, **kwargs):
+    """Stand-in for AsyncGoogleAdsClientWrapper.acall that runs func directly."""
+    return func(*args, **kwargs)
+
+
 # ---------------------------------------------------------------------------
 # Tests: _build_customer_clients_query
 # ---------------------------------------------------------------------------
@@ -58,13 +64,13 @@ class TestBuildCustomerClientsQuery:
 
 
 # ---------------------------------------------------------------------------
-# Tests: _parse_customer_client_row
+# Tests: _CUSTOMER_CLIENT_ROWS
 # ---------------------------------------------------------------------------
 
 class TestParseCustomerClientRow:
     def test_basic_parsing(self):
         row = _make_customer_client_row()
-        result = _parse_customer_client_row(row)
+        result = _CUSTOMER_CLIENT_ROWS.records([row])[0]
         assert result["client_customer"] == "customers/9876543210"
         assert result["descriptive_name"] == "Test Client Account"
         assert result["level"] == "1"
@@ -74,7 +80,7 @@ class TestParseCustomerClientRow:
 
     def test_status_strip(self):
         row = _make_customer_client_row(status="CustomerStatus.ENABLED")
-        result = _parse_customer_client_row(row)
+        result = _CUSTOMER_CLIENT_ROWS.records([row])[0]
         assert result["status"] == "ENABLED"
 
 
@@ -84,9 +90,10 @@ class TestParseCustomerClientRow:
 
 class TestGadsListCustomerClients:
     @patch("google_ads_mcp.tools.hierarchy.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_customer_client_row(
                 descriptive_name="Client A",
                 currency_code="EUR",
@@ -96,10 +103,10 @@ class TestGadsListCustomerClients:
                 descriptive_name="Client B",
                 currency_code="USD",
             ),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_customer_clients(
+        result = await gads_list_customer_clients(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -108,14 +115,15 @@ class TestGadsListCustomerClients:
         assert "Client B" in result
 
     @patch("google_ads_mcp.tools.hierarchy.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_customer_client_row(),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_customer_clients(
+        result = await gads_list_customer_clients(
             customer_id="1234567890",
             response_format="json",
             ctx=MagicMock(),
@@ -128,30 +136,32 @@ class TestGadsListCustomerClients:
         assert data["customer_clients"][0]["currency_code"] == "USD"
 
     @patch("google_ads_mcp.tools.hierarchy.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_customer_clients(
+        result = await gads_list_customer_clients(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
         assert "0/0" in result
 
     @patch("google_ads_mcp.tools.hierarchy.get_client")
-    def test_pagination(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_pagination(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_customer_client_row(
                 descriptive_name=f"Client {i}",
                 client_customer=f"customers/{i}",
             )
-            for i in range(6)
-        ]
+            for i in range(3)
+        ], next_page_token="tok", has_more=True)
         mock_get_client.return_value = mock_client
 
-        result = gads_list_customer_clients(
+        result = await gads_list_customer_clients(
             customer_id="1234567890",
             limit=3,
             offset=0,
@@ -159,23 +169,24 @@ class TestGadsListCustomerClients:
             ctx=MagicMock(),
         )
         data = json.loads(result)
-        assert data["pagination"]["total"] == 6
+        assert data["pagination"]["total"] is None
         assert data["pagination"]["count"] == 3
         assert data["pagination"]["has_more"] is True
 
     @patch("google_ads_mcp.tools.hierarchy.get_client")
-    def test_pagination_offset(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_pagination_offset(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_customer_client_row(
                 descriptive_name=f"Client {i}",
                 client_customer=f"customers/{i}",
             )
-            for i in range(6)
-        ]
+            for i in range(4, 6)
+        ], skipped=4)
         mock_get_client.return_value = mock_client
 
-        result = gads_list_customer_clients(
+        result = await gads_list_customer_clients(
             customer_id="1234567890",
             limit=3,
             offset=4,
@@ -194,8 +205,10 @@ class TestGadsListCustomerClients:
 
 class TestGadsListAccessibleCustomers:
     @patch("google_ads_mcp.tools.hierarchy.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.acall.side_effect = _call_inline
         mock_service = MagicMock()
         mock_response = MagicMock()
         mock_response.resource_names = [
@@ -206,14 +219,16 @@ class TestGadsListAccessibleCustomers:
         mock_client.get_service.return_value = mock_service
         mock_get_client.return_value = mock_client
 
-        result = gads_list_accessible_customers(ctx=MagicMock())
+        result = await gads_list_accessible_customers(ctx=MagicMock())
         assert "## Accessible Customers" in result
         assert "1234567890" in result
         assert "9876543210" in result
 
     @patch("google_ads_mcp.tools.hierarchy.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.acall.side_effect = _call_inline
         mock_service = MagicMock()
         mock_response = MagicMock()
         mock_response.resource_names = [
@@ -224,7 +239,7 @@ class TestGadsListAccessibleCustomers:
         mock_client.get_service.return_value = mock_service
         mock_get_client.return_value = mock_client
 
-        result = gads_list_accessible_customers(
+        result = await gads_list_accessible_customers(
             response_format="json",
             ctx=MagicMock(),
         )
@@ -237,8 +252,10 @@ class TestGadsListAccessibleCustomers:
         assert data["accessible_customers"][1]["customer_id"] == "9876543210"
 
     @patch("google_ads_mcp.tools.hierarchy.get_client")
-    def test_empty_results_markdown(self, mock_get_client):
-        mock_client = MagicMock()
+    @pytest.mark.asyncio
+    async def test_empty_results_markdown(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.acall.side_effect = _call_inline
         mock_service = MagicMock()
         mock_response = MagicMock()
         mock_response.resource_names = []
@@ -246,12 +263,14 @@ class TestGadsListAccessibleCustomers:
         mock_client.get_service.return_value = mock_service
         mock_get_client.return_value = mock_client
 
-        result = gads_list_accessible_customers(ctx=MagicMock())
+        result = await gads_list_accessible_customers(ctx=MagicMock())
         assert "No accessible customer accounts found" in result
 
     @patch("google_ads_mcp.tools.hierarchy.get_client")
-    def test_empty_results_json(self, mock_get_client):
-        mock_client = MagicMock()
+    @pytest.mark.asyncio
+    async def test_empty_results_json(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.acall.side_effect = _call_inline
         mock_service = MagicMock()
         mock_response = MagicMock()
         mock_response.resource_names = []
@@ -259,7 +278,7 @@ class TestGadsListAccessibleCustomers:
         mock_client.get_service.return_value = mock_service
         mock_get_client.return_value = mock_client
 
-        result = gads_list_accessible_customers(
+        result = await gads_list_accessible_customers(
             response_format="json",
             ctx=MagicMock(),
         )
@@ -268,8 +287,10 @@ class TestGadsListAccessibleCustomers:
         assert data["accessible_customers"] == []
 
     @patch("google_ads_mcp.tools.hierarchy.get_client")
-    def test_single_customer(self, mock_get_client):
-        mock_client = MagicMock()
+    @pytest.mark.asyncio
+    async def test_single_customer(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.acall.side_effect = _call_inline
         mock_service = MagicMock()
         mock_response = MagicMock()
         mock_response.resource_names = ["customers/5555555555"]
@@ -277,7 +298,7 @@ class TestGadsListAccessibleCustomers:
         mock_client.get_service.return_value = mock_service
         mock_get_client.return_value = mock_client
 
-        result = gads_list_accessible_customers(
+        result = await gads_list_accessible_customers(
             response_format="json",
             ctx=MagicMock(),
         )
@@ -286,8 +307,10 @@ class TestGadsListAccessibleCustomers:
         assert data["accessible_customers"][0]["customer_id"] == "5555555555"
 
     @patch("google_ads_mcp.tools.hierarchy.get_client")
-    def test_service_called_correctly(self, mock_get_client):
-        mock_client = MagicMock()
+    @pytest.mark.asyncio
+    async def test_service_called_correctly(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.acall.side_effect = _call_inline
         mock_service = MagicMock()
         mock_response = MagicMock()
         mock_response.resource_names = []
@@ -295,7 +318,7 @@ class TestGadsListAccessibleCustomers:
         mock_client.get_service.return_value = mock_service
         mock_get_client.return_value = mock_client
 
-        gads_list_accessible_customers(ctx=MagicMock())
+        await gads_list_accessible_customers(ctx=MagicMock())
         mock_client.get_service.assert_called_once_with("CustomerService")
         mock_service.list_accessible_customers.assert_called_once()
 
@@ -330,13 +353,13 @@ class TestBuildMerchantCenterLinksQuery:
 
 
 # ---------------------------------------------------------------------------
-# Tests: _parse_merchant_center_link_row
+# Tests: _MERCHANT_CENTER_LINK_ROWS
 # ---------------------------------------------------------------------------
 
 class TestParseMerchantCenterLinkRow:
     def test_basic_parsing(self):
         row = _make_merchant_center_link_row()
-        result = _parse_merchant_center_link_row(row)
+        result = _MERCHANT_CENTER_LINK_ROWS.records([row])[0]
         assert result["merchant_id"] == "123456"
         assert result["account_name"] == "My Shop"
         assert result["status"] == "ENABLED"
@@ -345,7 +368,7 @@ class TestParseMerchantCenterLinkRow:
         row = _make_merchant_center_link_row(
             status="MerchantCenterLinkStatus.ENABLED"
         )
-        result = _parse_merchant_center_link_row(row)
+        result = _MERCHANT_CENTER_LINK_ROWS.records([row])[0]
         assert result["status"] == "ENABLED"
 
 
@@ -355,19 +378,20 @@ class TestParseMerchantCenterLinkRow:
 
 class TestGadsListMerchantCenterLinks:
     @patch("google_ads_mcp.tools.hierarchy.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_merchant_center_link_row(
                 merchant_id="111", account_name="Shop A",
             ),
             _make_merchant_center_link_row(
                 merchant_id="222", account_name="Shop B",
             ),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_merchant_center_links(
+        result = await gads_list_merchant_center_links(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -376,14 +400,15 @@ class TestGadsListMerchantCenterLinks:
         assert "Shop B" in result
 
     @patch("google_ads_mcp.tools.hierarchy.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_merchant_center_link_row(),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_merchant_center_links(
+        result = await gads_list_merchant_center_links(
             customer_id="1234567890",
             response_format="json",
             ctx=MagicMock(),
@@ -396,29 +421,31 @@ class TestGadsListMerchantCenterLinks:
         assert data["merchant_center_links"][0]["account_name"] == "My Shop"
 
     @patch("google_ads_mcp.tools.hierarchy.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_merchant_center_links(
+        result = await gads_list_merchant_center_links(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
         assert "0/0" in result
 
     @patch("google_ads_mcp.tools.hierarchy.get_client")
-    def test_pagination(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_pagination(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_merchant_center_link_row(
                 merchant_id=str(i), account_name=f"Shop {i}",
             )
-            for i in range(5)
-        ]
+            for i in range(2)
+        ], next_page_token="tok", has_more=True)
         mock_get_client.return_value = mock_client
 
-        result = gads_list_merchant_center_links(
+        result = await gads_list_merchant_center_links(
             customer_id="1234567890",
             limit=2,
             offset=0,
@@ -426,6 +453,6 @@ class TestGadsListMerchantCenterLinks:
             ctx=MagicMock(),
         )
         data = json.loads(result)
-        assert data["pagination"]["total"] == 5
+        assert data["pagination"]["total"] is None
         assert data["pagination"]["count"] == 2
         assert data["pagination"]["has_more"] is True
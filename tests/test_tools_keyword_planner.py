@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
 from google_ads_mcp.tools.keyword_planner import gads_generate_keyword_ideas
 
 
@@ -24,10 +25,18 @@ def _make_keyword_idea(
     return idea
 
 
+def _call_inline(func, *args, **kwargs):
+    """Stand-in for AsyncGoogleAdsClientWrapper.acall that runs func directly."""
+    return func(*args, **kwargs)
+
+
 class TestGadsGenerateKeywordIdeas:
     @patch("google_ads_mcp.tools.keyword_planner.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.client = MagicMock()
+        mock_client.acall.side_effect = _call_inline
         mock_service = MagicMock()
         mock_service.generate_keyword_ideas.return_value = [
             _make_keyword_idea(text="running shoes"),
@@ -37,7 +46,7 @@ class TestGadsGenerateKeywordIdeas:
         mock_client.client.get_type.return_value = MagicMock()
         mock_get_client.return_value = mock_client
 
-        result = gads_generate_keyword_ideas(
+        result = await gads_generate_keyword_ideas(
             customer_id="1234567890",
             keywords="running shoes, sneakers",
             ctx=MagicMock(),
@@ -46,8 +55,11 @@ class TestGadsGenerateKeywordIdeas:
         assert "running shoes" in result
 
     @patch("google_ads_mcp.tools.keyword_planner.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.client = MagicMock()
+        mock_client.acall.side_effect = _call_inline
         mock_service = MagicMock()
         mock_service.generate_keyword_ideas.return_value = [
             _make_keyword_idea(text="running shoes", avg_monthly_searches=12000),
@@ -56,7 +68,7 @@ class TestGadsGenerateKeywordIdeas:
         mock_client.client.get_type.return_value = MagicMock()
         mock_get_client.return_value = mock_client
 
-        result = gads_generate_keyword_ideas(
+        result = await gads_generate_keyword_ideas(
             customer_id="1234567890",
             keywords="running shoes",
             response_format="json",
@@ -72,8 +84,11 @@ class TestGadsGenerateKeywordIdeas:
         assert data["seed_keywords"] == ["running shoes"]
 
     @patch("google_ads_mcp.tools.keyword_planner.get_client")
-    def test_with_geo_target(self, mock_get_client):
-        mock_client = MagicMock()
+    @pytest.mark.asyncio
+    async def test_with_geo_target(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.client = MagicMock()
+        mock_client.acall.side_effect = _call_inline
         mock_service = MagicMock()
         mock_service.generate_keyword_ideas.return_value = [
             _make_keyword_idea(text="sneakers"),
@@ -83,7 +98,7 @@ class TestGadsGenerateKeywordIdeas:
         mock_client.client.get_type.return_value = mock_request
         mock_get_client.return_value = mock_client
 
-        result = gads_generate_keyword_ideas(
+        result = await gads_generate_keyword_ideas(
             customer_id="1234567890",
             keywords="sneakers",
             geo_target_id="2840",
@@ -95,24 +110,28 @@ class TestGadsGenerateKeywordIdeas:
         assert len(data["keyword_ideas"]) == 1
 
     @patch("google_ads_mcp.tools.keyword_planner.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.client = MagicMock()
+        mock_client.acall.side_effect = _call_inline
         mock_service = MagicMock()
         mock_service.generate_keyword_ideas.return_value = []
         mock_client.get_service.return_value = mock_service
         mock_client.client.get_type.return_value = MagicMock()
         mock_get_client.return_value = mock_client
 
-        result = gads_generate_keyword_ideas(
+        result = await gads_generate_keyword_ideas(
             customer_id="1234567890",
             keywords="xyz123abc",
             ctx=MagicMock(),
         )
         assert "0 of 0" in result
 
-    def test_empty_keywords(self):
+    @pytest.mark.asyncio
+    async def test_empty_keywords(self):
         """Test that empty keywords string returns an error."""
-        result = gads_generate_keyword_ideas(
+        result = await gads_generate_keyword_ideas(
             customer_id="1234567890",
             keywords="",
             ctx=MagicMock(),
@@ -120,9 +139,10 @@ class TestGadsGenerateKeywordIdeas:
         data = json.loads(result)
         assert "error" in data
 
-    def test_whitespace_only_keywords(self):
+    @pytest.mark.asyncio
+    async def test_whitespace_only_keywords(self):
         """Test that whitespace-only keywords string returns an error."""
-        result = gads_generate_keyword_ideas(
+        result = await gads_generate_keyword_ideas(
             customer_id="1234567890",
             keywords="  ,  ,  ",
             ctx=MagicMock(),
@@ -131,8 +151,11 @@ class TestGadsGenerateKeywordIdeas:
         assert "error" in data
 
     @patch("google_ads_mcp.tools.keyword_planner.get_client")
-    def test_pagination(self, mock_get_client):
-        mock_client = MagicMock()
+    @pytest.mark.asyncio
+    async def test_pagination(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.client = MagicMock()
+        mock_client.acall.side_effect = _call_inline
         mock_service = MagicMock()
         mock_service.generate_keyword_ideas.return_value = [
             _make_keyword_idea(text=f"keyword {i}")
@@ -142,7 +165,7 @@ class TestGadsGenerateKeywordIdeas:
         mock_client.client.get_type.return_value = MagicMock()
         mock_get_client.return_value = mock_client
 
-        result = gads_generate_keyword_ideas(
+        result = await gads_generate_keyword_ideas(
             customer_id="1234567890",
             keywords="test",
             limit=3,
@@ -151,13 +174,16 @@ class TestGadsGenerateKeywordIdeas:
             ctx=MagicMock(),
         )
         data = json.loads(result)
-        assert data["pagination"]["total"] == 10
+        assert data["pagination"]["total"] is None
         assert data["pagination"]["count"] == 3
         assert data["pagination"]["has_more"] is True
 
     @patch("google_ads_mcp.tools.keyword_planner.get_client")
-    def test_competition_parsing(self, mock_get_client):
-        mock_client = MagicMock()
+    @pytest.mark.asyncio
+    async def test_competition_parsing(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.client = MagicMock()
+        mock_client.acall.side_effect = _call_inline
         mock_service = MagicMock()
         mock_service.generate_keyword_ideas.return_value = [
             _make_keyword_idea(
@@ -169,7 +195,7 @@ class TestGadsGenerateKeywordIdeas:
         mock_client.client.get_type.return_value = MagicMock()
         mock_get_client.return_value = mock_client
 
-        result = gads_generate_keyword_ideas(
+        result = await gads_generate_keyword_ideas(
             customer_id="1234567890",
             keywords="test",
             response_format="json",
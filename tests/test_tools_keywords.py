@@ -3,6 +3,9 @@
 import json
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper, QueryPage
 from google_ads_mcp.models.tool_inputs import (
     GetKeywordPerformanceInput,
     ListKeywordsInput,
@@ -10,7 +13,7 @@ from google_ads_mcp.models.tool_inputs import (
 from google_ads_mcp.tools.keywords import (
     _build_keyword_performance_query,
     _build_list_keywords_query,
-    _parse_keyword_row,
+    _KEYWORD_ROWS,
     list_keywords,
     get_keyword_performance,
 )
@@ -77,7 +80,7 @@ class TestBuildListKeywordsQuery:
 class TestParseKeywordRow:
     def test_basic_parsing(self):
         row = _make_keyword_row()
-        result = _parse_keyword_row(row)
+        result = _KEYWORD_ROWS.records([row])[0]
         assert result["keyword"] == "buy shoes"
         assert result["id"] == "200"
         assert result["campaign"] == "Campaign 1"
@@ -85,27 +88,29 @@ class TestParseKeywordRow:
 
 class TestListKeywords:
     @patch("google_ads_mcp.tools.keywords.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_keyword_row(),
             _make_keyword_row(text="running shoes", match_type="BROAD"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = list_keywords(
+        result = await list_keywords(
             customer_id="1234567890", ctx=MagicMock()
         )
         assert "## Keywords" in result
         assert "buy shoes" in result
 
     @patch("google_ads_mcp.tools.keywords.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_keyword_row()]
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_keyword_row()])
         mock_get_client.return_value = mock_client
 
-        result = list_keywords(
+        result = await list_keywords(
             customer_id="1234567890",
             response_format="json",
             ctx=MagicMock(),
@@ -141,12 +146,13 @@ class TestBuildKeywordPerformanceQuery:
 
 class TestGetKeywordPerformance:
     @patch("google_ads_mcp.tools.keywords.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_kw_perf_row()]
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_kw_perf_row()])
         mock_get_client.return_value = mock_client
 
-        result = get_keyword_performance(
+        result = await get_keyword_performance(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -155,12 +161,13 @@ class TestGetKeywordPerformance:
         assert "## Keyword Performance" in result
 
     @patch("google_ads_mcp.tools.keywords.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_kw_perf_row()]
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_kw_perf_row()])
         mock_get_client.return_value = mock_client
 
-        result = get_keyword_performance(
+        result = await get_keyword_performance(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
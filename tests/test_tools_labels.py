@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper, QueryPage
 from google_ads_mcp.tools.labels import (
     _build_list_labels_query,
     _build_campaign_labels_query,
@@ -12,12 +13,12 @@ from google_ads_mcp.tools.labels import (
     _build_ad_group_ad_labels_query,
     _build_ad_group_criterion_labels_query,
     _build_customer_labels_query,
-    _parse_label_row,
-    _parse_campaign_label_row,
-    _parse_ad_group_label_row,
-    _parse_ad_group_ad_label_row,
-    _parse_ad_group_criterion_label_row,
-    _parse_customer_label_row,
+    _LABEL_ROWS,
+    _CAMPAIGN_LABEL_ROWS,
+    _AD_GROUP_LABEL_ROWS,
+    _AD_GROUP_AD_LABEL_ROWS,
+    _AD_GROUP_CRITERION_LABEL_ROWS,
+    _CUSTOMER_LABEL_ROWS,
     gads_list_labels,
     gads_list_campaign_labels,
     gads_list_ad_group_labels,
@@ -121,7 +122,7 @@ class TestBuildListLabelsQuery:
 class TestParseLabelRow:
     def test_basic_parsing(self):
         row = _make_label_row()
-        result = _parse_label_row(row)
+        result = _LABEL_ROWS.records([row])[0]
         assert result["id"] == "100"
         assert result["name"] == "Test Label"
         assert result["background_color"] == "#FF0000"
@@ -129,21 +130,22 @@ class TestParseLabelRow:
 
     def test_status_strip(self):
         row = _make_label_row(status="LabelStatus.ENABLED")
-        result = _parse_label_row(row)
+        result = _LABEL_ROWS.records([row])[0]
         assert result["status"] == "ENABLED"
 
 
 class TestGadsListLabels:
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_label_row(label_id="1", name="Label A"),
             _make_label_row(label_id="2", name="Label B"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_labels(
+        result = await gads_list_labels(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -152,14 +154,15 @@ class TestGadsListLabels:
         assert "Label B" in result
 
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_label_row(label_id="1", name="Test"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_labels(
+        result = await gads_list_labels(
             customer_id="1234567890",
             response_format="json",
             ctx=MagicMock(),
@@ -171,27 +174,29 @@ class TestGadsListLabels:
         assert data["labels"][0]["name"] == "Test"
 
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_labels(
+        result = await gads_list_labels(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
         assert "0/0" in result
 
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_pagination(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_pagination(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_label_row(label_id=str(i), name=f"Label {i}")
-            for i in range(5)
-        ]
+            for i in range(2)
+        ], next_page_token="tok", has_more=True)
         mock_get_client.return_value = mock_client
 
-        result = gads_list_labels(
+        result = await gads_list_labels(
             customer_id="1234567890",
             limit=2,
             offset=0,
@@ -199,7 +204,7 @@ class TestGadsListLabels:
             ctx=MagicMock(),
         )
         data = json.loads(result)
-        assert data["pagination"]["total"] == 5
+        assert data["pagination"]["total"] is None
         assert data["pagination"]["count"] == 2
         assert data["pagination"]["has_more"] is True
 
@@ -231,14 +236,15 @@ class TestBuildCampaignLabelsQuery:
 
 class TestGadsListCampaignLabels:
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_campaign_label_row(),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_campaign_labels(
+        result = await gads_list_campaign_labels(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -247,14 +253,15 @@ class TestGadsListCampaignLabels:
         assert "Label A" in result
 
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_campaign_label_row(),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_campaign_labels(
+        result = await gads_list_campaign_labels(
             customer_id="1234567890",
             response_format="json",
             ctx=MagicMock(),
@@ -265,14 +272,15 @@ class TestGadsListCampaignLabels:
         assert data["campaign_labels"][0]["campaign_name"] == "Campaign A"
 
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_with_campaign_filter(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_with_campaign_filter(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_campaign_label_row(campaign_id="10"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_campaign_labels(
+        result = await gads_list_campaign_labels(
             customer_id="1234567890",
             campaign_id="10",
             response_format="json",
@@ -282,12 +290,13 @@ class TestGadsListCampaignLabels:
         assert len(data["campaign_labels"]) == 1
 
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_campaign_labels(
+        result = await gads_list_campaign_labels(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -315,14 +324,15 @@ class TestBuildAdGroupLabelsQuery:
 
 class TestGadsListAdGroupLabels:
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_ad_group_label_row(),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_ad_group_labels(
+        result = await gads_list_ad_group_labels(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -330,14 +340,15 @@ class TestGadsListAdGroupLabels:
         assert "Ad Group A" in result
 
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_ad_group_label_row(),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_ad_group_labels(
+        result = await gads_list_ad_group_labels(
             customer_id="1234567890",
             response_format="json",
             ctx=MagicMock(),
@@ -347,14 +358,15 @@ class TestGadsListAdGroupLabels:
         assert data["ad_group_labels"][0]["ad_group_name"] == "Ad Group A"
 
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_with_filters(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_with_filters(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_ad_group_label_row(),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_ad_group_labels(
+        result = await gads_list_ad_group_labels(
             customer_id="1234567890",
             ad_group_id="20",
             label_id="100",
@@ -365,12 +377,13 @@ class TestGadsListAdGroupLabels:
         assert len(data["ad_group_labels"]) == 1
 
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_ad_group_labels(
+        result = await gads_list_ad_group_labels(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -394,14 +407,15 @@ class TestBuildAdGroupAdLabelsQuery:
 
 class TestGadsListAdGroupAdLabels:
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_ad_group_ad_label_row(),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_ad_group_ad_labels(
+        result = await gads_list_ad_group_ad_labels(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -409,14 +423,15 @@ class TestGadsListAdGroupAdLabels:
         assert "Ad A" in result
 
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_ad_group_ad_label_row(),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_ad_group_ad_labels(
+        result = await gads_list_ad_group_ad_labels(
             customer_id="1234567890",
             response_format="json",
             ctx=MagicMock(),
@@ -426,14 +441,15 @@ class TestGadsListAdGroupAdLabels:
         assert data["ad_labels"][0]["ad_name"] == "Ad A"
 
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_with_label_filter(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_with_label_filter(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_ad_group_ad_label_row(),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_ad_group_ad_labels(
+        result = await gads_list_ad_group_ad_labels(
             customer_id="1234567890",
             label_id="100",
             response_format="json",
@@ -443,12 +459,13 @@ class TestGadsListAdGroupAdLabels:
         assert len(data["ad_labels"]) == 1
 
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_ad_group_ad_labels(
+        result = await gads_list_ad_group_ad_labels(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -472,28 +489,30 @@ class TestBuildAdGroupCriterionLabelsQuery:
 
 class TestGadsListAdGroupCriterionLabels:
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_criterion_label_row(),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_ad_group_criterion_labels(
+        result = await gads_list_ad_group_criterion_labels(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
         assert "## Criterion Labels" in result
 
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_criterion_label_row(),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_ad_group_criterion_labels(
+        result = await gads_list_ad_group_criterion_labels(
             customer_id="1234567890",
             response_format="json",
             ctx=MagicMock(),
@@ -503,12 +522,13 @@ class TestGadsListAdGroupCriterionLabels:
         assert data["criterion_labels"][0]["criterion_id"] == "40"
 
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_ad_group_criterion_labels(
+        result = await gads_list_ad_group_criterion_labels(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -530,14 +550,15 @@ class TestBuildCustomerLabelsQuery:
 
 class TestGadsListCustomerLabels:
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_customer_label_row(),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_customer_labels(
+        result = await gads_list_customer_labels(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -545,14 +566,15 @@ class TestGadsListCustomerLabels:
         assert "Label A" in result
 
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_customer_label_row(),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_customer_labels(
+        result = await gads_list_customer_labels(
             customer_id="1234567890",
             response_format="json",
             ctx=MagicMock(),
@@ -562,27 +584,29 @@ class TestGadsListCustomerLabels:
         assert data["customer_labels"][0]["label_name"] == "Label A"
 
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_list_customer_labels(
+        result = await gads_list_customer_labels(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
         assert "0/0" in result
 
     @patch("google_ads_mcp.tools.labels.get_client")
-    def test_pagination(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_pagination(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_customer_label_row(label_id=str(i), label_name=f"Label {i}")
-            for i in range(4)
-        ]
+            for i in range(1, 3)
+        ], skipped=1, next_page_token="tok", has_more=True)
         mock_get_client.return_value = mock_client
 
-        result = gads_list_customer_labels(
+        result = await gads_list_customer_labels(
             customer_id="1234567890",
             limit=2,
             offset=1,
@@ -590,7 +614,7 @@ class TestGadsListCustomerLabels:
             ctx=MagicMock(),
         )
         data = json.loads(result)
-        assert data["pagination"]["total"] == 4
+        assert data["pagination"]["total"] is None
         assert data["pagination"]["count"] == 2
         assert data["pagination"]["offset"] == 1
         assert data["pagination"]["has_more"] is True
@@ -603,7 +627,7 @@ class TestGadsListCustomerLabels:
 class TestParseHelpers:
     def test_parse_campaign_label_row(self):
         row = _make_campaign_label_row()
-        result = _parse_campaign_label_row(row)
+        result = _CAMPAIGN_LABEL_ROWS.records([row])[0]
         assert result["campaign_id"] == "10"
         assert result["campaign_name"] == "Campaign A"
         assert result["label_id"] == "100"
@@ -611,24 +635,24 @@ class TestParseHelpers:
 
     def test_parse_ad_group_label_row(self):
         row = _make_ad_group_label_row()
-        result = _parse_ad_group_label_row(row)
+        result = _AD_GROUP_LABEL_ROWS.records([row])[0]
         assert result["ad_group_id"] == "20"
         assert result["ad_group_name"] == "Ad Group A"
 
     def test_parse_ad_group_ad_label_row(self):
         row = _make_ad_group_ad_label_row()
-        result = _parse_ad_group_ad_label_row(row)
+        result = _AD_GROUP_AD_LABEL_ROWS.records([row])[0]
         assert result["ad_id"] == "30"
         assert result["ad_name"] == "Ad A"
 
     def test_parse_criterion_label_row(self):
         row = _make_criterion_label_row()
-        result = _parse_ad_group_criterion_label_row(row)
+        result = _AD_GROUP_CRITERION_LABEL_ROWS.records([row])[0]
         assert result["criterion_id"] == "40"
         assert result["label_id"] == "100"
 
     def test_parse_customer_label_row(self):
         row = _make_customer_label_row()
-        result = _parse_customer_label_row(row)
+        result = _CUSTOMER_LABEL_ROWS.records([row])[0]
         assert result["customer_id"] == "1234567890"
         assert result["label_name"] == "Label A"
@@ -0,0 +1,192 @@
+"""Tests for the MCC fan-out report tool."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.api_core.exceptions import DeadlineExceeded
+
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
+from google_ads_mcp.tools.mcc import gads_mcc_report
+from google_ads_mcp.utils.errors import AuthenticationError
+
+MANAGER = "9999999999"
+
+
+def _client_row(cid, name, currency="EUR"):
+    return SimpleNamespace(customer_client=SimpleNamespace(
+        id=cid, descriptive_name=name, currency_code=currency,
+    ))
+
+
+def _metrics_row(clicks, cost):
+    return SimpleNamespace(
+        campaign=SimpleNamespace(id="1", name="Brand", status="CampaignStatus.ENABLED"),
+        metrics=SimpleNamespace(
+            impressions=clicks * 10, clicks=clicks, cost_micros=cost,
+            conversions=1.0, conversions_value=20.0,
+        ),
+    )
+
+
+class FanOutClient:
+    """aquery stand-in: lists N leaves for the manager, one row per leaf."""
+
+    def __init__(self, leaves, failing=(), delay=0.0, error=None):
+        self.leaves = leaves
+        self.failing = set(failing)
+        self.error = error
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.queried = []
+
+    async def aquery(self, customer_id, query, max_rows=None, **kwargs):
+        if customer_id == MANAGER:
+            return self.leaves
+        self.queried.append(customer_id)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if customer_id in self.failing:
+                raise self.error or AuthenticationError("Errore auth: accesso negato")
+            return [_metrics_row(int(customer_id[-2:]), 1_000_000 * int(customer_id[-2:]))]
+        finally:
+            self.active -= 1
+
+
+def _mock(fake):
+    client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+    client.aquery.side_effect = fake.aquery
+    return client
+
+
+class TestGadsMccReport:
+    @patch("google_ads_mcp.tools.mcc.get_client")
+    @pytest.mark.asyncio
+    async def test_merges_accounts_with_customer_id(self, mock_get_client):
+        fake = FanOutClient([
+            _client_row("1000000001", "Shop A"),
+            _client_row("1000000002", "Shop B"),
+            _client_row("1000000003", "Shop C", currency="USD"),
+        ])
+        mock_get_client.return_value = _mock(fake)
+        result = await gads_mcc_report(
+            customer_id="999-999-9999", response_format="json", ctx=MagicMock()
+        )
+        data = json.loads(result)
+        assert data["accounts"] == 3
+        assert [r["customer_id"] for r in data["rows"]] == [
+            "1000000003", "1000000002", "1000000001",
+        ]
+        totals = {t["currency"]: t for t in data["totals"]}
+        assert totals["EUR"]["clicks"] == 3
+        assert totals["USD"]["cost_micros"] == 3_000_000
+
+    @patch("google_ads_mcp.tools.mcc.get_client")
+    @pytest.mark.asyncio
+    async def test_failing_account_is_isolated(self, mock_get_client):
+        fake = FanOutClient(
+            [_client_row("1000000001", "A"), _client_row("1000000002", "B")],
+            failing={"1000000001"},
+        )
+        mock_get_client.return_value = _mock(fake)
+        data = json.loads(await gads_mcc_report(
+            customer_id=MANAGER, response_format="json", ctx=MagicMock()
+        ))
+        assert [r["customer_id"] for r in data["rows"]] == ["1000000002"]
+        assert data["errors"][0]["customer_id"] == "1000000001"
+        assert "accesso negato" in data["errors"][0]["error"]
+
+    @patch("google_ads_mcp.tools.mcc.get_client")
+    @pytest.mark.asyncio
+    async def test_unmapped_exception_is_isolated(self, mock_get_client):
+        fake = FanOutClient(
+            [_client_row("1000000001", "A"), _client_row("1000000002", "B")],
+            failing={"1000000001"},
+            error=DeadlineExceeded("deadline exceeded"),
+        )
+        mock_get_client.return_value = _mock(fake)
+        data = json.loads(await gads_mcc_report(
+            customer_id=MANAGER, response_format="json", ctx=MagicMock()
+        ))
+        assert [r["customer_id"] for r in data["rows"]] == ["1000000002"]
+        assert data["errors"][0]["customer_id"] == "1000000001"
+        assert "deadline exceeded" in data["errors"][0]["error"]
+
+    @patch("google_ads_mcp.tools.mcc.get_client")
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded_and_parallel(self, mock_get_client):
+        leaves = [_client_row(f"10000000{i:02d}", f"Shop {i}") for i in range(60)]
+        fake = FanOutClient(leaves, delay=0.01)
+        mock_get_client.return_value = _mock(fake)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        data = json.loads(await gads_mcc_report(
+            customer_id=MANAGER, max_concurrency=15,
+            response_format="json", ctx=MagicMock(),
+        ))
+        assert len(data["rows"]) == 60
+        assert fake.peak == 15
+        # 60 accounts at 10ms each: ~4 waves (~40ms) instead of 600ms
+        # sequentially; the bound leaves headroom for a loaded machine.
+        assert loop.time() - start < 0.6
+
+    @patch("google_ads_mcp.tools.mcc.get_client")
+    @pytest.mark.asyncio
+    async def test_client_filters(self, mock_get_client):
+        fake = FanOutClient([
+            _client_row("1000000001", "Shop Milano"),
+            _client_row("1000000002", "Shop Roma"),
+            _client_row("1000000003", "Outlet Roma"),
+        ])
+        mock_get_client.return_value = _mock(fake)
+        await gads_mcc_report(
+            customer_id=MANAGER, client_ids="100-000-0002,1000000003",
+            name_contains="shop", ctx=MagicMock(),
+        )
+        assert fake.queried == ["1000000002"]
+
+    @patch("google_ads_mcp.tools.mcc.get_client")
+    @pytest.mark.asyncio
+    async def test_campaign_report_markdown(self, mock_get_client):
+        fake = FanOutClient([_client_row("1000000001", "Shop A")])
+        mock_get_client.return_value = _mock(fake)
+        result = await gads_mcc_report(
+            customer_id=MANAGER, report="campaign", ctx=MagicMock()
+        )
+        assert "## MCC campaign report (1 accounts, 1 rows)" in result
+        assert "Brand" in result
+        assert "Total EUR" in result
+
+    @patch("google_ads_mcp.tools.mcc.get_client")
+    @pytest.mark.asyncio
+    async def test_custom_gaql_flattened(self, mock_get_client):
+        fake = FanOutClient([_client_row("1000000001", "Shop A")])
+        client = _mock(fake)
+        mock_get_client.return_value = client
+        with patch(
+            "google_ads_mcp.tools.mcc._row_to_dict",
+            return_value={"campaign": {"name": "Brand"}},
+        ):
+            data = json.loads(await gads_mcc_report(
+                customer_id=MANAGER,
+                query="SELECT campaign.name FROM campaign",
+                response_format="json",
+                ctx=MagicMock(),
+            ))
+        assert data["rows"] == [{
+            "customer_id": "1000000001", "account_name": "Shop A",
+            "currency": "EUR", "campaign.name": "Brand",
+        }]
+        assert data["totals"] == []
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_select(self):
+        result = await gads_mcc_report(
+            customer_id=MANAGER, query="DELETE FROM campaign", ctx=MagicMock()
+        )
+        assert "Only SELECT" in result
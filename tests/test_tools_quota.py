@@ -0,0 +1,82 @@
+"""Tests for the quota status tool."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
+from google_ads_mcp.quota import QuotaLimiter
+from google_ads_mcp.singleflight import SingleFlight
+from google_ads_mcp.tools.quota import gads_quota_status
+
+
+@pytest.fixture
+def mock_client():
+    client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+    client.quota = QuotaLimiter(daily_operations=100)
+    client.quota.reserve("1111111111", cost=3)
+    client.quota.reserve("2222222222")
+    return client
+
+
+class TestGadsQuotaStatus:
+    @patch("google_ads_mcp.tools.quota.get_client")
+    @pytest.mark.asyncio
+    async def test_json_lists_developer_token_and_customers(self, mock_get_client, mock_client):
+        mock_get_client.return_value = mock_client
+        result = await gads_quota_status(response_format="json", ctx=MagicMock())
+        data = json.loads(result)
+        accounts = {a["key"]: a for a in data["accounts"]}
+        assert accounts["developer_token"]["used_today"] == 4
+        assert accounts["developer_token"]["remaining_today"] == 96
+        assert accounts["1111111111"]["used_today"] == 3
+
+    @patch("google_ads_mcp.tools.quota.get_client")
+    @pytest.mark.asyncio
+    async def test_customer_filter(self, mock_get_client, mock_client):
+        mock_get_client.return_value = mock_client
+        result = await gads_quota_status(
+            customer_id="222-222-2222", response_format="json", ctx=MagicMock()
+        )
+        keys = [a["key"] for a in json.loads(result)["accounts"]]
+        assert keys == ["developer_token", "2222222222"]
+
+    @patch("google_ads_mcp.tools.quota.get_client")
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client, mock_client):
+        mock_get_client.return_value = mock_client
+        result = await gads_quota_status(ctx=MagicMock())
+        assert "## Quota API" in result
+        assert "1111111111" in result
+
+    @patch("google_ads_mcp.tools.quota.get_client")
+    @pytest.mark.asyncio
+    async def test_disabled(self, mock_get_client):
+        client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        client.quota = None
+        mock_get_client.return_value = client
+        result = await gads_quota_status(ctx=MagicMock())
+        assert "disabled" in result
+
+    @patch("google_ads_mcp.tools.quota.get_client")
+    @pytest.mark.asyncio
+    async def test_includes_coalescing_stats(self, mock_get_client, mock_client):
+        mock_client.singleflight = SingleFlight()
+        mock_client.singleflight.do("k", lambda: None)
+        mock_get_client.return_value = mock_client
+        data = json.loads(await gads_quota_status(response_format="json", ctx=MagicMock()))
+        assert data["coalescing"] == {"executed": 1, "coalesced": 0, "in_flight": 0}
+        result = await gads_quota_status(ctx=MagicMock())
+        assert "Shared queries" in result
+
+    @patch("google_ads_mcp.tools.quota.get_client")
+    @pytest.mark.asyncio
+    async def test_includes_batching_stats(self, mock_get_client, mock_client):
+        mock_client.batcher = MagicMock()
+        mock_client.batcher.stats.return_value = {"calls": 12, "requests": 2}
+        mock_get_client.return_value = mock_client
+        data = json.loads(await gads_quota_status(response_format="json", ctx=MagicMock()))
+        assert data["batching"] == {"calls": 12, "requests": 2}
+        result = await gads_quota_status(ctx=MagicMock())
+        assert "12 calls sent in 2 API requests" in result
@@ -3,10 +3,13 @@
 import json
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper, QueryPage
 from google_ads_mcp.models.tool_inputs import SearchTermsReportInput
 from google_ads_mcp.tools.search_terms import (
     _build_search_terms_query,
-    _parse_search_term_row,
+    _SEARCH_TERM_ROWS,
     search_terms_report,
 )
 
@@ -75,7 +78,7 @@ class TestBuildSearchTermsQuery:
 class TestParseSearchTermRow:
     def test_basic_parsing(self):
         row = _make_search_term_row()
-        result = _parse_search_term_row(row)
+        result = _SEARCH_TERM_ROWS.records([row])[0]
         assert result["search_term"] == "buy red shoes"
         assert result["campaign"] == "Campaign 1"
         assert result["impressions"] == 100
@@ -84,15 +87,16 @@ class TestParseSearchTermRow:
 
 class TestSearchTermsReport:
     @patch("google_ads_mcp.tools.search_terms.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_search_term_row(term="buy shoes"),
             _make_search_term_row(term="red shoes sale"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = search_terms_report(
+        result = await search_terms_report(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -103,12 +107,13 @@ class TestSearchTermsReport:
         assert "red shoes sale" in result
 
     @patch("google_ads_mcp.tools.search_terms.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_search_term_row()]
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_search_term_row()])
         mock_get_client.return_value = mock_client
 
-        result = search_terms_report(
+        result = await search_terms_report(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -121,15 +126,16 @@ class TestSearchTermsReport:
         assert data["search_terms"][0]["search_term"] == "buy red shoes"
 
     @patch("google_ads_mcp.tools.search_terms.get_client")
-    def test_pagination(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_pagination(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_search_term_row(term=f"term {i}")
-            for i in range(10)
-        ]
+            for i in range(3)
+        ], next_page_token="tok", has_more=True)
         mock_get_client.return_value = mock_client
 
-        result = search_terms_report(
+        result = await search_terms_report(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -138,17 +144,18 @@ class TestSearchTermsReport:
             ctx=MagicMock(),
         )
         data = json.loads(result)
-        assert data["pagination"]["total"] == 10
+        assert data["pagination"]["total"] is None
         assert data["pagination"]["count"] == 3
         assert data["pagination"]["has_more"] is True
 
     @patch("google_ads_mcp.tools.search_terms.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = search_terms_report(
+        result = await search_terms_report(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper, QueryPage
 from google_ads_mcp.tools.views import (
     _build_geographic_view_query,
     _build_shopping_performance_query,
@@ -12,12 +13,12 @@ from google_ads_mcp.tools.views import (
     _build_topic_view_query,
     _build_user_location_view_query,
     _build_click_view_query,
-    _parse_geographic_row,
-    _parse_shopping_performance_row,
-    _parse_display_keyword_row,
+    _GEOGRAPHIC_ROWS,
+    _SHOPPING_PERFORMANCE_ROWS,
+    _DISPLAY_KEYWORD_ROWS,
     _parse_topic_row,
-    _parse_user_location_row,
-    _parse_click_row,
+    _USER_LOCATION_ROWS,
+    _CLICK_ROWS,
     gads_geographic_view,
     gads_shopping_performance_view,
     gads_display_keyword_view,
@@ -177,7 +178,7 @@ class TestBuildGeographicViewQuery:
 class TestParseGeographicRow:
     def test_basic_parsing(self):
         row = _make_geographic_row()
-        result = _parse_geographic_row(row)
+        result = _GEOGRAPHIC_ROWS.records([row])[0]
         assert result["country_criterion_id"] == "2380"
         assert result["campaign"] == "Campaign 1"
         assert result["impressions"] == 500
@@ -186,15 +187,16 @@ class TestParseGeographicRow:
 
 class TestGadsGeographicView:
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_geographic_row(country_id="2380", campaign_name="IT Campaign"),
             _make_geographic_row(country_id="2840", campaign_name="US Campaign"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_geographic_view(
+        result = await gads_geographic_view(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -205,12 +207,13 @@ class TestGadsGeographicView:
         assert "US Campaign" in result
 
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_geographic_row()]
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_geographic_row()])
         mock_get_client.return_value = mock_client
 
-        result = gads_geographic_view(
+        result = await gads_geographic_view(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -223,28 +226,30 @@ class TestGadsGeographicView:
         assert data["geographic_data"][0]["country_criterion_id"] == "2380"
 
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_campaign_id_filter(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_geographic_row()]
+    @pytest.mark.asyncio
+    async def test_campaign_id_filter(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_geographic_row()])
         mock_get_client.return_value = mock_client
 
-        gads_geographic_view(
+        await gads_geographic_view(
             customer_id="1234567890",
             campaign_id="42",
             start_date="2026-01-01",
             end_date="2026-01-31",
             ctx=MagicMock(),
         )
-        called_query = mock_client.query.call_args[0][1]
+        called_query = mock_client.aquery_page.call_args[0][1]
         assert "campaign.id = 42" in called_query
 
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_geographic_view(
+        result = await gads_geographic_view(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -253,13 +258,14 @@ class TestGadsGeographicView:
         assert "0 of 0" in result
 
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_date_defaults(self, mock_get_client):
+    @pytest.mark.asyncio
+    async def test_date_defaults(self, mock_get_client):
         """Verify default dates are applied when not provided."""
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_geographic_view(
+        result = await gads_geographic_view(
             customer_id="1234567890",
             ctx=MagicMock(),
         )
@@ -285,7 +291,7 @@ class TestBuildShoppingPerformanceQuery:
 class TestParseShoppingPerformanceRow:
     def test_basic_parsing(self):
         row = _make_shopping_row()
-        result = _parse_shopping_performance_row(row)
+        result = _SHOPPING_PERFORMANCE_ROWS.records([row])[0]
         assert result["product_item_id"] == "SKU-123"
         assert result["product_title"] == "Red Widget"
         assert result["product_brand"] == "Acme"
@@ -295,15 +301,16 @@ class TestParseShoppingPerformanceRow:
 
 class TestGadsShoppingPerformanceView:
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_shopping_row(item_id="SKU-A", title="Widget A"),
             _make_shopping_row(item_id="SKU-B", title="Widget B"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_shopping_performance_view(
+        result = await gads_shopping_performance_view(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -314,12 +321,13 @@ class TestGadsShoppingPerformanceView:
         assert "Widget B" in result
 
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_shopping_row()]
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_shopping_row()])
         mock_get_client.return_value = mock_client
 
-        result = gads_shopping_performance_view(
+        result = await gads_shopping_performance_view(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -331,28 +339,30 @@ class TestGadsShoppingPerformanceView:
         assert data["shopping_performance"][0]["product_item_id"] == "SKU-123"
 
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_campaign_id_filter(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_shopping_row()]
+    @pytest.mark.asyncio
+    async def test_campaign_id_filter(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_shopping_row()])
         mock_get_client.return_value = mock_client
 
-        gads_shopping_performance_view(
+        await gads_shopping_performance_view(
             customer_id="1234567890",
             campaign_id="77",
             start_date="2026-01-01",
             end_date="2026-01-31",
             ctx=MagicMock(),
         )
-        called_query = mock_client.query.call_args[0][1]
+        called_query = mock_client.aquery_page.call_args[0][1]
         assert "campaign.id = 77" in called_query
 
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_shopping_performance_view(
+        result = await gads_shopping_performance_view(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -379,7 +389,7 @@ class TestBuildDisplayKeywordViewQuery:
 class TestParseDisplayKeywordRow:
     def test_basic_parsing(self):
         row = _make_display_keyword_row()
-        result = _parse_display_keyword_row(row)
+        result = _DISPLAY_KEYWORD_ROWS.records([row])[0]
         assert result["display_name"] == "shoes"
         assert result["keyword_text"] == "running shoes"
         assert result["impressions"] == 800
@@ -387,15 +397,16 @@ class TestParseDisplayKeywordRow:
 
 class TestGadsDisplayKeywordView:
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_display_keyword_row(display_name="shoes"),
             _make_display_keyword_row(display_name="clothing"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_display_keyword_view(
+        result = await gads_display_keyword_view(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -406,12 +417,13 @@ class TestGadsDisplayKeywordView:
         assert "clothing" in result
 
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_display_keyword_row()]
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_display_keyword_row()])
         mock_get_client.return_value = mock_client
 
-        result = gads_display_keyword_view(
+        result = await gads_display_keyword_view(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -423,12 +435,13 @@ class TestGadsDisplayKeywordView:
         assert data["display_keywords"][0]["keyword_text"] == "running shoes"
 
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_display_keyword_view(
+        result = await gads_display_keyword_view(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -472,14 +485,15 @@ class TestParseTopicRow:
 
 class TestGadsTopicView:
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_topic_row(topic_path=["Arts", "Movies"]),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_topic_view(
+        result = await gads_topic_view(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -489,12 +503,13 @@ class TestGadsTopicView:
         assert "Arts > Movies" in result
 
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_topic_row()]
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_topic_row()])
         mock_get_client.return_value = mock_client
 
-        result = gads_topic_view(
+        result = await gads_topic_view(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -506,28 +521,30 @@ class TestGadsTopicView:
         assert "pagination" in data
 
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_campaign_id_filter(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_campaign_id_filter(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        gads_topic_view(
+        await gads_topic_view(
             customer_id="1234567890",
             campaign_id="11",
             start_date="2026-01-01",
             end_date="2026-01-31",
             ctx=MagicMock(),
         )
-        called_query = mock_client.query.call_args[0][1]
+        called_query = mock_client.aquery_page.call_args[0][1]
         assert "campaign.id = 11" in called_query
 
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_topic_view(
+        result = await gads_topic_view(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -554,7 +571,7 @@ class TestBuildUserLocationViewQuery:
 class TestParseUserLocationRow:
     def test_basic_parsing(self):
         row = _make_user_location_row()
-        result = _parse_user_location_row(row)
+        result = _USER_LOCATION_ROWS.records([row])[0]
         assert result["country_criterion_id"] == "2380"
         assert result["impressions"] == 700
         assert result["clicks"] == 35
@@ -562,15 +579,16 @@ class TestParseUserLocationRow:
 
 class TestGadsUserLocationView:
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_user_location_row(country_id="2380"),
             _make_user_location_row(country_id="2840"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_user_location_view(
+        result = await gads_user_location_view(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -579,12 +597,13 @@ class TestGadsUserLocationView:
         assert "## User Location View" in result
 
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_user_location_row()]
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_user_location_row()])
         mock_get_client.return_value = mock_client
 
-        result = gads_user_location_view(
+        result = await gads_user_location_view(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -596,28 +615,30 @@ class TestGadsUserLocationView:
         assert data["user_locations"][0]["country_criterion_id"] == "2380"
 
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_campaign_id_filter(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_campaign_id_filter(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        gads_user_location_view(
+        await gads_user_location_view(
             customer_id="1234567890",
             campaign_id="22",
             start_date="2026-01-01",
             end_date="2026-01-31",
             ctx=MagicMock(),
         )
-        called_query = mock_client.query.call_args[0][1]
+        called_query = mock_client.aquery_page.call_args[0][1]
         assert "campaign.id = 22" in called_query
 
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_user_location_view(
+        result = await gads_user_location_view(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -644,7 +665,7 @@ class TestBuildClickViewQuery:
 class TestParseClickRow:
     def test_basic_parsing(self):
         row = _make_click_row()
-        result = _parse_click_row(row)
+        result = _CLICK_ROWS.records([row])[0]
         assert result["gclid"] == "CjwKCAtest123"
         assert result["city"] == "Milan"
         assert result["country"] == "Italy"
@@ -654,15 +675,16 @@ class TestParseClickRow:
 
 class TestGadsClickView:
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_markdown_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_click_row(gclid="gclid1", city="Milan"),
             _make_click_row(gclid="gclid2", city="Rome"),
-        ]
+        ])
         mock_get_client.return_value = mock_client
 
-        result = gads_click_view(
+        result = await gads_click_view(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -673,12 +695,13 @@ class TestGadsClickView:
         assert "Rome" in result
 
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_json_output(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [_make_click_row()]
+    @pytest.mark.asyncio
+    async def test_json_output(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([_make_click_row()])
         mock_get_client.return_value = mock_client
 
-        result = gads_click_view(
+        result = await gads_click_view(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -691,28 +714,30 @@ class TestGadsClickView:
         assert data["clicks"][0]["city"] == "Milan"
 
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_campaign_id_filter(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_campaign_id_filter(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        gads_click_view(
+        await gads_click_view(
             customer_id="1234567890",
             campaign_id="88",
             start_date="2026-01-01",
             end_date="2026-01-31",
             ctx=MagicMock(),
         )
-        called_query = mock_client.query.call_args[0][1]
+        called_query = mock_client.aquery_page.call_args[0][1]
         assert "campaign.id = 88" in called_query
 
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_empty_results(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = []
+    @pytest.mark.asyncio
+    async def test_empty_results(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([])
         mock_get_client.return_value = mock_client
 
-        result = gads_click_view(
+        result = await gads_click_view(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -721,15 +746,16 @@ class TestGadsClickView:
         assert "0 of 0" in result
 
     @patch("google_ads_mcp.tools.views.get_client")
-    def test_pagination(self, mock_get_client):
-        mock_client = MagicMock()
-        mock_client.query.return_value = [
+    @pytest.mark.asyncio
+    async def test_pagination(self, mock_get_client):
+        mock_client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+        mock_client.aquery_page.return_value = QueryPage([
             _make_click_row(gclid=f"gclid_{i}")
-            for i in range(10)
-        ]
+            for i in range(3)
+        ], next_page_token="tok", has_more=True)
         mock_get_client.return_value = mock_client
 
-        result = gads_click_view(
+        result = await gads_click_view(
             customer_id="1234567890",
             start_date="2026-01-01",
             end_date="2026-01-31",
@@ -738,6 +764,6 @@ class TestGadsClickView:
             ctx=MagicMock(),
         )
         data = json.loads(result)
-        assert data["pagination"]["total"] == 10
+        assert data["pagination"]["total"] is None
         assert data["pagination"]["count"] == 3
         assert data["pagination"]["has_more"] is True
@@ -0,0 +1,149 @@
+"""Tests for the warehouse sync tool and source="warehouse" reports."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from google_ads_mcp.client import AsyncGoogleAdsClientWrapper
+from google_ads_mcp.tools.campaigns import get_campaign_performance
+from google_ads_mcp.tools.warehouse import gads_sync_reports
+from google_ads_mcp.utils.errors import GoogleAdsMCPError
+from google_ads_mcp.warehouse import Warehouse
+from tests.test_warehouse import FakeStreamClient
+
+
+async def _call_inline(func, *args, **kwargs):
+    return func(*args, **kwargs)
+
+
+def _ctx(warehouse):
+    ctx = MagicMock()
+    ctx.request_context.lifespan_context = {"warehouse": warehouse}
+    return ctx
+
+
+@pytest.fixture
+def warehouse(tmp_path):
+    wh = Warehouse(str(tmp_path / "warehouse.sqlite"))
+    yield wh
+    wh.close()
+
+
+@pytest.fixture
+def mock_client():
+    client = MagicMock(spec=AsyncGoogleAdsClientWrapper)
+    client.arun.side_effect = _call_inline
+    client.query_stream.side_effect = FakeStreamClient().query_stream
+    return client
+
+
+class TestGadsSyncReports:
+    @patch("google_ads_mcp.tools.warehouse.get_client")
+    @pytest.mark.asyncio
+    async def test_sync_selected_resources(self, mock_get_client, mock_client, warehouse):
+        mock_get_client.return_value = mock_client
+        result = await gads_sync_reports(
+            customer_id="123-456-7890",
+            resources="campaign",
+            start_date="2024-01-01",
+            response_format="json",
+            ctx=_ctx(warehouse),
+        )
+        data = json.loads(result)
+        assert [s["resource"] for s in data["synced"]] == ["campaign"]
+        assert data["synced"][0]["rows"] > 0
+        assert warehouse.get_watermark("1234567890", "campaign") is not None
+
+    @patch("google_ads_mcp.tools.warehouse.get_client")
+    @pytest.mark.asyncio
+    async def test_markdown_output(self, mock_get_client, mock_client, warehouse):
+        mock_get_client.return_value = mock_client
+        result = await gads_sync_reports(
+            customer_id="1234567890",
+            resources="campaign",
+            initial_days=2,
+            ctx=_ctx(warehouse),
+        )
+        assert "## Warehouse Sync" in result
+        assert "campaign" in result
+
+    @patch("google_ads_mcp.tools.warehouse.get_client")
+    @pytest.mark.asyncio
+    async def test_disabled_warehouse(self, mock_get_client, mock_client):
+        mock_get_client.return_value = mock_client
+        with pytest.raises(GoogleAdsMCPError, match="GOOGLE_ADS_WAREHOUSE_DB"):
+            await gads_sync_reports(customer_id="1234567890", ctx=_ctx(None))
+
+
+class TestWarehouseSource:
+    @patch("google_ads_mcp.tools.campaigns.get_client")
+    @pytest.mark.asyncio
+    async def test_campaign_performance_from_warehouse(
+        self, mock_get_client, mock_client, warehouse
+    ):
+        mock_get_client.return_value = mock_client
+        ctx = _ctx(warehouse)
+        with patch("google_ads_mcp.tools.warehouse.get_client", return_value=mock_client):
+            await gads_sync_reports(
+                customer_id="1234567890", resources="campaign",
+                start_date="2024-01-01", ctx=ctx,
+            )
+
+        result = await get_campaign_performance(
+            customer_id="1234567890",
+            status="all",
+            start_date="2024-01-01",
+            end_date="2024-01-03",
+            limit=1,
+            source="warehouse",
+            response_format="json",
+            ctx=ctx,
+        )
+        data = json.loads(result)
+        assert data["performance"][0]["id"] == "1"
+        assert data["performance"][0]["clicks"] == 30
+        assert data["performance"][0]["ctr"] == "10.00%"
+        assert data["pagination"]["total"] == 2
+        assert data["pagination"]["next_cursor"]
+        mock_client.aquery_page.assert_not_called()
+
+        result = await get_campaign_performance(
+            customer_id="1234567890",
+            status="all",
+            start_date="2024-01-01",
+            end_date="2024-01-03",
+            limit=1,
+            cursor=data["pagination"]["next_cursor"],
+            source="warehouse",
+            response_format="json",
+            ctx=ctx,
+        )
+        data = json.loads(result)
+        assert data["performance"][0]["id"] == "2"
+        assert data["pagination"]["has_more"] is False
+
+    @patch("google_ads_mcp.tools.campaigns.get_client")
+    @pytest.mark.asyncio
+    async def test_status_filter_uses_gaql_literal(
+        self, mock_get_client, mock_client, warehouse
+    ):
+        mock_get_client.return_value = mock_client
+        ctx = _ctx(warehouse)
+        with patch("google_ads_mcp.tools.warehouse.get_client", return_value=mock_client):
+            await gads_sync_reports(
+                customer_id="1234567890", resources="campaign",
+                start_date="2024-01-01", ctx=ctx,
+            )
+
+        result = await get_campaign_performance(
+            customer_id="1234567890",
+            status="paused",
+            start_date="2024-01-01",
+            end_date="2024-01-03",
+            source="warehouse",
+            response_format="json",
+            ctx=ctx,
+        )
+        data = json.loads(result)
+        assert [p["id"] for p in data["performance"]] == ["2"]
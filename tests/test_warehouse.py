@@ -0,0 +1,157 @@
+"""Tests for the local report warehouse."""
+
+import re
+from datetime import date, timedelta
+from enum import Enum
+from types import SimpleNamespace
+
+import pytest
+
+from google_ads_mcp.utils.errors import InvalidInputError
+from google_ads_mcp.warehouse import REPORTS, Warehouse, sync_reports, sync_resource
+
+
+class CampaignStatus(Enum):
+    ENABLED = 2
+    PAUSED = 3
+
+
+def _campaign_row(day, cid, clicks, cost, status=CampaignStatus.ENABLED):
+    return SimpleNamespace(
+        segments=SimpleNamespace(date=day),
+        campaign=SimpleNamespace(id=cid, name=f"Campaign {cid}", status=status),
+        metrics=SimpleNamespace(
+            impressions=clicks * 10,
+            clicks=clicks,
+            cost_micros=cost,
+            interactions=clicks,
+            conversions=1.5,
+            conversions_value=10.0,
+        ),
+    )
+
+
+class FakeStreamClient:
+    """Streams two campaigns per day for the queried date range."""
+
+    def __init__(self):
+        self.queries = []
+
+    def query_stream(self, customer_id, query):
+        self.queries.append(query)
+        start, end = re.search(r"BETWEEN '([\d-]+)' AND '([\d-]+)'", query).groups()
+        day = date.fromisoformat(start)
+        while day <= date.fromisoformat(end):
+            yield _campaign_row(day.isoformat(), 1, 10, 2_000_000)
+            yield _campaign_row(day.isoformat(), 2, 5, 500_000, CampaignStatus.PAUSED)
+            day += timedelta(days=1)
+
+
+@pytest.fixture
+def warehouse(tmp_path):
+    wh = Warehouse(str(tmp_path / "warehouse.sqlite"))
+    yield wh
+    wh.close()
+
+
+class TestReportSpec:
+    def test_gaql_selects_date_dimensions_and_metrics(self):
+        query = REPORTS["keyword"].gaql("2024-01-01", "2024-01-31")
+        assert query.startswith("SELECT segments.date, ad_group_criterion.criterion_id")
+        assert "FROM keyword_view" in query
+        assert "metrics.cost_micros" in query
+        assert "BETWEEN '2024-01-01' AND '2024-01-31'" in query
+
+
+class TestSync:
+    def test_sync_resource_stores_rows_and_watermark(self, warehouse):
+        client = FakeStreamClient()
+        result = sync_resource(
+            client, warehouse, "1234567890", "campaign", "2024-01-01", "2024-01-03"
+        )
+        assert result.rows == 6
+        assert warehouse.get_watermark("1234567890", "campaign") == "2024-01-03"
+
+    def test_incremental_sync_starts_at_watermark(self, warehouse):
+        client = FakeStreamClient()
+        today = date(2024, 1, 10)
+        sync_reports(client, warehouse, "1234567890", ["campaign"], initial_days=9, today=today)
+        assert "'2024-01-01' AND '2024-01-10'" in client.queries[0]
+
+        client.queries.clear()
+        results = sync_reports(
+            client, warehouse, "1234567890", ["campaign"], today=date(2024, 1, 12)
+        )
+        assert "'2024-01-10' AND '2024-01-12'" in client.queries[0]
+        assert results[0].rows == 6
+
+        rows, total = warehouse.report("campaign", "1234567890", "2024-01-01", "2024-01-12")
+        assert total == 2
+        assert rows[0].metrics.clicks == 120
+
+    def test_unknown_resource_rejected_before_sync(self, warehouse):
+        client = FakeStreamClient()
+        with pytest.raises(InvalidInputError, match="Invalid warehouse resource"):
+            sync_reports(client, warehouse, "1234567890", ["campaign", "bogus"])
+        assert client.queries == []
+
+    def test_failed_sync_keeps_previous_data(self, warehouse):
+        sync_resource(
+            FakeStreamClient(), warehouse, "1234567890", "campaign",
+            "2024-01-01", "2024-01-02",
+        )
+
+        class BrokenClient:
+            def query_stream(self, customer_id, query):
+                yield _campaign_row("2024-01-02", 1, 1, 1)
+                raise RuntimeError("stream reset")
+
+        with pytest.raises(RuntimeError):
+            sync_resource(
+                BrokenClient(), warehouse, "1234567890", "campaign",
+                "2024-01-02", "2024-01-03",
+            )
+        assert warehouse.get_watermark("1234567890", "campaign") == "2024-01-02"
+        _, total = warehouse.report("campaign", "1234567890", "2024-01-01", "2024-01-02")
+        assert total == 2
+
+
+class TestReport:
+    @pytest.fixture(autouse=True)
+    def _synced(self, warehouse):
+        sync_resource(
+            FakeStreamClient(), warehouse, "1234567890", "campaign",
+            "2024-01-01", "2024-01-04",
+        )
+
+    def test_aggregates_and_derives_ratios(self, warehouse):
+        rows, total = warehouse.report("campaign", "1234567890", "2024-01-01", "2024-01-04")
+        assert total == 2
+        top = rows[0]
+        assert top.campaign.id == "1"
+        assert top.campaign.status == "ENABLED"
+        assert top.metrics.cost_micros == 8_000_000
+        assert top.metrics.ctr == pytest.approx(0.1)
+        assert top.metrics.average_cpc == pytest.approx(200_000)
+        assert top.metrics.conversions_from_interactions_rate == pytest.approx(0.15)
+
+    def test_filters_and_pagination(self, warehouse):
+        rows, total = warehouse.report(
+            "campaign", "1234567890", "2024-01-01", "2024-01-04",
+            filters={"status": "PAUSED", "campaign_id": None},
+        )
+        assert total == 1
+        assert rows[0].campaign.id == "2"
+
+        rows, total = warehouse.report(
+            "campaign", "1234567890", "2024-01-01", "2024-01-04", limit=1, offset=1
+        )
+        assert total == 2
+        assert [r.campaign.id for r in rows] == ["2"]
+
+    def test_date_range_and_customer_scoping(self, warehouse):
+        rows, _ = warehouse.report("campaign", "1234567890", "2024-01-02", "2024-01-02")
+        assert rows[0].metrics.clicks == 10
+        rows, total = warehouse.report("campaign", "9999999999", "2024-01-01", "2024-01-04")
+        assert rows == []
+        assert total == 0